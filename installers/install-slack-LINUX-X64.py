@@ -8,13 +8,29 @@ import os
 import sys
 import subprocess
 import shutil
-import re
 import argparse
 import json
+import glob
+import io
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import time
 
+from slackpolish_asar import AsarArchive, AsarError
+from slackpolish_cleanup import remove_slackpolish_code, summarize_removed
+from slackpolish_discovery import check_known_paths, load_cached_location, save_location, search_roots
+from slackpolish_fileops import backup_file, replace_file, temp_path_for
+from slackpolish_manifest import (
+    archive_is_install_result,
+    file_sha256,
+    load_manifest,
+    remove_manifest,
+    save_manifest,
+)
+from slackpolish_payload import ASAR_FLAVOR, BUNDLE_NAME, load_payload
+
 # ANSI colors (Windows may not support these, but we'll include them)
 GREEN = "\033[92m"
 YELLOW = "\033[93m"
@@ -24,6 +40,11 @@ RESET = "\033[0m"
 
 # Global verbose flag
 VERBOSE = False
+# False in --fleet workers, which have no terminal: validation concerns fail instead of prompting
+INTERACTIVE = True
+
+class InjectionValidationError(Exception):
+    """The injection file did not pass validation and the user (or --fleet) declined it."""
 
 def print_header(text):
     print(f"\n{BLUE}==================================================")
@@ -77,9 +98,16 @@ def detect_linux_system():
     
     return True
 
-def find_slack_installation_linux():
+def find_slack_installation_linux(use_cache=True, parallel=True):
     """Find Slack installation on Linux."""
     print_info("Searching for Slack installation on Linux...")
+
+    if use_cache:
+        cached_path = load_cached_location()
+        if cached_path:
+            print_success(f"Found Slack at: {cached_path} (cached)")
+            return cached_path
+        print_verbose("No valid cached Slack location")
     
     # Linux-specific paths (prioritized by commonality)
     possible_paths = [
@@ -91,31 +119,31 @@ def find_slack_installation_linux():
         "/var/lib/snapd/snap/slack/current/usr/lib/slack/resources",  # Snap alternative
     ]
     
-    for path in possible_paths:
+    def report_check(path):
         print_verbose(f"Checking: {path}")
-        if os.path.exists(path) and os.path.isfile(os.path.join(path, "app.asar")):
-            print_success(f"Found Slack at: {path}")
-            return path
-        else:
-            print_verbose(f"   ❌ Not found")
-    
-    # Deep search in common directories
+
+    slack_path = check_known_paths(possible_paths, on_check=report_check)
+    if slack_path:
+        print_success(f"Found Slack at: {slack_path}")
+        save_location(slack_path)
+        return slack_path
+    print_verbose("   ❌ Not found in common locations")
+
+    # Bounded search in common directories
     print_verbose("Performing deep search...")
-    search_dirs = [
+    search_roots_list = [
         "/usr/lib",
         "/opt",
         "/usr/local/lib",
         str(Path.home() / ".local" / "share"),
     ]
-    
-    for search_dir in search_dirs:
-        if os.path.exists(search_dir):
-            for root, dirs, files in os.walk(search_dir):
-                if "slack" in root.lower() and "app.asar" in files:
-                    slack_path = root
-                    print_success(f"Found Slack at: {slack_path}")
-                    return slack_path
-    
+
+    slack_path = search_roots(search_roots_list, parallel=parallel)
+    if slack_path:
+        print_success(f"Found Slack at: {slack_path}")
+        save_location(slack_path)
+        return slack_path
+
     return None
 
 def check_asar_tool_linux():
@@ -188,56 +216,45 @@ def install_asar_tool_linux():
     print("  2. Install asar: npm install -g asar")
     return None
 
-def find_injection_file(extract_dir):
-    """Find the best file for injection."""
-    print_info("Searching for injection point...")
-    
-    # Priority order for Linux (traditional preload files more common)
-    file_patterns = [
-        "preload.bundle.js",  # Most common on Linux
-        "preload.js",         # Alternative preload
-        "bundle.js",          # Generic bundle
-        "main.bundle.js",     # Main bundle
-        "index.js",           # Newer versions
-    ]
-    
-    search_dirs = ["dist", "src", "app", "build", "static", "js", "scripts", ""]
-    
+# Priority order for Linux (traditional preload files more common)
+INJECTION_FILE_PATTERNS = [
+    "preload.bundle.js",  # Most common on Linux
+    "preload.js",         # Alternative preload
+    "bundle.js",          # Generic bundle
+    "main.bundle.js",     # Main bundle
+    "index.js",           # Newer versions
+]
+
+INJECTION_SEARCH_DIRS = ["dist", "src", "app", "build", "static", "js", "scripts", ""]
+
+def select_injection_path(paths):
+    """Pick the best injection file from a list of '/'-separated relative paths."""
+    available = set(paths)
     found_files = []
-    
+
     # Search systematically
-    for search_dir in search_dirs:
-        search_path = os.path.join(extract_dir, search_dir) if search_dir else extract_dir
-        if os.path.exists(search_path):
-            for pattern in file_patterns:
-                file_path = os.path.join(search_path, pattern)
-                if os.path.exists(file_path):
-                    found_files.append(file_path)
-                    print_verbose(f"Found: {file_path}")
-    
-    # Also do recursive search
-    for root, dirs, files in os.walk(extract_dir):
-        for file in files:
-            if file.endswith('.js') and ('preload' in file.lower() or 'bundle' in file.lower() or file == 'index.js'):
-                file_path = os.path.join(root, file)
-                if file_path not in found_files:
-                    found_files.append(file_path)
-                    print_verbose(f"Found additional: {file_path}")
-    
+    for search_dir in INJECTION_SEARCH_DIRS:
+        for pattern in INJECTION_FILE_PATTERNS:
+            candidate = f"{search_dir}/{pattern}" if search_dir else pattern
+            if candidate in available and candidate not in found_files:
+                found_files.append(candidate)
+                print_verbose(f"Found: {candidate}")
+
+    # Also consider every other preload/bundle/index file
+    for path in paths:
+        file = path.rsplit("/", 1)[-1]
+        if file.endswith('.js') and ('preload' in file.lower() or 'bundle' in file.lower() or file == 'index.js'):
+            if path not in found_files:
+                found_files.append(path)
+                print_verbose(f"Found additional: {path}")
+
     if not found_files:
-        print_error("No suitable injection files found!")
-        print_info("Available JavaScript files:")
-        for root, dirs, files in os.walk(extract_dir):
-            for file in files:
-                if file.endswith('.js'):
-                    rel_path = os.path.relpath(os.path.join(root, file), extract_dir)
-                    print(f"  - {rel_path}")
         return None
-    
+
     # Select best file based on priority
-    for pattern in file_patterns:
+    for pattern in INJECTION_FILE_PATTERNS:
         for file_path in found_files:
-            if pattern in os.path.basename(file_path):
+            if pattern in file_path.rsplit("/", 1)[-1]:
                 if pattern == "preload.bundle.js":
                     print_success(f"Selected: {file_path} (standard preload)")
                 elif pattern == "index.js":
@@ -245,23 +262,63 @@ def find_injection_file(extract_dir):
                 else:
                     print_success(f"Selected: {file_path} ({pattern})")
                 return file_path
-    
+
     # Fallback to first found
     selected = found_files[0]
     print_warning(f"Selected: {selected} (fallback)")
     return selected
 
+def report_missing_injection_file(paths):
+    print_error("No suitable injection files found!")
+    print_info("Available JavaScript files:")
+    for path in paths:
+        if path.endswith('.js'):
+            print(f"  - {path}")
+
+def find_injection_file(extract_dir):
+    """Find the best file for injection in an extracted archive."""
+    print_info("Searching for injection point...")
+
+    paths = []
+    for root, dirs, files in os.walk(extract_dir):
+        for file in files:
+            rel_path = os.path.relpath(os.path.join(root, file), extract_dir)
+            paths.append(rel_path.replace(os.sep, "/"))
+
+    selected = select_injection_path(paths)
+    if not selected:
+        report_missing_injection_file(paths)
+        return None
+    return os.path.join(extract_dir, *selected.split("/"))
+
+def find_injection_entry(archive):
+    """Find the best file for injection directly in the ASAR index."""
+    print_info("Searching for injection point...")
+
+    paths = [path for path, _ in archive.iter_files()]
+    selected = select_injection_path(paths)
+    if not selected:
+        report_missing_injection_file(paths)
+    return selected
+
 def validate_injection_file(file_path, force=False):
     """Validate the injection file."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
-        
+    except Exception as e:
+        print_error(f"Error validating file: {e}")
+        return False
+
+    return validate_injection_content(content, force)
+
+def validate_injection_content(content, force=False):
+    """Validate the contents of the injection file."""
+    try:
         if len(content) < 100:
             print_warning(f"File seems small ({len(content)} bytes)")
             if not force:
-                response = input("Continue anyway? (y/N): ").strip().lower()
-                return response in ['y', 'yes']
+                return confirm_continue()
         
         # Check for JavaScript/Slack indicators
         js_indicators = ['function', 'const', 'let', 'var', 'require', 'module', 'exports']
@@ -278,13 +335,20 @@ def validate_injection_file(file_path, force=False):
             if force:
                 print_warning("Continuing due to --force flag")
                 return True
-            response = input("Continue anyway? (y/N): ").strip().lower()
-            return response in ['y', 'yes']
+            return confirm_continue()
             
     except Exception as e:
         print_error(f"Error validating file: {e}")
         return False
 
+def confirm_continue():
+    """Ask whether to continue despite a validation concern; never asks when not interactive."""
+    if not INTERACTIVE:
+        print_error("Not continuing without --force (no prompt in --fleet mode)")
+        return False
+    response = input("Continue anyway? (y/N): ").strip().lower()
+    return response in ['y', 'yes']
+
 def inject_scripts(injection_file, config_path, *script_paths):
     """Inject SlackPolish scripts into the target file."""
     try:
@@ -292,159 +356,59 @@ def inject_scripts(injection_file, config_path, *script_paths):
         with open(injection_file, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # COMPREHENSIVE CLEANUP - Remove ALL SlackPolish code
+        content = build_injected_content(content, config_path)
+        if content is None:
+            return False
+
+        # Write back
+        with open(injection_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        print_success("Scripts injected successfully!")
+        return True
+
+    except Exception as e:
+        print_error(f"Error injecting scripts: {e}")
+        return False
+
+def load_injection_payload(source_dir=None):
+    """
+    Return (injection block, sha256) for app.asar.
+
+    Comes from the prebuilt payload bundle next to the scripts, or is rendered
+    from the scripts themselves when one of them was edited after the build.
+    """
+    bundle = load_payload(source_dir or os.getcwd())
+    return bundle.flavor(ASAR_FLAVOR), bundle.flavor_sha256(ASAR_FLAVOR)
+
+def build_injected_content(content, config_path, injection=None):
+    """
+    Return content with old SlackPolish code removed and the current scripts injected.
+
+    Pass a prebuilt injection block (see load_injection_payload) to avoid loading the payload again.
+    """
+    try:
+        # COMPREHENSIVE CLEANUP - Remove ALL SlackPolish code in a single pass
         print_info("Performing comprehensive cleanup of all SlackPolish code...")
 
-        # Patterns to remove everything SlackPolish-related
-        cleanup_patterns = [
-            # Main injection blocks with optional semicolons - more comprehensive
-            r'// === SLACKPOLISH INJECTION START ===.*?// === SLACKPOLISH INJECTION END ===;?\s*(?:// === SLACKPOLISH INJECTION END ===;?\s*)*',
-            r'// === SLACK TEXT IMPROVER INJECTION START ===.*?// === SLACK TEXT IMPROVER INJECTION END ===;?\s*(?:// === SLACK TEXT IMPROVER INJECTION END ===;?\s*)*',
-
-            # Individual file markers (new structure)
-            r'// === SLACK-TEXT-IMPROVER\.JS ===.*?(?=// === |\Z)',
-            r'// === SLACK-SETTINGS\.JS ===.*?(?=// === |\Z)',
-            r'// === SLACK-CHANNEL-SUMMARY\.JS ===.*?(?=// === |\Z)',
-            r'// === LOGO-DATA\.JS ===.*?(?=// === |\Z)',
-
-            # Orphaned end markers - multiple consecutive ones
-            r'(?:// === SLACKPOLISH INJECTION END ===;?\s*)+',
-            r'(?:// === SLACK TEXT IMPROVER INJECTION END ===;?\s*)+',
-
-            # Config and utilities
-            r'window\.SLACKPOLISH_CONFIG\s*=.*?};?',
-            r'window\.SlackPolishUtils\s*=.*?};?',
-            r'window\.SLACKPOLISH_LOGO_BASE64\s*=.*?;',
-            r'window\.SLACKPOLISH_LOGO_DATA\s*=.*?;',
-
-            # Class definitions (old single-file structure)
-            r'class SlackTextImprover\s*{.*?}\s*\)\(\);?',
-            r'class SlackSettings\s*{.*?}\s*\)\(\);?',
-            r'class SlackChannelSummary\s*{.*?}\s*\)\(\);?',
-
-            # Function-based implementations
-            r'\(function\(\)\s*{\s*[\'"]use strict[\'"];.*?SlackTextImprover.*?}\)\(\);?',
-            r'\(function\(\)\s*{\s*[\'"]use strict[\'"];.*?SlackSettings.*?}\)\(\);?',
-            r'\(function\(\)\s*{\s*[\'"]use strict[\'"];.*?SlackChannelSummary.*?}\)\(\);?',
-
-            # Any remaining SlackPolish references
-            r'SlackPolish[A-Za-z]*\s*[=:].*?[;}]',
-            r'// SlackPolish.*?\n',
-            r'/\* SlackPolish.*?\*/',
-
-            # Cleanup any orphaned semicolons or empty lines left behind
-            r';\s*;\s*;+',
-            r'\n\s*\n\s*\n+',
-        ]
-
-        original_length = len(content)
-
-        for i, pattern in enumerate(cleanup_patterns):
-            before_length = len(content)
-            content = re.sub(pattern, '', content, flags=re.DOTALL | re.MULTILINE)
-            after_length = len(content)
-            if before_length != after_length:
-                print_info(f"  Pattern {i+1}: Removed {before_length - after_length} characters")
-
-        # Additional targeted cleanup for duplicate end markers
-        # This handles the specific case of duplicate injection end markers
-        duplicate_patterns = [
-            r'// === SLACKPOLISH INJECTION END ===;\s*\n\s*// === SLACKPOLISH INJECTION END ===',
-            r'// === SLACK TEXT IMPROVER INJECTION END ===;\s*\n\s*// === SLACK TEXT IMPROVER INJECTION END ===',
-        ]
-
-        for i, pattern in enumerate(duplicate_patterns):
-            before_length = len(content)
-            content = re.sub(pattern, '// === SLACKPOLISH INJECTION END ===', content, flags=re.DOTALL | re.MULTILINE)
-            after_length = len(content)
-            if before_length != after_length:
-                print_info(f"  Duplicate cleanup {i+1}: Removed {before_length - after_length} characters")
-
-        # Final cleanup - remove excessive whitespace
-        content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
-        content = re.sub(r';\s*;+', ';', content)
-
-        total_removed = original_length - len(content)
+        content, removed = remove_slackpolish_code(content)
+
+        for kind, count, characters in summarize_removed(removed):
+            print_info(f"  {kind}: Removed {count} span(s), {characters} characters")
+
+        total_removed = sum(span.end - span.start for span in removed)
         if total_removed > 0:
             print_success(f"Comprehensive cleanup complete: Removed {total_removed} characters of old code")
         else:
             print_info("No old SlackPolish code found to remove")
 
-        # Read config script
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_script = f.read()
-
-        # Read logo data if it exists
-        logo_script = ""
-        if os.path.exists("logo-data.js"):
-            with open("logo-data.js", 'r', encoding='utf-8') as f:
-                logo_script = f.read()
-
-        # Read the single text improver script
-        text_improver_script = ""
-        if os.path.exists('slack-text-improver.js'):
-            with open('slack-text-improver.js', 'r', encoding='utf-8') as f:
-                text_improver_script = f.read().strip()
-                # Ensure script ends with a semicolon
-                if not text_improver_script.endswith(';'):
-                    text_improver_script += ';'
-
-        # Read the settings script
-        settings_script = ""
-        if os.path.exists('slack-settings.js'):
-            with open('slack-settings.js', 'r', encoding='utf-8') as f:
-                settings_script = f.read().strip()
-                # Ensure script ends with a semicolon
-                if not settings_script.endswith(';'):
-                    settings_script += ';'
-
-        # Read the channel summary script
-        # TEMPORARILY DISABLED - causes syntax errors
-        channel_summary_script = ""
-        # if os.path.exists('slack-channel-summary.js'):
-        #     with open('slack-channel-summary.js', 'r', encoding='utf-8') as f:
-        #         channel_summary_script = f.read().strip()
-        #         # Ensure script ends with a semicolon
-        #         if not channel_summary_script.endswith(';'):
-        #             channel_summary_script += ';'
-
-        # Ensure config script ends properly
-        config_script = config_script.strip()
-        if not config_script.endswith(';'):
-            config_script += ';'
-
-        # Ensure logo script ends properly
-        if logo_script:
-            logo_script = logo_script.strip()
-            if not logo_script.endswith(';'):
-                logo_script += ';'
+        if injection is None:
+            injection, _ = load_injection_payload(os.path.dirname(os.path.abspath(config_path)))
 
         # Ensure proper ending of main content
         if not content.rstrip().endswith(';'):
             content = content.rstrip() + ';\n'
 
-        # Inject scripts with proper separation
-        # NOTE: Channel summary is temporarily disabled due to syntax errors
-        injection = f"""
-;
-// === SLACKPOLISH INJECTION START ===
-{config_script}
-
-{logo_script}
-
-// === SLACK-TEXT-IMPROVER.JS ===
-{text_improver_script}
-
-// === SLACK-SETTINGS.JS ===
-{settings_script}
-
-// === SLACK-CHANNEL-SUMMARY.JS ===
-// TEMPORARILY DISABLED - causes syntax errors when injected
-// Will be fixed in future version
-// {channel_summary_script}
-// === SLACKPOLISH INJECTION END ===
-"""
-
         # Find the closing IIFE pattern before the sourcemap comment
         # The file structure is: (()=>{ ... })();\n\n//# sourceMappingURL=...
         # We need to inject BEFORE the })(); that closes the main IIFE
@@ -481,16 +445,11 @@ def inject_scripts(injection_file, config_path, *script_paths):
             # No sourcemap, append at the end (old behavior)
             content += injection
 
-        # Write back
-        with open(injection_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        print_success("Scripts injected successfully!")
-        return True
+        return content
 
     except Exception as e:
         print_error(f"Error injecting scripts: {e}")
-        return False
+        return None
 
 def extract_asar(asar_path, output_dir, asar_tool):
     """Extract ASAR archive."""
@@ -501,12 +460,134 @@ def extract_asar(asar_path, output_dir, asar_tool):
         return False
 
 def repack_asar(input_dir, asar_path, asar_tool):
-    """Repack ASAR archive."""
+    """Repack ASAR archive next to asar_path, then swap it in atomically."""
+    temp_path = temp_path_for(asar_path)
     try:
-        subprocess.run([asar_tool, "pack", input_dir, asar_path], check=True)
+        subprocess.run([asar_tool, "pack", input_dir, temp_path], check=True)
+        replace_file(temp_path, asar_path)
         return True
     except subprocess.SubprocessError:
         return False
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def patch_asar_native(asar_path, force=False, source_path=None, injection=None):
+    """
+    Inject SlackPolish into app.asar in-process, rewriting only the injection file.
+
+    source_path is the archive to read from (defaults to asar_path); passing the
+    clean backup skips the cleanup of a previous injection.
+
+    Returns the archive path of the patched entry, or None on failure.
+    Raises InjectionValidationError if the injection file is declined.
+    """
+    temp_path = temp_path_for(asar_path)
+
+    try:
+        with AsarArchive(source_path or asar_path) as archive:
+            injection_entry = find_injection_entry(archive)
+            if not injection_entry:
+                print_error("Could not find suitable injection file")
+                return None
+
+            try:
+                content = archive.read_file(injection_entry).decode('utf-8')
+            except UnicodeDecodeError as e:
+                print_error(f"Injection file is not valid UTF-8: {e}")
+                return None
+
+            if not validate_injection_content(content, force):
+                print_error("File validation failed")
+                raise InjectionValidationError(injection_entry)
+
+            print_info("Injecting SlackPolish Text Improver...")
+            content = build_injected_content(content, "slack-config.js", injection)
+            if content is None:
+                print_error("Failed to inject scripts")
+                return None
+
+            print_info("Writing patched app.asar...")
+            archive.write(temp_path, {injection_entry: content.encode('utf-8')})
+
+        replace_file(temp_path, asar_path)
+        print_success("Scripts injected successfully!")
+        return injection_entry
+
+    except AsarError as e:
+        print_error(f"Could not read app.asar: {e}")
+        print_info("Retry with --use-asar-tool to fall back to the Node.js asar tool.")
+        return None
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def patch_asar_with_tool(asar_path, force=False):
+    """Inject SlackPolish by extracting and repacking app.asar with the Node.js asar tool."""
+    extract_dir = "slack_temp_extract"
+
+    # Check asar tool
+    asar_tool = check_asar_tool_linux()
+    if not asar_tool:
+        asar_tool = install_asar_tool_linux()
+        if not asar_tool:
+            print_error("Could not install asar tool")
+            return False
+    print_success(f"asar tool available: {asar_tool}")
+
+    # Extract
+    print_info("Extracting app.asar...")
+    try:
+        if os.path.exists(extract_dir):
+            shutil.rmtree(extract_dir)
+        if not extract_asar(asar_path, extract_dir, asar_tool):
+            print_error("Failed to extract app.asar")
+            print_info("This usually means the asar file is corrupted or locked.")
+            return False
+    except Exception as e:
+        print_error(f"Error during extraction: {e}")
+        return False
+
+    # Find injection file
+    injection_file = find_injection_file(extract_dir)
+    if not injection_file:
+        print_error("Could not find suitable injection file")
+        return False
+
+    # Validate file
+    if not validate_injection_file(injection_file, force):
+        print_error("File validation failed")
+        return False
+
+    # Inject scripts
+    print_info("Injecting SlackPolish Text Improver...")
+    try:
+        if not inject_scripts(injection_file, "slack-config.js"):
+            print_error("Failed to inject scripts")
+            return False
+    except Exception as e:
+        print_error(f"Error during script injection: {e}")
+        return False
+
+    # Repack
+    print_info("Repacking app.asar...")
+    try:
+        if not repack_asar(extract_dir, asar_path, asar_tool):
+            print_error("Failed to repack app.asar")
+            print_info("This usually means insufficient permissions to write to Slack directory.")
+            return False
+    except Exception as e:
+        print_error(f"Error during repacking: {e}")
+        return False
+
+    # Cleanup temporary directory
+    try:
+        if os.path.exists(extract_dir):
+            shutil.rmtree(extract_dir)
+    except Exception as e:
+        print_warning(f"Could not clean up temporary directory: {e}")
+
+    return True
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -519,6 +600,8 @@ Examples:
   sudo python3 install-slack-LINUX-X64.py -v                # Verbose output
   sudo python3 install-slack-LINUX-X64.py --force           # Force installation
   sudo python3 install-slack-LINUX-X64.py -s true           # Reset settings
+  sudo python3 install-slack-LINUX-X64.py --use-asar-tool   # Use the Node.js asar tool
+  sudo python3 install-slack-LINUX-X64.py --fleet '/opt/slack-*/resources' /usr/lib/slack/resources
         """
     )
     
@@ -529,8 +612,18 @@ Examples:
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Enable verbose output')
     parser.add_argument('--force', action='store_true',
-                       help='Force installation even if validation fails')
+                       help='Force installation even if validation fails or nothing changed')
     parser.add_argument('--slack-path', help='Specify Slack path manually')
+    parser.add_argument('--rescan', action='store_true',
+                       help='Ignore the cached Slack location and search again')
+    parser.add_argument('--use-asar-tool', action='store_true',
+                       help='Extract and repack with the Node.js asar tool instead of the built-in ASAR writer')
+    parser.add_argument('--fleet', nargs='+', metavar='PATH',
+                       help='Patch several Slack resources directories (paths or globs) in parallel')
+    parser.add_argument('--fleet-file', metavar='FILE',
+                       help='Read fleet targets from FILE, one path or glob per line')
+    parser.add_argument('-j', '--jobs', type=int,
+                       help='Worker processes for --fleet (default: one per target, up to the CPU count)')
     
     return parser.parse_args()
 
@@ -563,10 +656,99 @@ def check_permissions(slack_path):
     print_success("Permission check passed")
     return True
 
-def verify_installation(slack_path):
+INJECTION_START_MARKER = b"SLACKPOLISH INJECTION START"
+INJECTION_END_MARKER = b"SLACKPOLISH INJECTION END"
+
+def archive_entry_has_injection(archive, path):
+    """Check one archive entry for a complete injection block without extracting it."""
+    # The block sits just before the sourcemap comment, so scanning backwards
+    # finds the end marker within the last few KB of the file.
+    end_position = archive.rfind(path, INJECTION_END_MARKER)
+    if end_position == -1:
+        return False
+    return archive.rfind(path, INJECTION_START_MARKER, end=end_position) != -1
+
+def archive_has_injection(asar_path):
+    """True if app.asar already carries a SlackPolish injection (None if it can't be read)."""
+    try:
+        with AsarArchive(asar_path) as archive:
+            injection_entry = find_injection_entry(archive)
+            return bool(injection_entry) and archive_entry_has_injection(archive, injection_entry)
+    except AsarError:
+        return None
+
+def plan_native_install(slack_path, payload_sha256, force=False):
+    """
+    Decide how to patch using the manifest of the previous install.
+
+    Returns (up_to_date, source_path): up_to_date means app.asar already holds
+    this payload; source_path is the archive to patch from (None for app.asar).
+    """
+    asar_path = os.path.join(slack_path, "app.asar")
+    backup_path = os.path.join(slack_path, "app.asar.backup")
+
+    manifest = load_manifest(slack_path)
+    if not manifest:
+        print_verbose("No install manifest found, doing a full install")
+        return False, None
+
+    if archive_is_install_result(asar_path, manifest):
+        payload_unchanged = manifest.get("payload_sha256") == payload_sha256
+        if payload_unchanged and not force:
+            return True, None
+        if os.path.exists(backup_path) and file_sha256(backup_path) == manifest.get("original_sha256"):
+            reason = "Forced reinstall" if payload_unchanged else "SlackPolish files changed"
+            print_info(f"{reason}, rebuilding from the clean backup...")
+            return False, backup_path
+        print_verbose("Backup does not match the manifest, patching app.asar in place")
+        return False, None
+
+    # app.asar is not what we wrote last time: most likely a Slack update
+    print_info("app.asar changed since the last install (Slack update?)")
+    if archive_has_injection(asar_path) is False:
+        print_info("Refreshing backup from the new Slack version...")
+        method = backup_file(asar_path, backup_path)
+        print_success(f"Backup refreshed ({method})")
+    else:
+        print_verbose("app.asar already contains SlackPolish code, keeping the existing backup")
+    return False, None
+
+def verify_installation(slack_path, injection_entry=None):
     """Verify that the installation was successful."""
     print_info("Verifying installation...")
 
+    asar_path = os.path.join(slack_path, "app.asar")
+
+    try:
+        with AsarArchive(asar_path) as archive:
+            if injection_entry:
+                candidates = [injection_entry]
+            else:
+                candidates = [path for path, _ in archive.iter_files() if path.endswith('.js')]
+
+            injection_found = None
+            for path in candidates:
+                if archive_entry_has_injection(archive, path):
+                    injection_found = path
+                    break
+
+        if injection_found:
+            print_verbose(f"Injection markers found in {injection_found}")
+            print_success("Installation verification passed - SlackPolish code found")
+            return True
+        else:
+            print_error("Installation verification failed - SlackPolish code not found")
+            return False
+
+    except AsarError as e:
+        print_warning(f"Cannot read app.asar index ({e}), falling back to asar tool")
+        return verify_installation_with_tool(slack_path)
+    except Exception as e:
+        print_warning(f"Cannot verify installation: {e}")
+        return True  # Assume success if we can't verify
+
+def verify_installation_with_tool(slack_path):
+    """Verify the installation by extracting app.asar with the Node.js asar tool."""
     asar_path = os.path.join(slack_path, "app.asar")
     extract_dir = "slack_verify_extract"
 
@@ -617,6 +799,164 @@ def verify_installation(slack_path):
         print_warning(f"Cannot verify installation: {e}")
         return True  # Assume success if we can't verify
 
+def install_into(slack_path, args, injection=None, payload_sha256=None):
+    """
+    Patch one Slack resources directory.
+
+    injection/payload_sha256 may be prebuilt by the caller (fleet mode shares
+    one payload across targets). Returns (exit_code, status).
+    """
+    # Check permissions before proceeding
+    if not check_permissions(slack_path):
+        return 1, "no permission"
+
+    # Setup paths
+    asar_path = os.path.join(slack_path, "app.asar")
+    backup_path = os.path.join(slack_path, "app.asar.backup")
+
+    # Skip or shorten the work when nothing relevant changed since the last install
+    source_path = None
+    if not args.use_asar_tool:
+        if injection is None:
+            injection, payload_sha256 = load_injection_payload()
+        up_to_date, source_path = plan_native_install(slack_path, payload_sha256, args.force)
+        if up_to_date:
+            print_success("SlackPolish is already up to date (same payload, same Slack build)")
+            print_info("Use --force to reinstall anyway.")
+            return 0, "up to date"
+
+    # Create backup
+    if not os.path.exists(backup_path):
+        print_info("Creating backup...")
+        try:
+            method = backup_file(asar_path, backup_path)
+            print_success(f"Backup created ({method})")
+        except Exception as e:
+            print_error(f"Failed to create backup: {e}")
+            print_info("This usually means insufficient permissions. Try running with sudo.")
+            return 1, "backup failed"
+    else:
+        print_info("Backup already exists, skipping...")
+
+    # Patch app.asar
+    injection_entry = None
+    if args.use_asar_tool:
+        if not patch_asar_with_tool(asar_path, args.force):
+            return 1, "patch failed"
+        # The manifest only describes native installs
+        remove_manifest(slack_path)
+    else:
+        print_info("Patching app.asar in place...")
+        try:
+            injection_entry = patch_asar_native(asar_path, args.force, source_path, injection)
+            if not injection_entry:
+                return 1, "patch failed"
+        except InjectionValidationError:
+            return 1, "validation failed"
+        except Exception as e:
+            print_error(f"Error while patching app.asar: {e}")
+            print_info("This usually means insufficient permissions to write to Slack directory.")
+            return 1, "patch failed"
+
+    # Verify installation
+    if not verify_installation(slack_path, injection_entry):
+        print_error("Installation verification failed!")
+        print_info("The installation may not have worked correctly.")
+        print_info("Try running the installer again with sudo.")
+        return 1, "verify failed"
+
+    # Record what this install produced so an identical rerun is a no-op
+    if payload_sha256:
+        try:
+            save_manifest(slack_path, file_sha256(backup_path), payload_sha256, asar_path)
+        except OSError as e:
+            print_warning(f"Could not write install manifest: {e}")
+
+    return 0, "installed"
+
+def expand_fleet_targets(patterns, list_file=None):
+    """Resolve paths/globs (and lines of list_file) to unique resources directories."""
+    patterns = list(patterns or [])
+    if list_file:
+        with open(list_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    patterns.append(line)
+
+    targets = []
+    seen = set()
+    for pattern in patterns:
+        pattern = os.path.expanduser(pattern)
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            # /snap/slack/current and /snap/slack/123 are the same install
+            key = os.path.realpath(path)
+            if key not in seen:
+                seen.add(key)
+                targets.append(path)
+    return targets
+
+_FLEET_ARGS = None
+_FLEET_PAYLOAD = None
+
+def _init_fleet_worker(args, injection, payload_sha256):
+    global VERBOSE, INTERACTIVE, _FLEET_ARGS, _FLEET_PAYLOAD
+    VERBOSE = args.verbose
+    INTERACTIVE = False
+    _FLEET_ARGS = args
+    _FLEET_PAYLOAD = (injection, payload_sha256)
+
+def _run_fleet_target(slack_path):
+    """Install into one target with its output captured. Runs in a worker process."""
+    output = io.StringIO()
+    started = time.monotonic()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            if not os.path.isfile(os.path.join(slack_path, "app.asar")):
+                print_error(f"No app.asar in {slack_path}")
+                code, status = 1, "no app.asar"
+            else:
+                code, status = install_into(slack_path, _FLEET_ARGS, *_FLEET_PAYLOAD)
+        except Exception as e:
+            print_error(f"Unexpected error: {e}")
+            code, status = 1, "error"
+    return slack_path, code, status, time.monotonic() - started, output.getvalue()
+
+def run_fleet(args):
+    """Patch every fleet target in a process pool and print a result table."""
+    targets = expand_fleet_targets(args.fleet, args.fleet_file)
+    if not targets:
+        print_error("No fleet targets matched")
+        return 1
+
+    injection, payload_sha256 = load_injection_payload()
+    jobs = args.jobs or min(len(targets), os.cpu_count() or 1)
+    print_info(f"Patching {len(targets)} Slack installation(s) with {jobs} worker(s), payload {payload_sha256[:12]}")
+
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_fleet_worker,
+                             initargs=(args, injection, payload_sha256)) as executor:
+        for result in executor.map(_run_fleet_target, targets):
+            slack_path, code, status, elapsed, output = result
+            results.append(result)
+            if code != 0 or VERBOSE:
+                print_header(f"Log for {slack_path}")
+                print(output.rstrip())
+
+    width = max(len("TARGET"), *(len(result[0]) for result in results))
+    print(f"\n{'TARGET':<{width}}  {'STATUS':<19}  {'TIME':>7}")
+    for slack_path, code, status, elapsed, _ in results:
+        mark = "✅" if code == 0 else "❌"
+        print(f"{slack_path:<{width}}  {mark} {status:<17}  {elapsed:>6.1f}s")
+
+    failed = sum(1 for result in results if result[1] != 0)
+    if failed:
+        print_error(f"{failed} of {len(results)} installation(s) failed")
+        return 1
+    print_success(f"All {len(results)} installation(s) patched or already up to date")
+    return 0
+
 def main():
     """Main installation function."""
     global VERBOSE
@@ -632,18 +972,28 @@ def main():
             return 1
 
         # Check required files
+        # A prebuilt payload bundle stands in for the individual scripts
         required_files = ["slack-config.js", "slack-text-improver.js", "slack-settings.js", "slack-channel-summary.js", "logo-data.js"]
-        for file in required_files:
-            if not os.path.exists(file):
-                print_error(f"Required file not found: {file}")
+        if os.path.exists(BUNDLE_NAME):
+            print_success(f"Payload bundle found: {BUNDLE_NAME}")
+        else:
+            for file in required_files:
+                if not os.path.exists(file):
+                    print_error(f"Required file not found: {file}")
+                    return 1
+            print_success("All required files found")
+
+        if args.fleet or args.fleet_file:
+            if args.use_asar_tool:
+                print_error("--fleet only works with the built-in ASAR writer (drop --use-asar-tool)")
                 return 1
-        print_success("All required files found")
+            return run_fleet(args)
 
         # Find Slack installation
         if args.slack_path:
             slack_path = args.slack_path
         else:
-            slack_path = find_slack_installation_linux()
+            slack_path = find_slack_installation_linux(use_cache=not args.rescan)
 
         if not slack_path:
             print_error("Could not find Slack installation")
@@ -654,95 +1004,16 @@ def main():
             print_info("Try: sudo python3 install-slack-LINUX-X64.py --slack-path '/path/to/slack/resources'")
             return 1
 
-        # Check permissions before proceeding
-        if not check_permissions(slack_path):
-            return 1
-
-        # Check asar tool
-        asar_tool = check_asar_tool_linux()
-        if not asar_tool:
-            asar_tool = install_asar_tool_linux()
-            if not asar_tool:
-                print_error("Could not install asar tool")
-                return 1
-        print_success(f"asar tool available: {asar_tool}")
-
-        # Setup paths
-        asar_path = os.path.join(slack_path, "app.asar")
-        backup_path = os.path.join(slack_path, "app.asar.backup")
-        extract_dir = "slack_temp_extract"
-    
-        # Create backup
-        if not os.path.exists(backup_path):
-            print_info("Creating backup...")
-            try:
-                shutil.copy2(asar_path, backup_path)
-                print_success("Backup created")
-            except Exception as e:
-                print_error(f"Failed to create backup: {e}")
-                print_info("This usually means insufficient permissions. Try running with sudo.")
-                return 1
-        else:
-            print_info("Backup already exists, skipping...")
-
-        # Extract
-        print_info("Extracting app.asar...")
-        try:
-            if os.path.exists(extract_dir):
-                shutil.rmtree(extract_dir)
-            if not extract_asar(asar_path, extract_dir, asar_tool):
-                print_error("Failed to extract app.asar")
-                print_info("This usually means the asar file is corrupted or locked.")
-                return 1
-        except Exception as e:
-            print_error(f"Error during extraction: {e}")
-            return 1
-    
-        # Find injection file
-        injection_file = find_injection_file(extract_dir)
-        if not injection_file:
-            print_error("Could not find suitable injection file")
-            return 1
-
-        # Validate file
-        if not validate_injection_file(injection_file, args.force):
-            print_error("File validation failed")
-            return 1
-
-        # Inject scripts
-        print_info("Injecting SlackPolish Text Improver...")
-        try:
-            if not inject_scripts(injection_file, "slack-config.js"):
-                print_error("Failed to inject scripts")
-                return 1
-        except Exception as e:
-            print_error(f"Error during script injection: {e}")
-            return 1
-
-        # Repack
-        print_info("Repacking app.asar...")
-        try:
-            if not repack_asar(extract_dir, asar_path, asar_tool):
-                print_error("Failed to repack app.asar")
-                print_info("This usually means insufficient permissions to write to Slack directory.")
-                return 1
-        except Exception as e:
-            print_error(f"Error during repacking: {e}")
-            return 1
-
-        # Cleanup temporary directory
-        try:
-            if os.path.exists(extract_dir):
-                shutil.rmtree(extract_dir)
-        except Exception as e:
-            print_warning(f"Could not clean up temporary directory: {e}")
+        code, status = install_into(slack_path, args)
+        if code != 0:
+            return code
+        if status == "up to date":
+            save_location(slack_path)
+            return 0
 
-        # Verify installation
-        if not verify_installation(slack_path):
-            print_error("Installation verification failed!")
-            print_info("The installation may not have worked correctly.")
-            print_info("Try running the installer again with sudo.")
-            return 1
+        # Remember where Slack lives (with the patched app.asar stat) for next time
+        if save_location(slack_path):
+            print_verbose("Saved Slack location to discovery cache")
 
         print_header("🎉 Installation completed successfully!")
         print("Next steps:")
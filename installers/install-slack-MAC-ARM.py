@@ -17,6 +17,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+from slackpolish_payload import BUNDLE_NAME, build_bundle, write_bundle
+
 
 GREEN = "\033[92m"
 YELLOW = "\033[93m"
@@ -30,6 +32,11 @@ REPO_ROOT = SCRIPT_DIR.parent
 
 RUNTIME_FILES = [
     "installers/launch-slackpolish-MAC-ARM.py",
+    "installers/slackpolish_devtools.py",
+    "installers/slackpolish_jsmin.py",
+    "installers/slackpolish_metrics.py",
+    "installers/slackpolish_payload.py",
+    "installers/slackpolish_runtime.py",
     "slack-config.js",
     "logo-data.js",
     "slack-text-improver.js",
@@ -145,6 +152,11 @@ def copy_runtime_files(destination):
         shutil.copy2(source, target)
         print_verbose(f"Copied {source} -> {target}")
 
+    # Release build: debug test commands stripped, scripts minified
+    bundle = build_bundle(destination, strip_debug=True, minify=True)
+    write_bundle(bundle, destination / BUNDLE_NAME)
+    print_verbose(f"Built payload bundle {bundle.sha256[:12]} ({bundle.size} bytes)")
+
 
 def write_command_file(path, runtime_dir, attach_only=False):
     launcher_path = runtime_dir / "launch-slackpolish-MAC-ARM.py"
@@ -13,6 +13,9 @@ import argparse
 from pathlib import Path
 import time
 
+from slackpolish_discovery import check_known_paths, load_cached_location, save_location, search_roots
+from slackpolish_fileops import backup_file, replace_file, temp_path_for
+
 # ANSI colors (Windows may not support these, but we'll include them)
 GREEN = "\033[92m"
 YELLOW = "\033[93m"
@@ -73,10 +76,17 @@ def detect_windows_system():
 
     return True
 
-def find_slack_installation_windows():
+def find_slack_installation_windows(use_cache=True, parallel=True):
     """Find Slack installation on Windows."""
     print_info("Searching for Slack installation on Windows...")
 
+    if use_cache:
+        cached_path = load_cached_location()
+        if cached_path:
+            print_success(f"Found Slack at: {cached_path} (cached)")
+            return cached_path
+        print_verbose("No valid cached Slack location")
+
     # Windows-specific paths (prioritized by commonality)
     possible_paths = [
         str(Path.home() / "AppData" / "Local" / "slack" / "resources"),           # Most common (user install)
@@ -87,31 +97,31 @@ def find_slack_installation_windows():
         str(Path("C:\\") / "slack" / "resources"),                               # Root install
     ]
     
-    for path in possible_paths:
+    def report_check(path):
         print_verbose(f"Checking: {path}")
-        if os.path.exists(path) and os.path.isfile(os.path.join(path, "app.asar")):
-            print_success(f"Found Slack at: {path}")
-            return path
-        else:
-            print_verbose(f"   ❌ Not found")
-    
-    # Deep search in common directories
+
+    slack_path = check_known_paths(possible_paths, on_check=report_check)
+    if slack_path:
+        print_success(f"Found Slack at: {slack_path}")
+        save_location(slack_path)
+        return slack_path
+    print_verbose("   ❌ Not found in common locations")
+
+    # Bounded search in common directories
     print_verbose("Performing deep search...")
-    search_dirs = [
+    search_roots_list = [
         str(Path.home() / "AppData" / "Local"),
         str(Path.home() / "AppData" / "Roaming"),
         "C:\\Program Files",
         "C:\\Program Files (x86)",
     ]
-    
-    for search_dir in search_dirs:
-        if os.path.exists(search_dir):
-            for root, dirs, files in os.walk(search_dir):
-                if "slack" in root.lower() and "app.asar" in files:
-                    slack_path = root
-                    print_success(f"Found Slack at: {slack_path}")
-                    return slack_path
-    
+
+    slack_path = search_roots(search_roots_list, parallel=parallel)
+    if slack_path:
+        print_success(f"Found Slack at: {slack_path}")
+        save_location(slack_path)
+        return slack_path
+
     return None
 
 def check_asar_tool_windows():
@@ -350,12 +360,17 @@ def extract_asar(asar_path, output_dir, asar_tool):
         return False
 
 def repack_asar(input_dir, asar_path, asar_tool):
-    """Repack ASAR archive."""
+    """Repack ASAR archive next to asar_path, then swap it in atomically."""
+    temp_path = temp_path_for(asar_path)
     try:
-        subprocess.run([asar_tool, "pack", input_dir, asar_path], check=True)
+        subprocess.run([asar_tool, "pack", input_dir, temp_path], check=True)
+        replace_file(temp_path, asar_path)
         return True
-    except subprocess.SubprocessError:
+    except (subprocess.SubprocessError, OSError):
         return False
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -380,6 +395,8 @@ Examples:
     parser.add_argument('--force', action='store_true',
                        help='Force installation even if validation fails')
     parser.add_argument('--slack-path', help='Specify Slack path manually')
+    parser.add_argument('--rescan', action='store_true',
+                       help='Ignore the cached Slack location and search again')
     
     return parser.parse_args()
 
@@ -431,7 +448,7 @@ def main():
     if args.slack_path:
         slack_path = args.slack_path
     else:
-        slack_path = find_slack_installation_windows()
+        slack_path = find_slack_installation_windows(use_cache=not args.rescan)
 
     if not slack_path:
         print_error("Could not find Slack installation")
@@ -459,8 +476,8 @@ def main():
     # Create backup
     if not os.path.exists(backup_path):
         print_info("Creating backup...")
-        shutil.copy2(asar_path, backup_path)
-        print_success("Backup created")
+        method = backup_file(asar_path, backup_path)
+        print_success(f"Backup created ({method})")
     
     # Extract
     print_info("Extracting app.asar...")
@@ -495,6 +512,9 @@ def main():
     
     # Cleanup
     shutil.rmtree(extract_dir)
+
+    # Remember where Slack lives (with the patched app.asar stat) for next time
+    save_location(slack_path)
     
     print_header("🎉 Installation completed successfully!")
     print("Next steps:")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+SlackPolish runtime launcher for Linux x64.
+
+Like the macOS launcher, this does not touch Slack's installation or its
+app.asar. It:
+1. Starts Slack with a Chrome DevTools remote debugging port
+2. Connects to Slack page targets over the DevTools protocol
+3. Injects SlackPolish directly into Slack's page world
+
+Updating SlackPolish is a file copy plus reinjection; Slack updates need no
+re-install. State (status, log) lives under $XDG_STATE_HOME/slackpolish and
+the single-instance lock under $XDG_RUNTIME_DIR. The shared runtime core
+lives in slackpolish_runtime.py.
+
+Any Chromium-based binary can stand in for Slack when testing, e.g.:
+  launch-slackpolish-LINUX-X64.py --slack-path chromium \\
+      --slack-arg=--headless=new --slack-arg=https://app.slack.com/client/T0/C0
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from slackpolish_runtime import (
+    SlackPolishLauncher,
+    add_common_arguments,
+    launcher_options,
+    print_error,
+    print_info,
+    print_launcher_stats,
+    print_verbose,
+    run_control_command,
+    run_launcher,
+    start_logging,
+)
+
+
+STATE_DIR = Path(os.environ.get("XDG_STATE_HOME") or Path.home() / ".local" / "state") / "slackpolish"
+# Slack's user data dir for the deb/rpm package (snap and flatpak keep theirs elsewhere)
+SLACK_CONFIG_DIR = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config") / "Slack"
+if os.environ.get("XDG_RUNTIME_DIR"):
+    LOCK_PATH = Path(os.environ["XDG_RUNTIME_DIR"]) / "slackpolish-linux-launcher.lock"
+else:
+    LOCK_PATH = Path(tempfile.gettempdir()) / f"slackpolish-linux-launcher-{os.getuid()}.lock"
+
+
+def find_slack_executable():
+    candidates = [
+        shutil.which("slack"),
+        "/usr/bin/slack",
+        "/usr/lib/slack/slack",
+        "/snap/bin/slack",
+        "/var/lib/flatpak/exports/bin/com.slack.Slack",
+        str(Path.home() / ".local" / "share" / "flatpak" / "exports" / "bin" / "com.slack.Slack"),
+    ]
+
+    for candidate in candidates:
+        if candidate and os.path.exists(candidate):
+            return candidate
+    return None
+
+
+class SlackPolishLinuxLauncher(SlackPolishLauncher):
+    title = "🐧 SlackPolish Runtime Launcher for Linux"
+    devtools_active_port_path = SLACK_CONFIG_DIR / "DevToolsActivePort"
+
+    def __init__(self, slack_args=(), **options):
+        super().__init__(STATE_DIR, LOCK_PATH, **options)
+        self.slack_args = list(slack_args)
+
+    def _bring_slack_to_front(self):
+        # A second Slack invocation hands over to the running instance, which raises its window
+        if not self.slack_executable:
+            return
+        try:
+            subprocess.Popen(
+                [self.slack_executable],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except Exception as error:
+            print_verbose(f"Could not bring Slack to the front: {error}")
+
+    def _quit_slack(self):
+        print_info("Requested Slack shutdown before launch")
+        self._stop_processes("slack")
+
+    def _launch_slack(self):
+        command = [self.slack_executable, *self._debug_args(), *self.slack_args]
+
+        print_info("Launching Slack with remote debugging enabled...")
+        print_verbose("Launch command: " + " ".join(command))
+        # Own session so Slack outlives the launcher's terminal
+        subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Launch SlackPolish on Linux without modifying Slack's app.asar"
+    )
+    add_common_arguments(parser)
+    parser.add_argument(
+        "--slack-arg",
+        action="append",
+        default=[],
+        help="Extra argument passed to Slack (repeatable)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.control:
+        return run_control_command(LOCK_PATH, args.control)
+    if args.stats:
+        return print_launcher_stats(LOCK_PATH, args.stats)
+    start_logging(STATE_DIR / "launcher.log", args.verbose)
+
+    slack_executable = args.slack_path or find_slack_executable()
+    if slack_executable and not os.path.isabs(slack_executable):
+        slack_executable = shutil.which(slack_executable) or slack_executable
+
+    if not slack_executable and not args.attach_only:
+        print_error("Could not find Slack executable")
+        return 1
+
+    if slack_executable and not os.path.exists(slack_executable):
+        print_error(f"Slack executable not found: {slack_executable}")
+        return 1
+
+    launcher = SlackPolishLinuxLauncher(
+        slack_args=args.slack_arg,
+        slack_executable=slack_executable,
+        **launcher_options(args),
+    )
+    return run_launcher(launcher)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
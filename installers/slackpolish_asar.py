@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Native ASAR reader/writer used by the SlackPolish installers.
+
+Electron's ASAR format is a small header followed by the raw file data:
+
+    [uint32 4][uint32 header_size]            size pickle (8 bytes)
+    [uint32 payload][uint32 len][json][pad]   header pickle (header_size bytes)
+    [file data ...]                           offsets are relative to here
+
+The JSON index describes directories ({"files": {...}}), packed files
+({"size": n, "offset": "n"}), unpacked files ({"unpacked": true}) and
+symlinks ({"link": "..."}).
+
+This module memory-maps the archive, reads individual entries in place and
+writes a new archive in one streaming pass with only the changed entries
+replaced. No Node.js or `asar` CLI is needed.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+
+ALIGNMENT = 4
+DEFAULT_INTEGRITY_BLOCK_SIZE = 4 * 1024 * 1024
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class AsarError(RuntimeError):
+    pass
+
+
+def _align(size):
+    return size + (ALIGNMENT - size % ALIGNMENT) % ALIGNMENT
+
+
+def encode_header(header):
+    """Serialize an ASAR index into the size pickle + header pickle bytes."""
+    json_bytes = json.dumps(header, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    payload_size = _align(4 + len(json_bytes))
+    header_pickle = (
+        struct.pack("<II", payload_size, len(json_bytes))
+        + json_bytes
+        + b"\0" * (payload_size - 4 - len(json_bytes))
+    )
+    size_pickle = struct.pack("<II", 4, len(header_pickle))
+    return size_pickle + header_pickle
+
+
+def compute_integrity(data, block_size=DEFAULT_INTEGRITY_BLOCK_SIZE):
+    """Build an integrity record matching the one produced by `asar pack`."""
+    view = memoryview(data)
+    blocks = [
+        hashlib.sha256(view[start:start + block_size]).hexdigest()
+        for start in range(0, len(view), block_size)
+    ] or [hashlib.sha256(b"").hexdigest()]
+    return {
+        "algorithm": "SHA256",
+        "hash": hashlib.sha256(view).hexdigest(),
+        "blockSize": block_size,
+        "blocks": blocks,
+    }
+
+
+def _split_path(path):
+    return [part for part in path.replace("\\", "/").split("/") if part and part != "."]
+
+
+class AsarArchive:
+    """Read-only, memory-mapped view of an ASAR archive."""
+
+    def __init__(self, path):
+        self.path = path
+        self._handle = None
+        self._map = None
+        self.header = None
+        self.data_offset = 0
+        self._open()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _open(self):
+        self._handle = open(self.path, "rb")
+        try:
+            file_size = os.fstat(self._handle.fileno()).st_size
+            if file_size < 16:
+                raise AsarError(f"File is too small to be an ASAR archive: {self.path}")
+
+            self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+            pickle_size, header_size = struct.unpack_from("<II", self._map, 0)
+            if pickle_size != 4 or header_size < 8 or 8 + header_size > file_size:
+                raise AsarError(f"Invalid ASAR size header in {self.path}")
+
+            payload_size, json_size = struct.unpack_from("<II", self._map, 8)
+            if 4 + payload_size != header_size or json_size > payload_size - 4:
+                raise AsarError(f"Invalid ASAR header pickle in {self.path}")
+
+            try:
+                self.header = json.loads(bytes(self._map[16:16 + json_size]).decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as error:
+                raise AsarError(f"Could not decode ASAR index in {self.path}: {error}")
+
+            if "files" not in self.header:
+                raise AsarError(f"ASAR index has no root directory in {self.path}")
+            self.data_offset = 8 + header_size
+        except Exception:
+            self.close()
+            raise
+
+    def iter_entries(self, node=None, prefix=""):
+        """Yield (path, entry) for every file-like entry in the index."""
+        node = self.header if node is None else node
+        for name, entry in node.get("files", {}).items():
+            path = f"{prefix}/{name}" if prefix else name
+            if "files" in entry:
+                yield from self.iter_entries(entry, path)
+            else:
+                yield path, entry
+
+    def iter_files(self):
+        """Yield (path, entry) for entries whose data lives inside the archive."""
+        for path, entry in self.iter_entries():
+            if "link" in entry or entry.get("unpacked"):
+                continue
+            yield path, entry
+
+    def get_entry(self, path):
+        node = self.header
+        for part in _split_path(path):
+            children = node.get("files")
+            if children is None or part not in children:
+                raise KeyError(path)
+            node = children[part]
+        return node
+
+    def byte_range(self, path):
+        """Return the absolute (start, end) offsets of a packed file."""
+        entry = self.get_entry(path)
+        if "files" in entry or "link" in entry:
+            raise AsarError(f"Not a regular file: {path}")
+        if entry.get("unpacked"):
+            raise AsarError(f"File is stored outside the archive: {path}")
+        offset, size = int(entry["offset"]), int(entry["size"])
+        start = self.data_offset + offset
+        end = start + size
+        if offset < 0 or size < 0 or end > len(self._map):
+            raise AsarError(f"Entry extends past end of archive: {path}")
+        return start, end
+
+    def read_file(self, path):
+        start, end = self.byte_range(path)
+        return bytes(self._map[start:end])
+
+    def find(self, path, needle, start=0, end=None):
+        """Search a packed file in place; returns the offset within the file or -1."""
+        file_start, file_end = self.byte_range(path)
+        limit = file_end if end is None else min(file_end, file_start + end)
+        position = self._map.find(needle, file_start + start, limit)
+        return position - file_start if position != -1 else -1
+
+    def rfind(self, path, needle, start=0, end=None):
+        """Like find(), but scans backwards so markers near the end touch few pages."""
+        file_start, file_end = self.byte_range(path)
+        limit = file_end if end is None else min(file_end, file_start + end)
+        position = self._map.rfind(needle, file_start + start, limit)
+        return position - file_start if position != -1 else -1
+
+    def write(self, output_path, replacements=None):
+        """
+        Write a copy of this archive to output_path in a single pass.
+
+        replacements maps archive paths to their new bytes. Every other packed
+        file is streamed straight from the memory map. Offsets are reassigned
+        in original data order and integrity records are refreshed for
+        replaced files.
+        """
+        replacements = {
+            "/".join(_split_path(path)): data
+            for path, data in (replacements or {}).items()
+        }
+        header = json.loads(json.dumps(self.header))
+
+        for path, data in replacements.items():
+            try:
+                entry = self.get_entry(path)
+            except KeyError:
+                raise AsarError(f"Cannot replace missing entry: {path}")
+            if "files" in entry or "link" in entry or entry.get("unpacked"):
+                raise AsarError(f"Cannot replace non-packed entry: {path}")
+
+        packed = []
+        for path, entry in self.iter_files():
+            packed.append((int(entry["offset"]), path))
+        packed.sort()
+
+        layout = []
+        next_offset = 0
+        for original_offset, path in packed:
+            entry = _entry_in(header, path)
+            if path in replacements:
+                data = replacements[path]
+                size = len(data)
+                if "integrity" in entry:
+                    block_size = entry["integrity"].get("blockSize", DEFAULT_INTEGRITY_BLOCK_SIZE)
+                    entry["integrity"] = compute_integrity(data, block_size)
+            else:
+                # Validated up front so a corrupt index fails before anything is written
+                data = None
+                start, end = self.byte_range(path)
+                size = end - start
+            entry["offset"] = str(next_offset)
+            entry["size"] = size
+            layout.append((path, original_offset, size, data))
+            next_offset += size
+
+        with open(output_path, "wb") as output:
+            output.write(encode_header(header))
+            source = memoryview(self._map)
+            try:
+                for path, original_offset, size, data in layout:
+                    if data is not None:
+                        output.write(data)
+                        continue
+                    start = self.data_offset + original_offset
+                    for chunk_start in range(start, start + size, COPY_CHUNK_SIZE):
+                        output.write(source[chunk_start:min(chunk_start + COPY_CHUNK_SIZE, start + size)])
+            finally:
+                source.release()
+
+        return next_offset
+
+
+def _entry_in(header, path):
+    node = header
+    for part in _split_path(path):
+        node = node["files"][part]
+    return node
+
+
+def is_asar_archive(path):
+    try:
+        with AsarArchive(path):
+            return True
+    except (OSError, ValueError, AsarError):
+        return False
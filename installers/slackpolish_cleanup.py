@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Single-pass removal of old SlackPolish code from a Slack bundle.
+
+Every span the installers ever injected contains a recognisable anchor
+(an injection marker, a per-file section marker, a `window.SLACKPOLISH_*`
+global, a SlackPolish class name, ...). One literal scan finds those anchors left to right, each
+anchor's span is located with a bounded `str.find`/`re.match`, and
+the surviving text is joined once at the end. The bundle is therefore
+scanned once and copied once, however many stale injections it contains.
+IIFE openers and closers are followed forward through the same pass, so
+SlackPolish-looking names in Slack's own code never trigger a rescan.
+
+Slack's own code is never rewritten: whitespace and semicolons are only
+tidied at the seams of removed spans.
+"""
+
+import re
+from collections import namedtuple
+
+
+RemovedSpan = namedtuple("RemovedSpan", ["kind", "start", "end"])
+CleanupResult = namedtuple("CleanupResult", ["content", "removed"])
+
+BLOCK_END_MARKERS = {
+    "SLACKPOLISH": "// === SLACKPOLISH INJECTION END ===",
+    "SLACK TEXT IMPROVER": "// === SLACK TEXT IMPROVER INJECTION END ===",
+}
+SECTION_PREFIX = "// === "
+
+# Every anchor starts on "Slack", "SLACK" or "// ===" (prefixes such as
+# `window.` are lookbehinds), so a literal-only scan finds the candidates and
+# the full alternation only runs at those few positions.
+CANDIDATE_RE = re.compile(r"Slack|SLACK|// ===")
+ANCHOR_RE = re.compile(
+    r"(?P<block>// === (?P<block_name>SLACKPOLISH|SLACK TEXT IMPROVER) INJECTION START ===)"
+    r"|(?P<orphan_end>// === (?:SLACKPOLISH|SLACK TEXT IMPROVER) INJECTION END ===)"
+    r"|(?P<section>// === (?:SLACK-TEXT-IMPROVER|SLACK-SETTINGS|SLACK-CHANNEL-SUMMARY|LOGO-DATA)\.JS ===)"
+    r"|(?P<global_object>(?<=window\.)(?:SLACKPOLISH_CONFIG|SlackPolishUtils)\s*=)"
+    r"|(?P<global_value>(?<=window\.)(?:SLACKPOLISH_LOGO_BASE64|SLACKPOLISH_LOGO_DATA)\s*=)"
+    r"|(?P<class>(?<=class )Slack(?:TextImprover|Settings|ChannelSummary)\s*\{)"
+    r"|(?P<line_comment>(?<=// )SlackPolish)"
+    r"|(?P<block_comment>(?<=/\* )SlackPolish)"
+    r"|(?P<assignment>SlackPolish[A-Za-z]*\s*[=:])"
+    r"|(?P<iife>SlackTextImprover|SlackSettings|SlackChannelSummary)"
+)
+ANCHOR_PREFIX_LENGTHS = {
+    "global_object": len("window."),
+    "global_value": len("window."),
+    "class": len("class "),
+    "line_comment": len("// "),
+    "block_comment": len("/* "),
+}
+TRAILING_END_MARKERS_RE = re.compile(
+    r"(?:;?\s*// === (?:SLACKPOLISH|SLACK TEXT IMPROVER) INJECTION END ===)*;?\s*"
+)
+TRAILING_WHITESPACE_RE = re.compile(r";?\s*")
+CLASS_END_RE = re.compile(r"\}\s*\)\(\);?")
+IIFE_START_RE = re.compile(r"\(function\(\)\s*\{\s*['\"]use strict['\"];")
+IIFE_OPEN = "(function()"
+IIFE_CLOSE = "})()"
+
+
+class _LiteralTracker:
+    """
+    Occurrences of one literal, followed left to right alongside the anchor scan.
+
+    Queries must come with non-decreasing positions; every occurrence is found
+    once, so a whole pass costs one scan of content.
+    """
+
+    def __init__(self, content, literal):
+        self.content = content
+        self.literal = literal
+        self.last = -1
+        self.next = content.find(literal)
+
+    def last_before(self, position):
+        """Start of the last occurrence that ends at or before position, or -1."""
+        while self.next != -1 and self.next + len(self.literal) <= position:
+            self.last = self.next
+            self.next = self.content.find(self.literal, self.next + 1)
+        return self.last
+
+    def first_from(self, position):
+        """Start of the first occurrence at or after position, or -1."""
+        self.last_before(position)
+        found = self.next
+        while found != -1 and found < position:
+            found = self.content.find(self.literal, found + 1)
+        return found
+
+
+def _include_semicolon(content, end):
+    return end + 1 if content.startswith(";", end) else end
+
+
+def _find_span(content, match, floor, iife_opens, iife_closes):
+    """
+    Return (start, end) of the span for an anchor match, or None to skip it.
+
+    iife_opens and iife_closes are the pass's _LiteralTrackers for IIFE_OPEN
+    and IIFE_CLOSE.
+    """
+    kind = match.lastgroup
+    start = match.start() - ANCHOR_PREFIX_LENGTHS.get(kind, 0)
+    anchor_end = match.end()
+
+    if kind == "block":
+        start = _absorb_separator(content, start, floor)
+        end_marker = BLOCK_END_MARKERS[match.group("block_name")]
+        end = content.find(end_marker, anchor_end)
+        if end == -1:
+            # Unterminated block: drop the marker, sections inside still get caught
+            return start, TRAILING_WHITESPACE_RE.match(content, anchor_end).end()
+        return start, TRAILING_END_MARKERS_RE.match(content, end).end()
+
+    if kind == "orphan_end":
+        return start, TRAILING_END_MARKERS_RE.match(content, anchor_end).end()
+
+    if kind == "section":
+        end = content.find(SECTION_PREFIX, anchor_end)
+        return start, len(content) if end == -1 else end
+
+    if kind == "global_object":
+        end = content.find("}", anchor_end)
+        return None if end == -1 else (start, _include_semicolon(content, end + 1))
+
+    if kind == "global_value":
+        end = content.find(";", anchor_end)
+        return None if end == -1 else (start, end + 1)
+
+    if kind == "class":
+        end_match = CLASS_END_RE.search(content, anchor_end)
+        return (start, end_match.end()) if end_match else None
+
+    if kind == "line_comment":
+        end = content.find("\n", anchor_end)
+        return start, len(content) if end == -1 else end + 1
+
+    if kind == "block_comment":
+        end = content.find("*/", anchor_end)
+        return None if end == -1 else (start, end + 2)
+
+    if kind == "assignment":
+        candidates = [
+            position
+            for position in (content.find(";", anchor_end), content.find("}", anchor_end))
+            if position != -1
+        ]
+        return (start, min(candidates) + 1) if candidates else None
+
+    if kind == "iife":
+        # Remove the enclosing `(function(){'use strict'; ... })();` only if
+        # that IIFE is still open at the class name
+        open_position = iife_opens.last_before(start)
+        if open_position < floor or not IIFE_START_RE.match(content, open_position):
+            return None
+        if iife_closes.last_before(start) >= open_position:
+            return None
+        end = iife_closes.first_from(anchor_end)
+        if end == -1:
+            return None
+        return open_position, _include_semicolon(content, end + len(IIFE_CLOSE))
+
+    return None
+
+
+def _absorb_separator(content, start, floor):
+    """
+    Include the lone `;` line the injector writes before an injection block.
+
+    `...})();\\n;\\n// === SLACKPOLISH INJECTION START ===` becomes `...})();\\n`.
+    """
+    position = start
+    while position > floor and content[position - 1] in " \t\r\n":
+        position -= 1
+    if position > floor and content[position - 1] == ";":
+        if position - 1 == floor or content[position - 2] == "\n":
+            return position - 1
+    return start
+
+
+def remove_slackpolish_code(content):
+    """Strip every known SlackPolish span from content in a single pass."""
+    pieces = []
+    removed = []
+    cursor = 0
+    position = 0
+    iife_opens = _LiteralTracker(content, IIFE_OPEN)
+    iife_closes = _LiteralTracker(content, IIFE_CLOSE)
+
+    while True:
+        candidate = CANDIDATE_RE.search(content, position)
+        if not candidate:
+            break
+
+        match = ANCHOR_RE.match(content, candidate.start())
+        if not match:
+            position = candidate.end()
+            continue
+
+        span = _find_span(content, match, cursor, iife_opens, iife_closes)
+        if span is None or span[0] < cursor:
+            position = match.end()
+            continue
+
+        start, end = span
+        pieces.append(content[cursor:start])
+        removed.append(RemovedSpan(match.lastgroup, start, end))
+        cursor = position = end
+
+    if not removed:
+        return CleanupResult(content, removed)
+
+    pieces.append(content[cursor:])
+    return CleanupResult("".join(pieces), removed)
+
+
+def summarize_removed(removed):
+    """Return [(kind, count, characters)] in first-seen order."""
+    summary = {}
+    for span in removed:
+        count, characters = summary.get(span.kind, (0, 0))
+        summary[span.kind] = (count + 1, characters + span.end - span.start)
+    return [(kind, count, characters) for kind, (count, characters) in summary.items()]
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Asyncio Chrome DevTools protocol client for the SlackPolish runtime launcher.
+
+A single browser-level WebSocket carries every Slack page target. Pages are
+attached as flattened `Target.attachToTarget` sessions, so their commands and
+events travel over the same connection tagged with a `sessionId`. Commands
+are pipelined and matched to their responses by id through futures; events
+are routed to subscribers instead of being dropped.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import struct
+import time
+import urllib.parse
+
+
+COMMAND_TIMEOUT_SECONDS = 10
+RECEIVE_BUFFER_SIZE = 256 * 1024
+OPCODE_CONTINUATION = 0x0
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+
+class DevToolsProtocolError(RuntimeError):
+    pass
+
+
+def mask_payload(payload, mask_key):
+    """XOR payload with the repeating 4-byte mask as one big-integer operation."""
+    length = len(payload)
+    if not length:
+        return b""
+    repeated = (mask_key * (length // 4 + 1))[:length]
+    masked = int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")
+    return masked.to_bytes(length, "big")
+
+
+def encode_frame_header(length, opcode=OPCODE_TEXT, masked=True):
+    first_byte = 0x80 | opcode
+    mask_bit = 0x80 if masked else 0
+    if length < 126:
+        return struct.pack("!BB", first_byte, mask_bit | length)
+    if length < (1 << 16):
+        return struct.pack("!BBH", first_byte, mask_bit | 126, length)
+    return struct.pack("!BBQ", first_byte, mask_bit | 127, length)
+
+
+class _WebSocketProtocol(asyncio.BufferedProtocol):
+    """
+    Reads straight into a reusable bytearray (the event loop's recv_into) and
+    slices complete frames out of it with a memoryview. Unread bytes are moved
+    to the front only when the tail runs out; the buffer grows only for
+    frames larger than itself. Fragmented messages are reassembled and pings
+    are answered with pongs.
+    """
+
+    def __init__(self):
+        self.transport = None
+        self.buffer = bytearray(RECEIVE_BUFFER_SIZE)
+        self.start = 0
+        self.end = 0
+        self.needed = 0
+        # Opcode and payloads of a fragmented message still waiting for its FIN frame
+        self.fragment_opcode = None
+        self.fragments = []
+        self.handshake = asyncio.get_running_loop().create_future()
+        self.messages = asyncio.Queue()
+        self.can_write = asyncio.Event()
+        self.can_write.set()
+        self.error = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def get_buffer(self, sizehint):
+        if self.end == len(self.buffer) or self.needed > len(self.buffer) - self.start:
+            self._compact()
+        return memoryview(self.buffer)[self.end:]
+
+    def buffer_updated(self, nbytes):
+        self.end += nbytes
+        try:
+            self._parse()
+        except DevToolsProtocolError as error:
+            self._fail(error)
+
+    def connection_lost(self, exc):
+        self._fail(DevToolsProtocolError("WebSocket connection closed unexpectedly"))
+
+    def pause_writing(self):
+        self.can_write.clear()
+
+    def resume_writing(self):
+        self.can_write.set()
+
+    async def drain(self):
+        await self.can_write.wait()
+        if self.error:
+            raise self.error
+
+    def _compact(self):
+        pending = self.end - self.start
+        if self.needed > len(self.buffer):
+            grown = bytearray(max(self.needed, len(self.buffer) * 2))
+            grown[:pending] = memoryview(self.buffer)[self.start:self.end]
+            self.buffer = grown
+        elif self.start:
+            self.buffer[:pending] = self.buffer[self.start:self.end]
+        self.start = 0
+        self.end = pending
+
+    def _parse(self):
+        if not self.handshake.done():
+            header_end = self.buffer.find(b"\r\n\r\n", self.start, self.end)
+            if header_end < 0:
+                self.needed = self.end - self.start + 1
+                return
+            response = bytes(self.buffer[self.start:header_end])
+            self.start = header_end + 4
+            self.handshake.set_result(response.decode("utf-8", errors="replace"))
+
+        view = memoryview(self.buffer)
+        while self.end - self.start >= 2:
+            first_byte, second_byte = self.buffer[self.start], self.buffer[self.start + 1]
+            final = (first_byte & 0x80) != 0
+            opcode = first_byte & 0x0F
+            masked = (second_byte & 0x80) != 0
+            length = second_byte & 0x7F
+            offset = self.start + 2
+            if length == 126:
+                if self.end - offset < 2:
+                    break
+                length = struct.unpack_from("!H", self.buffer, offset)[0]
+                offset += 2
+            elif length == 127:
+                if self.end - offset < 8:
+                    break
+                length = struct.unpack_from("!Q", self.buffer, offset)[0]
+                offset += 8
+
+            mask_end = offset + (4 if masked else 0)
+            frame_end = mask_end + length
+            if frame_end > self.end:
+                self.needed = frame_end - self.start
+                break
+
+            payload = view[mask_end:frame_end]
+            if masked:
+                payload = mask_payload(payload, bytes(self.buffer[offset:mask_end]))
+            self.start = frame_end
+            self.needed = 0
+
+            if opcode == OPCODE_CLOSE:
+                raise DevToolsProtocolError("WebSocket connection closed by DevTools")
+            if opcode == OPCODE_PING:
+                self._send_pong(payload)
+            elif opcode in (OPCODE_TEXT, OPCODE_BINARY):
+                if self.fragment_opcode is not None:
+                    raise DevToolsProtocolError("WebSocket message started inside a fragmented message")
+                if final:
+                    self._deliver(opcode, payload)
+                else:
+                    self.fragment_opcode = opcode
+                    self.fragments = [bytes(payload)]
+            elif opcode == OPCODE_CONTINUATION:
+                if self.fragment_opcode is None:
+                    raise DevToolsProtocolError("WebSocket continuation frame without a message")
+                self.fragments.append(bytes(payload))
+                if final:
+                    self._deliver(self.fragment_opcode, b"".join(self.fragments))
+                    self.fragment_opcode = None
+                    self.fragments = []
+
+        if self.start == self.end:
+            self.start = self.end = 0
+
+    def _deliver(self, opcode, payload):
+        # DevTools only sends text; binary messages have no reader
+        if opcode == OPCODE_TEXT:
+            self.messages.put_nowait(str(payload, "utf-8", errors="replace"))
+
+    def _send_pong(self, payload):
+        if self.transport is None or self.transport.is_closing():
+            return
+        mask_key = os.urandom(4)
+        self.transport.writelines(
+            [encode_frame_header(len(payload), OPCODE_PONG), mask_key, mask_payload(payload, mask_key)]
+        )
+
+    def _fail(self, error):
+        if self.error:
+            return
+        self.error = error
+        if not self.handshake.done():
+            self.handshake.set_exception(error)
+        self.messages.put_nowait(error)
+        self.can_write.set()
+
+
+class SimpleWebSocketClient:
+    """Minimal client side of RFC 6455: text frames out, text frames in."""
+
+    def __init__(self, websocket_url):
+        parsed = urllib.parse.urlparse(websocket_url)
+        if parsed.scheme != "ws":
+            raise ValueError(f"Unsupported WebSocket scheme: {parsed.scheme}")
+
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 80
+        self.path = parsed.path or "/"
+        if parsed.query:
+            self.path += "?" + parsed.query
+
+        self.transport = None
+        self.protocol = None
+
+    async def connect(self, timeout=5):
+        loop = asyncio.get_running_loop()
+        self.transport, self.protocol = await asyncio.wait_for(
+            loop.create_connection(_WebSocketProtocol, self.host, self.port),
+            timeout,
+        )
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        request = (
+            f"GET {self.path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n"
+            "\r\n"
+        )
+        self.transport.write(request.encode("ascii"))
+        response = await asyncio.wait_for(self.protocol.handshake, timeout)
+        status_line = response.splitlines()[0]
+        if "101" not in status_line:
+            raise DevToolsProtocolError(f"WebSocket handshake failed: {status_line}")
+
+    def close(self):
+        if self.transport:
+            self.transport.close()
+            self.transport = None
+
+    async def send_text(self, text):
+        payload = text.encode("utf-8")
+        mask_key = os.urandom(4)
+        # Header, key and payload go out as one gathered write, never concatenated
+        self.transport.writelines(
+            [encode_frame_header(len(payload)), mask_key, mask_payload(payload, mask_key)]
+        )
+        await self.protocol.drain()
+
+    async def recv_text(self):
+        """Return the next text message; raises once the connection is gone."""
+        message = await self.protocol.messages.get()
+        if isinstance(message, Exception):
+            self.protocol.messages.put_nowait(message)
+            raise message
+        return message
+
+
+class DevToolsConnection:
+    """Browser-level DevTools connection shared by every attached session."""
+
+    def __init__(self, websocket_url, on_warning=None, on_command=None):
+        self.websocket = SimpleWebSocketClient(websocket_url)
+        self.on_warning = on_warning
+        # on_command(method, seconds, sent_bytes) for every command that got a response
+        self.on_command = on_command
+        self.message_id = 0
+        self.pending = {}
+        self.subscribers = {}
+        self.reader_task = None
+        self.closed = None
+
+    async def connect(self):
+        await self.websocket.connect()
+        self.closed = asyncio.get_running_loop().create_future()
+        self.reader_task = asyncio.create_task(self._read_loop())
+
+    async def close(self):
+        self.websocket.close()
+        if self.reader_task:
+            self.reader_task.cancel()
+            try:
+                await self.reader_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._fail_pending(DevToolsProtocolError("DevTools connection closed"))
+
+    def is_open(self):
+        return self.closed is not None and not self.closed.done()
+
+    async def send(self, method, params=None, session_id=None, timeout=COMMAND_TIMEOUT_SECONDS):
+        if not self.is_open():
+            raise DevToolsProtocolError("DevTools connection is closed")
+
+        self.message_id += 1
+        message_id = self.message_id
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[message_id] = future
+        text = json.dumps(message)
+        started = time.monotonic()
+        try:
+            await self.websocket.send_text(text)
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timed out waiting for DevTools response to {method}")
+        finally:
+            self.pending.pop(message_id, None)
+            if self.on_command and future.done() and not future.cancelled():
+                # ensure_ascii JSON, so characters are bytes
+                self.on_command(method, time.monotonic() - started, len(text))
+
+    def subscribe(self, method, callback, session_id=None):
+        """Call callback(params, session_id) for each `method` event of that session."""
+        self.subscribers.setdefault((method, session_id), []).append(callback)
+
+    def unsubscribe_session(self, session_id):
+        for key in [key for key in self.subscribers if key[1] == session_id]:
+            del self.subscribers[key]
+
+    async def attach(self, target_id):
+        result = await self.send("Target.attachToTarget", {"targetId": target_id, "flatten": True})
+        return DevToolsSession(self, result["sessionId"])
+
+    async def _read_loop(self):
+        error = None
+        try:
+            while True:
+                text = await self.websocket.recv_text()
+                if text is not None:
+                    self._dispatch(text)
+        except asyncio.CancelledError:
+            error = DevToolsProtocolError("DevTools connection closed")
+            raise
+        except Exception as exception:
+            error = exception
+        finally:
+            self._fail_pending(error)
+            if self.closed and not self.closed.done():
+                self.closed.set_result(error)
+
+    def _dispatch(self, text):
+        try:
+            message = json.loads(text)
+        except json.JSONDecodeError:
+            self._warn(f"Failed to decode DevTools message: {text[:200]}")
+            return
+
+        if "id" in message:
+            future = self.pending.get(message["id"])
+            if future is None or future.done():
+                return
+            if "error" in message:
+                future.set_exception(DevToolsProtocolError(json.dumps(message["error"])))
+            else:
+                future.set_result(message.get("result", {}))
+            return
+
+        key = (message.get("method"), message.get("sessionId"))
+        for callback in list(self.subscribers.get(key, ())):
+            try:
+                callback(message.get("params") or {}, message.get("sessionId"))
+            except Exception as error:
+                self._warn(f"DevTools event handler for {key[0]} failed: {error}")
+
+    def _fail_pending(self, error):
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(error or DevToolsProtocolError("DevTools connection closed"))
+        self.pending.clear()
+
+    def _warn(self, text):
+        if self.on_warning:
+            self.on_warning(text)
+
+
+class DevToolsSession:
+    """A flattened target session multiplexed over a DevToolsConnection."""
+
+    def __init__(self, connection, session_id):
+        self.connection = connection
+        self.session_id = session_id
+
+    async def send(self, method, params=None, timeout=COMMAND_TIMEOUT_SECONDS):
+        return await self.connection.send(method, params, session_id=self.session_id, timeout=timeout)
+
+    def subscribe(self, method, callback):
+        self.connection.subscribe(method, callback, session_id=self.session_id)
+
+    async def detach(self):
+        self.connection.unsubscribe_session(self.session_id)
+        if self.connection.is_open():
+            await self.connection.send("Target.detachFromTarget", {"sessionId": self.session_id})
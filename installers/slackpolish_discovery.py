@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Slack installation discovery shared by the SlackPolish installers.
+
+Lookups go through three layers, cheapest first:
+1. A persisted cache of the last resources directory, trusted only while
+   the recorded stat (mtime/size) of its app.asar still matches.
+2. The caller's list of well-known resources directories.
+3. A bounded-depth os.scandir search of a few root directories, run in
+   parallel across roots. Below the first two levels only directories whose
+   path mentions "slack" are descended, and known-heavy trees are skipped.
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+CACHE_FILE_NAME = "slack-location.json"
+CACHE_VERSION = 1
+DEFAULT_MAX_DEPTH = 6
+# Directories up to this depth are always listed; deeper ones only when
+# their path already contains "slack" (e.g. /opt/apps/com.slack.desktop/...)
+UNFILTERED_DEPTH = 2
+
+PRUNED_DIRECTORIES = {
+    "node_modules",
+    "__pycache__",
+    "site-packages",
+    "dist-packages",
+    "firmware",
+    "modules",
+    "locale",
+    "locales",
+    "x86_64-linux-gnu",
+    "i386-linux-gnu",
+    "aarch64-linux-gnu",
+    "temp",
+    "cache",
+}
+
+
+def default_cache_path():
+    """Per-user cache file location (XDG on Linux, LOCALAPPDATA on Windows)."""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+        return Path(base) / "SlackPolish" / CACHE_FILE_NAME
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "slackpolish" / CACHE_FILE_NAME
+
+
+def _asar_stat(resources_path):
+    try:
+        stat = os.stat(os.path.join(resources_path, "app.asar"))
+    except OSError:
+        return None
+    return {"asar_mtime_ns": stat.st_mtime_ns, "asar_size": stat.st_size}
+
+
+def load_cached_location(cache_path=None):
+    """Return the cached resources path if its app.asar is unchanged, else None."""
+    cache_path = Path(cache_path or default_cache_path())
+    try:
+        with open(cache_path, "r", encoding="utf-8") as handle:
+            cached = json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("version") != CACHE_VERSION:
+        return None
+
+    resources_path = cached.get("resources_path")
+    if not resources_path:
+        return None
+
+    current = _asar_stat(resources_path)
+    if current is None:
+        return None
+    if any(cached.get(key) != value for key, value in current.items()):
+        return None
+    return resources_path
+
+
+def save_location(resources_path, cache_path=None):
+    """Record resources_path and the current stat of its app.asar. Returns success."""
+    current = _asar_stat(resources_path)
+    if current is None:
+        return False
+
+    cache_path = Path(cache_path or default_cache_path())
+    record = {"version": CACHE_VERSION, "resources_path": str(resources_path), **current}
+    temp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(record, handle)
+        os.replace(temp_path, cache_path)
+        return True
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return False
+
+
+def forget_location(cache_path=None):
+    try:
+        os.remove(cache_path or default_cache_path())
+    except OSError:
+        pass
+
+
+def check_known_paths(paths, on_check=None):
+    """Return the first path that contains app.asar."""
+    for path in paths:
+        if on_check:
+            on_check(path)
+        if os.path.isfile(os.path.join(path, "app.asar")):
+            return path
+    return None
+
+
+def scan_root(root, max_depth=DEFAULT_MAX_DEPTH):
+    """Breadth-first, depth-bounded search for a Slack resources directory under root."""
+    if not os.path.isdir(root):
+        return None
+
+    queue = deque([(root, 0)])
+    while queue:
+        directory, depth = queue.popleft()
+        try:
+            with os.scandir(directory) as entries:
+                subdirectories = []
+                has_asar = False
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirectories.append(entry)
+                        elif entry.name == "app.asar" and entry.is_file():
+                            has_asar = True
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+        if has_asar and "slack" in directory.lower():
+            return directory
+
+        if depth >= max_depth:
+            continue
+
+        for entry in subdirectories:
+            name = entry.name.lower()
+            if name.startswith(".") or name in PRUNED_DIRECTORIES:
+                continue
+            if depth + 1 > UNFILTERED_DEPTH and "slack" not in entry.path[len(root):].lower():
+                continue
+            queue.append((entry.path, depth + 1))
+
+    return None
+
+
+def search_roots(roots, max_depth=DEFAULT_MAX_DEPTH, parallel=True):
+    """
+    Search several roots and return the hit from the earliest root in the list.
+
+    With parallel=True each root is scanned on its own thread (scandir
+    releases the GIL), so the total time is that of the slowest root.
+    """
+    roots = [root for root in roots if os.path.isdir(root)]
+    if not roots:
+        return None
+
+    if not parallel or len(roots) == 1:
+        for root in roots:
+            found = scan_root(root, max_depth)
+            if found:
+                return found
+        return None
+
+    with ThreadPoolExecutor(max_workers=len(roots)) as executor:
+        futures = [executor.submit(scan_root, root, max_depth) for root in roots]
+        results = [future.result() for future in futures]
+    return next((found for found in results if found), None)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Crash-safe swaps of app.asar and its backup.
+
+Every write lands in a temporary file next to the destination, is fsynced,
+and is then renamed over the destination with os.replace. Slack therefore
+only ever sees the old archive or the new one, never a half-written file.
+
+Copies use the cheapest method the filesystem offers:
+1. a hardlink (backups only, see backup_file)
+2. a reflink (FICLONE) on copy-on-write filesystems such as btrfs or XFS
+3. os.copy_file_range, which copies inside the kernel
+4. a plain buffered copy
+"""
+
+import errno
+import os
+import shutil
+import sys
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+TEMP_SUFFIX = ".slackpolish-tmp"
+COPY_CHUNK_SIZE = 1024 * 1024
+# _IOW(0x94, 9, int) from linux/fs.h
+FICLONE = 0x40049409
+# copy_file_range reports these when it cannot copy between the two files
+COPY_RANGE_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.EBADF,
+    errno.EPERM,
+}
+
+
+def temp_path_for(path):
+    return str(path) + TEMP_SUFFIX
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def fsync_directory(directory):
+    """Persist a rename. Windows has no directory handles, so this is a no-op there."""
+    if os.name == "nt":
+        return
+    fd = os.open(directory or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def replace_file(temp_path, path):
+    """fsync temp_path, rename it over path and persist the rename."""
+    fd = os.open(temp_path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(temp_path, path)
+    fsync_directory(os.path.dirname(os.path.abspath(path)))
+
+
+def _reflink(source_fd, destination_fd):
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(destination_fd, FICLONE, source_fd)
+        return True
+    except OSError:
+        return False
+
+
+def _copy_range(source_fd, destination_fd):
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return False
+
+    copied = 0
+    try:
+        while True:
+            count = copy_file_range(source_fd, destination_fd, COPY_CHUNK_SIZE * 64)
+            if count == 0:
+                return True
+            copied += count
+    except OSError as e:
+        # Nothing written yet: let the caller fall back to a plain copy
+        if copied == 0 and e.errno in COPY_RANGE_UNSUPPORTED:
+            return False
+        raise
+
+
+def clone_file(source, destination):
+    """Copy source's bytes to a new destination file. Returns the method used."""
+    with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+        source_fd = source_file.fileno()
+        destination_fd = destination_file.fileno()
+        if _reflink(source_fd, destination_fd):
+            return "reflink"
+        if _copy_range(source_fd, destination_fd):
+            return "copy_file_range"
+        shutil.copyfileobj(source_file, destination_file, COPY_CHUNK_SIZE)
+        return "copy"
+
+
+def copy_file(source, destination):
+    """Atomically replace destination with a copy of source (metadata included)."""
+    temp_path = temp_path_for(destination)
+    try:
+        method = clone_file(source, temp_path)
+        shutil.copystat(source, temp_path)
+        replace_file(temp_path, destination)
+        return method
+    finally:
+        _remove_quietly(temp_path)
+
+
+def backup_file(source, backup_path, allow_hardlink=True):
+    """
+    Atomically make backup_path hold the current contents of source.
+
+    A hardlink shares the inode with source, which is only safe because the
+    installers and the uninstaller replace app.asar by rename and never write
+    into it. Pass allow_hardlink=False where that does not hold. Falls back to
+    copy_file when linking is unsupported (FAT, cross-device, ...).
+    """
+    if allow_hardlink:
+        temp_path = temp_path_for(backup_path)
+        _remove_quietly(temp_path)
+        try:
+            os.link(source, temp_path)
+            os.replace(temp_path, backup_path)
+            fsync_directory(os.path.dirname(os.path.abspath(backup_path)))
+            return "hardlink"
+        except (OSError, NotImplementedError):
+            _remove_quietly(temp_path)
+    return copy_file(source, backup_path)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Conservative JavaScript minifier and debug stripper for the SlackPolish payload.
+
+strip_debug_regions() drops everything between `// @debug-only` and
+`// @end-debug-only` marker lines (the debug test commands, their typing
+simulators, ...). Code outside the markers must not depend on it.
+
+minify() removes comments and indentation and collapses whitespace. It
+never renames, reorders or joins lines: every line break in the source
+survives as a single `\\n`, so automatic semicolon insertion behaves exactly
+as before. Strings, template literals and regex literals are copied verbatim.
+"""
+
+import re
+
+
+DEBUG_REGION_RE = re.compile(
+    r"^[ \t]*// @debug-only\b[^\n]*\n.*?^[ \t]*// @end-debug-only[^\n]*(?:\n|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+
+WHITESPACE_CHARS = " \t\r\n\f\v\u00a0\ufeff\u2028\u2029"
+WHITESPACE_RE = re.compile(f"[{WHITESPACE_CHARS}]+")
+LINE_COMMENT_RE = re.compile("//[^\n\r\u2028\u2029]*")
+BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+STRING_RE = {
+    "'": re.compile(r"'[^'\\\n]*(?:\\.[^'\\\n]*)*'", re.DOTALL),
+    '"': re.compile(r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"', re.DOTALL),
+}
+WORD_RE = re.compile("[\\w$\u0080-\u009f\u00a1-\u2027\u202a-\ufefe\uff00-\uffff]+")
+REGEX_RE = re.compile(r"/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[\w$]*")
+
+# A `/` after one of these words starts a regex literal, not a division
+REGEX_KEYWORDS = {
+    "return", "typeof", "case", "do", "else", "in", "of", "new", "delete",
+    "void", "throw", "yield", "await", "instanceof",
+}
+NEWLINES = "\n\r\u2028\u2029"
+
+
+class MinifyError(ValueError):
+    pass
+
+
+def strip_debug_regions(source):
+    """Remove `// @debug-only` ... `// @end-debug-only` regions. Returns (source, count)."""
+    return DEBUG_REGION_RE.subn("", source)
+
+
+def _is_word_char(char):
+    return char.isalnum() or char in "_$" or ord(char) > 127
+
+
+def _needs_space(previous, following):
+    if not previous:
+        return False
+    if _is_word_char(previous) and (_is_word_char(following) or following == "\\"):
+        return True
+    # `a + +b`, `a - -b`, `a / /re/`, `1 .toString()`
+    if previous in "+-" and following == previous:
+        return True
+    if previous == "/" and following in "/*":
+        return True
+    return previous.isdigit() and following == "."
+
+
+def _scan_template(source, position):
+    """Scan template text from position. Returns (end, closed): after '`' or after '${'."""
+    length = len(source)
+    while position < length:
+        char = source[position]
+        if char == "\\":
+            position += 2
+        elif char == "`":
+            return position + 1, True
+        elif char == "$" and source.startswith("{", position + 1):
+            return position + 2, False
+        else:
+            position += 1
+    raise MinifyError("Unterminated template literal")
+
+
+def _regex_allowed(last_char, last_word):
+    if not last_char:
+        return True
+    if _is_word_char(last_char):
+        return last_word in REGEX_KEYWORDS
+    return last_char not in ")]`'\""
+
+
+def minify(source):
+    """Return source without comments or redundant whitespace (line breaks kept)."""
+    pieces = []
+    position = 0
+    length = len(source)
+    last_char = ""
+    last_word = ""
+    pending_space = False
+    pending_newline = False
+    brace_depth = 0
+    template_stack = []
+
+    def emit(text, word=""):
+        nonlocal last_char, last_word, pending_space, pending_newline
+        if pending_newline and pieces:
+            pieces.append("\n")
+        elif pending_space and _needs_space(last_char, text[0]):
+            pieces.append(" ")
+        pending_space = pending_newline = False
+        pieces.append(text)
+        last_char = text[-1]
+        last_word = word
+
+    while position < length:
+        char = source[position]
+
+        if char in WHITESPACE_CHARS:
+            end = WHITESPACE_RE.match(source, position).end()
+            if any(newline in source[position:end] for newline in NEWLINES):
+                pending_newline = True
+            else:
+                pending_space = True
+            position = end
+            continue
+
+        if char == "/":
+            if source.startswith("//", position):
+                position = LINE_COMMENT_RE.match(source, position).end()
+                pending_space = True
+                continue
+            if source.startswith("/*", position):
+                match = BLOCK_COMMENT_RE.match(source, position)
+                if not match:
+                    raise MinifyError("Unterminated block comment")
+                if any(newline in match.group() for newline in NEWLINES):
+                    pending_newline = True
+                else:
+                    pending_space = True
+                position = match.end()
+                continue
+            if _regex_allowed(last_char, last_word):
+                match = REGEX_RE.match(source, position)
+                if not match:
+                    raise MinifyError(f"Unterminated regex literal at offset {position}")
+                emit(match.group())
+                position = match.end()
+                continue
+            emit(char)
+            position += 1
+            continue
+
+        if char in STRING_RE:
+            match = STRING_RE[char].match(source, position)
+            if not match:
+                raise MinifyError(f"Unterminated string literal at offset {position}")
+            emit(match.group())
+            position = match.end()
+            continue
+
+        if char == "`" or (char == "}" and brace_depth == 0 and template_stack):
+            if char == "}":
+                brace_depth = template_stack.pop()
+            end, closed = _scan_template(source, position + 1)
+            emit(source[position:end])
+            if not closed:
+                template_stack.append(brace_depth)
+                brace_depth = 0
+            position = end
+            continue
+
+        if _is_word_char(char):
+            match = WORD_RE.match(source, position)
+            end = match.end() if match else position + 1
+            word = source[position:end]
+            emit(word, word)
+            position = end
+            continue
+
+        if char == "{":
+            brace_depth += 1
+        elif char == "}":
+            brace_depth -= 1
+        emit(char)
+        position += 1
+
+    if template_stack:
+        raise MinifyError("Unterminated template literal expression")
+    return "".join(pieces)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Install manifest kept next to app.asar.backup.
+
+The manifest records what the last install produced:
+- original_sha256: the clean Slack archive saved as app.asar.backup
+- payload_sha256:  the SlackPolish injection block (config, logo, scripts)
+- result_sha256:   the patched app.asar, plus its mtime/size for a fast check
+
+With it the installer can tell "nothing changed" (no-op), "payload changed"
+(rebuild from the backup) and "Slack was updated" (new original) apart
+without extracting or re-hashing more than it has to.
+"""
+
+import hashlib
+import json
+import os
+
+
+MANIFEST_NAME = "app.asar.slackpolish-manifest.json"
+MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def manifest_path(slack_path):
+    return os.path.join(slack_path, MANIFEST_NAME)
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as handle:
+        while True:
+            count = handle.readinto(buffer)
+            if not count:
+                break
+            digest.update(view[:count])
+    return digest.hexdigest()
+
+
+def load_manifest(slack_path):
+    try:
+        with open(manifest_path(slack_path), "r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def save_manifest(slack_path, original_sha256, payload_sha256, asar_path):
+    """Record the finished install. result_sha256 is computed from asar_path."""
+    stat = os.stat(asar_path)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "original_sha256": original_sha256,
+        "payload_sha256": payload_sha256,
+        "result_sha256": file_sha256(asar_path),
+        "result_mtime_ns": stat.st_mtime_ns,
+        "result_size": stat.st_size,
+    }
+    path = manifest_path(slack_path)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+    return manifest
+
+
+def remove_manifest(slack_path):
+    try:
+        os.remove(manifest_path(slack_path))
+    except OSError:
+        pass
+
+
+def archive_is_install_result(asar_path, manifest):
+    """True if asar_path is still the archive the manifest's install produced."""
+    try:
+        stat = os.stat(asar_path)
+    except OSError:
+        return False
+
+    if stat.st_size != manifest.get("result_size"):
+        return False
+    if stat.st_mtime_ns == manifest.get("result_mtime_ns"):
+        return True
+    # Same size but touched: fall back to the content hash
+    return file_sha256(asar_path) == manifest.get("result_sha256")
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+In-process metrics for the SlackPolish runtime launcher.
+
+Histograms with fixed buckets and labelled gauges, cheap enough to update on
+every DevTools command. The launcher serves a snapshot over its control
+socket (`--stats`) as JSON or as Prometheus text exposition.
+
+Latencies are recorded in seconds and sizes in bytes, the Prometheus base
+units, so both formats carry the same numbers.
+"""
+
+import json
+import threading
+from bisect import bisect_left
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1024, 16 * 1024, 128 * 1024, 1024 * 1024, 4 * 1024 * 1024, 16 * 1024 * 1024)
+METRIC_PREFIX = "slackpolish_"
+
+# name: (type, help, buckets)
+METRICS = {
+    "attach_seconds": (
+        "histogram",
+        "Time from attaching to a Slack target until SlackPolish is running in it",
+        LATENCY_BUCKETS,
+    ),
+    "reinject_seconds": (
+        "histogram",
+        "Time to re-inject SlackPolish into an attached target (lost runtime, hot reload or reinject command)",
+        LATENCY_BUCKETS,
+    ),
+    "health_probe_seconds": (
+        "histogram",
+        "Round trip of one target health probe",
+        LATENCY_BUCKETS,
+    ),
+    "devtools_http_seconds": (
+        "histogram",
+        "DevTools HTTP endpoint fetch time, by path",
+        LATENCY_BUCKETS,
+    ),
+    "devtools_command_seconds": (
+        "histogram",
+        "DevTools command round trip, by method",
+        LATENCY_BUCKETS,
+    ),
+    "devtools_sent_bytes": (
+        "histogram",
+        "Bytes sent per DevTools command, by method",
+        SIZE_BUCKETS,
+    ),
+    "startup_phase_seconds": (
+        "gauge",
+        "Duration of each launcher startup phase; 'ready' is the total until the first target is injected",
+        None,
+    ),
+}
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        # One slot per bucket plus the overflow (+Inf) slot
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th observation (max for the overflow)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": [[bound, count] for bound, count in zip(self.buckets, self.counts)],
+            "overflow": self.counts[-1],
+        }
+
+
+class LauncherMetrics:
+    """Named, labelled histograms and gauges; safe to update from the startup worker threads."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms = {}
+        self.gauges = {}
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(METRICS[name][2])
+            histogram.observe(value)
+
+    def set(self, name, value, **labels):
+        with self.lock:
+            self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def snapshot(self):
+        """{name: [{"labels": {...}, ...values}]} for every metric with data."""
+        result = {}
+        with self.lock:
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                result.setdefault(name, []).append({"labels": dict(labels), **histogram.snapshot()})
+            for (name, labels), value in sorted(self.gauges.items()):
+                result.setdefault(name, []).append({"labels": dict(labels), "value": value})
+        return result
+
+    def render_json(self):
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def render_prometheus(self):
+        lines = []
+        with self.lock:
+            histograms = sorted(self.histograms.items())
+            gauges = sorted(self.gauges.items())
+            for name, (kind, help_text, _) in METRICS.items():
+                if kind == "histogram":
+                    series = [(labels, h) for (metric, labels), h in histograms if metric == name]
+                else:
+                    series = [(labels, v) for (metric, labels), v in gauges if metric == name]
+                if not series:
+                    continue
+                full_name = METRIC_PREFIX + name
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} {kind}")
+                for labels, value in series:
+                    if kind == "gauge":
+                        lines.append(f"{full_name}{_format_labels(labels)} {value}")
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(value.buckets, value.counts):
+                        cumulative += count
+                        lines.append(f"{full_name}_bucket{_format_labels(labels, le=bound)} {cumulative}")
+                    lines.append(f"{full_name}_bucket{_format_labels(labels, le='+Inf')} {value.count}")
+                    lines.append(f"{full_name}_sum{_format_labels(labels)} {value.sum}")
+                    lines.append(f"{full_name}_count{_format_labels(labels)} {value.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels, **extra):
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in pairs) + "}"
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Content-addressed SlackPolish payload bundle.
+
+The SlackPolish scripts are rendered once, for every way they get injected,
+into a single artifact:
+
+    SLACKPOLISH-PAYLOAD <version> <index length>\\n
+    <index JSON>\\n
+    <body: the rendered flavors, back to back>
+
+Flavors:
+- "asar":    the block the Linux installer writes into app.asar
+- "runtime": the page-world bootstrap the macOS launcher evaluates over DevTools;
+             it leaves out the ~2 MB logo (every script that shows it falls
+             back to an inline SVG), since the launcher sends the flavor on
+             every attach
+
+The index holds the SHA-256 and size of the body (the bundle's identity),
+each flavor's offset/size/SHA-256 inside the body, an offset table of the
+scripts inside each flavor, and the build options. Loading is one read of
+one file, and every consumer gets byte-identical code.
+
+Release builds strip `// @debug-only` regions and minify every script
+(see slackpolish_jsmin.py); --report compares them with a plain build
+and lists what still takes up the most room.
+
+Build it with:
+  python3 installers/slackpolish_payload.py [--source-dir DIR] [--output FILE]
+  python3 installers/slackpolish_payload.py --strip-debug --minify --report
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from slackpolish_jsmin import minify as minify_script, strip_debug_regions
+
+
+BUNDLE_NAME = "slackpolish-payload.bundle"
+BUNDLE_MAGIC = "SLACKPOLISH-PAYLOAD"
+BUNDLE_VERSION = 1
+
+ASAR_FLAVOR = "asar"
+RUNTIME_FLAVOR = "runtime"
+
+# (part name, source file), in injection order
+SOURCE_PARTS = [
+    ("config", "slack-config.js"),
+    ("logo", "logo-data.js"),
+    ("text improver", "slack-text-improver.js"),
+    ("settings", "slack-settings.js"),
+    ("channel summary", "slack-channel-summary.js"),
+]
+SOURCE_FILES = [file_name for _, file_name in SOURCE_PARTS]
+# Parts of the runtime flavor; the logo is nearly all of the payload and only decorates menus
+RUNTIME_PARTS = [(part, file_name) for part, file_name in SOURCE_PARTS if part != "logo"]
+
+
+class PayloadError(RuntimeError):
+    pass
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def read_source(source_dir, part, strip_debug=False, minify=False):
+    """Return one part's script, stripped and `;`-terminated."""
+    file_name = dict(SOURCE_PARTS)[part]
+    with open(Path(source_dir) / file_name, "r", encoding="utf-8") as handle:
+        script = handle.read()
+    if strip_debug:
+        script, _ = strip_debug_regions(script)
+    if minify:
+        script = minify_script(script)
+    script = script.strip()
+    if script and not script.endswith(";"):
+        script += ";"
+    return script
+
+
+def read_sources(source_dir, strip_debug=False, minify=False):
+    """Return {part name: script} with each script stripped and `;`-terminated."""
+    source_dir = Path(source_dir)
+    missing = [name for name in SOURCE_FILES if not (source_dir / name).exists()]
+    if missing:
+        raise FileNotFoundError(f"Missing required SlackPolish files: {', '.join(missing)}")
+
+    return {part: read_source(source_dir, part, strip_debug, minify) for part, _ in SOURCE_PARTS}
+
+
+def render_asar(scripts):
+    """Segments of the app.asar injection block. (part, text); part is None for glue."""
+    # NOTE: Channel summary is temporarily disabled due to syntax errors
+    return [
+        (None, "\n;\n// === SLACKPOLISH INJECTION START ===\n"),
+        ("config", scripts["config"]),
+        (None, "\n\n"),
+        ("logo", scripts["logo"]),
+        (None, "\n\n// === SLACK-TEXT-IMPROVER.JS ===\n"),
+        ("text improver", scripts["text improver"]),
+        (None, "\n\n// === SLACK-SETTINGS.JS ===\n"),
+        ("settings", scripts["settings"]),
+        (None,
+         "\n\n// === SLACK-CHANNEL-SUMMARY.JS ===\n"
+         "// TEMPORARILY DISABLED - causes syntax errors when injected\n"
+         "// Will be fixed in future version\n"
+         "// \n"
+         "// === SLACKPOLISH INJECTION END ===\n"),
+    ]
+
+
+def render_runtime(scripts):
+    """Segments of the macOS runtime bootstrap, each script in its own try/catch."""
+    build = _sha256("".join(scripts[part] for part, _ in RUNTIME_PARTS).encode("utf-8"))[:12]
+    segments = [(None, f"""(function() {{
+    const href = String(window.location.href || '');
+    if (!/^https:\\/\\/app\\.slack\\.com\\/client\\//.test(href)) {{
+        return;
+    }}
+
+    const runtimeState = {{
+        href,
+        build: '{build}',
+        activatedAt: Date.now()
+    }};
+    const previousRuntime = window.__SLACKPOLISH_RUNTIME_ACTIVE__ || null;
+    window.__SLACKPOLISH_RUNTIME_ACTIVE__ = runtimeState;
+
+    if (
+        window.__SLACKPOLISH_RUNTIME_URL__ === href &&
+        previousRuntime &&
+        previousRuntime.build === runtimeState.build
+    ) {{
+        return;
+    }}
+    window.__SLACKPOLISH_RUNTIME_URL__ = href;
+
+    console.log('SLACKPOLISH runtime bootstrap starting ' + href);
+""")]
+
+    for index, (part, _) in enumerate(RUNTIME_PARTS):
+        label = part.upper()
+        separator = "" if index == 0 else "\n"
+        segments.append((None, f"{separator}\n    try {{\n// === SLACKPOLISH {label} START ===\n"))
+        segments.append((part, scripts[part]))
+        segments.append((None,
+                         f"\n// === SLACKPOLISH {label} END ===\n"
+                         f"    }} catch (error) {{\n"
+                         f"        console.error('SlackPolish {part} bootstrap failed:', error);\n"
+                         f"    }}"))
+
+    segments.append((None, "\n    console.log('SLACKPOLISH runtime bootstrap completed ' + href);\n})();"))
+    return segments
+
+
+FLAVOR_RENDERERS = {
+    ASAR_FLAVOR: render_asar,
+    RUNTIME_FLAVOR: render_runtime,
+}
+
+
+def render_flavor(name, scripts):
+    """Render one flavor straight to text, without building a bundle."""
+    return "".join(text for _, text in FLAVOR_RENDERERS[name](scripts))
+
+
+class PayloadBundle:
+    """A loaded (or freshly built) payload bundle."""
+
+    def __init__(self, index, body):
+        self.index = index
+        self.body = body
+        self._texts = {}
+
+    @property
+    def sha256(self):
+        return self.index["sha256"]
+
+    @property
+    def size(self):
+        return self.index["size"]
+
+    def flavor_names(self):
+        return list(self.index["flavors"])
+
+    def _flavor_record(self, name):
+        try:
+            return self.index["flavors"][name]
+        except KeyError:
+            raise KeyError(f"Payload bundle has no '{name}' flavor") from None
+
+    def flavor_bytes(self, name):
+        record = self._flavor_record(name)
+        return self.body[record["offset"]:record["offset"] + record["size"]]
+
+    def flavor(self, name):
+        """The flavor as text, decoded once."""
+        if name not in self._texts:
+            self._texts[name] = bytes(self.flavor_bytes(name)).decode("utf-8")
+        return self._texts[name]
+
+    def flavor_sha256(self, name):
+        return self._flavor_record(name)["sha256"]
+
+    @property
+    def options(self):
+        """Build options: {"strip_debug": bool, "minify": bool}."""
+        return dict(self.index.get("options") or {"strip_debug": False, "minify": False})
+
+    def parts(self, name):
+        """Offset table of the scripts in a flavor: [{name, offset, size}] relative to the flavor."""
+        return self._flavor_record(name)["parts"]
+
+    def scripts(self, name=RUNTIME_FLAVOR):
+        """{part name: script} as rendered into a flavor, sliced out through its offset table."""
+        data = self.flavor_bytes(name)
+        scripts = {part: "" for part, _ in SOURCE_PARTS}
+        for part in self.parts(name):
+            scripts[part["name"]] = bytes(data[part["offset"]:part["offset"] + part["size"]]).decode("utf-8")
+        return scripts
+
+    def to_bytes(self):
+        index = json.dumps(self.index, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        header = f"{BUNDLE_MAGIC} {BUNDLE_VERSION} {len(index)}\n".encode("ascii")
+        return b"".join([header, index, b"\n", bytes(self.body)])
+
+
+def build_bundle(source_dir, strip_debug=False, minify=False):
+    """Render every flavor from the scripts in source_dir into an in-memory bundle."""
+    scripts = read_sources(source_dir, strip_debug, minify)
+    chunks = []
+    flavors = {}
+    body_offset = 0
+
+    for name, renderer in FLAVOR_RENDERERS.items():
+        flavor_chunks = []
+        parts = []
+        flavor_offset = 0
+        for part, text in renderer(scripts):
+            data = text.encode("utf-8")
+            if part is not None and data:
+                parts.append({"name": part, "offset": flavor_offset, "size": len(data)})
+            flavor_chunks.append(data)
+            flavor_offset += len(data)
+
+        data = b"".join(flavor_chunks)
+        flavors[name] = {
+            "offset": body_offset,
+            "size": len(data),
+            "sha256": _sha256(data),
+            "parts": parts,
+        }
+        chunks.append(data)
+        body_offset += len(data)
+
+    body = b"".join(chunks)
+    index = {
+        "version": BUNDLE_VERSION,
+        "sha256": _sha256(body),
+        "size": len(body),
+        "flavors": flavors,
+        "options": {"strip_debug": strip_debug, "minify": minify},
+        "sources": {
+            file_name: _sha256(scripts[part].encode("utf-8"))
+            for part, file_name in SOURCE_PARTS
+        },
+    }
+    return PayloadBundle(index, memoryview(body))
+
+
+def write_bundle(bundle, path):
+    path = Path(path)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as handle:
+        handle.write(bundle.to_bytes())
+    os.replace(temp_path, path)
+
+
+def _parse_header(data, path):
+    newline = data.find(b"\n")
+    try:
+        magic, version, index_length = data[:newline].decode("ascii").split(" ")
+        version = int(version)
+        index_length = int(index_length)
+    except ValueError:
+        raise PayloadError(f"{path} is not a SlackPolish payload bundle") from None
+    if newline == -1 or magic != BUNDLE_MAGIC:
+        raise PayloadError(f"{path} is not a SlackPolish payload bundle")
+    if version != BUNDLE_VERSION:
+        raise PayloadError(f"Unsupported payload bundle version {version}")
+    return newline + 1, index_length
+
+
+def _parse_index(data, index_start, index_length):
+    try:
+        return json.loads(data[index_start:index_start + index_length])
+    except ValueError as e:
+        raise PayloadError(f"Corrupt payload bundle index: {e}") from None
+
+
+def read_bundle_index(path):
+    """Read only the index of a bundle (no body, no hash check)."""
+    with open(path, "rb") as handle:
+        head = handle.readline(256)
+        index_start, index_length = _parse_header(head, path)
+        return _parse_index(head + handle.read(index_length), index_start, index_length)
+
+
+def load_bundle(path):
+    """Load a bundle with a single read and check its hash."""
+    with open(path, "rb") as handle:
+        data = handle.read()
+
+    index_start, index_length = _parse_header(data, path)
+    index = _parse_index(data, index_start, index_length)
+
+    body = memoryview(data)[index_start + index_length + 1:]
+    if len(body) != index.get("size") or _sha256(body) != index.get("sha256"):
+        raise PayloadError(f"Payload bundle {path} does not match its recorded hash")
+    return PayloadBundle(index, body)
+
+
+def bundle_is_current(bundle_path, source_dir):
+    """True if the bundle exists and no source script is newer than it."""
+    try:
+        bundle_mtime = os.stat(bundle_path).st_mtime_ns
+    except OSError:
+        return False
+    for file_name in SOURCE_FILES:
+        try:
+            if os.stat(Path(source_dir) / file_name).st_mtime_ns > bundle_mtime:
+                return False
+        except OSError:
+            # Source not shipped next to the bundle: the bundle is authoritative
+            continue
+    return True
+
+
+def load_payload(source_dir, bundle_path=None):
+    """
+    Return the payload bundle for source_dir.
+
+    Uses the prebuilt bundle (source_dir/slackpolish-payload.bundle by default)
+    unless a script was edited after it was built, in which case the bundle is
+    rebuilt in memory from the scripts, with the same build options. Both
+    paths yield identical bytes.
+    """
+    bundle_path = Path(bundle_path or Path(source_dir) / BUNDLE_NAME)
+    if bundle_is_current(bundle_path, source_dir):
+        try:
+            return load_bundle(bundle_path)
+        except (OSError, PayloadError):
+            pass
+
+    # Rebuild with the options the (stale) bundle was built with
+    try:
+        options = read_bundle_index(bundle_path).get("options", {})
+    except (OSError, PayloadError):
+        options = {}
+    return build_bundle(
+        source_dir,
+        strip_debug=bool(options.get("strip_debug")),
+        minify=bool(options.get("minify")),
+    )
+
+
+def measure_parse_ms(script, runs=5):
+    """Best-of-N V8 compile time for script in milliseconds, or None without node."""
+    node = shutil.which("node")
+    if not node:
+        return None
+    # A different trailing comment per run defeats V8's in-isolate compile cache
+    probe = (
+        "const vm = require('vm');"
+        "const source = require('fs').readFileSync(0, 'utf8');"
+        "let best = Infinity;"
+        f"for (let i = 0; i < {runs}; i++) {{"
+        "  const started = process.hrtime.bigint();"
+        "  new vm.Script(source + '\\n//' + i);"
+        "  best = Math.min(best, Number(process.hrtime.bigint() - started) / 1e6);"
+        "}"
+        "console.log(best);"
+    )
+    try:
+        result = subprocess.run(
+            [node, "-e", probe], input=script, capture_output=True, text=True, check=True
+        )
+        return float(result.stdout.strip())
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+
+
+# Scripts listed per flavor under "largest" in --report
+REPORT_LARGEST_PARTS = 3
+
+
+def print_report(baseline, bundle, parse_time=True):
+    """Print per-script and per-flavor sizes (and parse times) of bundle against baseline."""
+    def percent(before, after):
+        return f"{(after - before) * 100 / before:+.1f}%" if before else "-"
+
+    print(f"\n{'script':<16} {'before':>10} {'after':>10} {'change':>8}")
+    before_parts = {part["name"]: part["size"] for part in baseline.parts(RUNTIME_FLAVOR)}
+    for part in bundle.parts(RUNTIME_FLAVOR):
+        before = before_parts.get(part["name"], 0)
+        print(f"{part['name']:<16} {before:>10} {part['size']:>10} {percent(before, part['size']):>8}")
+
+    print(f"\n{'flavor':<16} {'before':>10} {'after':>10} {'change':>8} {'parse ms':>17}")
+    for name in bundle.flavor_names():
+        before = len(baseline.flavor_bytes(name))
+        after = len(bundle.flavor_bytes(name))
+        parse = "-"
+        if parse_time:
+            before_ms = measure_parse_ms(baseline.flavor(name))
+            after_ms = measure_parse_ms(bundle.flavor(name))
+            if before_ms is not None and after_ms is not None:
+                parse = f"{before_ms:.1f} -> {after_ms:.1f}"
+        print(f"{name:<16} {before:>10} {after:>10} {percent(before, after):>8} {parse:>17}")
+
+    print(f"\n{'largest':<16} {'flavor':<10} {'bytes':>10} {'share':>8}")
+    for name in bundle.flavor_names():
+        total = len(bundle.flavor_bytes(name))
+        for part in sorted(bundle.parts(name), key=lambda part: part["size"], reverse=True)[:REPORT_LARGEST_PARTS]:
+            print(f"{part['name']:<16} {name:<10} {part['size']:>10} {part['size'] * 100 / total:>7.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the SlackPolish payload bundle")
+    parser.add_argument("--source-dir", default=str(Path(__file__).resolve().parent.parent),
+                        help="Directory holding the slack-*.js scripts (default: repository root)")
+    parser.add_argument("--output", help=f"Bundle path (default: SOURCE_DIR/{BUNDLE_NAME})")
+    parser.add_argument("--strip-debug", action="store_true",
+                        help="Drop // @debug-only regions (debug test commands and their helpers)")
+    parser.add_argument("--minify", action="store_true",
+                        help="Remove comments and indentation from every script")
+    parser.add_argument("--report", action="store_true",
+                        help="Compare sizes and V8 parse times (needs node) with a plain build")
+    args = parser.parse_args()
+
+    output = Path(args.output or Path(args.source_dir) / BUNDLE_NAME)
+    try:
+        bundle = build_bundle(args.source_dir, args.strip_debug, args.minify)
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    write_bundle(bundle, output)
+
+    print(f"✅ Wrote {output} ({bundle.size} bytes, sha256 {bundle.sha256[:12]})")
+    for name in bundle.flavor_names():
+        parts = ", ".join(f"{part['name']} @{part['offset']}+{part['size']}" for part in bundle.parts(name))
+        print(f"   {name:<8} {len(bundle.flavor_bytes(name)):>9} bytes  {bundle.flavor_sha256(name)[:12]}  [{parts}]")
+
+    if args.report:
+        print_report(build_bundle(args.source_dir), bundle)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
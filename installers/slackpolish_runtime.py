@@ -0,0 +1,1403 @@
+#!/usr/bin/env python3
+"""
+Platform-neutral core of the SlackPolish runtime launchers.
+
+The launchers never modify Slack's installation. They start Slack with a
+Chrome DevTools remote debugging port, follow its page targets over one
+DevTools connection (slackpolish_devtools.py) and inject the runtime payload
+(slackpolish_payload.py) into every workspace page.
+
+This module holds everything that does not depend on the operating system:
+logging, the single-instance lock, the status file, the target session
+manager and --watch. SlackPolishLauncher subclasses in the platform
+launchers (launch-slackpolish-MAC-ARM.py, launch-slackpolish-LINUX-X64.py)
+start, quit and focus Slack.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import re
+import signal
+import socket
+import socketserver
+import struct
+import subprocess
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+from slackpolish_devtools import DevToolsConnection, DevToolsProtocolError
+from slackpolish_metrics import LauncherMetrics
+from slackpolish_payload import (
+    RUNTIME_FLAVOR,
+    RUNTIME_PARTS,
+    load_payload,
+    read_source,
+    render_flavor,
+)
+
+
+GREEN = "\033[92m"
+YELLOW = "\033[93m"
+RED = "\033[91m"
+BLUE = "\033[94m"
+RESET = "\033[0m"
+
+# Startup timings are measured from here, as close to process start as the launcher gets
+STARTUP_STARTED = time.monotonic()
+VERBOSE = False
+LOG_PATH = None
+LOG_HANDLE = None
+LOG_SIZE = 0
+# launcher.log is rotated to launcher.log.1 .. .N once it grows past this
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+# Check if we're in a runtime directory or source directory
+# Runtime: slack-*.js files are in SCRIPT_DIR itself
+# Source: slack-*.js files are in SCRIPT_DIR (installers) parent
+FILE_DIR = SCRIPT_DIR if (SCRIPT_DIR / "slack-config.js").exists() else REPO_ROOT
+ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
+# Upper bound on how long the event loop sleeps when DevTools is quiet
+EVENT_WAIT_SECONDS = 5
+# How often --watch stats the runtime scripts
+WATCH_INTERVAL_SECONDS = 0.5
+# DevTools readiness: connect attempts back off from the initial delay to the max,
+# while DevToolsActivePort is checked every poll interval for an early start
+DEVTOOLS_RETRY_INITIAL_SECONDS = 0.05
+DEVTOOLS_RETRY_MAX_SECONDS = 0.5
+DEVTOOLS_PORT_FILE_POLL_SECONDS = 0.05
+# How long to wait for a stopped process to exit
+PROCESS_EXIT_TIMEOUT_SECONDS = 5
+# How long a control socket client waits for the launcher to answer
+CONTROL_TIMEOUT_SECONDS = 30
+# Commands the running launcher accepts on its control socket
+CONTROL_COMMANDS = ("status", "stats", "reinject", "reload-payload", "focus", "shutdown")
+# Deadline for one target's health probe; a hung renderer only delays itself
+HEALTH_PROBE_TIMEOUT_SECONDS = 3
+# Retry delay after the first failed attach/probe, doubled per failure up to the max
+RETRY_BACKOFF_SECONDS = 1
+RETRY_BACKOFF_MAX_SECONDS = 60
+# Runtime health in one short string: "ok", "reinject", or "skip" off workspace pages
+HEALTH_PROBE_EXPRESSION = """
+(() => {
+    const href = String(window.location.href || '');
+    if (!href.startsWith('https://app.slack.com/client/')) return 'skip';
+    const runtime = window.__SLACKPOLISH_RUNTIME_ACTIVE__;
+    const badge = document.getElementById('slackpolish-runtime-status');
+    return runtime && badge && String(runtime.href || '') === href ? 'ok' : 'reinject';
+})()
+""".strip()
+# Run before a forced reinjection: the bootstrap skips a document whose
+# __SLACKPOLISH_RUNTIME_URL__ already matches the page and the build
+RUNTIME_RESET_EXPRESSION = "delete window.__SLACKPOLISH_RUNTIME_URL__"
+# Status changes made within this window are written as one launcher-status.json update
+STATUS_COALESCE_SECONDS = 0.25
+# Without a heartbeat file, launcher-status.json is rewritten this often to stay fresh
+STATUS_HEARTBEAT_SECONDS = 5
+# launcher-heartbeat: magic, layout version, pid, started_at, last_heartbeat
+HEARTBEAT_MAGIC = b"SPHB"
+HEARTBEAT_FORMAT = "<4sIIdd"
+HEARTBEAT_SIZE = struct.calcsize(HEARTBEAT_FORMAT)
+HEARTBEAT_TIME_OFFSET = struct.calcsize("<4sIId")
+
+
+def configure_logging(log_path, verbose=False):
+    """Send printed lines to log_path as well; call before the launcher starts."""
+    global LOG_PATH, VERBOSE
+    close_log()
+    LOG_PATH = Path(log_path)
+    VERBOSE = verbose
+
+
+def append_log_line(text):
+    """Buffer one line for the log; flush_log() (heartbeat, warnings, exit) writes it out."""
+    global LOG_HANDLE, LOG_SIZE
+    if LOG_PATH is None:
+        return
+    try:
+        if LOG_HANDLE is None:
+            LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+            LOG_HANDLE = open(LOG_PATH, "ab")
+            LOG_SIZE = os.fstat(LOG_HANDLE.fileno()).st_size
+        data = (ANSI_ESCAPE_RE.sub("", text) + "\n").encode("utf-8")
+        LOG_HANDLE.write(data)
+        LOG_SIZE += len(data)
+        if LOG_SIZE > LOG_MAX_BYTES:
+            _rotate_log()
+    except Exception:
+        pass
+
+
+def flush_log():
+    if LOG_HANDLE is None:
+        return
+    try:
+        LOG_HANDLE.flush()
+    except Exception:
+        pass
+
+
+def close_log():
+    global LOG_HANDLE
+    if LOG_HANDLE is None:
+        return
+    try:
+        LOG_HANDLE.close()
+    except Exception:
+        pass
+    LOG_HANDLE = None
+
+
+atexit.register(close_log)
+
+
+def _rotate_log():
+    close_log()
+    for index in range(LOG_BACKUP_COUNT - 1, 0, -1):
+        older = LOG_PATH.with_name(f"{LOG_PATH.name}.{index}")
+        if older.exists():
+            os.replace(older, LOG_PATH.with_name(f"{LOG_PATH.name}.{index + 1}"))
+    os.replace(LOG_PATH, LOG_PATH.with_name(f"{LOG_PATH.name}.1"))
+
+
+def read_heartbeat(path):
+    """Return {"pid", "started_at", "last_heartbeat"} from a heartbeat file, or None."""
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read(HEARTBEAT_SIZE)
+        magic, version, pid, started_at, last_heartbeat = struct.unpack(HEARTBEAT_FORMAT, data)
+    except (OSError, struct.error):
+        return None
+    if magic != HEARTBEAT_MAGIC or version != 1:
+        return None
+    return {"pid": pid, "started_at": started_at, "last_heartbeat": last_heartbeat}
+
+
+class HeartbeatFile:
+    """
+    Fixed-layout heartbeat record kept in a shared memory map.
+
+    beat() stores one double in the mapping, so the running launcher pays no
+    syscall per heartbeat; the kernel writes the page back on its own schedule.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            os.ftruncate(fd, HEARTBEAT_SIZE)
+            self.map = mmap.mmap(fd, HEARTBEAT_SIZE)
+        finally:
+            os.close(fd)
+        now = time.time()
+        struct.pack_into(HEARTBEAT_FORMAT, self.map, 0, HEARTBEAT_MAGIC, 1, os.getpid(), now, now)
+
+    def beat(self):
+        struct.pack_into("<d", self.map, HEARTBEAT_TIME_OFFSET, time.time())
+
+    def close(self):
+        if self.map.closed:
+            return
+        # A stopped launcher leaves a zero heartbeat, never a fresh-looking one
+        struct.pack_into("<d", self.map, HEARTBEAT_TIME_OFFSET, 0.0)
+        self.map.close()
+
+
+def print_header(text):
+    line_one = f"\n{BLUE}=================================================="
+    line_two = text
+    line_three = f"=================================================={RESET}\n"
+    print(line_one, flush=True)
+    print(line_two, flush=True)
+    print(line_three, flush=True)
+    append_log_line(line_one)
+    append_log_line(line_two)
+    append_log_line(line_three)
+
+
+def print_success(text):
+    line = f"{GREEN}✅ {text}{RESET}"
+    print(line, flush=True)
+    append_log_line(line)
+
+
+def print_warning(text):
+    line = f"{YELLOW}⚠️ {text}{RESET}"
+    print(line, flush=True)
+    append_log_line(line)
+    flush_log()
+
+
+def print_error(text):
+    line = f"{RED}❌ {text}{RESET}"
+    print(line, flush=True)
+    append_log_line(line)
+    flush_log()
+
+
+def print_info(text):
+    line = f"{BLUE}🔍 {text}{RESET}"
+    print(line, flush=True)
+    append_log_line(line)
+
+
+def print_verbose(text):
+    if VERBOSE:
+        line = f"{BLUE}🔍 [VERBOSE] {text}{RESET}"
+        print(line, flush=True)
+        append_log_line(line)
+
+
+class AlreadyRunningAndFocused(RuntimeError):
+    pass
+
+
+def _interrupt_on_signal(_signum, _frame):
+    raise KeyboardInterrupt
+
+
+def control_socket_path(lock_path):
+    """The running launcher's control socket lives next to its lock file."""
+    return Path(lock_path).with_suffix(".sock")
+
+
+def query_launcher(lock_path, command, timeout=CONTROL_TIMEOUT_SECONDS):
+    """Send one command line to the running launcher and return its reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(control_socket_path(lock_path)))
+        client.sendall(command.encode("utf-8") + b"\n")
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return b"".join(chunks).decode("utf-8")
+
+
+class _ControlRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        command = self.rfile.readline(4096).decode("utf-8", errors="replace").strip()
+        after_reply = None
+        try:
+            reply, after_reply = self.server.launcher._control_command(command)
+        except Exception as error:
+            reply = f"error: {error}\n"
+        self.wfile.write(reply.encode("utf-8"))
+        self.wfile.flush()
+        if after_reply:
+            after_reply()
+
+
+class _ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, launcher):
+        self.launcher = launcher
+        super().__init__(str(path), _ControlRequestHandler)
+
+
+class SlackTargetSession:
+    def __init__(self, target):
+        self.target = target
+        self.target_id = target["id"]
+        self.devtools = None
+        # Serializes attach / health check / reinjection for this target
+        self.lock = asyncio.Lock()
+        # Page.addScriptToEvaluateOnNewDocument registration and the build it holds
+        self.script_identifier = None
+        self.registered_hash = None
+        # {name: (version, scriptId)} compiled in the current execution context
+        self.compiled_scripts = {}
+        # Consecutive failed attaches / probes, for the retry backoff
+        self.failures = 0
+
+    async def connect(self, connection):
+        self.devtools = await connection.attach(self.target_id)
+        self.devtools.subscribe("Runtime.executionContextsCleared", self._forget_compiled_scripts)
+        await asyncio.gather(self._command("Runtime.enable"), self._command("Page.enable"))
+
+    async def register_script(self, source, payload_hash):
+        """Register source for new documents once per build, replacing an older build."""
+        if self.registered_hash == payload_hash:
+            return False
+        if self.script_identifier:
+            await self._command(
+                "Page.removeScriptToEvaluateOnNewDocument",
+                {"identifier": self.script_identifier},
+            )
+            self.script_identifier = self.registered_hash = None
+        result = await self._command("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+        self.script_identifier = result.get("identifier")
+        self.registered_hash = payload_hash
+        return True
+
+    async def run_script(self, source, payload_hash):
+        """Run source in the current document, sending it at most once per execution context."""
+        return await self._run_cached("runtime", source, payload_hash)
+
+    async def reset_runtime(self):
+        """Clear the bootstrap's run-once marker so the next run_script starts SlackPolish again."""
+        await self._command("Runtime.evaluate", {"expression": RUNTIME_RESET_EXPRESSION})
+
+    async def probe(self, expression):
+        """Evaluate a fixed expression, compiled once per execution context and then run by id."""
+        result = await self._run_cached("probe", expression, "probe")
+        return result.get("result", {}).get("value")
+
+    async def close(self):
+        if not self.devtools:
+            return
+        try:
+            await self.devtools.detach()
+        except (DevToolsProtocolError, TimeoutError) as error:
+            print_verbose(f"Could not detach from target cleanly: {error}")
+        self.devtools = None
+
+    async def _command(self, method, params=None):
+        return await self.devtools.send(method, params)
+
+    async def _run_cached(self, name, source, version):
+        cached = self.compiled_scripts.get(name)
+        if cached and cached[0] == version:
+            try:
+                return await self._run_compiled_script(cached[1])
+            except DevToolsProtocolError:
+                # The context was replaced between the event and this call
+                self.compiled_scripts.pop(name, None)
+
+        result = await self._command(
+            "Runtime.compileScript",
+            {
+                "expression": source,
+                "sourceURL": f"slackpolish-{name}-{version}.js",
+                "persistScript": True,
+            },
+        )
+        if "exceptionDetails" in result:
+            raise DevToolsProtocolError(
+                f"SlackPolish {name} failed to compile: "
+                + str(result["exceptionDetails"].get("text") or result["exceptionDetails"])
+            )
+        self.compiled_scripts[name] = (version, result["scriptId"])
+        return await self._run_compiled_script(result["scriptId"])
+
+    async def _run_compiled_script(self, script_id):
+        return await self._command(
+            "Runtime.runScript",
+            {
+                "scriptId": script_id,
+                "awaitPromise": False,
+                "returnByValue": True,
+            },
+        )
+
+    def _forget_compiled_scripts(self, _params, _session_id):
+        self.compiled_scripts.clear()
+
+
+class RuntimePayloadWatcher:
+    """
+    Rebuilds the runtime payload when a SlackPolish script in source_dir changes.
+
+    Only the edited scripts are re-read (and re-minified for release builds);
+    the others are reused from the payload the launcher started with.
+    """
+
+    def __init__(self, source_dir, payload):
+        self.source_dir = Path(source_dir)
+        self.options = payload.options
+        self.scripts = payload.scripts(RUNTIME_FLAVOR)
+        self.mtimes = {file_name: self._mtime(file_name) for _, file_name in RUNTIME_PARTS}
+
+    def _mtime(self, file_name):
+        try:
+            return os.stat(self.source_dir / file_name).st_mtime_ns
+        except OSError:
+            return None
+
+    def poll(self):
+        """
+        Return (source, payload hash, changed files, failures) or None if no script changed.
+
+        source is None when every changed script failed to read or minify; a
+        failed script keeps its previous version until it is saved again.
+        """
+        changed = []
+        failures = []
+        for part, file_name in RUNTIME_PARTS:
+            mtime = self._mtime(file_name)
+            if mtime is None or mtime == self.mtimes[file_name]:
+                continue
+            self.mtimes[file_name] = mtime
+            try:
+                self.scripts[part] = read_source(self.source_dir, part, **self.options)
+            except Exception as error:
+                failures.append(f"{file_name}: {error}")
+                continue
+            changed.append(file_name)
+
+        if not changed and not failures:
+            return None
+        if not changed:
+            return None, None, changed, failures
+        source = render_flavor(RUNTIME_FLAVOR, self.scripts)
+        return source, hashlib.sha256(source.encode("utf-8")).hexdigest()[:12], changed, failures
+
+
+class SlackPolishLauncher:
+    """
+    Keeps SlackPolish injected into a running Slack. Platform launchers
+    subclass it and implement _quit_slack, _launch_slack and
+    _bring_slack_to_front.
+    """
+
+    title = "SlackPolish Runtime Launcher"
+    # DevToolsActivePort in Slack's user data dir, written once the debugging server listens
+    devtools_active_port_path = None
+
+    def __init__(
+        self,
+        state_dir,
+        lock_path,
+        slack_executable,
+        debug_port,
+        launch_slack,
+        relaunch,
+        inject_interval,
+        attach_or_relaunch=False,
+        health_interval=30.0,
+        watch=False,
+    ):
+        self.state_dir = Path(state_dir)
+        self.status_path = self.state_dir / "launcher-status.json"
+        self.heartbeat_path = self.state_dir / "launcher-heartbeat"
+        self.log_path = self.state_dir / "launcher.log"
+        self.lock_path = Path(lock_path)
+        self.slack_executable = slack_executable
+        self.debug_port = debug_port
+        self.launch_slack = launch_slack
+        self.relaunch = relaunch
+        self.inject_interval = inject_interval
+        self.attach_or_relaunch = attach_or_relaunch
+        self.health_interval = health_interval
+        self.watch = watch
+        # Built by _start_background_work while Slack boots
+        self.runtime_payload = None
+        self.payload_hash = None
+        self.payload_watcher = None
+        self.background = None
+        self.background_work = []
+        self.timings = {}
+        self.sessions = {}
+        self.browser = None
+        # Event loop of the current DevTools connection, for control socket commands
+        self.loop = None
+        self.tasks = set()
+        self.lock_handle = None
+        self.control_path = control_socket_path(self.lock_path)
+        self.control_server = None
+        self.metrics = LauncherMetrics()
+        self.heartbeat = None
+        self.last_heartbeat = 0
+        self.status_written = {}
+        self.status_written_at = 0
+        self.status_flush_handle = None
+        self.status = {
+            "pid": os.getpid(),
+            "started_at": int(time.time()),
+            "last_heartbeat": int(time.time()),
+            "phase": "starting",
+            "debug_port": self.debug_port,
+            "payload_hash": self.payload_hash,
+            "attach_or_relaunch": self.attach_or_relaunch,
+            "relaunch": self.relaunch,
+            "slack_executable": self.slack_executable,
+            "last_error": None,
+            "session_count": 0,
+        }
+
+    def run(self):
+        print_header(self.title)
+        # Stop on SIGTERM (stale-launcher recovery, logout) the same way as on Ctrl-C,
+        # so the lock, control socket and status are cleaned up
+        signal.signal(signal.SIGTERM, _interrupt_on_signal)
+        self._acquire_or_recover_single_instance_lock()
+        self._start_control_server()
+        self._open_heartbeat()
+        self._start_background_work()
+        self._update_status(phase="lock-acquired")
+
+        try:
+            if self.relaunch:
+                self._update_status(phase="relaunching-slack")
+                started = time.monotonic()
+                self._quit_slack()
+                self._record_timing("quit-slack", started)
+
+            if self.launch_slack:
+                self._update_status(phase="launching-slack")
+                started = time.monotonic()
+                self._launch_slack()
+                self._record_timing("launch-slack", started)
+
+            self._update_status(phase="connecting-devtools")
+            started = time.monotonic()
+            self._connect_or_relaunch_if_needed()
+            self._record_timing("devtools-ready", started)
+
+            self._finish_background_work()
+            print_success(f"Runtime payload prepared ({self.payload_hash})")
+
+            print_info("Watching Slack page targets for workspace injection...")
+            self._update_status(phase="watching-targets", last_error=None)
+            while True:
+                try:
+                    asyncio.run(self._watch_targets())
+                except KeyboardInterrupt:
+                    print_info("Stopping launcher...")
+                    self._update_status(phase="stopped")
+                    break
+                except Exception as error:
+                    print_warning(f"Target watch error: {error}")
+                    self._update_status(phase="watch-error", last_error=str(error))
+                    time.sleep(self.inject_interval)
+        finally:
+            if self.background:
+                # shutdown(cancel_futures=True) needs Python 3.9
+                for future in self.background_work:
+                    future.cancel()
+                self.background.shutdown(wait=False)
+            self._update_status(phase="stopped", session_count=0)
+            self._flush_status()
+            if self.heartbeat:
+                self.heartbeat.close()
+            self._stop_control_server()
+            self._release_single_instance_lock()
+
+    def _start_background_work(self):
+        """Build the payload on a worker thread while Slack starts."""
+        self.background = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="slackpolish-startup",
+        )
+        self.background_work = [
+            self.background.submit(self._timed, "payload", load_payload, FILE_DIR),
+        ]
+
+    def _finish_background_work(self):
+        started = time.monotonic()
+        [payload] = [future.result() for future in self.background_work]
+        self.background.shutdown()
+        self.background = None
+        self._record_timing("payload-wait", started)
+        self._use_payload(payload)
+
+    def _use_payload(self, payload):
+        # Prebuilt bundle from the installer, or rendered from FILE_DIR if a script is newer
+        self.runtime_payload = payload.flavor(RUNTIME_FLAVOR)
+        self.payload_hash = payload.flavor_sha256(RUNTIME_FLAVOR)[:12]
+        if self.watch:
+            self.payload_watcher = RuntimePayloadWatcher(FILE_DIR, payload)
+        self._update_status(payload_hash=self.payload_hash)
+
+    def _timed(self, name, function, *args):
+        started = time.monotonic()
+        try:
+            return function(*args)
+        finally:
+            self._record_timing(name, started)
+
+    def _record_timing(self, name, started):
+        elapsed = time.monotonic() - started
+        self.timings[name] = round(elapsed * 1000)
+        self.metrics.set("startup_phase_seconds", elapsed, phase=name)
+        print_verbose(f"⏱ {name}: {self.timings[name]} ms")
+
+    def _record_ready(self):
+        """Report the startup breakdown once, when the first target has SlackPolish running."""
+        if "ready" in self.timings:
+            return
+        self._record_timing("ready", STARTUP_STARTED)
+        phases = ", ".join(f"{name} {elapsed} ms" for name, elapsed in self.timings.items() if name != "ready")
+        print_info(f"⏱ SlackPolish ready {self.timings['ready']} ms after start ({phases})")
+        self._update_status(startup_timings_ms=dict(self.timings))
+
+    def _connect_or_relaunch_if_needed(self):
+        print_info("Waiting for Slack DevTools endpoint...")
+        initial_timeout = 2 if self.attach_or_relaunch else 20
+
+        try:
+            self._wait_for_devtools(timeout=initial_timeout)
+            print_success(f"Connected to DevTools endpoint on port {self.debug_port}")
+            return
+        except TimeoutError:
+            if not self.attach_or_relaunch:
+                raise
+
+            print_warning(
+                "Slack DevTools endpoint was not detected quickly. "
+                "Relaunching Slack with SlackPolish runtime enabled..."
+            )
+
+        self._quit_slack()
+        self._launch_slack()
+
+        print_info("Waiting for Slack DevTools endpoint after relaunch...")
+        self._wait_for_devtools()
+        print_success(f"Connected to DevTools endpoint on port {self.debug_port} after relaunch")
+
+    def _acquire_single_instance_lock(self):
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock_handle = open(self.lock_path, "a+", encoding="utf-8")
+        try:
+            fcntl.flock(self.lock_handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise RuntimeError("SlackPolish is already running")
+
+        self.lock_handle.seek(0)
+        self.lock_handle.truncate()
+        self.lock_handle.write(str(os.getpid()))
+        self.lock_handle.flush()
+
+    def _acquire_or_recover_single_instance_lock(self):
+        try:
+            self._acquire_single_instance_lock()
+            return
+        except RuntimeError:
+            # A launcher that answers on its control socket is alive: hand over and leave
+            try:
+                query_launcher(self.lock_path, "focus", timeout=2)
+            except OSError as error:
+                print_verbose(f"Running launcher did not answer on its control socket: {error}")
+            else:
+                print_success("SlackPolish is already running. Brought Slack to the foreground.")
+                raise AlreadyRunningAndFocused()
+
+            # Older launchers without a control socket, or a stuck one
+            lock_pid = self._read_lock_pid()
+            status = self._read_heartbeat()
+            if not status or status["pid"] != lock_pid:
+                status = self._read_status()
+            if self._can_recover_stuck_launcher(lock_pid, status):
+                self._terminate_process(lock_pid, reason="stale launcher")
+                self._wait_for_exit([lock_pid])
+                self._acquire_single_instance_lock()
+                print_warning("Recovered from a stale SlackPolish launcher process")
+                return
+
+            if self._devtools_available():
+                self._bring_slack_to_front()
+                print_success("SlackPolish is already running. Brought Slack to the foreground.")
+                raise AlreadyRunningAndFocused()
+
+            self._bring_slack_to_front()
+            raise RuntimeError(f"SlackPolish is already running. Logs: {self.log_path}")
+
+    def _release_single_instance_lock(self):
+        if not self.lock_handle:
+            return
+        try:
+            self.lock_handle.seek(0)
+            self.lock_handle.truncate()
+            fcntl.flock(self.lock_handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            self.lock_handle.close()
+            self.lock_handle = None
+
+    def _read_lock_pid(self):
+        try:
+            return int(self.lock_path.read_text(encoding="utf-8").strip())
+        except Exception:
+            return None
+
+    def _read_status(self):
+        try:
+            with open(self.status_path, "r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except Exception:
+            return None
+
+    def _read_heartbeat(self):
+        return read_heartbeat(self.heartbeat_path)
+
+    def _start_control_server(self):
+        """Serve the control socket on a thread, so it answers across DevTools reconnects."""
+        try:
+            # Holding the lock makes any socket file left here a stale one
+            self._remove_control_socket()
+            self.control_server = _ControlServer(self.control_path, self)
+            os.chmod(self.control_path, 0o600)
+        except OSError as error:
+            print_warning(f"Control socket unavailable, --stats will not work: {error}")
+            self.control_server = None
+            return
+        thread = threading.Thread(
+            target=self.control_server.serve_forever,
+            name="slackpolish-control",
+            daemon=True,
+        )
+        thread.start()
+
+    def _stop_control_server(self):
+        if not self.control_server:
+            return
+        self.control_server.shutdown()
+        self.control_server.server_close()
+        self.control_server = None
+        self._remove_control_socket()
+
+    def _remove_control_socket(self):
+        try:
+            self.control_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _control_command(self, command):
+        """
+        Answer one control socket command (called on the control thread).
+
+        Returns the reply text and an optional callable to run once the reply
+        has been sent.
+        """
+        name, _, argument = command.partition(" ")
+        if name == "status":
+            return json.dumps(self._control_status(), indent=2, sort_keys=True) + "\n", None
+        if name == "stats":
+            if argument == "prometheus":
+                return self.metrics.render_prometheus(), None
+            return self.metrics.render_json() + "\n", None
+        if name == "reinject":
+            count = self._run_in_loop(self._reinject_all())
+            return f"ok: re-injected {count} target(s)\n", None
+        if name == "reload-payload":
+            payload_hash, count = self._run_in_loop(self._reload_payload())
+            return f"ok: payload {payload_hash} in {count} target(s)\n", None
+        if name == "focus":
+            self._bring_slack_to_front()
+            return "ok\n", None
+        if name == "shutdown":
+            # Stop through the SIGTERM handler, on the main thread, after replying
+            return "ok: shutting down\n", lambda: os.kill(os.getpid(), signal.SIGTERM)
+        return f"error: unknown command {name!r}\n", None
+
+    def _control_status(self):
+        return {
+            **self.status,
+            "targets": [
+                {
+                    "id": session.target_id,
+                    "url": session.target.get("url"),
+                    "attached": session.devtools is not None,
+                    "failures": session.failures,
+                }
+                for session in list(self.sessions.values())
+            ],
+        }
+
+    def _run_in_loop(self, coroutine):
+        """Run coroutine on the DevTools event loop from the control thread and wait for it."""
+        loop = self.loop
+        if loop is None or self.runtime_payload is None:
+            coroutine.close()
+            raise RuntimeError("not connected to Slack DevTools yet")
+        future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+        return future.result(CONTROL_TIMEOUT_SECONDS)
+
+    def _on_devtools_command(self, method, seconds, sent_bytes):
+        self.metrics.observe("devtools_command_seconds", seconds, method=method)
+        self.metrics.observe("devtools_sent_bytes", sent_bytes, method=method)
+
+    def _open_heartbeat(self):
+        try:
+            self.heartbeat = HeartbeatFile(self.heartbeat_path)
+        except (OSError, ValueError) as error:
+            # Stale-launcher recovery falls back to last_heartbeat in the status file
+            print_verbose(f"Could not map heartbeat file, using the status file instead: {error}")
+
+    def _write_status(self):
+        """Replace the status file in one rename, so readers never see a partial write."""
+        self.status["last_heartbeat"] = int(time.time())
+        temp_path = self.status_path.with_name(f".{self.status_path.name}.{os.getpid()}.tmp")
+        try:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                json.dump(self.status, handle, sort_keys=True)
+            os.replace(temp_path, self.status_path)
+        except Exception as error:
+            print_verbose(f"Could not write launcher status: {error}")
+            return
+        self.status_written = {key: value for key, value in self.status.items() if key != "last_heartbeat"}
+        self.status_written_at = time.monotonic()
+
+    def _update_status(self, **updates):
+        """Record status changes; the file is rewritten once per burst, and only if a field changed."""
+        self.status.update(updates)
+        self.status["session_count"] = len(self.sessions)
+        if not self._status_changed() or self.status_flush_handle:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_status()
+            return
+        self.status_flush_handle = loop.call_later(STATUS_COALESCE_SECONDS, self._flush_status)
+
+    def _status_changed(self):
+        return any(self.status_written.get(key) != value for key, value in self.status.items() if key != "last_heartbeat")
+
+    def _flush_status(self):
+        if self.status_flush_handle:
+            self.status_flush_handle.cancel()
+            self.status_flush_handle = None
+        if self._status_changed():
+            self._write_status()
+
+    def _heartbeat(self):
+        now = time.time()
+        if now - self.last_heartbeat < 2:
+            return
+        self.last_heartbeat = now
+        self._update_status()
+        if self.heartbeat:
+            self.heartbeat.beat()
+        elif time.monotonic() - self.status_written_at >= STATUS_HEARTBEAT_SECONDS:
+            self._write_status()
+        flush_log()
+
+    def _process_exists(self, pid):
+        if not pid:
+            return False
+        try:
+            os.kill(pid, 0)
+            return True
+        except OSError:
+            return False
+
+    def _can_recover_stuck_launcher(self, lock_pid, status):
+        if not lock_pid or not self._process_exists(lock_pid):
+            return False
+
+        if not status or status.get("pid") != lock_pid:
+            return False
+
+        heartbeat_age = time.time() - float(status.get("last_heartbeat") or 0)
+        if heartbeat_age < 15:
+            return False
+
+        try:
+            self._fetch_json("/json/version")
+            return False
+        except Exception:
+            return True
+
+    def _terminate_process(self, pid, reason):
+        if not pid or pid == os.getpid():
+            return
+        print_warning(f"Stopping {reason} process {pid}")
+        try:
+            os.kill(pid, 15)
+        except OSError:
+            return
+
+    def _stop_processes(self, name):
+        """SIGTERM every process named exactly name and wait until they have exited."""
+        try:
+            result = subprocess.run(["pgrep", "-x", name], capture_output=True, text=True, check=False)
+        except Exception as error:
+            print_verbose(f"Could not look up {name} processes: {error}")
+            return
+        pids = [int(pid) for pid in result.stdout.split() if pid.isdigit() and int(pid) != os.getpid()]
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+        self._wait_for_exit(pids)
+
+    def _wait_for_exit(self, pids, timeout=PROCESS_EXIT_TIMEOUT_SECONDS):
+        deadline = time.monotonic() + timeout
+        remaining = [pid for pid in pids if pid]
+        while remaining:
+            for pid in remaining:
+                try:
+                    # Reaps the process if it is our own child, so it stops counting as alive
+                    os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    pass
+            remaining = [pid for pid in remaining if self._process_exists(pid)]
+            if not remaining:
+                return True
+            if time.monotonic() >= deadline:
+                print_warning(f"Processes still running after {timeout}s: {remaining}")
+                return False
+            time.sleep(0.05)
+        return True
+
+    def _bring_slack_to_front(self):
+        raise NotImplementedError
+
+    def _quit_slack(self):
+        raise NotImplementedError
+
+    def _launch_slack(self):
+        raise NotImplementedError
+
+    def _debug_args(self):
+        return [
+            f"--remote-debugging-port={self.debug_port}",
+            "--remote-allow-origins=*",
+        ]
+
+    def _wait_for_devtools(self, timeout=20):
+        """
+        Retry the DevTools endpoint with backoff, and try again at once when
+        Slack writes a fresh DevToolsActivePort (it does so as soon as the
+        debugging server is listening).
+        """
+        deadline = time.monotonic() + timeout
+        delay = DEVTOOLS_RETRY_INITIAL_SECONDS
+        next_attempt = 0
+        port_file_mtime = self._devtools_port_file_mtime()
+        while True:
+            now = time.monotonic()
+            mtime = self._devtools_port_file_mtime()
+            if now >= next_attempt or mtime != port_file_mtime:
+                port_file_mtime = mtime
+                if self._devtools_available():
+                    return
+                next_attempt = now + delay
+                delay = min(delay * 2, DEVTOOLS_RETRY_MAX_SECONDS)
+            if now >= deadline:
+                raise TimeoutError("Slack DevTools endpoint did not become available")
+            time.sleep(DEVTOOLS_PORT_FILE_POLL_SECONDS)
+
+    def _devtools_port_file_mtime(self):
+        if not self.devtools_active_port_path:
+            return None
+        try:
+            return os.stat(self.devtools_active_port_path).st_mtime_ns
+        except OSError:
+            return None
+
+    async def _watch_targets(self):
+        """Follow DevTools target events over one browser connection until it drops."""
+        websocket_url = self._fetch_json("/json/version").get("webSocketDebuggerUrl")
+        if not websocket_url:
+            raise DevToolsProtocolError("Slack DevTools endpoint has no browser connection")
+
+        self.loop = asyncio.get_running_loop()
+        self.browser = DevToolsConnection(
+            websocket_url,
+            on_warning=print_warning,
+            on_command=self._on_devtools_command,
+        )
+        try:
+            await self.browser.connect()
+            self.browser.subscribe("Target.targetCreated", self._on_target_info)
+            self.browser.subscribe("Target.targetInfoChanged", self._on_target_info)
+            self.browser.subscribe("Target.targetDestroyed", self._on_target_destroyed)
+            self.browser.subscribe("Target.detachedFromTarget", self._on_detached_from_target)
+            # Replays targetCreated for every existing target, then reports changes
+            await self.browser.send("Target.setDiscoverTargets", {"discover": True})
+            print_verbose("Subscribed to DevTools target events")
+            self._update_status(phase="watching-targets", last_error=None)
+
+            next_health_check = time.monotonic() + self.health_interval
+            wait_limit = WATCH_INTERVAL_SECONDS if self.payload_watcher else EVENT_WAIT_SECONDS
+            while True:
+                timeout = min(wait_limit, max(0, next_health_check - time.monotonic()))
+                done, _ = await asyncio.wait({self.browser.closed}, timeout=timeout)
+                if done:
+                    raise self.browser.closed.result() or DevToolsProtocolError("DevTools connection closed")
+                if self.payload_watcher:
+                    await self._reload_changed_payload()
+                if time.monotonic() >= next_health_check:
+                    self._probe_targets()
+                    next_health_check = time.monotonic() + self.health_interval
+                self._heartbeat()
+        finally:
+            for task in list(self.tasks):
+                task.cancel()
+            await self.browser.close()
+            self.browser = None
+            self.loop = None
+            self.sessions.clear()
+            # Recount the sessions, then write without waiting for the coalescing delay
+            self._update_status()
+            self._flush_status()
+
+    async def _reload_changed_payload(self):
+        change = self.payload_watcher.poll()
+        if not change:
+            return
+
+        source, payload_hash, changed_files, failures = change
+        for failure in failures:
+            print_warning(f"Could not rebuild {failure}")
+        if source is None:
+            return
+
+        self.runtime_payload, self.payload_hash = source, payload_hash
+        print_info(f"Rebuilt runtime payload ({self.payload_hash}) after editing {', '.join(changed_files)}")
+        self._update_status(payload_hash=self.payload_hash)
+        await self._reload_all()
+
+    async def _reload_payload(self):
+        """reload-payload: rebuild from FILE_DIR and push the build to every target."""
+        payload = await asyncio.get_running_loop().run_in_executor(None, load_payload, FILE_DIR)
+        previous_hash = self.payload_hash
+        self._use_payload(payload)
+        if self.payload_hash == previous_hash:
+            print_info(f"Runtime payload unchanged ({self.payload_hash})")
+            return self.payload_hash, 0
+        print_info(f"Reloaded runtime payload ({self.payload_hash}) on request")
+        return self.payload_hash, await self._reload_all()
+
+    async def _reload_all(self):
+        # The new bootstrap runs the previous build's __SLACKPOLISH_RUNTIME_TEARDOWN__,
+        # which removes its listeners through __SLACKPOLISH_LISTENER_STATE__
+        results = await asyncio.gather(*(self._reload_target(target_id) for target_id in list(self.sessions)))
+        return sum(results)
+
+    async def _reinject_all(self):
+        """reinject: run the current build again in every attached target."""
+        results = await asyncio.gather(
+            *(
+                self._reload_target(target_id, action="Re-injected", force=True)
+                for target_id in list(self.sessions)
+            )
+        )
+        return sum(results)
+
+    async def _reload_target(self, target_id, action="Hot-reloaded", force=False):
+        session = self.sessions.get(target_id)
+        if not session:
+            return False
+        async with session.lock:
+            if self.sessions.get(target_id) is not session or not session.devtools:
+                return False
+            try:
+                started = time.monotonic()
+                await self._inject(session, force=force)
+                self.metrics.observe("reinject_seconds", time.monotonic() - started)
+            except Exception as error:
+                print_warning(f"{action} failed for target {session.target.get('url')}: {error}")
+                return False
+        print_success(f"{action} SlackPolish ({self.payload_hash}) into target: {session.target.get('url')}")
+        return True
+
+    def _spawn(self, coroutine):
+        task = asyncio.create_task(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+    def _task_done(self, task):
+        self.tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            print_warning(f"Target update failed: {task.exception()}")
+            self._update_status(last_error=str(task.exception()))
+
+    def _on_target_info(self, params, _session_id):
+        target_info = params.get("targetInfo") or {}
+        target_id = target_info.get("targetId")
+        target_url = str(target_info.get("url") or "")
+        if target_info.get("type") != "page" or "app.slack.com" not in target_url:
+            if target_id in self.sessions:
+                self._spawn(self._detach_target(target_id))
+            return
+
+        target = {
+            "id": target_id,
+            "type": "page",
+            "title": target_info.get("title"),
+            "url": target_url,
+        }
+        session = self.sessions.get(target_id)
+        if session is None:
+            session = SlackTargetSession(target)
+            self.sessions[target_id] = session
+            self._spawn(self._attach_target(session))
+            return
+
+        # Title changes (unread counts) also arrive here; only URL changes matter
+        previous_url = session.target.get("url")
+        session.target = target
+        if previous_url != target_url:
+            self._spawn(self._refresh_target(target_id))
+
+    def _on_target_destroyed(self, params, _session_id):
+        self._drop_session(params.get("targetId"))
+
+    def _on_detached_from_target(self, params, _session_id):
+        for target_id, session in list(self.sessions.items()):
+            if session.devtools and session.devtools.session_id == params.get("sessionId"):
+                self._drop_session(target_id)
+
+    def _on_navigated(self, target_id, params):
+        # Page.frameNavigated carries a frame, navigatedWithinDocument a frameId
+        frame = params.get("frame") or {}
+        if frame.get("parentId") or params.get("frameId", target_id) != target_id:
+            return
+        session = self.sessions.get(target_id)
+        if session:
+            print_verbose(f"Slack target navigated: {session.target.get('url')}")
+            self._spawn(self._refresh_target(target_id))
+
+    def _drop_session(self, target_id):
+        session = self.sessions.pop(target_id, None)
+        if session is None:
+            return
+        if session.devtools:
+            self.browser.unsubscribe_session(session.devtools.session_id)
+        print_verbose(f"Slack target went away: {session.target.get('url')}")
+        self._update_status(phase="watching-targets")
+
+    async def _detach_target(self, target_id):
+        session = self.sessions.pop(target_id, None)
+        if session is None:
+            return
+        async with session.lock:
+            await session.close()
+        print_verbose(f"Detached from Slack target: {session.target.get('url')}")
+        self._update_status(phase="watching-targets")
+
+    def _probe_targets(self):
+        """Start a health probe for every idle target without waiting for any of them."""
+        for target_id, session in list(self.sessions.items()):
+            # Busy targets (attaching, backing off, still probing) are skipped this round
+            if session.devtools and not session.lock.locked():
+                self._spawn(self._refresh_target(target_id))
+
+    async def _refresh_target(self, target_id):
+        session = self.sessions.get(target_id)
+        if not session:
+            return
+
+        async with session.lock:
+            if self.sessions.get(target_id) is not session or not session.devtools:
+                return
+            target = session.target
+            try:
+                started = time.monotonic()
+                needs_reinject = await asyncio.wait_for(
+                    self._target_needs_runtime_reinject(session),
+                    HEALTH_PROBE_TIMEOUT_SECONDS,
+                )
+                self.metrics.observe("health_probe_seconds", time.monotonic() - started)
+                if needs_reinject:
+                    print_warning(
+                        "SlackPolish runtime was missing from target. Re-injecting: "
+                        + f"{target.get('title') or '(untitled)'} | {target.get('url')}"
+                    )
+                    started = time.monotonic()
+                    await self._inject(session, force=True)
+                    self.metrics.observe("reinject_seconds", time.monotonic() - started)
+                    print_success(
+                        "Re-injected SlackPolish into target: "
+                        + f"{target.get('title') or '(untitled)'} | {target.get('url')}"
+                    )
+                session.failures = 0
+            except Exception as error:
+                if isinstance(error, asyncio.TimeoutError):
+                    error = f"no answer within {HEALTH_PROBE_TIMEOUT_SECONDS}s"
+                await session.close()
+                self._retry_target(session, f"Target session became unhealthy: {error}")
+
+    def _retry_target(self, session, reason):
+        """Replace a failed session with a fresh one that attaches after an exponential backoff."""
+        if self.sessions.get(session.target_id) is not session:
+            return
+        replacement = SlackTargetSession(session.target)
+        replacement.failures = session.failures + 1
+        self.sessions[session.target_id] = replacement
+        delay = min(RETRY_BACKOFF_MAX_SECONDS, RETRY_BACKOFF_SECONDS * 2 ** (session.failures))
+        print_warning(f"{reason}. Reattaching in {delay}s: {session.target.get('url')}")
+        self._update_status(last_error=reason)
+        self._spawn(self._attach_target(replacement, delay))
+
+    async def _attach_target(self, session, delay=0):
+        target = session.target
+        target_id = session.target_id
+        async with session.lock:
+            if delay:
+                await asyncio.sleep(delay)
+                if self.sessions.get(target_id) is not session:
+                    return
+            try:
+                started = time.monotonic()
+                await session.connect(self.browser)
+                for method in ("Page.frameNavigated", "Page.navigatedWithinDocument"):
+                    session.devtools.subscribe(
+                        method,
+                        lambda params, _session_id: self._on_navigated(target_id, params),
+                    )
+                await self._inject(session)
+                self.metrics.observe("attach_seconds", time.monotonic() - started)
+            except Exception as error:
+                await session.close()
+                self._retry_target(session, f"Could not attach to Slack target: {error}")
+                return
+        print_success(
+            "Attached to Slack target: "
+            + f"{target.get('title') or '(untitled)'} | {target.get('url')}"
+        )
+        self._update_status(phase="watching-targets", last_error=None)
+        self._record_ready()
+
+    async def _inject(self, session, force=False):
+        # Registration is skipped when this build is already registered, and the
+        # current document reuses its compiled script, so reinjection after a
+        # lost badge only sends a Runtime.runScript by reference. force clears
+        # the bootstrap's marker first; without it an unchanged build is a no-op
+        async def run():
+            if force:
+                await session.reset_runtime()
+            await session.run_script(self.runtime_payload, self.payload_hash)
+
+        await asyncio.gather(
+            session.register_script(self.runtime_payload, self.payload_hash),
+            run(),
+        )
+
+    async def _target_needs_runtime_reinject(self, session):
+        return await session.probe(HEALTH_PROBE_EXPRESSION) == "reinject"
+
+    def _fetch_json(self, path):
+        url = f"http://127.0.0.1:{self.debug_port}{path}"
+        started = time.monotonic()
+        with urllib.request.urlopen(url, timeout=3) as response:
+            result = json.load(response)
+        self.metrics.observe("devtools_http_seconds", time.monotonic() - started, path=path)
+        return result
+
+    def _devtools_available(self):
+        try:
+            self._fetch_json("/json/version")
+            return True
+        except Exception:
+            return False
+
+
+def add_common_arguments(parser):
+    """Arguments shared by every platform launcher."""
+    parser.add_argument(
+        "--slack-path",
+        help="Path to the Slack application or executable",
+    )
+    parser.add_argument(
+        "--debug-port",
+        type=int,
+        default=9222,
+        help="Chrome DevTools port to use for Slack runtime injection",
+    )
+    parser.add_argument(
+        "--attach-only",
+        action="store_true",
+        help="Do not launch Slack, only attach to an already-running Slack debug port",
+    )
+    parser.add_argument(
+        "--attach-or-relaunch",
+        action="store_true",
+        help="Attach to running Slack when possible, otherwise relaunch Slack with the debug port",
+    )
+    parser.add_argument(
+        "--relaunch",
+        action="store_true",
+        help="Quit Slack before launching it with the debug port",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds to wait before reconnecting after the DevTools connection drops",
+    )
+    parser.add_argument(
+        "--health-interval",
+        type=float,
+        default=30.0,
+        help="Seconds between safety-net checks that the runtime is still present in each target",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Watch the SlackPolish scripts and hot-reload edits into running Slack targets",
+    )
+    parser.add_argument(
+        "--control",
+        choices=[command for command in CONTROL_COMMANDS if command != "stats"],
+        help="Send a command to the running launcher over its control socket and exit",
+    )
+    parser.add_argument(
+        "--stats",
+        nargs="?",
+        const="json",
+        choices=["json", "prometheus"],
+        help="Print the running launcher's metrics (JSON, or Prometheus text) and exit",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+
+
+def launcher_options(args):
+    """SlackPolishLauncher keyword arguments for the common command line options."""
+    return {
+        "debug_port": args.debug_port,
+        "launch_slack": not (args.attach_only or args.attach_or_relaunch),
+        "relaunch": args.relaunch,
+        "inject_interval": args.poll_interval,
+        "attach_or_relaunch": args.attach_or_relaunch,
+        "health_interval": args.health_interval,
+        "watch": args.watch,
+    }
+
+
+def start_logging(log_path, verbose):
+    configure_logging(log_path, verbose)
+    append_log_line("")
+    append_log_line(f"=== launcher start {time.strftime('%Y-%m-%d %H:%M:%S')} pid={os.getpid()} ===")
+
+
+def run_control_command(lock_path, command):
+    """--control / --stats: send command to the running launcher and print the reply."""
+    try:
+        reply = query_launcher(lock_path, command)
+    except OSError as error:
+        print_error(f"SlackPolish launcher is not running ({control_socket_path(lock_path)}): {error}")
+        return 1
+    print(reply, end="")
+    return 1 if reply.startswith("error:") else 0
+
+
+def print_launcher_stats(lock_path, output_format):
+    """--stats: print the running launcher's metrics; returns the process exit code."""
+    return run_control_command(lock_path, "stats prometheus" if output_format == "prometheus" else "stats")
+
+
+def run_launcher(launcher):
+    """Run a launcher until it stops; returns the process exit code."""
+    try:
+        launcher.run()
+        return 0
+    except AlreadyRunningAndFocused:
+        return 0
+    except KeyboardInterrupt:
+        return 0
+    except Exception as error:
+        print_error(str(error))
+        return 1
@@ -10,6 +10,8 @@ import subprocess
 import shutil
 import argparse
 
+from slackpolish_fileops import copy_file, fsync_directory
+
 def print_error(message):
     print(f"❌ {message}")
 
@@ -44,8 +46,13 @@ def backup_exists(slack_path):
     backup_path = os.path.join(slack_path, "app.asar.backup")
     return os.path.exists(backup_path)
 
-def restore_original_asar(slack_path):
-    """Restore the original app.asar from backup."""
+def restore_original_asar(slack_path, keep_backup=True):
+    """
+    Restore the original app.asar from backup.
+
+    The swap is a rename, so Slack never sees a missing or half-written
+    archive. Without keep_backup the backup itself is renamed into place.
+    """
     try:
         asar_path = os.path.join(slack_path, "app.asar")
         backup_path = os.path.join(slack_path, "app.asar.backup")
@@ -59,13 +66,20 @@ def restore_original_asar(slack_path):
             return False
         
         print_info("Restoring original app.asar from backup...")
-        
-        # Remove current (modified) app.asar
-        if os.path.exists(asar_path):
-            os.remove(asar_path)
-        
-        # Restore from backup
-        shutil.copy2(backup_path, asar_path)
+
+        if keep_backup:
+            # Independent copy (reflink where supported) so the kept backup stays pristine
+            method = copy_file(backup_path, asar_path)
+            print_info(f"Restored a copy of the backup ({method})")
+        else:
+            os.replace(backup_path, asar_path)
+            fsync_directory(slack_path)
+            print_info("Moved the backup into place")
+
+        # The installer's manifest describes the patched archive, which is gone now
+        manifest_path = os.path.join(slack_path, "app.asar.slackpolish-manifest.json")
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
         
         print_success("Original app.asar restored successfully!")
         return True
@@ -131,7 +145,7 @@ def main():
         return 0
     
     # Restore original asar
-    if not restore_original_asar(slack_path):
+    if not restore_original_asar(slack_path, keep_backup=args.keep_backup):
         print_error("Failed to restore original asar")
         return 1
     
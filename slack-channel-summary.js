@@ -25,6 +25,12 @@
         }
     };
 
+    // Map-reduce summaries: histories over SUMMARY_CHUNK_TOKENS are summarized in parts
+    const SUMMARY_CHUNK_TOKENS = 12000;       // Input budget per request (about 48,000 characters)
+    const SUMMARY_CONCURRENCY = 3;            // Part summaries requested at once
+    const SUMMARY_PARTIAL_MAX_TOKENS = 800;   // Length of each part's notes
+    const SUMMARY_DAY_BREAK_FILL = 0.75;      // Close a part at a day boundary once it is this full
+
     // Channel Summary management
     const SlackChannelSummary = {
         // Default settings (only what's needed for channel summary)
@@ -1098,15 +1104,16 @@
         // Process messages and generate AI summary
         processAndDisplaySummary: async function(result, summaryLevel, textbox, generateBtn) {
             try {
-                // Format messages for AI processing
-                const messagesText = this.formatMessagesForAI(result.messages);
-
                 // Show animated loading display
                 this.startAISummaryAnimation(textbox, result, summaryLevel);
 
                 // Generate AI summary if we have messages
                 if (result.messages.length > 0) {
-                    const aiSummary = await this.generateAISummary(messagesText, summaryLevel, result);
+                    // Histories that don't fit one request are summarized in parts, then merged
+                    const chunks = this.splitMessagesIntoChunks(result.messages, this.getChunkTokenBudget());
+                    const aiSummary = chunks.length > 1
+                        ? await this.generateChunkedSummary(chunks, summaryLevel, result)
+                        : await this.generateAISummary(this.formatMessagesForAI(result.messages), summaryLevel, result);
 
                     // Stop animation and display final result
                     this.stopAISummaryAnimation();
@@ -1140,6 +1147,9 @@
             const reportTitle = isThreadSummary ? '🧵 THREAD SUMMARY REPORT' : '📊 CHANNEL SUMMARY REPORT';
             const locationLabel = isThreadSummary ? `🧵  THREAD IN: ${channelName}` : `🏷️  CHANNEL: ${channelName}`;
 
+            // Filled in by generateChunkedSummary as parts complete
+            this.summaryProgress = '';
+
             // Store animation interval for cleanup
             this.aiSummaryInterval = setInterval(() => {
                 const spinner = frames[frameIndex];
@@ -1156,7 +1166,7 @@ ${locationLabel}
 │                ${spinner} GENERATING AI SUMMARY...                  │
 │          Please wait while we analyze the messages         │
 │                   Summary Level: ${summaryLevel.toUpperCase()}                    │
-└─────────────────────────────────────────────────────────────┘`;
+└─────────────────────────────────────────────────────────────┘${this.summaryProgress ? `\n\n${this.summaryProgress}` : ''}`;
 
                 frameIndex = (frameIndex + 1) % frames.length;
             }, 100); // Update every 100ms for smooth spinner animation
@@ -1287,23 +1297,233 @@ Generated by SlackPolish Channel Summary • ${new Date().toLocaleString()}`;
                 return 'No messages to summarize.';
             }
 
-            return messages.map(msg => {
-                const timestamp = msg.timestamp ? new Date(msg.timestamp).toLocaleString() : '';
-                const user = msg.user || 'Unknown';
-                const text = msg.text || '';
-                return `${timestamp} - ${user}: ${text}`;
-            }).join('\n');
+            return messages.map(msg => this.formatMessageLine(msg)).join('\n');
+        },
+
+        formatMessageLine: function(msg) {
+            const timestamp = msg.timestamp ? new Date(msg.timestamp).toLocaleString() : '';
+            const user = msg.user || 'Unknown';
+            const text = msg.text || '';
+            return `${timestamp} - ${user}: ${text}`;
+        },
+
+        // Rough token count (about 4 characters per token for English text)
+        estimateTokens: function(text) {
+            return Math.ceil(text.length / 4);
+        },
+
+        getChunkTokenBudget: function() {
+            return window.SLACKPOLISH_CONFIG?.CHANNEL_SUMMARY?.CHUNK_TOKENS || SUMMARY_CHUNK_TOKENS;
+        },
+
+        // Split messages into windows of at most budgetTokens, oldest first. A thread
+        // (parent plus replies) is never split unless it alone is over budget, and a
+        // window that is mostly full is closed at the next day boundary.
+        splitMessagesIntoChunks: function(messages, budgetTokens) {
+            const units = [];
+            for (const msg of messages) {
+                const line = this.formatMessageLine(msg);
+                const current = units[units.length - 1];
+                if (msg.isThreadReply && current && current.threadTs === msg.parentTs) {
+                    current.messages.push(msg);
+                    current.lines.push(line);
+                    current.tokens += this.estimateTokens(line) + 1;
+                } else {
+                    const time = msg.timestamp ? new Date(msg.timestamp) : null;
+                    units.push({
+                        threadTs: msg.ts,
+                        time: time ? time.getTime() : 0,
+                        day: time ? time.toDateString() : '',
+                        messages: [msg],
+                        lines: [line],
+                        tokens: this.estimateTokens(line) + 1
+                    });
+                }
+            }
+
+            // Channel history arrives newest first; summaries read better oldest first
+            units.sort((a, b) => a.time - b.time);
+
+            const chunks = [];
+            let chunk = null;
+            const closeChunk = () => {
+                if (chunk && chunk.messages.length > 0) {
+                    chunk.text = chunk.lines.join('\n');
+                    chunks.push(chunk);
+                }
+                chunk = null;
+            };
+            const openChunk = (day) => {
+                chunk = { messages: [], lines: [], tokens: 0, firstDay: day, lastDay: day };
+            };
+
+            for (const unit of units) {
+                if (chunk && (chunk.tokens + unit.tokens > budgetTokens ||
+                    (unit.day !== chunk.lastDay && chunk.tokens >= budgetTokens * SUMMARY_DAY_BREAK_FILL))) {
+                    closeChunk();
+                }
+
+                if (unit.tokens > budgetTokens) {
+                    // A single huge thread: cut it by lines
+                    closeChunk();
+                    unit.lines.forEach((line, index) => {
+                        const lineTokens = this.estimateTokens(line) + 1;
+                        if (chunk && chunk.tokens + lineTokens > budgetTokens) {
+                            closeChunk();
+                        }
+                        if (!chunk) {
+                            openChunk(unit.day);
+                        }
+                        chunk.messages.push(unit.messages[index]);
+                        chunk.lines.push(line);
+                        chunk.tokens += lineTokens;
+                    });
+                    closeChunk();
+                    continue;
+                }
+
+                if (!chunk) {
+                    openChunk(unit.day);
+                }
+                chunk.messages.push(...unit.messages);
+                chunk.lines.push(...unit.lines);
+                chunk.tokens += unit.tokens;
+                chunk.lastDay = unit.day || chunk.lastDay;
+            }
+            closeChunk();
+
+            return chunks;
+        },
+
+        // Map-reduce summary: summarize each chunk (a few at a time), merge the partial
+        // summaries in batches until they fit one request, then write the final summary
+        generateChunkedSummary: async function(chunks, summaryLevel, result) {
+            try {
+                const apiKey = this.getSummaryApiKey();
+                const budgetTokens = this.getChunkTokenBudget();
+                const concurrency = window.SLACKPOLISH_CONFIG?.CHANNEL_SUMMARY?.CHUNK_CONCURRENCY || SUMMARY_CONCURRENCY;
+                const startedAt = Date.now();
+
+                utils.debug('Generating chunked AI summary', {
+                    chunks: chunks.length,
+                    messages: result.messages.length,
+                    budgetTokens,
+                    concurrency,
+                    summaryLevel
+                });
+
+                let done = 0;
+                this.setSummaryProgress(`📦 Summarizing ${chunks.length} parts (0/${chunks.length} done)`);
+                let notes = await this.mapWithConcurrency(chunks, concurrency, async (chunk, index) => {
+                    const partial = await this.requestSummaryCompletion(
+                        apiKey,
+                        this.createChunkPrompt(chunk, index, chunks.length, result),
+                        SUMMARY_PARTIAL_MAX_TOKENS
+                    );
+                    done++;
+                    this.setSummaryProgress(`📦 Summarizing ${chunks.length} parts (${done}/${chunks.length} done)`);
+                    return this.formatPartialHeading(chunk, index, chunks.length) + '\n' + partial;
+                });
+
+                // Merge neighbouring partial summaries until everything fits one request
+                let round = 0;
+                while (notes.length > 1 && this.estimateTokens(notes.join('\n\n')) > budgetTokens) {
+                    round++;
+                    const partialCount = notes.length;
+                    const batches = this.batchByTokens(notes, budgetTokens);
+                    let merged = 0;
+                    this.setSummaryProgress(`🔗 Merging ${partialCount} partial summaries (round ${round}, 0/${batches.length})`);
+                    notes = await this.mapWithConcurrency(batches, concurrency, async (batch) => {
+                        const mergedNotes = await this.requestSummaryCompletion(
+                            apiKey,
+                            this.createMergePrompt(batch, result),
+                            SUMMARY_PARTIAL_MAX_TOKENS
+                        );
+                        merged++;
+                        this.setSummaryProgress(`🔗 Merging ${partialCount} partial summaries (round ${round}, ${merged}/${batches.length})`);
+                        return mergedNotes;
+                    });
+                }
+
+                this.setSummaryProgress(`✍️ Writing the final summary from ${chunks.length} parts...`);
+                const summary = await this.requestSummaryCompletion(
+                    apiKey,
+                    this.createReducePrompt(notes.join('\n\n'), summaryLevel, result, chunks.length),
+                    this.getMaxTokensForSummaryLevel(summaryLevel)
+                );
+
+                utils.debug('Chunked AI summary generated', {
+                    chunks: chunks.length,
+                    mergeRounds: round,
+                    durationMs: Date.now() - startedAt
+                });
+
+                return summary;
+            } catch (error) {
+                return this.handleSummaryError(error);
+            }
+        },
+
+        setSummaryProgress: function(text) {
+            this.summaryProgress = text;
+            utils.debug('Summary progress', { progress: text });
+        },
+
+        // Run task(item, index) over items with at most `limit` in flight; results keep item order.
+        // The first failure stops new work from starting and is rethrown.
+        mapWithConcurrency: async function(items, limit, task) {
+            const results = new Array(items.length);
+            let next = 0;
+            let failed = false;
+
+            const worker = async () => {
+                while (!failed && next < items.length) {
+                    const index = next++;
+                    try {
+                        results[index] = await task(items[index], index);
+                    } catch (error) {
+                        failed = true;
+                        throw error;
+                    }
+                }
+            };
+
+            await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+            return results;
+        },
+
+        // Consecutive groups of texts whose combined size fits budgetTokens (at least two per group)
+        batchByTokens: function(texts, budgetTokens) {
+            const batches = [];
+            let batch = [];
+            let tokens = 0;
+            for (const text of texts) {
+                const textTokens = this.estimateTokens(text);
+                if (batch.length >= 2 && tokens + textTokens > budgetTokens) {
+                    batches.push(batch);
+                    batch = [];
+                    tokens = 0;
+                }
+                batch.push(text);
+                tokens += textTokens;
+            }
+            if (batch.length === 1 && batches.length > 0) {
+                batches[batches.length - 1].push(batch[0]);
+            } else if (batch.length > 0) {
+                batches.push(batch);
+            }
+            return batches;
+        },
+
+        formatPartialHeading: function(chunk, index, total) {
+            const days = chunk.firstDay === chunk.lastDay ? chunk.firstDay : `${chunk.firstDay} - ${chunk.lastDay}`;
+            return `PART ${index + 1} OF ${total}${days ? ` (${days})` : ''}, ${chunk.messages.length} messages:`;
         },
 
         // Generate AI summary using OpenAI
         generateAISummary: async function(messagesText, summaryLevel, result) {
             try {
-                // Get API key from localStorage (same method as text improver)
-                const apiKey = localStorage.getItem('slackpolish_openai_api_key');
-                if (!apiKey) {
-                    this.showApiKeyUpdatePopup('OpenAI API key not configured. Please enter your API key to use Channel Summary.');
-                    throw new Error('OpenAI API key not found. Please configure your API key in SlackPolish settings.');
-                }
+                const apiKey = this.getSummaryApiKey();
 
                 // Create prompt based on summary level
                 const prompt = this.createSummaryPrompt(messagesText, summaryLevel, result);
@@ -1315,64 +1535,149 @@ Generated by SlackPolish Channel Summary • ${new Date().toLocaleString()}`;
                     hasApiKey: !!apiKey
                 });
 
-                // Make direct OpenAI API call (same method as text improver)
-                const response = await fetch('https://api.openai.com/v1/chat/completions', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                        'Authorization': `Bearer ${apiKey}`
-                    },
-                    body: JSON.stringify({
-                        model: window.SLACKPOLISH_CONFIG?.OPENAI_MODEL || 'gpt-4-turbo',
-                        messages: [{ role: 'user', content: prompt }],
-                        max_tokens: this.getMaxTokensForSummaryLevel(summaryLevel),
-                        temperature: window.SLACKPOLISH_CONFIG?.CHANNEL_SUMMARY_TEMPERATURE || 0.3
-                    })
-                });
+                return await this.requestSummaryCompletion(apiKey, prompt, this.getMaxTokensForSummaryLevel(summaryLevel));
 
-                if (!response.ok) {
-                    // Handle API errors the same way as text improver
-                    if (response.status === 401) {
-                        this.showApiKeyUpdatePopup('Invalid or missing API key. Please update your OpenAI API key.');
-                        throw new Error('Invalid API key');
-                    } else if (response.status === 429) {
-                        this.showApiKeyUpdatePopup('OpenAI API quota exceeded or billing issue. Please check your OpenAI account or update your API key.');
-                        throw new Error('API quota exceeded');
-                    } else if (response.status === 403) {
-                        this.showApiKeyUpdatePopup('OpenAI API access forbidden. Please check your API key permissions.');
-                        throw new Error('API access forbidden');
-                    } else {
-                        throw new Error(`OpenAI API error: ${response.status} ${response.statusText}`);
-                    }
-                }
+            } catch (error) {
+                return this.handleSummaryError(error);
+            }
+        },
 
-                const data = await response.json();
+        getSummaryApiKey: function() {
+            // Get API key from localStorage (same method as text improver)
+            const apiKey = localStorage.getItem('slackpolish_openai_api_key');
+            if (!apiKey) {
+                this.showApiKeyUpdatePopup('OpenAI API key not configured. Please enter your API key to use Channel Summary.');
+                throw new Error('OpenAI API key not found. Please configure your API key in SlackPolish settings.');
+            }
+            return apiKey;
+        },
+
+        requestSummaryCompletion: async function(apiKey, prompt, maxTokens) {
+            // Make direct OpenAI API call (same method as text improver)
+            const response = await fetch('https://api.openai.com/v1/chat/completions', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'Authorization': `Bearer ${apiKey}`
+                },
+                body: JSON.stringify({
+                    model: window.SLACKPOLISH_CONFIG?.OPENAI_MODEL || 'gpt-4-turbo',
+                    messages: [{ role: 'user', content: prompt }],
+                    max_tokens: maxTokens,
+                    temperature: window.SLACKPOLISH_CONFIG?.CHANNEL_SUMMARY_TEMPERATURE || 0.3
+                })
+            });
 
-                if (data.choices && data.choices[0] && data.choices[0].message) {
-                    return data.choices[0].message.content;
+            if (!response.ok) {
+                // Handle API errors the same way as text improver
+                if (response.status === 401) {
+                    this.showApiKeyUpdatePopup('Invalid or missing API key. Please update your OpenAI API key.');
+                    throw new Error('Invalid API key');
+                } else if (response.status === 429) {
+                    this.showApiKeyUpdatePopup('OpenAI API quota exceeded or billing issue. Please check your OpenAI account or update your API key.');
+                    throw new Error('API quota exceeded');
+                } else if (response.status === 403) {
+                    this.showApiKeyUpdatePopup('OpenAI API access forbidden. Please check your API key permissions.');
+                    throw new Error('API access forbidden');
                 } else {
-                    throw new Error('Invalid response format from OpenAI API');
+                    throw new Error(`OpenAI API error: ${response.status} ${response.statusText}`);
                 }
+            }
 
-            } catch (error) {
-                utils.debug('Error generating AI summary', { error: error.message });
+            const data = await response.json();
 
-                // Don't show popup again if we already showed it for API key issues
-                if (!error.message.includes('Invalid API key') &&
-                    !error.message.includes('API quota exceeded') &&
-                    !error.message.includes('API access forbidden')) {
-                    return `❌ Failed to generate AI summary: ${error.message}\n\nRaw messages are shown above for your reference.`;
-                }
+            if (data.choices && data.choices[0] && data.choices[0].message) {
+                return data.choices[0].message.content;
+            } else {
+                throw new Error('Invalid response format from OpenAI API');
+            }
+        },
 
-                throw error; // Re-throw API key errors to be handled by caller
+        handleSummaryError: function(error) {
+            utils.debug('Error generating AI summary', { error: error.message });
+
+            // Don't show popup again if we already showed it for API key issues
+            if (!error.message.includes('Invalid API key') &&
+                !error.message.includes('API quota exceeded') &&
+                !error.message.includes('API access forbidden')) {
+                return `❌ Failed to generate AI summary: ${error.message}\n\nRaw messages are shown above for your reference.`;
             }
+
+            throw error; // Re-throw API key errors to be handled by caller
         },
 
         // Create summary prompt based on level
         createSummaryPrompt: function(messagesText, summaryLevel, result) {
             const channelName = result.channelName || 'this channel';
             const messageCount = result.messages.length;
+            const { levelInstructions, formatInstructions } = this.getSummaryInstructions(summaryLevel);
+
+            return `Please analyze the following ${messageCount} messages from ${channelName} and create a well-structured summary.
+
+INSTRUCTIONS:
+${levelInstructions}
+
+${formatInstructions}
+
+MESSAGES TO ANALYZE:
+${messagesText}
+
+Please provide your summary now:`;
+        },
+
+        // Map step: notes for one chunk, to be merged with the other chunks' notes later
+        createChunkPrompt: function(chunk, index, total, result) {
+            const channelName = result.channelName || 'this channel';
+            const days = chunk.firstDay === chunk.lastDay ? chunk.firstDay : `${chunk.firstDay} to ${chunk.lastDay}`;
+
+            return `The following ${chunk.messages.length} messages are part ${index + 1} of ${total} of the conversation history of ${channelName}${days ? ` (${days})` : ''}.
+
+Write concise notes on this part only. They will be merged with the notes for the other parts into one summary, so do not write an introduction or conclusion. Capture:
+• Main topics and who drove each discussion
+• Decisions made
+• Action items, with owners and deadlines if mentioned
+• Important numbers, dates and links
+• Open questions and unresolved issues
+
+MESSAGES:
+${chunk.text}
+
+Notes:`;
+        },
+
+        // Intermediate reduce step: several consecutive parts' notes become one set of notes
+        createMergePrompt: function(notes, result) {
+            const channelName = result.channelName || 'this channel';
+
+            return `Below are notes on consecutive parts of the conversation history of ${channelName}, oldest first.
+
+Merge them into a single set of notes covering the whole period. Keep every decision, action item (with owners), important number and date, and open question. Combine topics that continue across parts, and drop anything that a later part shows was resolved or superseded. Do not write an introduction or conclusion.
+
+${notes.join('\n\n')}
+
+Merged notes:`;
+        },
+
+        // Final reduce step: the usual summary format, written from the merged notes
+        createReducePrompt: function(notesText, summaryLevel, result, partCount) {
+            const channelName = result.channelName || 'this channel';
+            const messageCount = result.messages.length;
+            const { levelInstructions, formatInstructions } = this.getSummaryInstructions(summaryLevel);
+
+            return `The ${messageCount} messages from ${channelName} were too many to read at once, so they were summarized in ${partCount} parts. Using the notes on those parts below, create a well-structured summary of the whole conversation.
+
+INSTRUCTIONS:
+${levelInstructions}
 
+${formatInstructions}
+
+NOTES ON THE CONVERSATION (oldest first):
+${notesText}
+
+Please provide your summary now:`;
+        },
+
+        getSummaryInstructions: function(summaryLevel) {
             let levelInstructions = '';
             let formatInstructions = '';
 
@@ -1426,17 +1731,7 @@ Generated by SlackPolish Channel Summary • ${new Date().toLocaleString()}`;
                 formatInstructions = `Format your response with clear sections and bullet points for easy reading.`;
             }
 
-            return `Please analyze the following ${messageCount} messages from ${channelName} and create a well-structured summary.
-
-INSTRUCTIONS:
-${levelInstructions}
-
-${formatInstructions}
-
-MESSAGES TO ANALYZE:
-${messagesText}
-
-Please provide your summary now:`;
+            return { levelInstructions, formatInstructions };
         },
 
         // Show API key update popup (same as text improver)
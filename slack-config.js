@@ -68,6 +68,11 @@ window.SLACKPOLISH_CONFIG = {
                                      // • Medium (0.4-0.7): Balanced creativity and consistency (recommended)
                                      // • Higher (0.8-1.0): More creative, varied, but potentially inconsistent
 
+    OPENAI_STREAM: true,             // Stream improvements token by token into a preview above the status badge
+                                     // The composer is only replaced once the reply is complete;
+                                     // Escape (or typing) cancels and leaves your text untouched
+                                     // Set to false to wait for the full reply instead
+
  
 
     // ========================================
@@ -214,6 +219,11 @@ window.SLACKPOLISH_CONFIG = {
                                              //
                                              // Recommendation: 3-5 messages for most use cases
 
+        prefetchTtlSeconds: 30,              // How long context fetched on composer focus stays fresh
+                                             //
+                                             // Context is fetched when you focus a message box or switch channels,
+                                             // so the hotkey doesn't wait for Slack's API. Set to 0 to always refetch.
+
         minTextLength: 20,                   // Minimum text length to trigger Smart Context
                                              //
                                              // Smart Context only activates when your message is shorter than this
@@ -242,6 +252,21 @@ window.SLACKPOLISH_CONFIG = {
                                              // Recommendation: Enable only for troubleshooting
     },
 
+    // ========================================
+    // MESSAGE CACHE SETTINGS
+    // ========================================
+    // Channel history fetched for Smart Context and summaries is kept in memory, so
+    // repeat requests only ask Slack for messages newer than the last one seen
+    MESSAGE_CACHE: {
+        enabled: true,                       // Cache conversations.history results per channel
+        maxChannels: 20,                     // Least recently used channels are dropped beyond this
+        maxMessages: 50000,                  // Upper bound on cached messages across all channels
+        maxAgeMinutes: 15,                   // Refetch from scratch after this long, to pick up edits,
+                                             // reactions and new thread replies on older messages
+        persist: false                       // Also keep the cache in IndexedDB so it survives reloads
+                                             // Note: stores message text on disk in Slack's browser profile
+    },
+
     // ========================================
     // CHANNEL SUMMARY SETTINGS
     // ========================================
@@ -254,6 +279,10 @@ window.SLACKPOLISH_CONFIG = {
         INCLUDE_PARTICIPANTS: true,       // Include participant analysis
         INCLUDE_MESSAGE_COUNT: true,      // Show message count in summary
         INCLUDE_FILES_LINKS: false,       // Include file/link references
+        THREAD_CONCURRENCY: 4,            // Thread reply requests kept in flight; halved automatically when Slack rate-limits
+        CHUNK_TOKENS: 12000,              // Histories larger than this (~4 characters per token) are summarized
+                                          // in parts along thread and day boundaries, then merged
+        CHUNK_CONCURRENCY: 3,             // Part summaries requested from OpenAI at once
 
         // Summary depth options
         DEPTH_OPTIONS: {
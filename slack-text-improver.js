@@ -876,11 +876,13 @@
         setTextInElement: function(element, text, preservedSelectionInfo = null, textState = null) {
             if (!element) return;
 
+            // @debug-only
             // Handle debug test markers
             if (text.startsWith('[DEBUG_')) {
                 this.handleDebugInsertion(element, text);
                 return;
             }
+            // @end-debug-only
 
             // Check if we should replace selected text only
             // Use preserved selection info if available, otherwise check current selection
@@ -1293,6 +1295,7 @@
             }
         },
 
+        // @debug-only
         handleDebugInsertion: function(element, markedText) {
             // Parse debug marker
             const markerEnd = markedText.indexOf(']');
@@ -1528,8 +1531,14 @@
                 }, i * delay);
             }
         }
+        // @end-debug-only
     };
 
+    // Smart context fetched ahead of the hotkey, keyed by "channelId:threadTs" (or ":channel")
+    const SMART_CONTEXT_TTL_SECONDS = 30;
+    const SMART_CONTEXT_CACHE_SIZE = 20;
+    const smartContextCache = new Map();
+
     // Text improvement functionality
     const textImprover = {
         isProcessing: false,
@@ -1573,11 +1582,13 @@
 
 
 
+            // @debug-only
             // DEBUG TEST SYSTEM: Intercept debug commands in debug mode
             if (CONFIG.DEBUG_MODE && originalText.trim().startsWith('SlackPolish test')) {
                 utils.debug('Debug test command detected', { command: originalText });
                 return this.handleDebugTest(originalText.trim());
             }
+            // @end-debug-only
 
             if (!CONFIG.OPENAI_API_KEY) {
                 utils.debug('API key missing', { hasApiKey: false });
@@ -1606,6 +1617,10 @@
             // Show loading indicator
             showLoadingIndicator();
 
+            const cancelController = new AbortController();
+            const stopListeningForCancel = listenForImprovementCancel(cancelController);
+            const streamPreview = createStreamPreview();
+
             try {
                 const prompt = await this.buildPrompt(originalText, textState);
 
@@ -1615,6 +1630,13 @@
                     promptLength: prompt.length
                 });
 
+                // Stream the reply into a preview; Escape or typing aborts the request
+                const requestOptions = {
+                    temperature: this.getImprovementTemperature(),
+                    signal: cancelController.signal,
+                    onDelta: CONFIG.OPENAI_STREAM !== false ? (text) => streamPreview.update(text) : null
+                };
+
                 // Use shared OpenAI module if available, fallback to local implementation
                 let response;
                 if (window.SlackPolishOpenAI) {
@@ -1622,12 +1644,10 @@
                         CONFIG.OPENAI_API_KEY,
                         CONFIG.MODEL,
                         prompt,
-                        {
-                            temperature: this.getImprovementTemperature()
-                        }
+                        requestOptions
                     );
                 } else {
-                    response = await this.callOpenAI(prompt);
+                    response = await this.callOpenAI(prompt, requestOptions);
                 }
 
                 if (response && response.trim()) {
@@ -1699,6 +1719,11 @@
                     return null;
                 }
             } catch (error) {
+                if (error.name === 'AbortError') {
+                    utils.log('Text improvement cancelled - composer left unchanged');
+                    utils.debug('Text improvement cancelled', { originalText });
+                    return null;
+                }
                 utils.log(`Error improving text: ${error.message}`);
                 utils.debug('Text improvement error', {
                     error: error.message,
@@ -1709,6 +1734,8 @@
                 return null;
             } finally {
                 this.isProcessing = false;
+                stopListeningForCancel();
+                streamPreview.remove();
                 // Hide loading indicator
                 hideLoadingIndicator();
                 setStatusBadgeState('active', 'SlackPolish Active');
@@ -1716,6 +1743,7 @@
             }
         },
 
+        // @debug-only
         handleDebugTest(originalText) {
             // Parse debug command: "SlackPolish test [command] [parameters...]"
             const parts = originalText.split(' ');
@@ -1875,6 +1903,7 @@ Available test commands (use in debug mode only):
 
             return helpText;
         },
+        // @end-debug-only
 
         async buildPrompt(text, textState = null) {
             utils.debug('Building prompt', {
@@ -1963,23 +1992,73 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
             return configuredTemperature;
         },
 
-        async getSmartContext() {
-            try {
-                if (!window.SlackPolishChannelMessages) {
-                    utils.debug('Channel Messages module not available for smart context');
-                    return [];
+        getSmartContextTtl() {
+            const seconds = window.SLACKPOLISH_CONFIG?.SMART_CONTEXT?.prefetchTtlSeconds;
+            return (typeof seconds === 'number' ? seconds : SMART_CONTEXT_TTL_SECONDS) * 1000;
+        },
+
+        // Warm the context cache ahead of the hotkey (composer focus, channel switch)
+        prefetchSmartContext(reason) {
+            if (!CONFIG.SMART_CONTEXT || !CONFIG.SMART_CONTEXT.enabled || CONFIG.STYLE === 'TONE_POLISH') {
+                return;
+            }
+            if (!window.SlackPolishChannelMessages || this.isProcessing) {
+                return;
+            }
+            this.getSmartContext(reason);
+        },
+
+        async getSmartContext(reason = 'improvement') {
+            if (!window.SlackPolishChannelMessages) {
+                utils.debug('Channel Messages module not available for smart context');
+                return [];
+            }
+
+            // Check if user is currently focused in a thread
+            const threadTs = this.isUserInThreadInput() ? this.getCurrentThreadTs() : null;
+            const channelId = window.SlackPolishChannelMessages.getCurrentChannelId();
+            if (!channelId) {
+                return this.fetchSmartContext(threadTs);
+            }
+
+            const key = `${channelId}:${threadTs || 'channel'}`;
+            const now = Date.now();
+            const cached = smartContextCache.get(key);
+            if (cached && now - cached.fetchedAt < this.getSmartContextTtl()) {
+                utils.debug('Using prefetched smart context', {
+                    key,
+                    reason,
+                    ageMs: now - cached.fetchedAt
+                });
+                return cached.promise;
+            }
+
+            const promise = this.fetchSmartContext(threadTs).then(messages => {
+                // Don't hold on to a failed or empty fetch for the whole TTL
+                if (messages.length === 0 && smartContextCache.get(key)?.promise === promise) {
+                    smartContextCache.delete(key);
                 }
+                return messages;
+            });
+            smartContextCache.delete(key);
+            smartContextCache.set(key, { promise, fetchedAt: now });
+            while (smartContextCache.size > SMART_CONTEXT_CACHE_SIZE) {
+                smartContextCache.delete(smartContextCache.keys().next().value);
+            }
+            utils.debug('Started smart context fetch', { key, reason });
+            return promise;
+        },
 
+        async fetchSmartContext(threadTs) {
+            try {
                 utils.debug('Fetching smart context messages');
 
-                // Check if user is currently focused in a thread
-                const isInThreadInput = this.isUserInThreadInput();
                 let result = null;
 
-                if (isInThreadInput) {
+                if (threadTs) {
                     utils.debug('User is in thread input - fetching thread context');
                     try {
-                        result = await this.getThreadContext(5);
+                        result = await this.getThreadContext(5, threadTs);
                     } catch (threadError) {
                         utils.debug('Thread context fetching failed, falling back to channel context', {
                             error: threadError.message
@@ -2011,7 +2090,7 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                 utils.debug('Smart context messages prepared', {
                     totalMessages: result.messages.length,
                     contextMessages: contextMessages.length,
-                    contextType: isInThreadInput ? 'thread' : 'channel',
+                    contextType: threadTs ? 'thread' : 'channel',
                     channelId: result.channelId,
                     channelName: result.channelName,
                     threadTs: result.threadTs || null,
@@ -2072,12 +2151,10 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
             return result;
         },
 
-        async getThreadContext(count = 5) {
+        async getThreadContext(count = 5, threadTs = this.getCurrentThreadTs()) {
             // Get context from thread conversation
             utils.debug('Fetching thread context');
 
-            // Extract thread timestamp from URL or DOM
-            const threadTs = this.getCurrentThreadTs();
             if (!threadTs) {
                 throw new Error('Could not determine thread timestamp');
             }
@@ -2220,11 +2297,12 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
             }
         },
 
-        async callOpenAI(prompt) {
+        async callOpenAI(prompt, options = {}) {
             utils.debug('Calling OpenAI API', {
                 model: CONFIG.MODEL,
                 promptLength: prompt.length,
-                apiKeyLength: CONFIG.OPENAI_API_KEY ? CONFIG.OPENAI_API_KEY.length : 0
+                apiKeyLength: CONFIG.OPENAI_API_KEY ? CONFIG.OPENAI_API_KEY.length : 0,
+                stream: !!options.onDelta
             });
 
             const requestBody = {
@@ -2236,7 +2314,8 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                     }
                 ],
                 max_tokens: window.SLACKPOLISH_CONFIG?.OPENAI_MAX_TOKENS || 500,
-                temperature: this.getImprovementTemperature()
+                temperature: this.getImprovementTemperature(),
+                stream: !!options.onDelta
             };
 
             utils.debug('API request body', requestBody);
@@ -2247,7 +2326,8 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                     'Content-Type': 'application/json',
                     'Authorization': `Bearer ${CONFIG.OPENAI_API_KEY}`
                 },
-                body: JSON.stringify(requestBody)
+                body: JSON.stringify(requestBody),
+                signal: options.signal
             });
 
             utils.debug('API response received', {
@@ -2262,6 +2342,12 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                 throw new Error(errorData.error?.message || `HTTP ${response.status}`);
             }
 
+            if (requestBody.stream) {
+                const streamed = await readOpenAIStream(response, options.onDelta);
+                utils.debug('API stream finished', { resultLength: streamed.length });
+                return streamed;
+            }
+
             const data = await response.json();
             const result = data.choices?.[0]?.message?.content || '';
 
@@ -2292,6 +2378,8 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
     let currentKeyupListener = null;
     let currentFocusListener = null;
     let currentBlurListener = null;
+    let currentComposerFocusListener = null;
+    let currentChannelObserver = null;
     let currentStorageListener = null;
     let currentCustomSettingsListener = null;
 
@@ -2302,6 +2390,8 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                 keyup: null,
                 focus: null,
                 blur: null,
+                composerFocus: null,
+                channelObserver: null,
                 storage: null,
                 settingsCustom: null,
                 activeSetupId: null,
@@ -2329,6 +2419,12 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
             if (globalListenerState.blur) {
                 window.removeEventListener('blur', globalListenerState.blur);
             }
+            if (globalListenerState.composerFocus) {
+                document.removeEventListener('focusin', globalListenerState.composerFocus);
+            }
+            if (globalListenerState.channelObserver) {
+                globalListenerState.channelObserver.disconnect();
+            }
             if (globalListenerState.storage) {
                 window.removeEventListener('storage', globalListenerState.storage);
             }
@@ -2343,6 +2439,8 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
         currentKeyupListener = null;
         currentFocusListener = null;
         currentBlurListener = null;
+        currentComposerFocusListener = null;
+        currentChannelObserver = null;
         currentStorageListener = null;
         currentCustomSettingsListener = null;
 
@@ -2350,6 +2448,8 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
         globalListenerState.keyup = null;
         globalListenerState.focus = null;
         globalListenerState.blur = null;
+        globalListenerState.composerFocus = null;
+        globalListenerState.channelObserver = null;
         globalListenerState.storage = null;
         globalListenerState.settingsCustom = null;
         globalListenerState.isProcessing = false;
@@ -2376,6 +2476,12 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
             if (globalListenerState.blur) {
                 window.removeEventListener('blur', globalListenerState.blur);
             }
+            if (globalListenerState.composerFocus) {
+                document.removeEventListener('focusin', globalListenerState.composerFocus);
+            }
+            if (globalListenerState.channelObserver) {
+                globalListenerState.channelObserver.disconnect();
+            }
 
             if (currentKeydownListener) {
                 document.removeEventListener('keydown', currentKeydownListener);
@@ -2410,12 +2516,16 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
         currentKeyupListener = null;
         currentFocusListener = null;
         currentBlurListener = null;
+        currentComposerFocusListener = null;
+        currentChannelObserver = null;
         currentStorageListener = null;
         currentCustomSettingsListener = null;
         globalListenerState.keydown = null;
         globalListenerState.keyup = null;
         globalListenerState.focus = null;
         globalListenerState.blur = null;
+        globalListenerState.composerFocus = null;
+        globalListenerState.channelObserver = null;
         globalListenerState.storage = null;
         globalListenerState.settingsCustom = null;
         globalListenerState.activeSetupId = setupId;
@@ -2578,6 +2688,30 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
         globalListenerState.focus = currentFocusListener;
         globalListenerState.blur = currentBlurListener;
 
+        // Prefetch smart context while the user is still typing, so the hotkey
+        // doesn't wait on a conversations.history/replies round trip
+        currentComposerFocusListener = function(event) {
+            if (event.target && event.target.isContentEditable) {
+                textImprover.prefetchSmartContext('composer-focus');
+            }
+        };
+        document.addEventListener('focusin', currentComposerFocusListener);
+        globalListenerState.composerFocus = currentComposerFocusListener;
+
+        // Slack switches channels with pushState, but always retitles the window
+        const titleElement = document.querySelector('title');
+        if (titleElement && typeof MutationObserver !== 'undefined') {
+            let lastPath = window.location.pathname;
+            currentChannelObserver = new MutationObserver(() => {
+                if (window.location.pathname !== lastPath) {
+                    lastPath = window.location.pathname;
+                    textImprover.prefetchSmartContext('channel-change');
+                }
+            });
+            currentChannelObserver.observe(titleElement, { childList: true, characterData: true, subtree: true });
+            globalListenerState.channelObserver = currentChannelObserver;
+        }
+
         // Log successful setup completion
         utils.log(`Event listeners registered successfully for ${CONFIG.HOTKEY} (setup-id: ${setupId})`);
         utils.debug('Event listener setup completed', {
@@ -2759,6 +2893,89 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
         return;
     }
 
+    // Abort an in-flight improvement when the user presses Escape or keeps typing
+    function listenForImprovementCancel(controller) {
+        const onKeydown = (event) => {
+            const typing = (event.key.length === 1 && !event.ctrlKey && !event.metaKey && !event.altKey) ||
+                event.key === 'Backspace' || event.key === 'Delete' || event.key === 'Enter';
+            if (event.key !== 'Escape' && !typing) return;
+
+            if (event.key === 'Escape') {
+                event.preventDefault();
+                event.stopPropagation();
+            }
+            utils.debug('Cancelling text improvement', { key: event.key });
+            controller.abort();
+        };
+
+        document.addEventListener('keydown', onKeydown, true);
+        return () => document.removeEventListener('keydown', onKeydown, true);
+    }
+
+    // Read-only preview of a streamed improvement, shown above the status badge;
+    // the composer itself is only written once the stream has finished
+    function createStreamPreview() {
+        let preview = null;
+        let latestText = '';
+        let frameRequested = false;
+        let removed = false;
+
+        const render = () => {
+            frameRequested = false;
+            if (removed) return;
+            if (!preview) {
+                if (!document.body) return;
+                preview = document.createElement('div');
+                preview.id = 'slackpolish-stream-preview';
+                preview.style.cssText = `
+                    position: fixed;
+                    left: 20px;
+                    bottom: 64px;
+                    max-width: 420px;
+                    max-height: 40vh;
+                    overflow: hidden;
+                    padding: 10px 14px;
+                    border-radius: 10px;
+                    background: rgba(255, 255, 255, 0.97);
+                    color: #1d1c1d;
+                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+                    font-size: 13px;
+                    line-height: 1.45;
+                    white-space: pre-wrap;
+                    z-index: 9999;
+                    box-shadow: 0 4px 16px rgba(0,0,0,0.22);
+                    border: 1px solid rgba(18, 100, 163, 0.35);
+                    pointer-events: none;
+                `;
+                preview.innerHTML = `
+                    <div id="slackpolish-stream-preview-text"></div>
+                    <div style="margin-top: 6px; font-size: 11px; color: #616061;">Esc or keep typing to cancel</div>
+                `;
+                document.body.appendChild(preview);
+                setStatusBadgeState('busy', 'SlackPolish Writing');
+            }
+            preview.querySelector('#slackpolish-stream-preview-text').textContent = latestText;
+        };
+
+        return {
+            update(text) {
+                latestText = text;
+                // Coalesce chunks to at most one DOM update per frame
+                if (!frameRequested) {
+                    frameRequested = true;
+                    requestAnimationFrame(render);
+                }
+            },
+            remove() {
+                removed = true;
+                if (preview) {
+                    preview.remove();
+                    preview = null;
+                }
+            }
+        };
+    }
+
     // Show simple error notification (original design)
     function showSimpleError(message) {
         const errorDiv = document.createElement('div');
@@ -3069,11 +3286,124 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
         }
     }
 
+    // Per-channel conversations.history cache (see SlackPolishChannelMessages.fetchChannelMessages)
+    const MESSAGE_CACHE_DEFAULTS = {
+        enabled: true,
+        maxChannels: 20,
+        maxMessages: 50000,
+        maxAgeMinutes: 15,
+        persist: false
+    };
+    const MESSAGE_CACHE_DB = 'slackpolish-message-cache';
+    const MESSAGE_CACHE_STORE = 'channels';
+
+    // Messages (oldest first) are contiguous from coveredFrom up to newestTs, the
+    // high-water mark as of syncedAt; complete means coveredFrom is the channel start.
+    // An entry seeded by a request with a past latest only covers up to coveredTo
+    function createChannelCacheEntry(channelId) {
+        return {
+            channelId,
+            messages: [],
+            newestTs: null,
+            coveredFrom: null,
+            coveredTo: null,
+            complete: false,
+            syncedAt: 0
+        };
+    }
+
+    // Slack timestamps ("1700000000.123456") carry more digits than a double keeps exact
+    function compareSlackTs(a, b) {
+        const [aSeconds, aFraction = ''] = String(a).split('.');
+        const [bSeconds, bFraction = ''] = String(b).split('.');
+        if (aSeconds !== bSeconds) {
+            return Number(aSeconds) - Number(bSeconds);
+        }
+        const width = Math.max(aFraction.length, bFraction.length);
+        const aPadded = aFraction.padEnd(width, '0');
+        const bPadded = bFraction.padEnd(width, '0');
+        return aPadded === bPadded ? 0 : (aPadded < bPadded ? -1 : 1);
+    }
+
+    const THREAD_REPLY_CONCURRENCY = 4;
+    const THREAD_REPLY_PAGE_SIZE = 200;
+    const SLACK_RATE_LIMIT_RETRIES = 5;
+    const SLACK_RATE_LIMIT_MAX_BACKOFF_MS = 30000;
+
+    // Shared by concurrent Slack API workers: caps the calls in flight, and on a
+    // ratelimited response pauses every worker for Retry-After and halves the cap.
+    // The cap grows back by one after each run of successful calls.
+    function createSlackRateLimiter(maxConcurrency) {
+        const waiting = [];
+        const wakeNext = () => {
+            const next = waiting.shift();
+            if (next) next();
+        };
+
+        return {
+            limit: maxConcurrency,
+            active: 0,
+            pausedUntil: 0,
+            successes: 0,
+            rateLimitedCalls: 0,
+
+            async acquire() {
+                while (true) {
+                    const pauseMs = this.pausedUntil - Date.now();
+                    if (pauseMs > 0) {
+                        await new Promise(resolve => setTimeout(resolve, pauseMs));
+                    } else if (this.active < this.limit) {
+                        this.active++;
+                        return;
+                    } else {
+                        await new Promise(resolve => waiting.push(resolve));
+                    }
+                }
+            },
+
+            release() {
+                this.active--;
+                wakeNext();
+            },
+
+            succeeded() {
+                if (this.limit < maxConcurrency && ++this.successes >= this.limit) {
+                    this.limit++;
+                    this.successes = 0;
+                    wakeNext();
+                }
+            },
+
+            // Returns the delay applied before the next call
+            rateLimited(retryAfterSeconds, attempt) {
+                const delayMs = retryAfterSeconds
+                    ? retryAfterSeconds * 1000
+                    : Math.min(1000 * 2 ** attempt, SLACK_RATE_LIMIT_MAX_BACKOFF_MS);
+                this.pausedUntil = Math.max(this.pausedUntil, Date.now() + delayMs);
+                this.limit = Math.max(1, Math.floor(this.limit / 2));
+                this.successes = 0;
+                this.rateLimitedCalls++;
+                return delayMs;
+            }
+        };
+    }
+
+    // Retry-After as seconds, from whichever form the API wrapper hands back
+    function getRetryAfterSeconds(response) {
+        const value = response.retry_after ?? response.headers?.['retry-after'] ?? response.headers?.['Retry-After'];
+        const seconds = parseFloat(value);
+        return Number.isFinite(seconds) && seconds > 0 ? seconds : null;
+    }
+
     // Initialize global Channel Messages system
     function initializeGlobalChannelMessagesSystem() {
         if (window.SlackPolishChannelMessages) return; // Already initialized
 
         window.SlackPolishChannelMessages = {
+            messageCache: new Map(), // channelId -> cache entry, least recently used first
+            messageCacheQueue: new Map(),
+            messageCacheDB: null,
+
             getCurrentChannelId() {
                 try {
                     // Try multiple methods to get current channel ID
@@ -3336,77 +3666,30 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                         throw new Error('Could not determine current channel ID');
                     }
 
-                    let allMessages = [];
-                    let hasMore = true;
-                    let cursor = latest; // Start from latest timestamp
-                    let totalApiCalls = 0;
-                    const maxApiCalls = getAllMessages ? 100 : 10; // Safety limit
-
-                    while (hasMore && totalApiCalls < maxApiCalls) {
-                        totalApiCalls++;
-
-                        // Build API request parameters
-                        const apiParams = {
-                            channel: channelId,
-                            limit: getAllMessages ? 1000 : Math.min(count - allMessages.length, 1000),
-                            inclusive: inclusive
-                        };
-
-                        // Add timestamp parameters
-                        if (oldest) {
-                            apiParams.oldest = this.convertToSlackTimestamp(oldest);
-                        }
-                        if (cursor) {
-                            apiParams.latest = this.convertToSlackTimestamp(cursor);
-                        }
-
-                        if (window.SlackPolishDebug) {
-                            window.SlackPolishDebug.addLog('channel-messages', 'Making API call', {
-                                call: totalApiCalls,
-                                params: apiParams,
-                                currentMessageCount: allMessages.length
-                            });
-                        }
-
-                        // Call Slack's internal conversations.history API
-                        const response = await this.callSlackAPI('conversations.history', apiParams);
-
-                        if (!response.ok) {
-                            throw new Error(`Slack API error: ${response.error || 'Unknown error'}`);
-                        }
-
-                        const messages = response.messages || [];
-
-                        if (window.SlackPolishDebug) {
-                            window.SlackPolishDebug.addLog('channel-messages', 'API response received', {
-                                messagesReceived: messages.length,
-                                hasMore: response.has_more,
-                                responseMetadata: response.response_metadata
-                            });
-                        }
-
-                        // Process and add messages
-                        const processedMessages = messages.map(msg => this.processSlackMessage(msg));
-                        allMessages.push(...processedMessages);
-
-                        // Check if we should continue
-                        hasMore = response.has_more && (getAllMessages || allMessages.length < count);
+                    const request = {
+                        count,
+                        inclusive,
+                        getAllMessages,
+                        oldestTs: oldest ? this.convertToSlackTimestamp(oldest) : null,
+                        latestTs: latest ? this.convertToSlackTimestamp(latest) : null
+                    };
+                    const calls = {
+                        made: 0,
+                        limit: getAllMessages ? 100 : 10 // Safety limit
+                    };
 
-                        // Update cursor for next request (oldest message timestamp)
-                        if (hasMore && messages.length > 0) {
-                            cursor = messages[messages.length - 1].ts;
+                    let allMessages = await this.withCachedChannel(channelId, async (entry) => {
+                        // Only ask Slack for what the cache doesn't have: newer messages
+                        // since the high-water mark, then older pages until the request is covered
+                        if (entry.syncedAt && this.needsNewerMessages(entry, request)) {
+                            await this.fetchNewerMessages(entry, calls);
                         }
-
-                        // Safety check
-                        if (!getAllMessages && allMessages.length >= count) {
-                            hasMore = false;
+                        while (!entry.complete && calls.made < calls.limit && this.needsOlderMessages(entry, request)) {
+                            await this.fetchOlderMessages(entry, request, calls);
                         }
-                    }
-
-                    // Trim to requested count if not getting all messages
-                    if (!getAllMessages && allMessages.length > count) {
-                        allMessages = allMessages.slice(0, count);
-                    }
+                        entry.syncedAt = Date.now();
+                        return this.selectCachedMessages(entry, request);
+                    });
 
                     // Include thread messages if requested
                     if (includeThreads) {
@@ -3418,7 +3701,7 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                         channelName: this.getCurrentChannelName(),
                         messages: allMessages,
                         totalReturned: allMessages.length,
-                        apiCallsMade: totalApiCalls,
+                        apiCallsMade: calls.made,
                         fetchedAt: new Date().toISOString(),
                         parameters: {
                             count,
@@ -3446,10 +3729,309 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                 }
             },
 
+            async fetchHistoryPage(params, calls) {
+                calls.made++;
+
+                if (window.SlackPolishDebug) {
+                    window.SlackPolishDebug.addLog('channel-messages', 'Making API call', {
+                        call: calls.made,
+                        params
+                    });
+                }
+
+                // Call Slack's internal conversations.history API
+                const response = await this.callSlackAPI('conversations.history', params);
+
+                if (!response.ok) {
+                    throw new Error(`Slack API error: ${response.error || 'Unknown error'}`);
+                }
+
+                const messages = response.messages || [];
+
+                if (window.SlackPolishDebug) {
+                    window.SlackPolishDebug.addLog('channel-messages', 'API response received', {
+                        messagesReceived: messages.length,
+                        hasMore: response.has_more,
+                        responseMetadata: response.response_metadata
+                    });
+                }
+
+                // Slack returns newest first; the cache keeps oldest first
+                return {
+                    messages: messages.map(msg => this.processSlackMessage(msg)).reverse(),
+                    hasMore: !!response.has_more && messages.length > 0
+                };
+            },
+
+            // Messages posted since the cache was last synced (oldest= the high-water mark)
+            async fetchNewerMessages(entry, calls) {
+                const pages = [];
+                let cursor = null;
+                let hasMore = true;
+
+                while (hasMore && calls.made < calls.limit) {
+                    const params = {
+                        channel: entry.channelId,
+                        oldest: entry.newestTs || '0',
+                        inclusive: false,
+                        limit: 1000
+                    };
+                    if (cursor) {
+                        params.latest = cursor;
+                    }
+
+                    const page = await this.fetchHistoryPage(params, calls);
+                    pages.unshift(page.messages);
+                    hasMore = page.hasMore;
+                    if (hasMore) {
+                        cursor = page.messages[0].ts;
+                    }
+                }
+
+                const newer = [].concat(...pages)
+                    .filter(msg => !entry.newestTs || compareSlackTs(msg.ts, entry.newestTs) > 0);
+
+                if (hasMore) {
+                    // Too much happened to close the gap; keep only the new, contiguous span
+                    entry.messages = newer;
+                    entry.coveredFrom = newer.length > 0 ? newer[0].ts : null;
+                    entry.complete = false;
+                } else {
+                    entry.messages = entry.messages.concat(newer);
+                }
+                // Either way the cache now reaches the high-water mark
+                entry.coveredTo = null;
+                if (newer.length > 0) {
+                    entry.newestTs = newer[newer.length - 1].ts;
+                }
+            },
+
+            // A windowed entry only needs the gap to now when the request reaches past it
+            needsNewerMessages(entry, request) {
+                if (!entry.coveredTo || !request.latestTs) {
+                    return true;
+                }
+                return compareSlackTs(request.latestTs, entry.coveredTo) > 0;
+            },
+
+            // One page older than anything cached, bounded by the request's oldest;
+            // the first page of an empty entry starts at the request's latest
+            async fetchOlderMessages(entry, request, calls) {
+                const params = {
+                    channel: entry.channelId,
+                    limit: request.getAllMessages
+                        ? 1000
+                        : Math.max(1, Math.min(request.count - this.selectCachedMessages(entry, request).length, 1000)),
+                    inclusive: !entry.coveredFrom
+                };
+                if (entry.coveredFrom) {
+                    params.latest = entry.coveredFrom;
+                } else if (request.latestTs) {
+                    params.latest = request.latestTs;
+                    entry.coveredTo = request.latestTs;
+                }
+                if (request.oldestTs) {
+                    params.oldest = request.oldestTs;
+                }
+
+                const page = await this.fetchHistoryPage(params, calls);
+                const older = page.messages
+                    .filter(msg => !entry.coveredFrom || compareSlackTs(msg.ts, entry.coveredFrom) < 0);
+
+                entry.messages = older.concat(entry.messages);
+                if (!entry.newestTs && older.length > 0) {
+                    entry.newestTs = older[older.length - 1].ts;
+                }
+
+                if (page.hasMore) {
+                    entry.coveredFrom = older.length > 0 ? older[0].ts : entry.coveredFrom;
+                } else if (request.oldestTs) {
+                    entry.coveredFrom = request.oldestTs;
+                } else {
+                    // Reached the start of the channel
+                    entry.complete = true;
+                    entry.coveredFrom = older.length > 0 ? older[0].ts : (entry.coveredFrom || '0');
+                }
+            },
+
+            needsOlderMessages(entry, request) {
+                if (entry.complete) {
+                    return false;
+                }
+                if (!entry.coveredFrom) {
+                    return true;
+                }
+                if (request.oldestTs && compareSlackTs(entry.coveredFrom, request.oldestTs) <= 0) {
+                    return false;
+                }
+                return request.getAllMessages || this.selectCachedMessages(entry, request).length < request.count;
+            },
+
+            // Cached messages in the requested window, newest first like conversations.history
+            selectCachedMessages(entry, request) {
+                const selected = [];
+                for (let i = entry.messages.length - 1; i >= 0; i--) {
+                    const msg = entry.messages[i];
+                    if (request.latestTs) {
+                        const order = compareSlackTs(msg.ts, request.latestTs);
+                        if (order > 0 || (order === 0 && !request.inclusive)) continue;
+                    }
+                    if (request.oldestTs) {
+                        const order = compareSlackTs(msg.ts, request.oldestTs);
+                        if (order < 0 || (order === 0 && !request.inclusive)) break;
+                    }
+                    selected.push(msg);
+                    if (!request.getAllMessages && selected.length >= request.count) break;
+                }
+                return selected;
+            },
+
+            // Run task(entry) against the channel's cache entry, one task per channel at a time
+            async withCachedChannel(channelId, task) {
+                const settings = this.getMessageCacheSettings();
+                if (!settings.enabled) {
+                    return task(createChannelCacheEntry(channelId));
+                }
+
+                const previous = this.messageCacheQueue.get(channelId) || Promise.resolve();
+                const run = previous.catch(() => {}).then(async () => {
+                    const entry = await this.getCachedChannel(channelId, settings);
+                    try {
+                        return await task(entry);
+                    } finally {
+                        // Pages already merged stay valid even if a later call failed
+                        this.messageCache.delete(channelId);
+                        this.messageCache.set(channelId, entry);
+                        this.trimMessageCache(settings, channelId);
+                        if (settings.persist) {
+                            this.persistCachedChannel(entry);
+                        }
+                    }
+                });
+                this.messageCacheQueue.set(channelId, run);
+
+                try {
+                    return await run;
+                } finally {
+                    if (this.messageCacheQueue.get(channelId) === run) {
+                        this.messageCacheQueue.delete(channelId);
+                    }
+                }
+            },
+
+            getMessageCacheSettings() {
+                return {
+                    ...MESSAGE_CACHE_DEFAULTS,
+                    ...(window.SLACKPOLISH_CONFIG?.MESSAGE_CACHE || {})
+                };
+            },
+
+            async getCachedChannel(channelId, settings) {
+                let entry = this.messageCache.get(channelId);
+                if (!entry && settings.persist) {
+                    entry = await this.loadPersistedChannel(channelId);
+                }
+
+                // Edits, reactions and new thread replies on old messages aren't seen
+                // by incremental refreshes, so start over once an entry gets old
+                if (!entry || Date.now() - entry.syncedAt > settings.maxAgeMinutes * 60 * 1000) {
+                    entry = createChannelCacheEntry(channelId);
+                }
+                return entry;
+            },
+
+            // Least recently used channels go first; the active one is trimmed instead
+            trimMessageCache(settings, activeChannelId) {
+                let total = 0;
+                for (const entry of this.messageCache.values()) {
+                    total += entry.messages.length;
+                }
+
+                for (const [channelId, entry] of this.messageCache) {
+                    if (this.messageCache.size <= settings.maxChannels && total <= settings.maxMessages) {
+                        break;
+                    }
+                    if (channelId !== activeChannelId) {
+                        this.messageCache.delete(channelId);
+                        total -= entry.messages.length;
+                    }
+                }
+
+                const active = this.messageCache.get(activeChannelId);
+                if (active && active.messages.length > settings.maxMessages) {
+                    active.messages = active.messages.slice(-settings.maxMessages);
+                    active.coveredFrom = active.messages[0].ts;
+                    active.complete = false;
+                }
+            },
+
+            clearMessageCache() {
+                this.messageCache.clear();
+                if (typeof indexedDB !== 'undefined') {
+                    this.openMessageCacheDB()
+                        .then(db => db.transaction(MESSAGE_CACHE_STORE, 'readwrite').objectStore(MESSAGE_CACHE_STORE).clear())
+                        .catch(() => {});
+                }
+            },
+
+            openMessageCacheDB() {
+                if (!this.messageCacheDB) {
+                    this.messageCacheDB = new Promise((resolve, reject) => {
+                        const request = indexedDB.open(MESSAGE_CACHE_DB, 1);
+                        request.onupgradeneeded = () => {
+                            request.result.createObjectStore(MESSAGE_CACHE_STORE, { keyPath: 'channelId' });
+                        };
+                        request.onsuccess = () => resolve(request.result);
+                        request.onerror = () => reject(request.error);
+                    });
+                }
+                return this.messageCacheDB;
+            },
+
+            async loadPersistedChannel(channelId) {
+                if (typeof indexedDB === 'undefined') {
+                    return null;
+                }
+                try {
+                    const db = await this.openMessageCacheDB();
+                    return await new Promise((resolve, reject) => {
+                        const request = db.transaction(MESSAGE_CACHE_STORE).objectStore(MESSAGE_CACHE_STORE).get(channelId);
+                        request.onsuccess = () => resolve(request.result || null);
+                        request.onerror = () => reject(request.error);
+                    });
+                } catch (error) {
+                    if (window.SlackPolishDebug) {
+                        window.SlackPolishDebug.addLog('channel-messages', 'Could not read persisted message cache', {
+                            channelId,
+                            error: error?.message
+                        });
+                    }
+                    return null;
+                }
+            },
+
+            persistCachedChannel(entry) {
+                if (typeof indexedDB === 'undefined') {
+                    return;
+                }
+                this.openMessageCacheDB()
+                    .then(db => {
+                        db.transaction(MESSAGE_CACHE_STORE, 'readwrite').objectStore(MESSAGE_CACHE_STORE).put(entry);
+                    })
+                    .catch(error => {
+                        if (window.SlackPolishDebug) {
+                            window.SlackPolishDebug.addLog('channel-messages', 'Could not persist message cache', {
+                                channelId: entry.channelId,
+                                error: error?.message
+                            });
+                        }
+                    });
+            },
+
             convertToSlackTimestamp(timestamp) {
                 if (typeof timestamp === 'string') {
-                    // If it's already a Slack timestamp (contains decimal)
-                    if (timestamp.includes('.')) {
+                    // If it's already a Slack timestamp (seconds, optionally with a decimal part)
+                    if (/^\d+(\.\d+)?$/.test(timestamp)) {
                         return timestamp;
                     }
                     // If it's an ISO string, convert to Slack timestamp
@@ -3485,7 +4067,10 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                                 if (response.ok) {
                                     resolve(response);
                                 } else {
-                                    reject(new Error(response.error || 'API call failed'));
+                                    const error = new Error(response.error || 'API call failed');
+                                    error.slackError = response.error || null;
+                                    error.retryAfter = getRetryAfterSeconds(response);
+                                    reject(error);
                                 }
                             });
                         });
@@ -3588,28 +4173,19 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
 
             async includeThreadReplies(messages, channelId) {
                 try {
-                    const messagesWithThreads = [];
-
-                    for (const message of messages) {
-                        messagesWithThreads.push(message);
-
-                        // If message has replies, fetch them
-                        if (message.reply_count > 0 && message.ts) {
+                    const parents = messages.filter(message => message.reply_count > 0 && message.ts);
+                    const concurrency = window.SLACKPOLISH_CONFIG?.CHANNEL_SUMMARY?.THREAD_CONCURRENCY || THREAD_REPLY_CONCURRENCY;
+                    const limiter = createSlackRateLimiter(concurrency);
+                    const repliesByParent = new Map();
+                    const startedAt = Date.now();
+
+                    // Workers pull parents off a shared index; the limiter decides how many calls are in flight
+                    let nextParent = 0;
+                    const worker = async () => {
+                        while (nextParent < parents.length) {
+                            const message = parents[nextParent++];
                             try {
-                                const threadResponse = await this.callSlackAPI('conversations.replies', {
-                                    channel: channelId,
-                                    ts: message.ts
-                                });
-
-                                if (threadResponse.ok && threadResponse.messages) {
-                                    // Skip the parent message (first in array) and add replies
-                                    const replies = threadResponse.messages.slice(1).map(msg => ({
-                                        ...this.processSlackMessage(msg),
-                                        isThreadReply: true,
-                                        parentTs: message.ts
-                                    }));
-                                    messagesWithThreads.push(...replies);
-                                }
+                                repliesByParent.set(message.ts, await this.fetchThreadReplies(channelId, message.ts, limiter));
                             } catch (error) {
                                 if (window.SlackPolishDebug) {
                                     window.SlackPolishDebug.addLog('channel-messages', 'Error fetching thread replies', {
@@ -3619,6 +4195,28 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                                 }
                             }
                         }
+                    };
+                    await Promise.all(Array.from({ length: Math.min(concurrency, parents.length) }, worker));
+
+                    // Replies go right after their parent, in the original message order
+                    const messagesWithThreads = [];
+                    for (const message of messages) {
+                        messagesWithThreads.push(message);
+                        const replies = repliesByParent.get(message.ts);
+                        if (replies) {
+                            messagesWithThreads.push(...replies);
+                        }
+                    }
+
+                    if (window.SlackPolishDebug) {
+                        window.SlackPolishDebug.addLog('channel-messages', 'Thread replies included', {
+                            threads: parents.length,
+                            threadsFetched: repliesByParent.size,
+                            replies: messagesWithThreads.length - messages.length,
+                            concurrency,
+                            rateLimitedCalls: limiter.rateLimitedCalls,
+                            durationMs: Date.now() - startedAt
+                        });
                     }
 
                     return messagesWithThreads;
@@ -3632,6 +4230,77 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                 }
             },
 
+            // All replies in a thread, following next_cursor page by page
+            async fetchThreadReplies(channelId, threadTs, limiter) {
+                const replies = [];
+                let cursor = null;
+
+                do {
+                    const params = {
+                        channel: channelId,
+                        ts: threadTs,
+                        limit: THREAD_REPLY_PAGE_SIZE
+                    };
+                    if (cursor) {
+                        params.cursor = cursor;
+                    }
+
+                    const response = await this.callSlackAPIWithRetry('conversations.replies', params, limiter);
+                    for (const msg of response.messages || []) {
+                        // The parent message is returned with the replies
+                        if (msg.ts !== threadTs) {
+                            replies.push({
+                                ...this.processSlackMessage(msg),
+                                isThreadReply: true,
+                                parentTs: threadTs
+                            });
+                        }
+                    }
+                    cursor = response.has_more ? response.response_metadata?.next_cursor || null : null;
+                } while (cursor);
+
+                return replies;
+            },
+
+            async callSlackAPIWithRetry(method, params, limiter) {
+                for (let attempt = 0; ; attempt++) {
+                    await limiter.acquire();
+                    const startedAt = Date.now();
+                    try {
+                        const response = await this.callSlackAPI(method, params);
+                        limiter.succeeded();
+                        if (window.SlackPolishDebug) {
+                            window.SlackPolishDebug.addLog('channel-messages', 'Slack API call timing', {
+                                method,
+                                ts: params.ts,
+                                cursor: params.cursor || null,
+                                attempt,
+                                inFlight: limiter.active,
+                                durationMs: Date.now() - startedAt
+                            });
+                        }
+                        return response;
+                    } catch (error) {
+                        if (error.slackError !== 'ratelimited' || attempt >= SLACK_RATE_LIMIT_RETRIES) {
+                            throw error;
+                        }
+                        const delayMs = limiter.rateLimited(error.retryAfter, attempt);
+                        if (window.SlackPolishDebug) {
+                            window.SlackPolishDebug.addLog('channel-messages', 'Slack API rate limited, backing off', {
+                                method,
+                                ts: params.ts,
+                                attempt,
+                                retryAfter: error.retryAfter,
+                                delayMs,
+                                concurrency: limiter.limit
+                            });
+                        }
+                    } finally {
+                        limiter.release();
+                    }
+                }
+            },
+
             extractMessagesFromDOM() {
                 try {
                     const messages = [];
@@ -4090,6 +4759,50 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
         };
     }
 
+    // Read an OpenAI chat completion event stream, calling onDelta(textSoFar, delta)
+    // for every content chunk; resolves with the full text
+    async function readOpenAIStream(response, onDelta) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let pending = '';
+        let text = '';
+
+        while (true) {
+            const { done, value } = await reader.read();
+            pending += decoder.decode(value || new Uint8Array(0), { stream: !done });
+
+            // Events are "data: {...}" lines; the last line may still be incomplete
+            const lines = pending.split('\n');
+            pending = done ? '' : lines.pop();
+
+            for (const rawLine of lines) {
+                const line = rawLine.trim();
+                if (!line.startsWith('data:')) continue;
+
+                const data = line.slice(5).trim();
+                if (data === '[DONE]') return text;
+
+                let event;
+                try {
+                    event = JSON.parse(data);
+                } catch (error) {
+                    continue;
+                }
+                if (event.error) {
+                    throw new Error(event.error.message || 'OpenAI stream error');
+                }
+
+                const delta = event.choices?.[0]?.delta?.content;
+                if (delta) {
+                    text += delta;
+                    if (onDelta) onDelta(text, delta);
+                }
+            }
+
+            if (done) return text;
+        }
+    }
+
     // Initialize global OpenAI system
     function initializeGlobalOpenAISystem() {
         if (window.SlackPolishOpenAI) return; // Already initialized
@@ -4198,7 +4911,9 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                         model: model,
                         messages: [{ role: 'user', content: prompt }],
                         max_tokens: options.maxTokens || window.SLACKPOLISH_CONFIG?.OPENAI_MAX_TOKENS || 500,
-                        temperature: options.temperature || window.SLACKPOLISH_CONFIG?.OPENAI_TEMPERATURE || 0.7
+                        temperature: options.temperature || window.SLACKPOLISH_CONFIG?.OPENAI_TEMPERATURE || 0.7,
+                        // With onDelta the reply arrives as server-sent events, token by token
+                        stream: !!options.onDelta
                     };
 
                     const response = await fetch('https://api.openai.com/v1/chat/completions', {
@@ -4207,7 +4922,8 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                             'Content-Type': 'application/json',
                             'Authorization': `Bearer ${apiKey}`
                         },
-                        body: JSON.stringify(requestBody)
+                        body: JSON.stringify(requestBody),
+                        signal: options.signal
                     });
 
                     if (window.SlackPolishDebug) {
@@ -4222,6 +4938,16 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
                         throw new Error(errorData.error?.message || `HTTP ${response.status}`);
                     }
 
+                    if (requestBody.stream) {
+                        const streamed = await readOpenAIStream(response, options.onDelta);
+                        if (window.SlackPolishDebug) {
+                            window.SlackPolishDebug.addLog('openai', 'Text improvement stream finished', {
+                                resultLength: streamed.length
+                            });
+                        }
+                        return streamed;
+                    }
+
                     const data = await response.json();
                     const result = data.choices?.[0]?.message?.content || '';
 
@@ -4234,6 +4960,9 @@ IMPORTANT: Respond with ONLY the improved text. Do not include any explanations,
 
                     return result;
                 } catch (error) {
+                    if (error.name === 'AbortError') {
+                        throw error;
+                    }
                     if (window.SlackPolishDebug) {
                         window.SlackPolishDebug.addLog('openai', 'Text improvement error', {
                             error: error.message
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SlackPolish cleanup on a synthetic Slack preload bundle.
+
+Builds a ~10 MB minified-looking bundle with zero, one and many stale
+SlackPolish injections, plus one whose Slack code is full of identifiers
+that look like SlackPolish class names ("stray"), and times
+installers/slackpolish_cleanup.py on each.
+Pass --legacy to also time the old 25-pattern re.sub sweep (slow).
+
+Usage:
+  python3 tests/benchmarks/bench_injection_cleanup.py
+  python3 tests/benchmarks/bench_injection_cleanup.py --size-mb 20 --legacy
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "installers"))
+
+from slackpolish_cleanup import remove_slackpolish_code, summarize_removed  # noqa: E402
+
+
+SOURCEMAP = "\n\n//# sourceMappingURL=preload.bundle.js.map\n"
+
+STALE_INJECTION = """
+;
+// === SLACKPOLISH INJECTION START ===
+window.SLACKPOLISH_CONFIG = {{ DEBUG_MODE: false }};
+
+window.SLACKPOLISH_LOGO_BASE64 = "iVBORw0KGgo{logo}";
+
+// === SLACK-TEXT-IMPROVER.JS ===
+(function() {{ 'use strict'; const improver = {{ name: 'SlackTextImprover', body: '{body}' }}; }})();
+
+// === SLACK-SETTINGS.JS ===
+(function() {{ 'use strict'; window.SlackPolishSettings = {{}}; }})();
+// === SLACKPOLISH INJECTION END ===
+"""
+
+# The pre-engine cleanup from install-slack-LINUX-X64.py, kept for comparison
+LEGACY_PATTERNS = [
+    r'// === SLACKPOLISH INJECTION START ===.*?// === SLACKPOLISH INJECTION END ===;?\s*(?:// === SLACKPOLISH INJECTION END ===;?\s*)*',
+    r'// === SLACK TEXT IMPROVER INJECTION START ===.*?// === SLACK TEXT IMPROVER INJECTION END ===;?\s*(?:// === SLACK TEXT IMPROVER INJECTION END ===;?\s*)*',
+    r'// === SLACK-TEXT-IMPROVER\.JS ===.*?(?=// === |\Z)',
+    r'// === SLACK-SETTINGS\.JS ===.*?(?=// === |\Z)',
+    r'// === SLACK-CHANNEL-SUMMARY\.JS ===.*?(?=// === |\Z)',
+    r'// === LOGO-DATA\.JS ===.*?(?=// === |\Z)',
+    r'(?:// === SLACKPOLISH INJECTION END ===;?\s*)+',
+    r'(?:// === SLACK TEXT IMPROVER INJECTION END ===;?\s*)+',
+    r'window\.SLACKPOLISH_CONFIG\s*=.*?};?',
+    r'window\.SlackPolishUtils\s*=.*?};?',
+    r'window\.SLACKPOLISH_LOGO_BASE64\s*=.*?;',
+    r'window\.SLACKPOLISH_LOGO_DATA\s*=.*?;',
+    r'class SlackTextImprover\s*{.*?}\s*\)\(\);?',
+    r'class SlackSettings\s*{.*?}\s*\)\(\);?',
+    r'class SlackChannelSummary\s*{.*?}\s*\)\(\);?',
+    r'\(function\(\)\s*{\s*[\'"]use strict[\'"];.*?SlackTextImprover.*?}\)\(\);?',
+    r'\(function\(\)\s*{\s*[\'"]use strict[\'"];.*?SlackSettings.*?}\)\(\);?',
+    r'\(function\(\)\s*{\s*[\'"]use strict[\'"];.*?SlackChannelSummary.*?}\)\(\);?',
+    r'SlackPolish[A-Za-z]*\s*[=:].*?[;}]',
+    r'// SlackPolish.*?\n',
+    r'/\* SlackPolish.*?\*/',
+    r';\s*;\s*;+',
+    r'\n\s*\n\s*\n+',
+]
+
+
+def legacy_cleanup(content):
+    for pattern in LEGACY_PATTERNS:
+        content = re.sub(pattern, '', content, flags=re.DOTALL | re.MULTILINE)
+    content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
+    content = re.sub(r';\s*;+', ';', content)
+    return content
+
+
+def build_slack_code(size_bytes, rng, iifes=True):
+    """Minified-looking code with the constructs the old patterns scan from."""
+    snippets = [
+        "(function(){'use strict';var a=1;return a})();",
+        "function t(e,n){for(;;){if(e>n)break;e++}return e}",
+        "const n=require('electron');n.ipcRenderer.on('x',()=>{});",
+        "window.__slack_state__={teams:[],ts:Date.now()};",
+        "class r{constructor(e){this.e=e}get v(){return this.e}}",
+    ]
+    if not iifes:
+        # Arrow functions only, like most of a modern bundle: no `(function()` nearby
+        snippets = snippets[1:]
+    parts = []
+    total = 0
+    while total < size_bytes:
+        line = "".join(rng.choice(snippets) for _ in range(40)) + "\n"
+        parts.append(line)
+        total += len(line)
+    return "(()=>{" + "".join(parts) + "})();"
+
+
+# Slack identifiers that hit the IIFE anchor but sit in no SlackPolish IIFE
+STRAY_ANCHORS = ["x.SlackSettingsStore", "SlackTextImproverFlag", "n.SlackChannelSummaryView"]
+
+
+def add_stray_anchors(slack_code, count, rng):
+    """Splice count stray anchor names into the code at line boundaries."""
+    lines = slack_code.split("\n")
+    for _ in range(count):
+        index = rng.randrange(len(lines))
+        lines[index] += f"var s={rng.choice(STRAY_ANCHORS)};"
+    return "\n".join(lines)
+
+
+def build_bundle(size_bytes, injections, rng, stray=0):
+    slack_code = build_slack_code(size_bytes, rng, iifes=not stray)
+    if stray:
+        slack_code = add_stray_anchors(slack_code, stray, rng)
+    stale = "".join(
+        STALE_INJECTION.format(logo="A" * 2048, body="x" * 4096)
+        for _ in range(injections)
+    )
+    return slack_code + stale + SOURCEMAP
+
+
+def time_call(func, content, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(content)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SlackPolish bundle cleanup")
+    parser.add_argument("--size-mb", type=float, default=10.0, help="Size of the synthetic Slack code")
+    parser.add_argument("--many", type=int, default=25, help="Stale injections in the 'many' case")
+    parser.add_argument("--stray", type=int, default=20000,
+                        help="Stray SlackPolish-looking names in the 'stray' case")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (best time is reported)")
+    parser.add_argument("--legacy", action="store_true", help="Also time the old 25-regex sweep")
+    args = parser.parse_args()
+
+    rng = random.Random(1234)
+    size_bytes = int(args.size_mb * 1024 * 1024)
+
+    print(f"{'case':<8} {'bundle MB':>10} {'engine ms':>10} {'removed':>8} {'legacy ms':>10}")
+    for label, injections, stray in (("zero", 0, 0), ("one", 1, 0), ("many", args.many, 0), ("stray", 1, args.stray)):
+        bundle = build_bundle(size_bytes, injections, rng, stray)
+        elapsed, result = time_call(remove_slackpolish_code, bundle, args.repeat)
+
+        block_count = sum(count for kind, count, _ in summarize_removed(result.removed) if kind == "block")
+        if block_count != injections or "SLACKPOLISH" in result.content:
+            print(f"❌ {label}: expected {injections} blocks removed, got {block_count}")
+            return 1
+
+        legacy = "-"
+        if args.legacy:
+            legacy_elapsed, _ = time_call(legacy_cleanup, bundle, 1)
+            legacy = f"{legacy_elapsed * 1000:.1f}"
+
+        print(
+            f"{label:<8} {len(bundle) / (1024 * 1024):>10.2f} {elapsed * 1000:>10.1f} "
+            f"{len(result.removed):>8} {legacy:>10}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark: DevTools WebSocket framing in installers/slackpolish_devtools.py.
+
+Times the client-side masking of one outgoing frame the size of the runtime
+payload, and the parsing of a stream of incoming frames fed in socket-sized
+chunks, against the byte-by-byte generator and `+=` buffer they replaced.
+
+Usage:
+  python3 tests/benchmarks/bench_websocket_framing.py
+  python3 tests/benchmarks/bench_websocket_framing.py --size-kb 300 --legacy
+"""
+
+import argparse
+import asyncio
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "installers"))
+
+from slackpolish_devtools import _WebSocketProtocol, encode_frame_header, mask_payload  # noqa: E402
+
+
+CHUNK_SIZE = 65536
+
+
+def legacy_mask(payload, mask_key):
+    return bytes(payload[i] ^ mask_key[i % 4] for i in range(len(payload)))
+
+
+def legacy_parse(stream):
+    """The old _recv_exact loop: grow a bytes buffer with += and slice frames off it."""
+    recv_buffer = b""
+    position = 0
+    messages = 0
+
+    def recv_exact(count):
+        nonlocal recv_buffer, position
+        while len(recv_buffer) < count:
+            recv_buffer += stream[position:position + CHUNK_SIZE]
+            position += CHUNK_SIZE
+        data = recv_buffer[:count]
+        recv_buffer = recv_buffer[count:]
+        return data
+
+    while position < len(stream) or recv_buffer:
+        header = recv_exact(2)
+        length = header[1] & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", recv_exact(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", recv_exact(8))[0]
+        recv_exact(length).decode("utf-8")
+        messages += 1
+    return messages
+
+
+def buffered_parse(stream):
+    """Feed the stream through the protocol's get_buffer/buffer_updated, like the event loop."""
+    protocol = _WebSocketProtocol()
+    protocol.handshake.set_result("HTTP/1.1 101 Switching Protocols")
+    view = memoryview(stream)
+    position = 0
+    while position < len(stream):
+        target = protocol.get_buffer(CHUNK_SIZE)
+        count = min(len(target), CHUNK_SIZE, len(stream) - position)
+        target[:count] = view[position:position + count]
+        position += count
+        protocol.buffer_updated(count)
+    return protocol.messages.qsize()
+
+
+def build_stream(size_bytes, small_messages):
+    """One payload-sized response plus many small protocol events."""
+    frames = []
+    for payload in [b"{" + b"x" * (size_bytes - 2) + b"}"] + [b'{"method":"Runtime.consoleAPICalled"}'] * small_messages:
+        frames.append(encode_frame_header(len(payload), masked=False) + payload)
+    return b"".join(frames)
+
+
+def time_call(func, argument, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*argument)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+async def run(args):
+    size_bytes = int(args.size_kb * 1024)
+    payload = os.urandom(size_bytes)
+    mask_key = os.urandom(4)
+    stream = build_stream(size_bytes, args.events)
+
+    print(f"{'case':<10} {'KB':>8} {'framing ms':>11} {'legacy ms':>10}")
+
+    elapsed, masked = time_call(mask_payload, (payload, mask_key), args.repeat)
+    legacy = "-"
+    if args.legacy:
+        legacy_elapsed, legacy_masked = time_call(legacy_mask, (payload, mask_key), 1)
+        if legacy_masked != masked:
+            print("❌ mask: output differs from the byte-by-byte mask")
+            return 1
+        legacy = f"{legacy_elapsed * 1000:.1f}"
+    print(f"{'mask':<10} {size_bytes / 1024:>8.0f} {elapsed * 1000:>11.2f} {legacy:>10}")
+
+    elapsed, messages = time_call(buffered_parse, (stream,), args.repeat)
+    if messages != args.events + 1:
+        print(f"❌ receive: expected {args.events + 1} messages, got {messages}")
+        return 1
+    legacy = "-"
+    if args.legacy:
+        legacy_elapsed, _ = time_call(legacy_parse, (stream,), 1)
+        legacy = f"{legacy_elapsed * 1000:.1f}"
+    print(f"{'receive':<10} {len(stream) / 1024:>8.0f} {elapsed * 1000:>11.2f} {legacy:>10}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DevTools WebSocket framing")
+    parser.add_argument("--size-kb", type=float, default=300.0, help="Size of the payload-sized frame")
+    parser.add_argument("--events", type=int, default=2000, help="Small event frames in the receive stream")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case (best time is reported)")
+    parser.add_argument("--legacy", action="store_true", help="Also time the old generator mask and += buffer")
+    args = parser.parse_args()
+    # The protocol creates its futures on the running loop
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+In-process stand-in for Slack's DevTools endpoint, for the launcher tests.
+
+FakeDevToolsConnection is a real DevToolsConnection whose WebSocket is
+replaced by a fake: commands still go through send(), pending futures and
+_dispatch(), so sessions are multiplexed and events routed exactly as over
+the wire. Every command is recorded in `commands`; each page answers the
+health probe with its `probe` value, or never answers while `hung`.
+
+Run with installers/ as the working directory and this directory on
+PYTHONPATH.
+"""
+
+import asyncio
+import json
+import tempfile
+from pathlib import Path
+
+import slackpolish_runtime
+from slackpolish_devtools import DevToolsConnection, DevToolsProtocolError
+from slackpolish_runtime import SlackPolishLauncher
+
+
+class FakePage:
+    def __init__(self, target_id, url):
+        self.target_id = target_id
+        self.url = url
+        self.probe = "ok"
+        self.hung = False
+
+
+class _FakeWebSocket:
+    def __init__(self, connection):
+        self.connection = connection
+
+    async def send_text(self, text):
+        asyncio.get_running_loop().call_soon(self.connection.answer, json.loads(text))
+
+    def close(self):
+        pass
+
+
+class FakeDevToolsConnection(DevToolsConnection):
+    def __init__(self):
+        super().__init__("ws://127.0.0.1:9222/devtools/browser/fake")
+        self.websocket = _FakeWebSocket(self)
+        self.pages = {}
+        self.commands = []
+        self.next_id = 0
+
+    async def connect(self):
+        self.closed = asyncio.get_running_loop().create_future()
+
+    def add_page(self, target_id, url="https://app.slack.com/client/T1/C1"):
+        self.pages[target_id] = FakePage(target_id, url)
+        return self.pages[target_id]
+
+    def target_info(self, page):
+        return {"targetInfo": {"targetId": page.target_id, "type": "page", "title": "Slack", "url": page.url}}
+
+    def drop(self):
+        """Lose the connection, like Slack quitting."""
+        self._fail_pending(DevToolsProtocolError("DevTools connection closed"))
+        if not self.closed.done():
+            self.closed.set_result(DevToolsProtocolError("DevTools connection closed"))
+
+    def page_for(self, session_id):
+        return self.pages.get(str(session_id).replace("session-", "", 1))
+
+    def sent(self, method, session_id=None):
+        return [
+            command for command in self.commands
+            if command["method"] == method and (session_id is None or command.get("sessionId") == session_id)
+        ]
+
+    def emit(self, method, params, session_id=None):
+        message = {"method": method, "params": params}
+        if session_id:
+            message["sessionId"] = session_id
+        self._dispatch(json.dumps(message))
+
+    def answer(self, message):
+        self.commands.append(message)
+        method, params = message["method"], message["params"]
+        page = self.page_for(message.get("sessionId"))
+        self.next_id += 1
+        if method == "Target.attachToTarget":
+            result = {"sessionId": f"session-{params['targetId']}"}
+        elif method == "Runtime.compileScript":
+            result = {"scriptId": f"script-{self.next_id}"}
+        elif method == "Page.addScriptToEvaluateOnNewDocument":
+            result = {"identifier": f"registration-{self.next_id}"}
+        elif method == "Runtime.runScript":
+            if page and page.hung:
+                return
+            result = {"result": {"value": page.probe if page else None}}
+        else:
+            result = {}
+        self._dispatch(json.dumps({"id": message["id"], "result": result}))
+        if method == "Target.setDiscoverTargets":
+            # Like Chrome, replay targetCreated for every existing target
+            for existing in self.pages.values():
+                self.emit("Target.targetCreated", self.target_info(existing))
+
+
+def make_launcher(payload="console.log('slackpolish');", payload_hash="build1"):
+    """A launcher with a prepared payload and a connected fake browser."""
+    state_dir = Path(tempfile.mkdtemp(prefix="slackpolish-launcher-"))
+    launcher = SlackPolishLauncher(state_dir, state_dir / "launcher.lock", None, 9222, False, False, 1)
+    launcher.runtime_payload = payload
+    launcher.payload_hash = launcher.status["payload_hash"] = payload_hash
+    launcher.browser = FakeDevToolsConnection()
+    return launcher
+
+
+def use_fake_browser(launcher, browser):
+    """Make launcher._watch_targets() connect to browser instead of a real Slack."""
+    def connect(websocket_url, on_warning=None, on_command=None):
+        browser.on_warning = on_warning
+        browser.on_command = on_command
+        return browser
+
+    launcher._fetch_json = lambda path: {"webSocketDebuggerUrl": "ws://127.0.0.1:9222/devtools/browser/fake"}
+    slackpolish_runtime.DevToolsConnection = connect
+
+
+async def settle(launcher, rounds=20):
+    """Let spawned attach/refresh tasks and queued DevTools answers finish."""
+    for _ in range(rounds):
+        await asyncio.sleep(0)
+        if launcher.tasks:
+            await asyncio.wait(set(launcher.tasks), timeout=5)
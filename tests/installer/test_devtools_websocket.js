@@ -0,0 +1,203 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: DevTools WebSocket Framing
+ * Feeds RFC 6455 frames into installers/slackpolish_devtools.py's
+ * _WebSocketProtocol in small pieces and checks the decoded messages, the
+ * extended lengths, masking, fragmented messages and ping/pong.
+ */
+
+const path = require('path');
+const crypto = require('crypto');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+
+// feed(frames, chunk) pushes bytes through get_buffer/buffer_updated like the
+// event loop would and returns the decoded messages plus what was written back
+const SETUP =
+    'import asyncio, json, os, struct, sys\n' +
+    'from slackpolish_devtools import _WebSocketProtocol, encode_frame_header, mask_payload\n' +
+    'class FakeTransport:\n' +
+    '    def __init__(self):\n' +
+    '        self.written = b""\n' +
+    '    def writelines(self, chunks):\n' +
+    '        self.written += b"".join(chunks)\n' +
+    '    def is_closing(self):\n' +
+    '        return False\n' +
+    'def frame(payload, opcode=0x1, final=True, mask_key=None):\n' +
+    '    header = bytearray(encode_frame_header(len(payload), opcode, masked=mask_key is not None))\n' +
+    '    if not final:\n' +
+    '        header[0] &= 0x7F\n' +
+    '    if mask_key is None:\n' +
+    '        return bytes(header) + payload\n' +
+    '    return bytes(header) + mask_key + mask_payload(payload, mask_key)\n' +
+    'async def feed(data, chunk):\n' +
+    '    protocol = _WebSocketProtocol()\n' +
+    '    transport = FakeTransport()\n' +
+    '    protocol.connection_made(transport)\n' +
+    '    data = b"HTTP/1.1 101 Switching Protocols\\r\\n\\r\\n" + data\n' +
+    '    position = 0\n' +
+    '    while position < len(data):\n' +
+    '        buffer = protocol.get_buffer(-1)\n' +
+    '        count = min(len(buffer), chunk, len(data) - position)\n' +
+    '        buffer[:count] = data[position:position + count]\n' +
+    '        position += count\n' +
+    '        protocol.buffer_updated(count)\n' +
+    '    messages = []\n' +
+    '    while not protocol.messages.empty():\n' +
+    '        message = protocol.messages.get_nowait()\n' +
+    '        messages.append(message if isinstance(message, str) else "error: " + str(message))\n' +
+    '    return {"messages": messages, "written": transport.written.hex()}\n';
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+function runPython(script) {
+    const result = spawnSync('python3', ['-c', SETUP + script], {
+        cwd: INSTALLERS_DIR,
+        encoding: 'utf8',
+        maxBuffer: 16 * 1024 * 1024
+    });
+    if (result.status !== 0) {
+        throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+    }
+    return JSON.parse(result.stdout);
+}
+
+// Decode one client frame (masked, as a client must send them)
+function decodeClientFrame(buffer) {
+    const opcode = buffer[0] & 0x0F;
+    assert(buffer[1] & 0x80, 'Client frames must be masked');
+    const length = buffer[1] & 0x7F;
+    const mask = buffer.slice(2, 6);
+    const payload = Buffer.from(buffer.slice(6, 6 + length).map((byte, i) => byte ^ mask[i % 4]));
+    return { final: (buffer[0] & 0x80) !== 0, opcode, payload: payload.toString('utf8') };
+}
+
+class DevToolsWebSocketTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    testSplitFrames() {
+        const result = runPython(
+            'data = frame(b\'{"id":1}\') + frame("ünïcode".encode("utf-8")) + frame(b"")\n' +
+            'print(json.dumps(asyncio.run(feed(data, 1))))'
+        );
+        assertEqual(JSON.stringify(result.messages), JSON.stringify(['{"id":1}', 'ünïcode', '']),
+            'Frames delivered one byte at a time should decode in order');
+    }
+
+    testExtendedLengths() {
+        const result = runPython(
+            'payloads = [b"a" * 125, b"b" * 126, b"c" * 65535, b"d" * 65536, b"e" * (300 * 1024)]\n' +
+            'headers = [len(encode_frame_header(len(p), masked=False)) for p in payloads]\n' +
+            'data = b"".join(frame(p) for p in payloads)\n' +
+            'result = asyncio.run(feed(data, 7000))\n' +
+            'print(json.dumps({"headers": headers, "lengths": [len(m) for m in result["messages"]],\n' +
+            '                  "intact": [m == p.decode() for m, p in zip(result["messages"], payloads)]}))'
+        );
+        assertEqual(result.headers.join(), '2,4,4,10,10', 'Lengths of 126+ and 65536+ should use the 16- and 64-bit forms');
+        assertEqual(result.lengths.join(), [125, 126, 65535, 65536, 300 * 1024].join(), 'Every length should decode');
+        assert(result.intact.every(Boolean), 'Payloads should arrive intact, including one larger than the buffer');
+    }
+
+    testMasking() {
+        const payload = crypto.randomBytes(1021).toString('hex');
+        const result = runPython(
+            `payload = "${payload}".encode()\n` +
+            'key = bytes([0x12, 0x34, 0x56, 0x78])\n' +
+            'naive = bytes(b ^ key[i % 4] for i, b in enumerate(payload))\n' +
+            'result = asyncio.run(feed(frame(payload, mask_key=key), 100))\n' +
+            'print(json.dumps({"same": mask_payload(payload, key) == naive, "empty": mask_payload(b"", key) == b"",\n' +
+            '                  "messages": result["messages"]}))'
+        );
+        assert(result.same, 'mask_payload should match a byte-by-byte XOR');
+        assert(result.empty, 'An empty payload should mask to nothing');
+        assertEqual(result.messages[0], payload, 'Masked frames should be unmasked on receipt');
+    }
+
+    testFragmentedMessages() {
+        const result = runPython(
+            'data = (frame(b\'{"method":\', final=False) + frame(b"hi", opcode=0x9)\n' +
+            '        + frame(b\'"Page.\', opcode=0x0, final=False) + frame(b\'loadEventFired"}\', opcode=0x0)\n' +
+            '        + frame(b"next"))\n' +
+            'print(json.dumps(asyncio.run(feed(data, 3))))'
+        );
+        assertEqual(JSON.stringify(result.messages), JSON.stringify(['{"method":"Page.loadEventFired"}', 'next']),
+            'Continuation frames should be joined into one message');
+        const pong = decodeClientFrame(Buffer.from(result.written, 'hex'));
+        assertEqual(pong.opcode, 0xA, 'A ping inside a fragmented message should be answered with a pong');
+        assert(pong.final, 'The pong should be a single frame');
+        assertEqual(pong.payload, 'hi', 'The pong should echo the ping payload');
+    }
+
+    testBrokenFragmentsFail() {
+        const result = runPython(
+            'stray = asyncio.run(feed(frame(b"tail", opcode=0x0), 64))\n' +
+            'nested = asyncio.run(feed(frame(b"a", final=False) + frame(b"b"), 64))\n' +
+            'print(json.dumps([stray["messages"], nested["messages"]]))'
+        );
+        const [stray, nested] = result;
+        assert(stray.length === 1 && stray[0].includes('continuation frame without a message'),
+            `A stray continuation should fail the connection, got ${stray}`);
+        assert(nested.length === 1 && nested[0].includes('inside a fragmented message'),
+            `A new message inside a fragmented one should fail the connection, got ${nested}`);
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting DevTools WebSocket Tests\n');
+
+        this.runTest('Split frames are reassembled', () => this.testSplitFrames());
+        this.runTest('Extended 16- and 64-bit lengths', () => this.testExtendedLengths());
+        this.runTest('Masking', () => this.testMasking());
+        this.runTest('Fragmented messages and pings', () => this.testFragmentedMessages());
+        this.runTest('Broken fragment sequences fail', () => this.testBrokenFragmentsFail());
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new DevToolsWebSocketTests();
+    tests.runAllTests();
+}
+
+module.exports = DevToolsWebSocketTests;
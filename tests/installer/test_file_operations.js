@@ -0,0 +1,186 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: File Operations
+ * Checks installers/slackpolish_fileops.py backups and swaps, and that a
+ * hardlinked backup survives the installer rewriting app.asar.
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { spawnSync } = require('child_process');
+const { buildAsar } = require('./test_native_asar');
+
+const REPO_ROOT = path.join(__dirname, '../..');
+const INSTALLERS_DIR = path.join(REPO_ROOT, 'installers');
+const INSTALLER = path.join(INSTALLERS_DIR, 'install-slack-LINUX-X64.py');
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+function runPython(script, args) {
+    const result = spawnSync('python3', ['-c', 'import sys\nfrom slackpolish_fileops import *\n' + script, ...args], {
+        cwd: INSTALLERS_DIR,
+        encoding: 'utf8'
+    });
+    if (result.status !== 0) {
+        throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+    }
+    return result.stdout.trim();
+}
+
+class FileOperationsTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+        this.tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'slackpolish-fileops-'));
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    writeFile(name, content) {
+        const filePath = path.join(this.tempDir, name);
+        fs.writeFileSync(filePath, content);
+        return filePath;
+    }
+
+    testBackupContent() {
+        const source = this.writeFile('backup-source.asar', 'original archive bytes');
+        const linked = path.join(this.tempDir, 'linked.backup');
+        const copied = path.join(this.tempDir, 'copied.backup');
+        const past = new Date('2024-01-02T03:04:05Z');
+        fs.utimesSync(source, past, past);
+
+        const methods = runPython(
+            'print(backup_file(sys.argv[1], sys.argv[2]), backup_file(sys.argv[1], sys.argv[3], allow_hardlink=False))',
+            [source, linked, copied]
+        ).split(' ');
+
+        assertEqual(methods[0], 'hardlink', 'Backups should be hardlinked where possible');
+        assertEqual(fs.statSync(linked).ino, fs.statSync(source).ino, 'A hardlinked backup should share the inode');
+        assert(methods[1] !== 'hardlink', 'allow_hardlink=False should copy');
+        assert(fs.statSync(copied).ino !== fs.statSync(source).ino, 'A copied backup should be its own file');
+        for (const backup of [linked, copied]) {
+            assertEqual(fs.readFileSync(backup, 'utf8'), 'original archive bytes', `${path.basename(backup)} should hold the source bytes`);
+        }
+        assertEqual(fs.statSync(copied).mtimeMs, past.getTime(), 'A copied backup should keep the source mtime');
+        assert(!fs.existsSync(linked + '.slackpolish-tmp') && !fs.existsSync(copied + '.slackpolish-tmp'), 'No temp files should be left');
+    }
+
+    testFailedReplaceKeepsOriginal() {
+        const destination = this.writeFile('keep.asar', 'original archive bytes');
+        const missing = path.join(this.tempDir, 'missing.asar');
+
+        const errors = runPython(
+            'errors = []\n' +
+            'for call in (lambda: replace_file(sys.argv[2], sys.argv[1]), lambda: copy_file(sys.argv[2], sys.argv[1])):\n' +
+            '    try:\n' +
+            '        call()\n' +
+            '    except OSError as error:\n' +
+            '        errors.append(type(error).__name__)\n' +
+            'print(" ".join(errors))',
+            [destination, missing]
+        );
+
+        assertEqual(errors, 'FileNotFoundError FileNotFoundError', 'Both failures should be raised to the caller');
+        assertEqual(fs.readFileSync(destination, 'utf8'), 'original archive bytes', 'The original should be intact');
+        assert(!fs.existsSync(destination + '.slackpolish-tmp'), 'A failed copy should remove its temp file');
+    }
+
+    testCopyOverHardlinkReplaces() {
+        const asar = this.writeFile('copy-target.asar', 'original archive bytes');
+        const backup = path.join(this.tempDir, 'copy-target.asar.backup');
+        const patched = this.writeFile('patched.asar', 'patched archive bytes');
+
+        runPython('backup_file(sys.argv[1], sys.argv[2])\ncopy_file(sys.argv[3], sys.argv[1])', [asar, backup, patched]);
+
+        assertEqual(fs.readFileSync(asar, 'utf8'), 'patched archive bytes', 'Destination should hold the new bytes');
+        assertEqual(fs.readFileSync(backup, 'utf8'), 'original archive bytes', 'The hardlinked backup should not change');
+        assert(fs.statSync(asar).ino !== fs.statSync(backup).ino, 'The destination should be a new inode');
+    }
+
+    testInstallKeepsHardlinkedBackup() {
+        const slackPath = path.join(this.tempDir, 'slack');
+        fs.mkdirSync(slackPath);
+        const asarPath = path.join(slackPath, 'app.asar');
+        const original = buildAsar({
+            'dist/preload.bundle.js':
+                'const { ipcRenderer } = require("electron");\n' +
+                'let ready = false;\n' +
+                'function start() { ready = true; window.slackPreload = ready; }\n' +
+                'module.exports = { start };\n',
+            'package.json': '{"name":"slack"}'
+        });
+        fs.writeFileSync(asarPath, original);
+        const originalInode = fs.statSync(asarPath).ino;
+
+        const result = spawnSync('python3', [INSTALLER, '--slack-path', slackPath], {
+            cwd: REPO_ROOT,
+            encoding: 'utf8',
+            stdio: ['ignore', 'pipe', 'pipe']
+        });
+        const output = result.stdout + result.stderr;
+        assertEqual(result.status, 0, `installer failed:\n${output}`);
+        assert(output.includes('Backup created (hardlink)'), 'The backup should be a hardlink');
+
+        const backupPath = path.join(slackPath, 'app.asar.backup');
+        assertEqual(fs.statSync(backupPath).ino, originalInode, 'The backup should keep the original inode');
+        assert(fs.statSync(asarPath).ino !== originalInode, 'app.asar should be replaced by rename, not written in place');
+        assert(fs.readFileSync(backupPath).equals(original), 'The backup should still hold the clean archive');
+        assertEqual(fs.statSync(backupPath).nlink, 1, 'The backup should no longer share its inode');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting File Operations Tests\n');
+
+        this.runTest('Backups hold the source bytes', () => this.testBackupContent());
+        this.runTest('A failed replace keeps the original', () => this.testFailedReplaceKeepsOriginal());
+        this.runTest('copy_file replaces a hardlinked destination', () => this.testCopyOverHardlinkReplaces());
+        this.runTest('Install leaves the hardlinked backup intact', () => this.testInstallKeepsHardlinkedBackup());
+
+        fs.rmSync(this.tempDir, { recursive: true, force: true });
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new FileOperationsTests();
+    tests.runAllTests();
+}
+
+module.exports = FileOperationsTests;
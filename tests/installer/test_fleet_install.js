@@ -0,0 +1,141 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Fleet Install
+ * Runs install-slack-LINUX-X64.py --fleet over two fake Slack resources
+ * directories, one with a usable preload and one that fails validation, and
+ * checks that the workers never prompt and report each target on its own.
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { spawnSync } = require('child_process');
+const { buildAsar, readAsar } = require('./test_native_asar');
+
+const REPO_ROOT = path.join(__dirname, '../..');
+const INSTALLER = path.join(REPO_ROOT, 'installers', 'install-slack-LINUX-X64.py');
+
+const GOOD_PRELOAD =
+    'const { ipcRenderer } = require("electron");\n' +
+    'let ready = false;\n' +
+    'function start() { ready = true; window.slackPreload = ready; }\n' +
+    'module.exports = { start };\n';
+const BAD_PRELOAD = '/* stub */';
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+class FleetInstallTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+        this.tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'slackpolish-fleet-'));
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    makeSlackRoot(name, preload) {
+        const root = path.join(this.tempDir, name);
+        fs.mkdirSync(root);
+        fs.writeFileSync(path.join(root, 'app.asar'), buildAsar({
+            'dist/preload.bundle.js': preload,
+            'package.json': '{"name":"slack"}'
+        }));
+        return root;
+    }
+
+    runFleet(args) {
+        return spawnSync('python3', [INSTALLER, ...args], {
+            cwd: REPO_ROOT,
+            encoding: 'utf8',
+            // No terminal: a prompt would hit EOF
+            stdio: ['ignore', 'pipe', 'pipe']
+        });
+    }
+
+    statusLine(output, root) {
+        return output.split('\n').find(line => line.startsWith(root + ' ')) || '';
+    }
+
+    testGoodAndBadTargets() {
+        const good = this.makeSlackRoot('good', GOOD_PRELOAD);
+        const bad = this.makeSlackRoot('bad', BAD_PRELOAD);
+        const badArchive = fs.readFileSync(path.join(bad, 'app.asar'));
+
+        const result = this.runFleet(['--fleet', good, bad]);
+        const output = result.stdout + result.stderr;
+
+        assertEqual(result.status, 1, 'A failed target should fail the fleet run');
+        assert(!output.includes('EOFError') && !output.includes('Continue anyway?'), 'Fleet workers should never prompt');
+        assert(this.statusLine(output, good).includes('installed'), `Good target should be installed:\n${output}`);
+        assert(this.statusLine(output, bad).includes('validation failed'), `Bad target should report a validation failure:\n${output}`);
+        assert(output.includes('1 of 2 installation(s) failed'), 'Summary should count the failure');
+
+        const patched = readAsar(fs.readFileSync(path.join(good, 'app.asar')));
+        assert(patched.read('dist/preload.bundle.js').toString('utf8').includes('SLACKPOLISH INJECTION START'),
+            'Good target should carry the injection');
+        assert(fs.readFileSync(path.join(bad, 'app.asar')).equals(badArchive), 'Bad target should be left untouched');
+    }
+
+    testForceAcceptsBadTarget() {
+        const bad = this.makeSlackRoot('forced', BAD_PRELOAD);
+
+        const result = this.runFleet(['--fleet', bad, '--force']);
+        const output = result.stdout + result.stderr;
+
+        assertEqual(result.status, 0, `--force should accept the file:\n${output}`);
+        assert(this.statusLine(output, bad).includes('installed'), 'Forced target should be installed');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Fleet Install Tests\n');
+
+        this.runTest('Good and bad targets are reported separately', () => this.testGoodAndBadTargets());
+        this.runTest('--force accepts a file that fails validation', () => this.testForceAcceptsBadTarget());
+
+        fs.rmSync(this.tempDir, { recursive: true, force: true });
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new FleetInstallTests();
+    tests.runAllTests();
+}
+
+module.exports = FleetInstallTests;
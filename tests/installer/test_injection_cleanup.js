@@ -0,0 +1,157 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Injection Cleanup Engine
+ * Runs installers/slackpolish_cleanup.py over bundles containing old SlackPolish
+ * injections and checks that only SlackPolish code is removed.
+ */
+
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${JSON.stringify(expected)}\nActual: ${JSON.stringify(actual)}`);
+    }
+}
+
+function cleanup(content) {
+    const script =
+        'import sys, json\n' +
+        'from slackpolish_cleanup import remove_slackpolish_code\n' +
+        'result = remove_slackpolish_code(sys.stdin.read())\n' +
+        'print(json.dumps({"content": result.content, "kinds": [span.kind for span in result.removed]}))';
+    const result = spawnSync('python3', ['-c', script], {
+        cwd: INSTALLERS_DIR,
+        input: content,
+        encoding: 'utf8'
+    });
+    if (result.status !== 0) {
+        throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+    }
+    return JSON.parse(result.stdout);
+}
+
+const SLACK_CODE = "(()=>{function t(e){for(;;){if(e)break}}(function(){'use strict';var a=1})();})();";
+const SOURCEMAP = '\n\n//# sourceMappingURL=preload.bundle.js.map\n';
+const INJECTION = [
+    '',
+    ';',
+    '// === SLACKPOLISH INJECTION START ===',
+    'window.SLACKPOLISH_CONFIG = { DEBUG_MODE: false };',
+    '// === SLACK-TEXT-IMPROVER.JS ===',
+    "(function() { 'use strict'; class SlackTextImprover {} })();",
+    '// === SLACKPOLISH INJECTION END ===',
+    ''
+].join('\n');
+
+class InjectionCleanupTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    testCleanBundleUnchanged() {
+        const bundle = SLACK_CODE + SOURCEMAP;
+        const result = cleanup(bundle);
+        assertEqual(result.content, bundle, 'Bundle without SlackPolish code should be unchanged');
+        assertEqual(result.kinds.length, 0, 'Nothing should be reported as removed');
+    }
+
+    testSingleInjectionRemoved() {
+        const result = cleanup(SLACK_CODE + '\n' + INJECTION + SOURCEMAP);
+        assertEqual(result.content, SLACK_CODE + SOURCEMAP, 'Injection and its separator line should be removed');
+        assertEqual(result.kinds.join(','), 'block', 'One block should be reported');
+    }
+
+    testManyInjectionsRemoved() {
+        const result = cleanup(SLACK_CODE + '\n' + INJECTION.repeat(5) + SOURCEMAP);
+        assert(!result.content.includes('SLACKPOLISH'), 'All injections should be removed');
+        assert(result.content.startsWith(SLACK_CODE), 'Slack code should be preserved');
+        assertEqual(result.kinds.length, 5, 'Each block should be reported');
+    }
+
+    testSlackCodeNotRewritten() {
+        const result = cleanup(SLACK_CODE + '\n' + INJECTION + SOURCEMAP);
+        assert(result.content.includes('for(;;)'), 'Empty for-loop clauses must not be collapsed');
+        assert(result.content.includes("(function(){'use strict';var a=1})();"), 'Unrelated IIFEs must be kept');
+    }
+
+    testLegacyLeftoversRemoved() {
+        const bundle = SLACK_CODE +
+            '\n// === SLACK-SETTINGS.JS ===\nconst x = 1;\n' +
+            '// === SLACKPOLISH INJECTION END ===;\n// === SLACKPOLISH INJECTION END ===\n' +
+            'window.SLACKPOLISH_LOGO_BASE64 = "abc";\n' +
+            "(function() { 'use strict'; new SlackChannelSummary(); })();\n" +
+            SOURCEMAP;
+        const result = cleanup(bundle);
+        assertEqual(result.kinds.join(','), 'section,orphan_end,global_value,iife', 'Each legacy span should be reported');
+        assert(!/SLACK|Slack/.test(result.content), 'No SlackPolish code should remain');
+        assert(result.content.startsWith(SLACK_CODE), 'Slack code should be preserved');
+    }
+
+    testStrayNamesInSlackCode() {
+        // Slack's own identifiers that contain SlackPolish class names, inside and outside IIFEs
+        const stray = "var s=x.SlackSettingsStore;(function(){var t=SlackTextImproverFlag;})();";
+        const leftover = "(function() { 'use strict'; new SlackChannelSummary(); })();\n";
+        const bundle = SLACK_CODE + stray.repeat(3) + leftover + stray + SOURCEMAP;
+        const result = cleanup(bundle);
+        assertEqual(result.content, SLACK_CODE + stray.repeat(3) + '\n' + stray + SOURCEMAP,
+            'Only the SlackPolish IIFE should be removed');
+        assertEqual(result.kinds.join(','), 'iife', 'One IIFE should be reported');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Injection Cleanup Tests\n');
+
+        this.runTest('Clean bundle unchanged', () => this.testCleanBundleUnchanged());
+        this.runTest('Single injection removed', () => this.testSingleInjectionRemoved());
+        this.runTest('Many injections removed', () => this.testManyInjectionsRemoved());
+        this.runTest('Slack code not rewritten', () => this.testSlackCodeNotRewritten());
+        this.runTest('Legacy leftovers removed', () => this.testLegacyLeftoversRemoved());
+        this.runTest('Stray class names in Slack code', () => this.testStrayNamesInSlackCode());
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new InjectionCleanupTests();
+    tests.runAllTests();
+}
+
+module.exports = InjectionCleanupTests;
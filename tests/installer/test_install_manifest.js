@@ -0,0 +1,208 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Install Manifest
+ * Installs into a fake Slack resources directory with install-slack-LINUX-X64.py
+ * and checks that installers/slackpolish_manifest.py and plan_native_install
+ * skip identical reinstalls and rebuild after a Slack update.
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const crypto = require('crypto');
+const { spawnSync } = require('child_process');
+const { buildAsar, readAsar } = require('./test_native_asar');
+
+const REPO_ROOT = path.join(__dirname, '../..');
+const INSTALLERS_DIR = path.join(REPO_ROOT, 'installers');
+const INSTALLER = path.join(INSTALLERS_DIR, 'install-slack-LINUX-X64.py');
+const MANIFEST_NAME = 'app.asar.slackpolish-manifest.json';
+
+function slackArchive(version) {
+    return buildAsar({
+        'dist/preload.bundle.js':
+            `const { ipcRenderer } = require("electron");\n` +
+            `let version = "${version}";\n` +
+            `function start() { window.slackVersion = version; }\n` +
+            `module.exports = { start };\n`,
+        'package.json': `{"name":"slack","version":"${version}"}`
+    });
+}
+
+function sha256(buffer) {
+    return crypto.createHash('sha256').update(buffer).digest('hex');
+}
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+function install(slackPath) {
+    const result = spawnSync('python3', [INSTALLER, '--slack-path', slackPath], {
+        cwd: REPO_ROOT,
+        encoding: 'utf8',
+        stdio: ['ignore', 'pipe', 'pipe']
+    });
+    const output = result.stdout + result.stderr;
+    if (result.status !== 0) {
+        throw new Error(`installer failed:\n${output}`);
+    }
+    return output;
+}
+
+// plan_native_install from the installer script, for a payload hash of our choosing
+function planNativeInstall(slackPath, payloadSha256) {
+    const script =
+        'import importlib.util, json, sys\n' +
+        'spec = importlib.util.spec_from_file_location("installer", "install-slack-LINUX-X64.py")\n' +
+        'installer = importlib.util.module_from_spec(spec)\n' +
+        'spec.loader.exec_module(installer)\n' +
+        'print(json.dumps(installer.plan_native_install(sys.argv[1], sys.argv[2])))';
+    const result = spawnSync('python3', ['-c', script, slackPath, payloadSha256], {
+        cwd: INSTALLERS_DIR,
+        encoding: 'utf8'
+    });
+    if (result.status !== 0) {
+        throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+    }
+    const lines = result.stdout.trim().split('\n');
+    return JSON.parse(lines[lines.length - 1]);
+}
+
+class InstallManifestTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+        this.tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'slackpolish-manifest-'));
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    // A Slack resources directory with SlackPolish installed once
+    installedSlack(name) {
+        const slackPath = path.join(this.tempDir, name);
+        fs.mkdirSync(slackPath);
+        fs.writeFileSync(path.join(slackPath, 'app.asar'), slackArchive('4.41.0'));
+        const output = install(slackPath);
+        assert(output.includes('Scripts injected successfully'), 'First install should patch app.asar');
+        assert(fs.existsSync(path.join(slackPath, MANIFEST_NAME)), 'First install should write the manifest');
+        return slackPath;
+    }
+
+    readManifest(slackPath) {
+        return JSON.parse(fs.readFileSync(path.join(slackPath, MANIFEST_NAME), 'utf8'));
+    }
+
+    testSecondInstallIsNoop() {
+        const slackPath = this.installedSlack('noop');
+        const asarPath = path.join(slackPath, 'app.asar');
+        const before = fs.statSync(asarPath, { bigint: true });
+        const manifest = this.readManifest(slackPath);
+
+        const output = install(slackPath);
+        assert(output.includes('already up to date'), 'Second install should be skipped');
+        assert(!output.includes('Writing patched app.asar'), 'Second install should not write app.asar');
+        assertEqual(fs.statSync(asarPath, { bigint: true }).mtimeNs, before.mtimeNs, 'app.asar should not be touched');
+        assertEqual(JSON.stringify(this.readManifest(slackPath)), JSON.stringify(manifest), 'Manifest should be unchanged');
+    }
+
+    testTouchedArchiveIsNoop() {
+        const slackPath = this.installedSlack('touched');
+        const asarPath = path.join(slackPath, 'app.asar');
+        const later = new Date(Date.now() + 3600 * 1000);
+        fs.utimesSync(asarPath, later, later);
+
+        const output = install(slackPath);
+        assert(output.includes('already up to date'), 'Same content with a new mtime should still be up to date');
+        assert(!output.includes('Slack update'), 'A touched archive should not look like a Slack update');
+    }
+
+    testSlackUpdateRebuildsFromNewOriginal() {
+        const slackPath = this.installedSlack('update');
+        const asarPath = path.join(slackPath, 'app.asar');
+        const updated = slackArchive('4.42.1');
+        fs.writeFileSync(asarPath, updated);
+
+        const output = install(slackPath);
+        assert(output.includes('app.asar changed since the last install'), 'The update should be detected');
+        assert(output.includes('Refreshing backup from the new Slack version'), 'The backup should be refreshed');
+
+        assert(fs.readFileSync(path.join(slackPath, 'app.asar.backup')).equals(updated), 'Backup should hold the new original');
+        const preload = readAsar(fs.readFileSync(asarPath)).read('dist/preload.bundle.js').toString('utf8');
+        assert(preload.includes('"4.42.1"'), 'Patched archive should be built from the new Slack version');
+        assert(preload.includes('SLACKPOLISH INJECTION START'), 'Patched archive should carry the injection');
+
+        const manifest = this.readManifest(slackPath);
+        assertEqual(manifest.original_sha256, sha256(updated), 'Manifest should record the new original');
+        assertEqual(manifest.result_sha256, sha256(fs.readFileSync(asarPath)), 'Manifest should record the new result');
+        assert(install(slackPath).includes('already up to date'), 'The install after the update should be a no-op again');
+    }
+
+    testPlanRebuildsFromBackupForNewPayload() {
+        const slackPath = this.installedSlack('payload');
+        const { payload_sha256: payloadSha256 } = this.readManifest(slackPath);
+
+        assertEqual(JSON.stringify(planNativeInstall(slackPath, payloadSha256)), '[true,null]',
+            'The recorded payload should be up to date');
+        assertEqual(JSON.stringify(planNativeInstall(slackPath, 'f'.repeat(64))),
+            JSON.stringify([false, path.join(slackPath, 'app.asar.backup')]),
+            'A new payload should be patched from the clean backup');
+
+        fs.unlinkSync(path.join(slackPath, MANIFEST_NAME));
+        assertEqual(JSON.stringify(planNativeInstall(slackPath, payloadSha256)), '[false,null]',
+            'Without a manifest the install should start from app.asar');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Install Manifest Tests\n');
+
+        this.runTest('Second install is a no-op', () => this.testSecondInstallIsNoop());
+        this.runTest('Touched archive with the same content is a no-op', () => this.testTouchedArchiveIsNoop());
+        this.runTest('Slack update rebuilds from the new original', () => this.testSlackUpdateRebuildsFromNewOriginal());
+        this.runTest('New payload is patched from the backup', () => this.testPlanRebuildsFromBackupForNewPayload());
+
+        fs.rmSync(this.tempDir, { recursive: true, force: true });
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new InstallManifestTests();
+    tests.runAllTests();
+}
+
+module.exports = InstallManifestTests;
@@ -0,0 +1,243 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Launcher Log, Status and Heartbeat
+ * Checks the buffered, rotating launcher log, the coalesced status file and
+ * the memory-mapped heartbeat from installers/slackpolish_runtime.py, including
+ * a launcher watching a fake DevTools connection (tests/installer/fake_devtools.py).
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+
+const SETUP =
+    'import asyncio, json, os, sys, time\n' +
+    'import slackpolish_runtime as runtime\n' +
+    'from fake_devtools import FakeDevToolsConnection, make_launcher, use_fake_browser\n' +
+    'state_dir = sys.argv[1]\n';
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+class LauncherLoggingTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+        this.tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'slackpolish-logging-'));
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    // Runs script with a fresh state directory; the last stdout line is JSON
+    runPython(name, script) {
+        const stateDir = path.join(this.tempDir, name);
+        fs.mkdirSync(stateDir);
+        const result = spawnSync('python3', ['-c', SETUP + script, stateDir], {
+            cwd: INSTALLERS_DIR,
+            encoding: 'utf8',
+            env: { ...process.env, PYTHONPATH: __dirname }
+        });
+        if (result.status !== 0) {
+            throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+        }
+        const lines = result.stdout.trim().split('\n');
+        return { stateDir, result: JSON.parse(lines[lines.length - 1]) };
+    }
+
+    testLogRotation() {
+        const { stateDir } = this.runPython('rotation',
+            'runtime.LOG_MAX_BYTES = 400\n' +
+            'runtime.configure_logging(os.path.join(state_dir, "launcher.log"))\n' +
+            'for index in range(300):\n' +
+            '    runtime.append_log_line(f"{runtime.GREEN}line {index:03d}{runtime.RESET}")\n' +
+            'runtime.close_log()\n' +
+            'print("{}")'
+        );
+
+        const files = fs.readdirSync(stateDir).sort();
+        assertEqual(files.join(), 'launcher.log,launcher.log.1,launcher.log.2,launcher.log.3',
+            'The log should keep LOG_BACKUP_COUNT rotated files');
+        for (const file of files) {
+            assert(fs.statSync(path.join(stateDir, file)).size <= 400 + 9, `${file} should stay near the size limit`);
+        }
+        const lines = ['launcher.log.3', 'launcher.log.2', 'launcher.log.1', 'launcher.log']
+            .map(file => fs.readFileSync(path.join(stateDir, file), 'utf8'))
+            .join('')
+            .trim()
+            .split('\n');
+        assertEqual(lines[lines.length - 1], 'line 299', 'The newest line should be in launcher.log, without colours');
+        lines.forEach((line, index) => {
+            if (index) {
+                assertEqual(Number(line.slice(5)), Number(lines[index - 1].slice(5)) + 1, 'Rotated files should hold consecutive lines');
+            }
+        });
+    }
+
+    testLogIsBufferedUntilFlush() {
+        const { result } = this.runPython('buffered',
+            'log_path = os.path.join(state_dir, "launcher.log")\n' +
+            'runtime.configure_logging(log_path)\n' +
+            'runtime.print_info("routine line")\n' +
+            'sizes = [os.path.getsize(log_path)]\n' +
+            'runtime.print_warning("warning line")\n' +
+            'sizes.append(os.path.getsize(log_path))\n' +
+            'print(json.dumps({"sizes": sizes, "log": open(log_path).read()}))'
+        );
+
+        assertEqual(result.sizes[0], 0, 'Routine lines should stay buffered');
+        assert(result.sizes[1] > 0, 'A warning should flush the log');
+        assert(result.log.includes('routine line') && result.log.includes('warning line'), 'Both lines should be written in order');
+    }
+
+    testHeartbeatFile() {
+        const { result } = this.runPython('heartbeat',
+            'path = os.path.join(state_dir, "launcher-heartbeat")\n' +
+            'heartbeat = runtime.HeartbeatFile(path)\n' +
+            'first = runtime.read_heartbeat(path)\n' +
+            'time.sleep(0.05)\n' +
+            'heartbeat.beat()\n' +
+            'second = runtime.read_heartbeat(path)\n' +
+            'heartbeat.close()\n' +
+            'closed = runtime.read_heartbeat(path)\n' +
+            'with open(path, "r+b") as handle:\n' +
+            '    handle.write(b"XXXX")\n' +
+            'print(json.dumps({"pid": os.getpid(), "size": os.path.getsize(path), "first": first,\n' +
+            '                  "second": second, "closed": closed, "corrupt": runtime.read_heartbeat(path)}))'
+        );
+
+        assertEqual(result.size, 28, 'The heartbeat file should hold one fixed-size record');
+        assertEqual(result.first.pid, result.pid, 'The record should carry the launcher pid');
+        assertEqual(result.first.started_at, result.first.last_heartbeat, 'A new record should start with a fresh heartbeat');
+        assert(result.second.last_heartbeat > result.first.last_heartbeat, 'beat() should move last_heartbeat forward');
+        assertEqual(result.second.started_at, result.first.started_at, 'beat() should keep started_at');
+        assertEqual(result.closed.last_heartbeat, 0, 'A closed heartbeat should read as stopped');
+        assertEqual(result.corrupt, null, 'A record without the magic should be ignored');
+    }
+
+    testStatusWritesAreCoalesced() {
+        const { result } = this.runPython('coalesced',
+            'launcher = make_launcher()\n' +
+            'launcher.state_dir = runtime.Path(state_dir)\n' +
+            'launcher.status_path = launcher.state_dir / "launcher-status.json"\n' +
+            'writes = []\n' +
+            'write_status = launcher._write_status\n' +
+            'def counting_write():\n' +
+            '    writes.append(dict(launcher.status))\n' +
+            '    write_status()\n' +
+            'launcher._write_status = counting_write\n' +
+            'async def main():\n' +
+            '    for phase in ("lock-acquired", "launching-slack", "connecting-devtools", "watching-targets"):\n' +
+            '        launcher._update_status(phase=phase)\n' +
+            '    await asyncio.sleep(runtime.STATUS_COALESCE_SECONDS + 0.1)\n' +
+            '    launcher._update_status(phase="watching-targets")\n' +
+            '    await asyncio.sleep(runtime.STATUS_COALESCE_SECONDS + 0.1)\n' +
+            'asyncio.run(main())\n' +
+            'print(json.dumps({"writes": [w["phase"] for w in writes],\n' +
+            '                  "file": json.loads(launcher.status_path.read_text())}))'
+        );
+
+        assertEqual(result.writes.join(), 'watching-targets', 'A burst of updates should be written once, and repeats not at all');
+        assertEqual(result.file.phase, 'watching-targets', 'The file should hold the last phase');
+    }
+
+    testWatchingKeepsHeartbeatAndStatusFresh() {
+        const { stateDir, result } = this.runPython('watching',
+            'launcher = make_launcher()\n' +
+            'launcher.state_dir = runtime.Path(state_dir)\n' +
+            'launcher.status_path = launcher.state_dir / "launcher-status.json"\n' +
+            'launcher.heartbeat_path = launcher.state_dir / "launcher-heartbeat"\n' +
+            'runtime.configure_logging(launcher.state_dir / "launcher.log")\n' +
+            'browser = FakeDevToolsConnection()\n' +
+            'browser.add_page("T1")\n' +
+            'use_fake_browser(launcher, browser)\n' +
+            'launcher.health_interval = 0.1\n' +
+            'launcher._open_heartbeat()\n' +
+            'async def main():\n' +
+            '    task = asyncio.create_task(launcher._watch_targets())\n' +
+            '    await asyncio.sleep(0.6)\n' +
+            '    watching = {"status": json.loads(launcher.status_path.read_text()),\n' +
+            '                "heartbeat": runtime.read_heartbeat(launcher.heartbeat_path),\n' +
+            '                "log": (launcher.state_dir / "launcher.log").read_text()}\n' +
+            '    browser.drop()\n' +
+            '    try:\n' +
+            '        await task\n' +
+            '    except runtime.DevToolsProtocolError:\n' +
+            '        pass\n' +
+            '    watching["after"] = json.loads(launcher.status_path.read_text())\n' +
+            '    return watching\n' +
+            'watching = asyncio.run(main())\n' +
+            'watching["pid"] = os.getpid()\n' +
+            'print(json.dumps(watching))'
+        );
+
+        const { status, heartbeat, log } = result;
+        assertEqual(status.phase, 'watching-targets', 'The status should report the watch phase');
+        assertEqual(status.session_count, 1, 'The status should count the attached target');
+        assertEqual(status.payload_hash, 'build1', 'The status should name the payload');
+        assert(status.startup_timings_ms && 'ready' in status.startup_timings_ms, 'The first attach should record startup timings');
+        assertEqual(heartbeat.pid, result.pid, 'The heartbeat should carry the launcher pid');
+        assert(heartbeat.last_heartbeat > heartbeat.started_at, 'The watch loop should beat the heartbeat');
+        assert(log.includes('Attached to Slack target: Slack | https://app.slack.com/client/T1/C1'),
+            'The heartbeat should flush the buffered log');
+        assertEqual(result.after.session_count, 0, 'Losing the connection should drop the sessions from the status');
+        assert(fs.existsSync(path.join(stateDir, 'launcher-heartbeat')), 'The heartbeat file should be kept');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Launcher Log, Status and Heartbeat Tests\n');
+
+        this.runTest('The log rotates', () => this.testLogRotation());
+        this.runTest('The log is buffered until a flush', () => this.testLogIsBufferedUntilFlush());
+        this.runTest('Heartbeat file layout', () => this.testHeartbeatFile());
+        this.runTest('Status writes are coalesced', () => this.testStatusWritesAreCoalesced());
+        this.runTest('Watching keeps the heartbeat and status fresh', () => this.testWatchingKeepsHeartbeatAndStatusFresh());
+
+        fs.rmSync(this.tempDir, { recursive: true, force: true });
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new LauncherLoggingTests();
+    tests.runAllTests();
+}
+
+module.exports = LauncherLoggingTests;
@@ -0,0 +1,148 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Launcher Metrics
+ * Feeds observations into installers/slackpolish_metrics.py and checks the
+ * JSON snapshot and the Prometheus text served by the launcher's --stats.
+ */
+
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+
+const SETUP =
+    'from slackpolish_metrics import LauncherMetrics\n' +
+    'metrics = LauncherMetrics()\n' +
+    'for seconds in (0.003, 0.04, 0.04, 0.3, 42):\n' +
+    '    metrics.observe("devtools_command_seconds", seconds, method="Runtime.runScript")\n' +
+    'metrics.observe("devtools_sent_bytes", 2048, method=\'Say "hi"\')\n' +
+    'metrics.set("startup_phase_seconds", 1.5, phase="ready")\n';
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+function runPython(script) {
+    const result = spawnSync('python3', ['-c', SETUP + script], {
+        cwd: INSTALLERS_DIR,
+        encoding: 'utf8'
+    });
+    if (result.status !== 0) {
+        throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+    }
+    return result.stdout;
+}
+
+class LauncherMetricsTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    testJsonSnapshot() {
+        const snapshot = JSON.parse(runPython('print(metrics.render_json())'));
+        const [commands] = snapshot.devtools_command_seconds;
+        assertEqual(commands.labels.method, 'Runtime.runScript', 'Labels should be kept');
+        assertEqual(commands.count, 5, 'Every observation should be counted');
+        assertEqual(commands.overflow, 1, 'Values past the last bucket should land in the overflow');
+        assertEqual(JSON.stringify(commands.buckets.slice(0, 4)), '[[0.005,1],[0.01,0],[0.025,0],[0.05,2]]',
+            'Buckets should stay in order and hold per-bucket counts');
+        assertEqual(commands.p50, 0.05, 'p50 should be the upper bound of its bucket');
+        assertEqual(commands.max, 42, 'max should be exact');
+        assertEqual(snapshot.startup_phase_seconds[0].value, 1.5, 'Gauges should be included');
+    }
+
+    testPrometheusText() {
+        const lines = runPython('print(metrics.render_prometheus(), end="")').split('\n');
+        assert(lines.includes('# TYPE slackpolish_devtools_command_seconds histogram'), 'Histogram TYPE line');
+        assert(lines.includes('slackpolish_devtools_command_seconds_bucket{method="Runtime.runScript",le="0.05"} 3'),
+            'Buckets should be cumulative');
+        assert(lines.includes('slackpolish_devtools_command_seconds_bucket{method="Runtime.runScript",le="+Inf"} 5'),
+            '+Inf bucket should equal the count');
+        assert(lines.includes('slackpolish_devtools_command_seconds_count{method="Runtime.runScript"} 5'), 'Count line');
+        assert(lines.includes('slackpolish_startup_phase_seconds{phase="ready"} 1.5'), 'Gauge line');
+        assert(!lines.some(line => line.startsWith('# TYPE slackpolish_attach_seconds')),
+            'Metrics without data should be left out');
+    }
+
+    testLabelEscaping() {
+        const text = runPython('print(metrics.render_prometheus(), end="")');
+        assert(text.includes('slackpolish_devtools_sent_bytes_count{method="Say \\"hi\\""} 1'),
+            'Quotes in label values should be escaped');
+    }
+
+    // --stats end to end: a stale socket file is replaced, and stopping removes the socket
+    testStatsOverControlSocket() {
+        const output = runPython(
+            'import json, tempfile\n' +
+            'from pathlib import Path\n' +
+            'from slackpolish_runtime import SlackPolishLauncher, query_launcher\n' +
+            'state = Path(tempfile.mkdtemp())\n' +
+            'launcher = SlackPolishLauncher(state, state / "launcher.lock", None, 9222, False, False, 1)\n' +
+            'launcher.metrics = metrics\n' +
+            'launcher.control_path.write_text("stale")\n' +
+            'launcher._start_control_server()\n' +
+            'reply = json.loads(query_launcher(launcher.lock_path, "stats"))\n' +
+            'launcher._stop_control_server()\n' +
+            'launcher._remove_control_socket()\n' +
+            'print(json.dumps({"served": launcher.control_server is None and "devtools_command_seconds" in reply,\n' +
+            '                  "removed": not launcher.control_path.exists()}))'
+        );
+        const result = JSON.parse(output.trim().split('\n').pop());
+        assert(result.served, 'The control socket should serve the metrics snapshot');
+        assert(result.removed, 'Stopping should remove the control socket');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Launcher Metrics Tests\n');
+
+        this.runTest('JSON snapshot', () => this.testJsonSnapshot());
+        this.runTest('Prometheus text exposition', () => this.testPrometheusText());
+        this.runTest('Label values are escaped', () => this.testLabelEscaping());
+        this.runTest('Stats are served over the control socket', () => this.testStatsOverControlSocket());
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new LauncherMetricsTests();
+    tests.runAllTests();
+}
+
+module.exports = LauncherMetricsTests;
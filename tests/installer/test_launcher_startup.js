@@ -0,0 +1,191 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Launcher Startup Pipeline
+ * Drives the startup steps of SlackPolishLauncher from installers/slackpolish_runtime.py:
+ * the DevTools readiness wait (backoff plus DevToolsActivePort), process-exit waits
+ * instead of fixed sleeps, the payload build on a worker thread and the per-phase timings.
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+
+// A launcher with its state in sys.argv[1]; DevTools answers once `ready` is set
+const SETUP =
+    'import json, os, subprocess, sys, threading, time\n' +
+    'from pathlib import Path\n' +
+    'from slackpolish_runtime import SlackPolishLauncher\n' +
+    'state_dir = Path(sys.argv[1])\n' +
+    'launcher = SlackPolishLauncher(state_dir, state_dir / "launcher.lock", None, 9222, False, False, 1)\n' +
+    'attempts = []\n' +
+    'ready = threading.Event()\n' +
+    'def devtools_available():\n' +
+    '    attempts.append(time.monotonic())\n' +
+    '    return ready.is_set()\n' +
+    'launcher._devtools_available = devtools_available\n';
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+class LauncherStartupTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+        this.tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'slackpolish-startup-'));
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    runPython(name, script) {
+        const stateDir = path.join(this.tempDir, name);
+        fs.mkdirSync(stateDir);
+        const result = spawnSync('python3', ['-c', SETUP + script, stateDir], {
+            cwd: INSTALLERS_DIR,
+            encoding: 'utf8'
+        });
+        if (result.status !== 0) {
+            throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+        }
+        const lines = result.stdout.trim().split('\n');
+        return JSON.parse(lines[lines.length - 1]);
+    }
+
+    testDevToolsRetriesBackOff() {
+        const result = this.runPython('backoff',
+            'try:\n' +
+            '    launcher._wait_for_devtools(timeout=1)\n' +
+            '    timed_out = False\n' +
+            'except TimeoutError:\n' +
+            '    timed_out = True\n' +
+            'gaps = [round(b - a, 3) for a, b in zip(attempts, attempts[1:])]\n' +
+            'print(json.dumps({"timed_out": timed_out, "gaps": gaps}))'
+        );
+
+        assert(result.timed_out, 'An endpoint that never comes up should time out');
+        assert(result.gaps.length >= 3 && result.gaps.length <= 6,
+            `attempts should back off instead of polling steadily, saw gaps ${result.gaps}`);
+        for (let i = 1; i < result.gaps.length; i++) {
+            assert(result.gaps[i] >= result.gaps[i - 1] - 0.01, `gaps should grow, saw ${result.gaps}`);
+        }
+        assert(Math.max(...result.gaps) <= 0.6, `retries should be capped, saw gaps ${result.gaps}`);
+    }
+
+    testDevToolsActivePortStartsAtOnce() {
+        const result = this.runPython('port-file',
+            'port_file = state_dir / "DevToolsActivePort"\n' +
+            'launcher.devtools_active_port_path = port_file\n' +
+            'def slack_listening():\n' +
+            '    ready.set()\n' +
+            '    port_file.write_text("9222\\n/devtools/browser/x")\n' +
+            '    return time.monotonic()\n' +
+            'written = []\n' +
+            'threading.Timer(1.2, lambda: written.append(slack_listening())).start()\n' +
+            'launcher._wait_for_devtools(timeout=5)\n' +
+            'print(json.dumps({"latency": time.monotonic() - written[0]}))'
+        );
+
+        // The backoff alone would take up to DEVTOOLS_RETRY_MAX_SECONDS (0.5s)
+        assert(result.latency < 0.25, `a fresh DevToolsActivePort should be noticed at once, took ${result.latency}s`);
+    }
+
+    testProcessExitWait() {
+        const result = this.runPython('exit-wait',
+            'quick = subprocess.Popen(["sleep", "0.2"])\n' +
+            'started = time.monotonic()\n' +
+            'exited = launcher._wait_for_exit([quick.pid])\n' +
+            'elapsed = time.monotonic() - started\n' +
+            'stuck = subprocess.Popen(["sleep", "30"])\n' +
+            'stuck_exited = launcher._wait_for_exit([stuck.pid], timeout=0.3)\n' +
+            'stuck.kill()\n' +
+            'stuck.wait()\n' +
+            'print(json.dumps({"exited": exited, "elapsed": elapsed, "stuck_exited": stuck_exited}))'
+        );
+
+        assert(result.exited, 'A process that exits should be waited for');
+        assert(result.elapsed < 1, `the wait should end when the process exits, took ${result.elapsed}s`);
+        assertEqual(result.stuck_exited, false, 'A process that does not exit should be reported after the timeout');
+    }
+
+    testPayloadBuildAndTimings() {
+        const result = this.runPython('timings',
+            'launcher._start_background_work()\n' +
+            'launcher._finish_background_work()\n' +
+            'launcher._record_ready()\n' +
+            'first = dict(launcher.timings)\n' +
+            'time.sleep(0.05)\n' +
+            'launcher._record_ready()\n' +
+            'launcher._flush_status()\n' +
+            'status = json.loads(launcher.status_path.read_text())\n' +
+            'phases = sorted(m["labels"]["phase"] for m in launcher.metrics.snapshot()["startup_phase_seconds"])\n' +
+            'print(json.dumps({"hash": launcher.payload_hash, "has_payload": bool(launcher.runtime_payload),\n' +
+            '                  "first": first, "timings": launcher.timings, "status": status, "phases": phases}))'
+        );
+
+        assert(result.has_payload && /^[0-9a-f]{12}$/.test(result.hash), 'The worker thread should build the payload');
+        assertEqual(result.status.payload_hash, result.hash, 'The status should report the payload hash');
+        for (const phase of ['payload', 'payload-wait', 'ready']) {
+            assert(phase in result.timings, `the ${phase} phase should be timed`);
+        }
+        assertEqual(result.timings.ready, result.first.ready, 'ready should be recorded once, for the first target');
+        assertEqual(JSON.stringify(result.status.startup_timings_ms), JSON.stringify(result.first),
+            'The status should carry the startup breakdown');
+        assertEqual(result.phases.join(), 'payload,payload-wait,ready', 'Every phase should be exported as a gauge');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Launcher Startup Tests\n');
+
+        this.runTest('DevTools retries back off', () => this.testDevToolsRetriesBackOff());
+        this.runTest('DevToolsActivePort starts the connection at once', () => this.testDevToolsActivePortStartsAtOnce());
+        this.runTest('Stopped processes are waited for, not slept on', () => this.testProcessExitWait());
+        this.runTest('The payload is built in the background and phases are timed', () => this.testPayloadBuildAndTimings());
+
+        fs.rmSync(this.tempDir, { recursive: true, force: true });
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new LauncherStartupTests();
+    tests.runAllTests();
+}
+
+module.exports = LauncherStartupTests;
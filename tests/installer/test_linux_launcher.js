@@ -0,0 +1,190 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Linux Runtime Launcher
+ * Loads installers/launch-slackpolish-LINUX-X64.py with the XDG directories
+ * pointing at a temporary tree and checks where its state lives, the Slack
+ * command line it starts and its fcntl single-instance lock.
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+
+// The Linux launcher module; new_launcher() builds one as main() would
+const SETUP =
+    'import importlib.util, json, os, sys\n' +
+    'spec = importlib.util.spec_from_file_location("linux_launcher", "launch-slackpolish-LINUX-X64.py")\n' +
+    'linux = importlib.util.module_from_spec(spec)\n' +
+    'spec.loader.exec_module(linux)\n' +
+    'def new_launcher(**options):\n' +
+    '    defaults = dict(slack_executable="/usr/bin/slack", debug_port=9333, launch_slack=True,\n' +
+    '                    relaunch=False, inject_interval=1)\n' +
+    '    return linux.SlackPolishLinuxLauncher(**{**defaults, **options})\n';
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+class LinuxLauncherTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+        this.tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'slackpolish-linux-launcher-'));
+        this.xdg = {
+            XDG_STATE_HOME: path.join(this.tempDir, 'state'),
+            XDG_CONFIG_HOME: path.join(this.tempDir, 'config'),
+            XDG_RUNTIME_DIR: path.join(this.tempDir, 'run')
+        };
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    runPython(script, env = {}) {
+        const result = spawnSync('python3', ['-c', SETUP + script], {
+            cwd: INSTALLERS_DIR,
+            encoding: 'utf8',
+            env: { ...process.env, ...this.xdg, ...env }
+        });
+        if (result.status !== 0) {
+            throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+        }
+        const lines = result.stdout.trim().split('\n');
+        return JSON.parse(lines[lines.length - 1]);
+    }
+
+    testStateUnderXdgDirectories() {
+        const result = this.runPython(
+            'launcher = new_launcher()\n' +
+            'print(json.dumps({"status": str(launcher.status_path), "log": str(launcher.log_path),\n' +
+            '                  "lock": str(launcher.lock_path), "control": str(launcher.control_path),\n' +
+            '                  "port_file": str(launcher.devtools_active_port_path)}))'
+        );
+
+        const stateDir = path.join(this.xdg.XDG_STATE_HOME, 'slackpolish');
+        assertEqual(result.status, path.join(stateDir, 'launcher-status.json'), 'Status should live under XDG_STATE_HOME');
+        assertEqual(result.log, path.join(stateDir, 'launcher.log'), 'The log should live under XDG_STATE_HOME');
+        assertEqual(result.lock, path.join(this.xdg.XDG_RUNTIME_DIR, 'slackpolish-linux-launcher.lock'),
+            'The lock should live under XDG_RUNTIME_DIR');
+        assertEqual(result.control, path.join(this.xdg.XDG_RUNTIME_DIR, 'slackpolish-linux-launcher.sock'),
+            'The control socket should sit next to the lock');
+        assertEqual(result.port_file, path.join(this.xdg.XDG_CONFIG_HOME, 'Slack', 'DevToolsActivePort'),
+            "DevToolsActivePort should be watched in Slack's XDG config dir");
+    }
+
+    testLockFallsBackToTempDir() {
+        const result = this.runPython(
+            'import tempfile\n' +
+            'print(json.dumps({"lock": str(linux.LOCK_PATH), "tmp": tempfile.gettempdir(), "uid": os.getuid()}))',
+            { XDG_RUNTIME_DIR: '' }
+        );
+        assertEqual(result.lock, path.join(result.tmp, `slackpolish-linux-launcher-${result.uid}.lock`),
+            'Without XDG_RUNTIME_DIR the lock should be per user in the temp dir');
+    }
+
+    testLaunchCommand() {
+        const result = this.runPython(
+            'started = []\n' +
+            'linux.subprocess.Popen = lambda command, **kwargs: started.append({"command": command, **kwargs})\n' +
+            'launcher = new_launcher(slack_args=["--headless=new", "https://app.slack.com/client/T0/C0"])\n' +
+            'launcher._launch_slack()\n' +
+            'print(json.dumps([{"command": s["command"], "new_session": s["start_new_session"]} for s in started]))'
+        );
+
+        assertEqual(result.length, 1, 'Slack should be started once');
+        assertEqual(result[0].command.join(' '),
+            '/usr/bin/slack --remote-debugging-port=9333 --remote-allow-origins=* --headless=new https://app.slack.com/client/T0/C0',
+            'Slack should start with the debugging port and the extra arguments');
+        assert(result[0].new_session, 'Slack should run in its own session so it outlives the terminal');
+    }
+
+    testSingleInstanceLock() {
+        const result = this.runPython(
+            'first, second = new_launcher(), new_launcher()\n' +
+            'first._acquire_single_instance_lock()\n' +
+            'pid = first.lock_path.read_text()\n' +
+            'try:\n' +
+            '    second._acquire_single_instance_lock()\n' +
+            '    blocked = None\n' +
+            'except RuntimeError as error:\n' +
+            '    blocked = str(error)\n' +
+            'first._release_single_instance_lock()\n' +
+            'second._acquire_single_instance_lock()\n' +
+            'second._release_single_instance_lock()\n' +
+            'print(json.dumps({"pid": pid, "own_pid": str(os.getpid()), "blocked": blocked}))'
+        );
+
+        assertEqual(result.pid, result.own_pid, 'The lock file should hold the owner pid');
+        assertEqual(result.blocked, 'SlackPolish is already running', 'A second launcher should not get the lock');
+    }
+
+    testFindsSlackOnPath() {
+        const binDir = path.join(this.tempDir, 'bin');
+        fs.mkdirSync(binDir, { recursive: true });
+        const slack = path.join(binDir, 'slack');
+        fs.writeFileSync(slack, '#!/bin/sh\n');
+        fs.chmodSync(slack, 0o755);
+
+        const result = this.runPython(
+            'print(json.dumps(linux.find_slack_executable()))',
+            { PATH: `${binDir}${path.delimiter}${process.env.PATH}` }
+        );
+        assertEqual(result, slack, 'slack on PATH should be preferred');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Linux Runtime Launcher Tests\n');
+
+        this.runTest('State lives under the XDG directories', () => this.testStateUnderXdgDirectories());
+        this.runTest('The lock falls back to the temp dir', () => this.testLockFallsBackToTempDir());
+        this.runTest('Slack is started with remote debugging', () => this.testLaunchCommand());
+        this.runTest('Only one launcher holds the lock', () => this.testSingleInstanceLock());
+        this.runTest('Slack is found on PATH', () => this.testFindsSlackOnPath());
+
+        fs.rmSync(this.tempDir, { recursive: true, force: true });
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new LinuxLauncherTests();
+    tests.runAllTests();
+}
+
+module.exports = LinuxLauncherTests;
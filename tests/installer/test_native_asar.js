@@ -0,0 +1,279 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Native ASAR Reader/Writer
+ * Builds ASAR archives in JavaScript and checks that installers/slackpolish_asar.py
+ * reads them and rewrites a single entry without disturbing the rest.
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const crypto = require('crypto');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+// Minimal ASAR encoder mirroring @electron/asar's pickle layout
+function buildAsar(files, extraEntries = {}) {
+    const header = { files: {} };
+    const chunks = [];
+    let offset = 0;
+
+    for (const [filePath, content] of Object.entries(files)) {
+        const data = Buffer.from(content);
+        const parts = filePath.split('/');
+        let node = header;
+        for (const dir of parts.slice(0, -1)) {
+            node.files[dir] = node.files[dir] || { files: {} };
+            node = node.files[dir];
+        }
+        node.files[parts[parts.length - 1]] = {
+            size: data.length,
+            offset: String(offset),
+            integrity: {
+                algorithm: 'SHA256',
+                hash: crypto.createHash('sha256').update(data).digest('hex'),
+                blockSize: 4 * 1024 * 1024,
+                blocks: [crypto.createHash('sha256').update(data).digest('hex')]
+            }
+        };
+        chunks.push(data);
+        offset += data.length;
+    }
+    Object.assign(header.files, extraEntries);
+
+    const json = Buffer.from(JSON.stringify(header), 'utf8');
+    const payloadSize = Math.ceil((4 + json.length) / 4) * 4;
+    const headerPickle = Buffer.alloc(4 + payloadSize);
+    headerPickle.writeUInt32LE(payloadSize, 0);
+    headerPickle.writeUInt32LE(json.length, 4);
+    json.copy(headerPickle, 8);
+
+    const sizePickle = Buffer.alloc(8);
+    sizePickle.writeUInt32LE(4, 0);
+    sizePickle.writeUInt32LE(headerPickle.length, 4);
+
+    return Buffer.concat([sizePickle, headerPickle, ...chunks]);
+}
+
+function readAsar(buffer) {
+    const headerSize = buffer.readUInt32LE(4);
+    const jsonSize = buffer.readUInt32LE(12);
+    const header = JSON.parse(buffer.slice(16, 16 + jsonSize).toString('utf8'));
+    const dataOffset = 8 + headerSize;
+
+    return {
+        header,
+        entry(filePath) {
+            let node = header;
+            for (const part of filePath.split('/')) {
+                node = node.files[part];
+            }
+            return node;
+        },
+        read(filePath) {
+            const entry = this.entry(filePath);
+            const start = dataOffset + Number(entry.offset);
+            return buffer.slice(start, start + entry.size);
+        }
+    };
+}
+
+function runPython(script, args) {
+    const result = spawnSync('python3', ['-c', script, ...args], {
+        cwd: INSTALLERS_DIR,
+        encoding: 'utf8'
+    });
+    if (result.status !== 0) {
+        throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+    }
+    return result.stdout;
+}
+
+class NativeAsarTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+        this.tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'slackpolish-asar-'));
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    writeArchive(name, files, extraEntries) {
+        const archivePath = path.join(this.tempDir, name);
+        fs.writeFileSync(archivePath, buildAsar(files, extraEntries));
+        return archivePath;
+    }
+
+    testListsEntries() {
+        const archivePath = this.writeArchive('list.asar', {
+            'dist/preload.bundle.js': '(()=>{})();',
+            'package.json': '{}'
+        }, { 'link.js': { link: 'dist/preload.bundle.js' } });
+
+        const output = runPython(
+            'import sys, json\n' +
+            'from slackpolish_asar import AsarArchive\n' +
+            'with AsarArchive(sys.argv[1]) as archive:\n' +
+            '    print(json.dumps([p for p, _ in archive.iter_files()]))',
+            [archivePath]
+        );
+        const paths = JSON.parse(output);
+        assertEqual(paths.length, 2, 'Only packed files should be listed');
+        assert(paths.includes('dist/preload.bundle.js'), 'Nested file should be listed with its directory');
+    }
+
+    testReplaceSingleEntry() {
+        const big = crypto.randomBytes(256 * 1024).toString('base64');
+        const archivePath = this.writeArchive('source.asar', {
+            'dist/preload.bundle.js': '(()=>{})();',
+            'dist/big.js': big,
+            'package.json': '{"name":"slack"}'
+        });
+        const outputPath = path.join(this.tempDir, 'patched.asar');
+        const replacement = '(()=>{})();\n// === SLACKPOLISH INJECTION START ===\n// ünïcode\n';
+
+        runPython(
+            'import sys\n' +
+            'from slackpolish_asar import AsarArchive\n' +
+            'with AsarArchive(sys.argv[1]) as archive:\n' +
+            '    archive.write(sys.argv[2], {"dist/preload.bundle.js": sys.argv[3].encode("utf-8")})',
+            [archivePath, outputPath, replacement]
+        );
+
+        const patched = readAsar(fs.readFileSync(outputPath));
+        assertEqual(patched.read('dist/preload.bundle.js').toString('utf8'), replacement, 'Replaced entry should hold new content');
+        assertEqual(patched.read('dist/big.js').toString('utf8'), big, 'Large entry should be copied unchanged');
+        assertEqual(patched.read('package.json').toString('utf8'), '{"name":"slack"}', 'Trailing entry should be copied unchanged');
+
+        const expectedHash = crypto.createHash('sha256').update(Buffer.from(replacement, 'utf8')).digest('hex');
+        assertEqual(patched.entry('dist/preload.bundle.js').integrity.hash, expectedHash, 'Integrity hash should be refreshed');
+    }
+
+    testRejectsCorruptEntryBeforeWriting() {
+        const archivePath = this.writeArchive('corrupt.asar', {
+            'dist/preload.bundle.js': '(()=>{})();',
+            'package.json': '{}'
+        }, {
+            'truncated.js': { size: 4096, offset: '2' },
+            'negative.js': { size: 4, offset: '-8' }
+        });
+        const outputPath = path.join(this.tempDir, 'corrupt-patched.asar');
+
+        const output = runPython(
+            'import os, sys\n' +
+            'from slackpolish_asar import AsarArchive, AsarError\n' +
+            'with AsarArchive(sys.argv[1]) as archive:\n' +
+            '    files = archive.header["files"]\n' +
+            '    corrupt = {name: files.pop(name) for name in ("truncated.js", "negative.js")}\n' +
+            '    for name, entry in corrupt.items():\n' +
+            '        files[name] = entry\n' +
+            '        try:\n' +
+            '            archive.write(sys.argv[2], {"dist/preload.bundle.js": b"patched"})\n' +
+            '            print("written")\n' +
+            '        except AsarError as error:\n' +
+            '            print(error)\n' +
+            '        files.pop(name)\n' +
+            'print(os.path.exists(sys.argv[2]))',
+            [archivePath, outputPath]
+        );
+        const lines = output.trim().split('\n');
+        assertEqual(lines[0], 'Entry extends past end of archive: truncated.js', 'An entry past the end should be rejected');
+        assertEqual(lines[1], 'Entry extends past end of archive: negative.js', 'A negative offset should be rejected');
+        assertEqual(lines[2], 'False', 'Nothing should be written for a corrupt archive');
+    }
+
+    testFindsMarkersInPlace() {
+        const preload = '(()=>{})();\n// === SLACKPOLISH INJECTION START ===\n// === SLACKPOLISH INJECTION END ===\n';
+        const archivePath = this.writeArchive('markers.asar', {
+            'dist/other.js': 'SLACKPOLISH INJECTION END',
+            'dist/preload.bundle.js': preload
+        });
+
+        const output = runPython(
+            'import sys\n' +
+            'from slackpolish_asar import AsarArchive\n' +
+            'with AsarArchive(sys.argv[1]) as archive:\n' +
+            '    end = archive.rfind("dist/preload.bundle.js", b"SLACKPOLISH INJECTION END")\n' +
+            '    print(end, archive.rfind("dist/preload.bundle.js", b"SLACKPOLISH INJECTION START", end=end), archive.find("dist/other.js", b"START"))',
+            [archivePath]
+        );
+        const [endOffset, startOffset, missing] = output.trim().split(' ').map(Number);
+        assertEqual(endOffset, preload.indexOf('SLACKPOLISH INJECTION END'), 'End marker offset should be relative to the entry');
+        assertEqual(startOffset, preload.indexOf('SLACKPOLISH INJECTION START'), 'Start marker should be found before the end marker');
+        assertEqual(missing, -1, 'Search should not leak into neighbouring entries');
+    }
+
+    testRejectsInvalidArchive() {
+        const archivePath = path.join(this.tempDir, 'broken.asar');
+        fs.writeFileSync(archivePath, Buffer.from('this is not an asar archive at all'));
+
+        const output = runPython(
+            'import sys\n' +
+            'from slackpolish_asar import is_asar_archive\n' +
+            'print(is_asar_archive(sys.argv[1]))',
+            [archivePath]
+        );
+        assertEqual(output.trim(), 'False', 'Invalid archive should be rejected');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Native ASAR Tests\n');
+
+        this.runTest('Lists packed entries', () => this.testListsEntries());
+        this.runTest('Replaces a single entry', () => this.testReplaceSingleEntry());
+        this.runTest('Rejects corrupt entries before writing', () => this.testRejectsCorruptEntryBeforeWriting());
+        this.runTest('Finds markers in place', () => this.testFindsMarkersInPlace());
+        this.runTest('Rejects invalid archive', () => this.testRejectsInvalidArchive());
+
+        fs.rmSync(this.tempDir, { recursive: true, force: true });
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new NativeAsarTests();
+    tests.runAllTests();
+}
+
+module.exports = NativeAsarTests;
+module.exports.buildAsar = buildAsar;
+module.exports.readAsar = readAsar;
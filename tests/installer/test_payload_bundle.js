@@ -0,0 +1,167 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Payload Bundle
+ * Builds the content-addressed payload bundle with installers/slackpolish_payload.py
+ * and checks its index, offset table and staleness handling.
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const crypto = require('crypto');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+
+const SOURCES = {
+    'slack-config.js': 'window.SLACKPOLISH_CONFIG = { DEBUG_MODE: false }',
+    'logo-data.js': 'window.SLACKPOLISH_LOGO_BASE64 = "iVBORw0KGgo";',
+    'slack-text-improver.js': "(function() { 'use strict'; window.improver = 'ünïcode'; })();",
+    'slack-settings.js': "(function() { 'use strict'; window.settings = {}; })();",
+    'slack-channel-summary.js': "(function() { 'use strict'; window.summary = {}; })();"
+};
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+function runPython(script, args) {
+    const result = spawnSync('python3', ['-c', script, ...args], {
+        cwd: INSTALLERS_DIR,
+        encoding: 'utf8'
+    });
+    if (result.status !== 0) {
+        throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+    }
+    return result.stdout;
+}
+
+function readBundle(bundlePath) {
+    const data = fs.readFileSync(bundlePath);
+    const newline = data.indexOf(0x0a);
+    const [magic, version, indexLength] = data.slice(0, newline).toString('ascii').split(' ');
+    const indexStart = newline + 1;
+    const index = JSON.parse(data.slice(indexStart, indexStart + Number(indexLength)).toString('utf8'));
+    const body = data.slice(indexStart + Number(indexLength) + 1);
+    return { magic, version: Number(version), index, body };
+}
+
+class PayloadBundleTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+        this.tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'slackpolish-payload-'));
+        for (const [name, content] of Object.entries(SOURCES)) {
+            fs.writeFileSync(path.join(this.tempDir, name), content);
+        }
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    buildBundle() {
+        const bundlePath = path.join(this.tempDir, 'slackpolish-payload.bundle');
+        runPython(
+            'import sys\n' +
+            'from slackpolish_payload import build_bundle, write_bundle\n' +
+            'write_bundle(build_bundle(sys.argv[1]), sys.argv[2])',
+            [this.tempDir, bundlePath]
+        );
+        return bundlePath;
+    }
+
+    testIndexDescribesBody() {
+        const bundle = readBundle(this.buildBundle());
+        assertEqual(bundle.magic, 'SLACKPOLISH-PAYLOAD', 'Bundle should start with its magic');
+        assertEqual(bundle.index.size, bundle.body.length, 'Recorded size should match the body');
+        assertEqual(bundle.index.sha256, crypto.createHash('sha256').update(bundle.body).digest('hex'), 'Bundle should be addressed by the hash of its body');
+
+        for (const [name, flavor] of Object.entries(bundle.index.flavors)) {
+            const data = bundle.body.slice(flavor.offset, flavor.offset + flavor.size);
+            assertEqual(flavor.sha256, crypto.createHash('sha256').update(data).digest('hex'), `${name} flavor hash should match its bytes`);
+        }
+    }
+
+    testOffsetTableLocatesScripts() {
+        const bundle = readBundle(this.buildBundle());
+        const runtime = bundle.index.flavors.runtime;
+        const flavorData = bundle.body.slice(runtime.offset, runtime.offset + runtime.size);
+        const settings = runtime.parts.find(part => part.name === 'settings');
+        const script = flavorData.slice(settings.offset, settings.offset + settings.size).toString('utf8');
+        assertEqual(script, SOURCES['slack-settings.js'], 'Offset table should point at the settings script');
+
+        const asarParts = bundle.index.flavors.asar.parts.map(part => part.name);
+        assert(!asarParts.includes('channel summary'), 'Disabled channel summary should not be in the asar flavor');
+        assert(asarParts.includes('logo'), 'The asar flavor should carry the logo');
+        assert(!runtime.parts.some(part => part.name === 'logo'), 'The runtime flavor should leave the logo out');
+        assert(!flavorData.toString('utf8').includes('SLACKPOLISH_LOGO_BASE64'), 'No logo data should reach the runtime flavor');
+    }
+
+    testStaleBundleIsRebuilt() {
+        const bundlePath = this.buildBundle();
+        const configPath = path.join(this.tempDir, 'slack-config.js');
+        fs.writeFileSync(configPath, 'window.SLACKPOLISH_CONFIG = { DEBUG_MODE: true };');
+        const future = new Date(Date.now() + 60000);
+        fs.utimesSync(configPath, future, future);
+
+        const output = runPython(
+            'import sys\n' +
+            'from slackpolish_payload import load_payload, load_bundle\n' +
+            'fresh = load_payload(sys.argv[1])\n' +
+            'print(fresh.sha256 != load_bundle(sys.argv[2]).sha256, "DEBUG_MODE: true" in fresh.flavor("asar"))',
+            [this.tempDir, bundlePath]
+        );
+        assertEqual(output.trim(), 'True True', 'Edited scripts should win over an older bundle');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Payload Bundle Tests\n');
+
+        this.runTest('Index describes the body', () => this.testIndexDescribesBody());
+        this.runTest('Offset table locates scripts', () => this.testOffsetTableLocatesScripts());
+        this.runTest('Stale bundle is rebuilt', () => this.testStaleBundleIsRebuilt());
+
+        fs.rmSync(this.tempDir, { recursive: true, force: true });
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new PayloadBundleTests();
+    tests.runAllTests();
+}
+
+module.exports = PayloadBundleTests;
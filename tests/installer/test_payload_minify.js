@@ -0,0 +1,153 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Payload Minifier
+ * Runs JavaScript snippets before and after installers/slackpolish_jsmin.py and
+ * checks that they evaluate to the same result, and that debug regions are stripped.
+ */
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+const ROOT_DIR = path.join(__dirname, '../..');
+
+// Each snippet evaluates to a value; tricky constructs for a whitespace/comment stripper
+const SNIPPETS = {
+    division: 'const a = 10, g = 2, i = 5; (a / g) / i + a/g/i',
+    regexAfterKeyword: "function f(s) { return /a\\/b['\"]/g.test(s) } f('a/b\"')",
+    regexWithClass: "'x//y/*z*/'.replace(/[/*]+/g, '-')",
+    unaryOperators: 'let x = 3; let y = x + +x - -x; y',
+    templateNesting: 'const n = 2; `a ${n > 1 ? `b ${`c // ${n}`}` : "d"} /* e */`',
+    commentsAndAsi: 'let v = 1 // comment\n;[v].map(q => q * 2 /* inline */ + 1)[0]',
+    stringsWithCommentMarkers: '"// not a comment" + \'/* nor this */\'',
+    numberMember: '1 .toString() + (2).toFixed(1)',
+    keywordSpacing: 'typeof void 0 === "undefined" && !(1 in [])'
+};
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+function runPython(script, input) {
+    const result = spawnSync('python3', ['-c', script], {
+        cwd: INSTALLERS_DIR,
+        input,
+        encoding: 'utf8'
+    });
+    if (result.status !== 0) {
+        throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+    }
+    return result.stdout;
+}
+
+function minify(source) {
+    return JSON.parse(runPython(
+        'import sys, json\n' +
+        'from slackpolish_jsmin import minify\n' +
+        'print(json.dumps(minify(sys.stdin.read())))',
+        source
+    ));
+}
+
+class PayloadMinifyTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    testSnippetsKeepBehaviour() {
+        const minified = JSON.parse(runPython(
+            'import sys, json\n' +
+            'from slackpolish_jsmin import minify\n' +
+            'print(json.dumps({k: minify(v) for k, v in json.load(sys.stdin).items()}))',
+            JSON.stringify(SNIPPETS)
+        ));
+        for (const [name, source] of Object.entries(SNIPPETS)) {
+            const expected = JSON.stringify(vm.runInNewContext(source));
+            const actual = JSON.stringify(vm.runInNewContext(minified[name]));
+            assertEqual(actual, expected, `${name} should evaluate the same after minification`);
+        }
+    }
+
+    testKeepsLineBreaks() {
+        const source = 'let a = 1\nlet b = a\n\n\n    // gone\n(function () { return b })()';
+        const output = minify(source);
+        assertEqual(output, 'let a=1\nlet b=a\n(function(){return b})()', 'Line breaks should survive as single newlines');
+    }
+
+    testSourcesStayValid() {
+        for (const file of ['slack-config.js', 'slack-settings.js', 'slack-text-improver.js', 'slack-channel-summary.js']) {
+            const output = minify(fs.readFileSync(path.join(ROOT_DIR, file), 'utf8'));
+            new vm.Script(output, { filename: file });
+        }
+    }
+
+    testStripsDebugRegions() {
+        const output = runPython(
+            'import sys\n' +
+            'from slackpolish_jsmin import strip_debug_regions\n' +
+            'source, count = strip_debug_regions(sys.stdin.read())\n' +
+            'print(count, "handleDebugTest" in source, "getDebugTestHelp" in source)',
+            fs.readFileSync(path.join(ROOT_DIR, 'slack-text-improver.js'), 'utf8')
+        );
+        const [count, hasHandler, hasHelp] = output.trim().split(' ');
+        assert(Number(count) > 0, 'Debug regions should be found');
+        assertEqual(hasHandler, 'False', 'Debug test handler should be stripped');
+        assertEqual(hasHelp, 'False', 'Debug test help should be stripped');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Payload Minifier Tests\n');
+
+        this.runTest('Snippets keep their behaviour', () => this.testSnippetsKeepBehaviour());
+        this.runTest('Line breaks are kept', () => this.testKeepsLineBreaks());
+        this.runTest('Minified sources still parse', () => this.testSourcesStayValid());
+        this.runTest('Debug regions are stripped', () => this.testStripsDebugRegions());
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new PayloadMinifyTests();
+    tests.runAllTests();
+}
+
+module.exports = PayloadMinifyTests;
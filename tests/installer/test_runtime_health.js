@@ -0,0 +1,174 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Runtime Health Probes
+ * Probes fake Slack targets (tests/installer/fake_devtools.py) through
+ * SlackPolishLauncher._probe_targets from installers/slackpolish_runtime.py and
+ * checks the per-target deadline, the reattach backoff and busy-target skipping.
+ */
+
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+
+// Two attached targets with short deadlines; warnings are collected instead of printed
+const SETUP =
+    'import asyncio, json, time\n' +
+    'import slackpolish_runtime as runtime\n' +
+    'from fake_devtools import make_launcher, settle\n' +
+    'from slackpolish_runtime import SlackTargetSession\n' +
+    'runtime.HEALTH_PROBE_TIMEOUT_SECONDS = 0.2\n' +
+    'runtime.RETRY_BACKOFF_SECONDS = 0.4\n' +
+    'warnings = []\n' +
+    'runtime.print_warning = warnings.append\n' +
+    'launcher = make_launcher()\n' +
+    'browser = launcher.browser\n' +
+    'async def attach_targets(*target_ids):\n' +
+    '    await browser.connect()\n' +
+    '    for target_id in target_ids:\n' +
+    '        page = browser.add_page(target_id, f"https://app.slack.com/client/{target_id}/C1")\n' +
+    '        session = SlackTargetSession({"id": target_id, "url": page.url})\n' +
+    '        launcher.sessions[target_id] = session\n' +
+    '        launcher._spawn(launcher._attach_target(session))\n' +
+    '    await settle(launcher)\n' +
+    '    browser.commands.clear()\n';
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+function runPython(script) {
+    const result = spawnSync('python3', ['-c', SETUP + script], {
+        cwd: INSTALLERS_DIR,
+        encoding: 'utf8',
+        env: { ...process.env, PYTHONPATH: __dirname }
+    });
+    if (result.status !== 0) {
+        throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+    }
+    const lines = result.stdout.trim().split('\n');
+    return JSON.parse(lines[lines.length - 1]);
+}
+
+class RuntimeHealthTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    testHungTargetOnlyDelaysItself() {
+        const result = runPython(
+            'async def main():\n' +
+            '    await attach_targets("T1", "T2")\n' +
+            '    browser.pages["T1"].hung = True\n' +
+            '    started = time.monotonic()\n' +
+            '    launcher._probe_targets()\n' +
+            '    while not browser.sent("Runtime.runScript", "session-T2") or launcher.sessions["T2"].lock.locked():\n' +
+            '        await asyncio.sleep(0.005)\n' +
+            '    healthy_after = time.monotonic() - started\n' +
+            '    await asyncio.sleep(0.3)\n' +
+            '    replacement = launcher.sessions["T1"]\n' +
+            '    backing_off = {"failures": replacement.failures, "attached": replacement.devtools is not None,\n' +
+            '                   "detached": len(browser.sent("Target.detachFromTarget"))}\n' +
+            '    browser.pages["T1"].hung = False\n' +
+            '    await settle(launcher)\n' +
+            '    return {"healthy_after": healthy_after, "backing_off": backing_off,\n' +
+            '            "reattached": launcher.sessions["T1"].devtools is not None, "warnings": warnings}\n' +
+            'print(json.dumps(asyncio.run(main())))'
+        );
+
+        assert(result.healthy_after < 0.2, `The healthy target should not wait for the hung one (${result.healthy_after}s)`);
+        assertEqual(result.backing_off.failures, 1, 'The hung target should be replaced with one recorded failure');
+        assertEqual(result.backing_off.attached, false, 'The replacement should wait out the backoff before attaching');
+        assertEqual(result.backing_off.detached, 1, 'The unhealthy session should be detached');
+        assert(result.warnings.some(text => text.includes('no answer within 0.2s') && text.includes('Reattaching in 0.4s')),
+            `The deadline and backoff should be reported: ${result.warnings}`);
+        assert(result.reattached, 'The target should be reattached after the backoff');
+    }
+
+    testBackoffDoublesUpToTheCap() {
+        const delays = runPython(
+            'delays = []\n' +
+            'for failures in range(10):\n' +
+            '    session = SlackTargetSession({"id": "T1", "url": "https://app.slack.com/client/T1/C1"})\n' +
+            '    session.failures = failures\n' +
+            '    launcher.sessions["T1"] = session\n' +
+            '    launcher._spawn = lambda coroutine: coroutine.close()\n' +
+            '    launcher._retry_target(session, "probe failed")\n' +
+            '    delays.append(float(warnings[-1].split("Reattaching in ")[1].split("s:")[0]))\n' +
+            '    assert launcher.sessions["T1"].failures == failures + 1\n' +
+            'print(json.dumps(delays))'
+        );
+
+        assertEqual(delays.slice(0, 4).join(), '0.4,0.8,1.6,3.2', 'The delay should double with every failure');
+        assertEqual(Math.max(...delays), 60, 'The delay should be capped at RETRY_BACKOFF_MAX_SECONDS');
+    }
+
+    testBusyTargetsAreSkipped() {
+        const result = runPython(
+            'async def main():\n' +
+            '    await attach_targets("T1", "T2")\n' +
+            '    async with launcher.sessions["T1"].lock:\n' +
+            '        launcher._probe_targets()\n' +
+            '        spawned = len(launcher.tasks)\n' +
+            '    await settle(launcher)\n' +
+            '    return {"spawned": spawned, "probed": sorted({c["sessionId"] for c in browser.commands})}\n' +
+            'print(json.dumps(asyncio.run(main())))'
+        );
+
+        assertEqual(result.spawned, 1, 'Only the idle target should get a probe this round');
+        assertEqual(result.probed.join(), 'session-T2', 'The busy target should not be probed');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Runtime Health Probe Tests\n');
+
+        this.runTest('A hung target only delays itself', () => this.testHungTargetOnlyDelaysItself());
+        this.runTest('The backoff doubles up to the cap', () => this.testBackoffDoublesUpToTheCap());
+        this.runTest('Busy targets are skipped', () => this.testBusyTargetsAreSkipped());
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new RuntimeHealthTests();
+    tests.runAllTests();
+}
+
+module.exports = RuntimeHealthTests;
@@ -0,0 +1,184 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Runtime Reinjection
+ * Drives SlackPolishLauncher._inject / _reinject_all from installers/slackpolish_runtime.py
+ * against a fake DevTools session, then runs what reached the page in a vm to check
+ * that a reinject really starts the runtime bootstrap again.
+ */
+
+const path = require('path');
+const vm = require('vm');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+
+// Every script the fake DevTools session ran in the page, per launcher action
+const SCRIPT = `
+import asyncio, json, tempfile
+from pathlib import Path
+from slackpolish_payload import RUNTIME_FLAVOR, RUNTIME_PARTS, SOURCE_PARTS, render_flavor
+from slackpolish_runtime import SlackPolishLauncher, SlackTargetSession
+
+class FakeDevTools:
+    def __init__(self):
+        self.scripts = {}
+        self.executed = []
+
+    async def send(self, method, params=None):
+        if method == "Runtime.compileScript":
+            script_id = str(len(self.scripts) + 1)
+            self.scripts[script_id] = params["expression"]
+            return {"scriptId": script_id}
+        if method == "Runtime.runScript":
+            self.executed.append(self.scripts[params["scriptId"]])
+        elif method == "Runtime.evaluate":
+            self.executed.append(params["expression"])
+        elif method == "Page.addScriptToEvaluateOnNewDocument":
+            return {"identifier": "1"}
+        return {}
+
+async def main():
+    state = Path(tempfile.mkdtemp())
+    launcher = SlackPolishLauncher(state, state / "lock", None, 0, False, False, 1)
+    launcher.runtime_payload = render_flavor(
+        RUNTIME_FLAVOR, {part: "window.__runs = (window.__runs || 0) + 1;" for part, _ in SOURCE_PARTS}
+    )
+    launcher.payload_hash = "build1"
+    session = SlackTargetSession({"id": "T1", "url": "https://app.slack.com/client/T1/C1"})
+    session.devtools = FakeDevTools()
+    launcher.sessions["T1"] = session
+    actions = {
+        "attach": lambda: launcher._inject(session),
+        "hot-reload": lambda: launcher._reload_target("T1"),
+        "reinject": launcher._reinject_all,
+    }
+    phases = {"parts": len(RUNTIME_PARTS)}
+    for name, action in actions.items():
+        await action()
+        phases[name] = list(session.devtools.executed)
+        session.devtools.executed.clear()
+        reinjects = launcher.metrics.snapshot().get("reinject_seconds", [{"count": 0}])
+        phases[name + "-count"] = reinjects[0]["count"]
+    print(json.dumps(phases))
+
+asyncio.run(main())
+`;
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+function runLauncher() {
+    const result = spawnSync('python3', ['-c', SCRIPT], {
+        cwd: INSTALLERS_DIR,
+        encoding: 'utf8'
+    });
+    if (result.status !== 0) {
+        throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+    }
+    const lines = result.stdout.trim().split('\n');
+    return JSON.parse(lines[lines.length - 1]);
+}
+
+// One Slack page; returns how many SlackPolish scripts ran after each phase
+function replayInPage(phases, names) {
+    const window = { location: { href: 'https://app.slack.com/client/T1/C1' } };
+    const context = vm.createContext({ window, console: { log() {}, error() {} } });
+    const runs = {};
+    for (const name of names) {
+        const before = window.__runs || 0;
+        for (const source of phases[name]) {
+            vm.runInContext(source, context);
+        }
+        runs[name] = (window.__runs || 0) - before;
+    }
+    return runs;
+}
+
+class RuntimeReinjectTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+        this.phases = null;
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    getPhases() {
+        if (!this.phases) {
+            this.phases = runLauncher();
+        }
+        return this.phases;
+    }
+
+    testReinjectRunsAgain() {
+        const phases = this.getPhases();
+        const runs = replayInPage(phases, ['attach', 'reinject']);
+        assertEqual(runs.attach, phases.parts, 'Attaching should run every SlackPolish script');
+        assertEqual(runs.reinject, phases.parts, 'A reinject of the same build should run every script again');
+    }
+
+    testReinjectReusesCompiledScript() {
+        const phases = this.getPhases();
+        assertEqual(phases.reinject.length, 2, 'A reinject should send the reset and one runScript');
+        assertEqual(phases.reinject[1], phases.attach[0], 'The runtime should be rerun from the compiled script');
+    }
+
+    testUnchangedBuildIsNotRestarted() {
+        const phases = this.getPhases();
+        const runs = replayInPage(phases, ['attach', 'hot-reload']);
+        assertEqual(runs['hot-reload'], 0, 'A hot reload of the same build should leave the running runtime alone');
+    }
+
+    testReinjectsAreCounted() {
+        const phases = this.getPhases();
+        assertEqual(phases['attach-count'], 0, 'Attaching is timed as attach_seconds, not a reinject');
+        assertEqual(phases['hot-reload-count'], 1, 'A hot reload should be counted in reinject_seconds');
+        assertEqual(phases['reinject-count'], 2, 'A reinject command should be counted in reinject_seconds');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Runtime Reinjection Tests\n');
+
+        this.runTest('Reinject runs the runtime again', () => this.testReinjectRunsAgain());
+        this.runTest('Reinject reuses the compiled script', () => this.testReinjectReusesCompiledScript());
+        this.runTest('Unchanged build is not restarted', () => this.testUnchangedBuildIsNotRestarted());
+        this.runTest('Hot reloads and reinjects are counted', () => this.testReinjectsAreCounted());
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new RuntimeReinjectTests();
+    tests.runAllTests();
+}
+
+module.exports = RuntimeReinjectTests;
@@ -0,0 +1,207 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Runtime Target Sessions
+ * Injects through SlackTargetSession from installers/slackpolish_runtime.py
+ * over a fake DevTools connection (tests/installer/fake_devtools.py) and checks
+ * that scripts are registered once per build and rerun by script id.
+ */
+
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+
+// record(name) stores the DevTools commands sent since the previous record
+const SETUP =
+    'import asyncio, json\n' +
+    'from fake_devtools import make_launcher\n' +
+    'from slackpolish_runtime import HEALTH_PROBE_EXPRESSION, SlackTargetSession\n' +
+    'phases = {}\n' +
+    'seen = 0\n' +
+    'def record(name, browser):\n' +
+    '    global seen\n' +
+    '    phases[name] = [\n' +
+    '        {"method": c["method"], "params": {k: v for k, v in c["params"].items() if k != "expression"}}\n' +
+    '        for c in browser.commands[seen:]\n' +
+    '    ]\n' +
+    '    seen = len(browser.commands)\n' +
+    'async def attached():\n' +
+    '    launcher = make_launcher()\n' +
+    '    await launcher.browser.connect()\n' +
+    '    page = launcher.browser.add_page("T1")\n' +
+    '    session = SlackTargetSession({"id": "T1", "url": page.url})\n' +
+    '    launcher.sessions["T1"] = session\n' +
+    '    await session.connect(launcher.browser)\n' +
+    '    return launcher, session\n';
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+function runPython(script) {
+    const result = spawnSync('python3', ['-c', SETUP + script], {
+        cwd: INSTALLERS_DIR,
+        encoding: 'utf8',
+        env: { ...process.env, PYTHONPATH: __dirname }
+    });
+    if (result.status !== 0) {
+        throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+    }
+    const lines = result.stdout.trim().split('\n');
+    return JSON.parse(lines[lines.length - 1]);
+}
+
+function methods(commands) {
+    return commands.map(command => command.method).join();
+}
+
+class RuntimeSessionTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    testSameBuildRunsById() {
+        const phases = runPython(
+            'async def main():\n' +
+            '    launcher, session = await attached()\n' +
+            '    record("connect", launcher.browser)\n' +
+            '    await launcher._inject(session)\n' +
+            '    record("first", launcher.browser)\n' +
+            '    await launcher._inject(session)\n' +
+            '    record("second", launcher.browser)\n' +
+            'asyncio.run(main())\n' +
+            'print(json.dumps(phases))'
+        );
+
+        assertEqual(methods(phases.connect), 'Target.attachToTarget,Runtime.enable,Page.enable', 'Attaching enables the domains');
+        const first = phases.first;
+        assertEqual(first.filter(c => c.method === 'Page.addScriptToEvaluateOnNewDocument').length, 1, 'The build should be registered');
+        const compile = first.find(c => c.method === 'Runtime.compileScript');
+        assert(compile && compile.params.persistScript, 'The runtime should be compiled as a persistent script');
+        assertEqual(compile.params.sourceURL, 'slackpolish-runtime-build1.js', 'The compiled script should be named after the build');
+
+        const run = first.find(c => c.method === 'Runtime.runScript');
+        assertEqual(methods(phases.second), 'Runtime.runScript', 'An unchanged build should only be rerun');
+        assertEqual(phases.second[0].params.scriptId, run.params.scriptId, 'The rerun should use the cached script id');
+    }
+
+    testNewBuildIsReregistered() {
+        const phases = runPython(
+            'async def main():\n' +
+            '    launcher, session = await attached()\n' +
+            '    await launcher._inject(session)\n' +
+            '    record("first", launcher.browser)\n' +
+            '    launcher.runtime_payload, launcher.payload_hash = "console.log(2);", "build2"\n' +
+            '    await launcher._inject(session)\n' +
+            '    record("rebuilt", launcher.browser)\n' +
+            'asyncio.run(main())\n' +
+            'print(json.dumps(phases))'
+        );
+
+        const rebuilt = phases.rebuilt;
+        assert(!phases.first.some(c => c.method === 'Page.removeScriptToEvaluateOnNewDocument'), 'Nothing to unregister at first');
+        const removed = rebuilt.find(c => c.method === 'Page.removeScriptToEvaluateOnNewDocument');
+        assert(removed, 'The old build should be unregistered');
+        assert(String(removed.params.identifier).startsWith('registration-'), 'The removal should name the old registration');
+        assert(rebuilt.findIndex(c => c.method === 'Page.addScriptToEvaluateOnNewDocument') >
+            rebuilt.indexOf(removed), 'The new build should be registered after the old one is removed');
+        const compile = rebuilt.find(c => c.method === 'Runtime.compileScript');
+        assertEqual(compile && compile.params.sourceURL, 'slackpolish-runtime-build2.js', 'The new build should be compiled');
+    }
+
+    testContextResetRecompiles() {
+        const phases = runPython(
+            'async def main():\n' +
+            '    launcher, session = await attached()\n' +
+            '    await launcher._inject(session)\n' +
+            '    record("first", launcher.browser)\n' +
+            '    launcher.browser.emit("Runtime.executionContextsCleared", {}, "session-OTHER")\n' +
+            '    await launcher._inject(session)\n' +
+            '    record("other-target", launcher.browser)\n' +
+            '    launcher.browser.emit("Runtime.executionContextsCleared", {}, "session-T1")\n' +
+            '    await launcher._inject(session)\n' +
+            '    record("navigated", launcher.browser)\n' +
+            'asyncio.run(main())\n' +
+            'print(json.dumps(phases))'
+        );
+
+        assertEqual(methods(phases['other-target']), 'Runtime.runScript', 'Another session\'s reset should not drop the cache');
+        assertEqual(methods(phases.navigated), 'Runtime.compileScript,Runtime.runScript',
+            'A new execution context should get the script compiled again, without re-registering');
+    }
+
+    testProbeIsCompiledOnce() {
+        const result = runPython(
+            'async def main():\n' +
+            '    launcher, session = await attached()\n' +
+            '    page = launcher.browser.pages["T1"]\n' +
+            '    values = [await session.probe(HEALTH_PROBE_EXPRESSION)]\n' +
+            '    page.probe = "reinject"\n' +
+            '    values.append(await session.probe(HEALTH_PROBE_EXPRESSION))\n' +
+            '    values.append(await launcher._target_needs_runtime_reinject(session))\n' +
+            '    record("probes", launcher.browser)\n' +
+            '    phases["values"] = values\n' +
+            'asyncio.run(main())\n' +
+            'print(json.dumps(phases))'
+        );
+
+        const probes = result.probes.filter(c => c.method !== 'Target.attachToTarget' && !c.method.endsWith('.enable'));
+        assertEqual(methods(probes), 'Runtime.compileScript,Runtime.runScript,Runtime.runScript,Runtime.runScript',
+            'The probe should be compiled once and then run by id');
+        assertEqual(JSON.stringify(result.values), '["ok","reinject",true]', 'Probe values should be returned');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Runtime Session Tests\n');
+
+        this.runTest('An unchanged build is rerun by script id', () => this.testSameBuildRunsById());
+        this.runTest('A new build is re-registered', () => this.testNewBuildIsReregistered());
+        this.runTest('A new execution context recompiles', () => this.testContextResetRecompiles());
+        this.runTest('The health probe is compiled once', () => this.testProbeIsCompiledOnce());
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new RuntimeSessionTests();
+    tests.runAllTests();
+}
+
+module.exports = RuntimeSessionTests;
@@ -0,0 +1,257 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Runtime Target Tracking
+ * Runs SlackPolishLauncher._watch_targets from installers/slackpolish_runtime.py
+ * against a fake DevTools connection (tests/installer/fake_devtools.py) and
+ * drives it with target events instead of a real Slack; checks that every
+ * target is multiplexed over the one browser connection.
+ */
+
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+
+// watch(steps) runs the launcher's watch loop, awaiting each step in turn
+const SETUP =
+    'import asyncio, json\n' +
+    'import slackpolish_runtime as runtime\n' +
+    'from fake_devtools import FakeDevToolsConnection, make_launcher, settle, use_fake_browser\n' +
+    'launcher = make_launcher()\n' +
+    'browser = FakeDevToolsConnection()\n' +
+    'use_fake_browser(launcher, browser)\n' +
+    'fetched = []\n' +
+    'fetch_json = launcher._fetch_json\n' +
+    'launcher._fetch_json = lambda path: (fetched.append(path), fetch_json(path))[1]\n' +
+    'launcher.health_interval = 60\n' +
+    'def methods(session_id=None):\n' +
+    '    return [c["method"] for c in browser.commands if session_id is None or c.get("sessionId") == session_id]\n' +
+    'def info(target_id, url, title="Slack", kind="page"):\n' +
+    '    return {"targetInfo": {"targetId": target_id, "type": kind, "title": title, "url": url}}\n' +
+    'async def watch(*steps):\n' +
+    '    task = asyncio.create_task(launcher._watch_targets())\n' +
+    '    await asyncio.sleep(0.05)\n' +
+    '    await settle(launcher)\n' +
+    '    results = []\n' +
+    '    for step in steps:\n' +
+    '        browser.commands.clear()\n' +
+    '        step()\n' +
+    '        await settle(launcher)\n' +
+    '        results.append({"methods": methods(), "sessions": sorted(launcher.sessions)})\n' +
+    '    browser.drop()\n' +
+    '    try:\n' +
+    '        await task\n' +
+    '    except runtime.DevToolsProtocolError:\n' +
+    '        pass\n' +
+    '    return results\n';
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+function runPython(script) {
+    const result = spawnSync('python3', ['-c', SETUP + script], {
+        cwd: INSTALLERS_DIR,
+        encoding: 'utf8',
+        env: { ...process.env, PYTHONPATH: __dirname }
+    });
+    if (result.status !== 0) {
+        throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+    }
+    const lines = result.stdout.trim().split('\n');
+    return JSON.parse(lines[lines.length - 1]);
+}
+
+class RuntimeTargetTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    testExistingTargetsAreAttached() {
+        const result = runPython(
+            'browser.add_page("T1")\n' +
+            'browser.add_page("W1", url="https://app.slack.com/workspace-signin")\n' +
+            'async def main():\n' +
+            '    await watch()\n' +
+            '    return {"methods": methods(), "fetched": fetched}\n' +
+            'print(json.dumps(asyncio.run(main())))'
+        );
+
+        assertEqual(result.fetched.join(), '/json/version', 'Targets should come from events, not /json/list');
+        const attaches = result.methods.filter(method => method === 'Target.attachToTarget');
+        assertEqual(attaches.length, 2, 'Both replayed app.slack.com pages should be attached');
+        assert(result.methods.includes('Page.addScriptToEvaluateOnNewDocument'), 'Attached targets should be injected');
+    }
+
+    testOtherTargetsAreIgnored() {
+        const [result] = runPython(
+            'print(json.dumps(asyncio.run(watch(\n' +
+            '    lambda: browser.emit("Target.targetCreated", info("X1", "https://example.com/")),\n' +
+            '    lambda: browser.emit("Target.targetCreated", info("S1", "https://app.slack.com/sw.js", kind="service_worker")),\n' +
+            '))[:1]))'
+        );
+        assertEqual(result.methods.length, 0, 'Non-Slack pages and workers should not be attached');
+        assertEqual(result.sessions.length, 0, 'No sessions should be created');
+    }
+
+    testTitleAndUrlChanges() {
+        const [created, retitled, navigated] = runPython(
+            'url = "https://app.slack.com/client/T1/C1"\n' +
+            'browser.add_page("T1", url)\n' +
+            'print(json.dumps(asyncio.run(watch(\n' +
+            '    lambda: browser.emit("Target.targetCreated", info("T2", url)),\n' +
+            '    lambda: browser.emit("Target.targetInfoChanged", info("T1", url, title="(3) Slack")),\n' +
+            '    lambda: browser.emit("Target.targetInfoChanged", info("T1", url.replace("C1", "C2"))),\n' +
+            '))))'
+        );
+
+        assertEqual(created.sessions.join(), 'T1,T2', 'A new Slack page should get its own session');
+        assertEqual(retitled.methods.length, 0, 'A title change (unread count) should not touch the target');
+        assertEqual(navigated.methods.join(), 'Runtime.compileScript,Runtime.runScript',
+            'A URL change should probe the target');
+    }
+
+    testTargetsGoingAway() {
+        const [leftSlack, destroyed] = runPython(
+            'browser.add_page("T1")\n' +
+            'browser.add_page("T2")\n' +
+            'print(json.dumps(asyncio.run(watch(\n' +
+            '    lambda: browser.emit("Target.targetInfoChanged", info("T1", "https://example.com/")),\n' +
+            '    lambda: browser.emit("Target.targetDestroyed", {"targetId": "T2"}),\n' +
+            '))))'
+        );
+
+        assertEqual(leftSlack.methods.join(), 'Target.detachFromTarget', 'A page that leaves Slack should be detached');
+        assertEqual(leftSlack.sessions.join(), 'T2', 'Its session should be dropped');
+        assertEqual(destroyed.methods.length, 0, 'A destroyed target needs no commands');
+        assertEqual(destroyed.sessions.length, 0, 'A destroyed target should be forgotten');
+    }
+
+    testSessionsShareOneConnection() {
+        const [, navigated] = runPython(
+            'browser.add_page("T1")\n' +
+            'browser.add_page("T2", url="https://app.slack.com/client/T2/C1")\n' +
+            'def navigate(frame):\n' +
+            '    browser.emit("Page.frameNavigated", {"frame": frame}, "session-T1")\n' +
+            'results = asyncio.run(watch(\n' +
+            '    lambda: None,\n' +
+            '    lambda: (navigate({"id": "child", "parentId": "T1"}), navigate({"id": "T1"})),\n' +
+            '))\n' +
+            'results[1]["sessions_used"] = sorted({c.get("sessionId") for c in browser.commands})\n' +
+            'print(json.dumps(results))'
+        );
+
+        assertEqual(navigated.sessions_used.join(), 'session-T1', 'A navigation event should only refresh its own session');
+        assertEqual(navigated.methods.join(), 'Runtime.compileScript,Runtime.runScript',
+            'A subframe navigation should be ignored and the main frame probed once');
+    }
+
+    testCommandsArePipelined() {
+        const result = runPython(
+            'browser.add_page("T1")\n' +
+            'browser.add_page("T2", url="https://app.slack.com/client/T2/C1")\n' +
+            'async def main():\n' +
+            '    await watch()\n' +
+            '    order = [c.get("sessionId") for c in browser.commands if c.get("sessionId")]\n' +
+            '    return {"order": order}\n' +
+            'print(json.dumps(asyncio.run(main())))'
+        );
+
+        const firstT2 = result.order.indexOf('session-T2');
+        const lastT1 = result.order.lastIndexOf('session-T1');
+        assert(firstT2 !== -1 && firstT2 < lastT1, 'Targets should be set up concurrently over the one connection');
+    }
+
+    testResponsesMatchedById() {
+        const result = runPython(
+            'async def main():\n' +
+            '    await browser.connect()\n' +
+            '    held = []\n' +
+            '    browser.answer = held.append\n' +
+            '    first = asyncio.create_task(browser.send("Runtime.evaluate", {"expression": "1"}, session_id="session-A"))\n' +
+            '    second = asyncio.create_task(browser.send("Runtime.evaluate", {"expression": "2"}, session_id="session-B"))\n' +
+            '    failing = asyncio.create_task(browser.send("Page.enable", session_id="session-B"))\n' +
+            '    lost = asyncio.create_task(browser.send("Page.enable", session_id="session-C"))\n' +
+            '    while len(held) < 4:\n' +
+            '        await asyncio.sleep(0)\n' +
+            '    for message in reversed(held[:3]):\n' +
+            '        if message["method"] == "Page.enable":\n' +
+            '            browser._dispatch(json.dumps({"id": message["id"], "error": {"message": "No target"}}))\n' +
+            '        else:\n' +
+            '            browser._dispatch(json.dumps({"id": message["id"], "result": {"value": message["params"]["expression"]}}))\n' +
+            '    browser.drop()\n' +
+            '    outcomes = []\n' +
+            '    for task in (first, second, failing, lost):\n' +
+            '        try:\n' +
+            '            outcomes.append(await task)\n' +
+            '        except runtime.DevToolsProtocolError as error:\n' +
+            '            outcomes.append("error: " + str(error))\n' +
+            '    return {"outcomes": outcomes, "sessions": [m.get("sessionId") for m in held]}\n' +
+            'print(json.dumps(asyncio.run(main())))'
+        );
+
+        assertEqual(result.sessions.join(), 'session-A,session-B,session-B,session-C', 'Commands should carry their session id');
+        const [first, second, failing, lost] = result.outcomes;
+        assertEqual(first.value, '1', 'Out-of-order responses should reach the right command');
+        assertEqual(second.value, '2', 'Out-of-order responses should reach the right command');
+        assert(String(failing).includes('No target'), 'An error response should fail only its own command');
+        assert(String(lost).includes('connection closed'), 'Commands still pending when the connection drops should fail');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Runtime Target Tracking Tests\n');
+
+        this.runTest('Existing targets are attached from events', () => this.testExistingTargetsAreAttached());
+        this.runTest('Other targets are ignored', () => this.testOtherTargetsAreIgnored());
+        this.runTest('Title and URL changes', () => this.testTitleAndUrlChanges());
+        this.runTest('Targets going away', () => this.testTargetsGoingAway());
+        this.runTest('Sessions share one connection', () => this.testSessionsShareOneConnection());
+        this.runTest('Commands are pipelined', () => this.testCommandsArePipelined());
+        this.runTest('Responses are matched by id', () => this.testResponsesMatchedById());
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new RuntimeTargetTests();
+    tests.runAllTests();
+}
+
+module.exports = RuntimeTargetTests;
@@ -0,0 +1,179 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Runtime --watch Hot Reload
+ * Edits SlackPolish scripts in a temporary source directory and checks that
+ * RuntimePayloadWatcher from installers/slackpolish_runtime.py rebuilds only what
+ * changed, and that a watching launcher pushes the new build to a fake Slack
+ * target (tests/installer/fake_devtools.py).
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+const SOURCE_FILES = ['slack-config.js', 'logo-data.js', 'slack-text-improver.js', 'slack-settings.js', 'slack-channel-summary.js'];
+
+// edit(name, text) rewrites a script with a later mtime, as an editor save would
+const SETUP =
+    'import asyncio, hashlib, json, os, sys, time\n' +
+    'import slackpolish_runtime as runtime\n' +
+    'from fake_devtools import FakeDevToolsConnection, make_launcher, settle, use_fake_browser\n' +
+    'from slackpolish_payload import RUNTIME_FLAVOR, load_payload\n' +
+    'source_dir = sys.argv[1]\n' +
+    'payload = load_payload(source_dir)\n' +
+    'watcher = runtime.RuntimePayloadWatcher(source_dir, payload)\n' +
+    'def edit(name, text):\n' +
+    '    path = os.path.join(source_dir, name)\n' +
+    '    mtime = os.stat(path).st_mtime_ns + 10 ** 9\n' +
+    '    with open(path, "w") as handle:\n' +
+    '        handle.write(text)\n' +
+    '    os.utime(path, ns=(mtime, mtime))\n';
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+class RuntimeWatchTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+        this.tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'slackpolish-watch-'));
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    // A source directory with one small script per SlackPolish part
+    runPython(name, script) {
+        const sourceDir = path.join(this.tempDir, name);
+        fs.mkdirSync(sourceDir);
+        for (const file of SOURCE_FILES) {
+            fs.writeFileSync(path.join(sourceDir, file), `window.loaded = (window.loaded || []).concat('${file} v1');\n`);
+        }
+        const result = spawnSync('python3', ['-c', SETUP + script, sourceDir], {
+            cwd: INSTALLERS_DIR,
+            encoding: 'utf8',
+            env: { ...process.env, PYTHONPATH: __dirname }
+        });
+        if (result.status !== 0) {
+            throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+        }
+        const lines = result.stdout.trim().split('\n');
+        return JSON.parse(lines[lines.length - 1]);
+    }
+
+    testWatcherRebuildsChangedScripts() {
+        const result = this.runPython('watcher',
+            'polls = [watcher.poll()]\n' +
+            'edit("slack-settings.js", "window.loaded = [\'settings v2\'];\\n")\n' +
+            'source, payload_hash, changed, failures = watcher.poll()\n' +
+            'polls.append(watcher.poll())\n' +
+            'print(json.dumps({"polls": polls, "changed": changed, "failures": failures,\n' +
+            '                  "hash_matches": payload_hash == hashlib.sha256(source.encode()).hexdigest()[:12],\n' +
+            '                  "hash_changed": payload_hash != payload.flavor_sha256(RUNTIME_FLAVOR)[:12],\n' +
+            '                  "source": source}))'
+        );
+
+        assertEqual(result.polls[0], null, 'Nothing should be rebuilt before an edit');
+        assertEqual(result.changed.join(), 'slack-settings.js', 'Only the edited script should be reported');
+        assertEqual(result.failures.length, 0, 'The edit should rebuild cleanly');
+        assert(result.source.includes("settings v2"), 'The new build should carry the edit');
+        assert(result.source.includes("slack-text-improver.js v1"), 'Unchanged scripts should be reused');
+        assert(result.hash_matches && result.hash_changed, 'The payload hash should describe the new build');
+        assertEqual(result.polls[1], null, 'A second poll without edits should find nothing');
+    }
+
+    testWatchingLauncherHotReloads() {
+        const result = this.runPython('launcher',
+            'launcher = make_launcher(payload.flavor(RUNTIME_FLAVOR), payload.flavor_sha256(RUNTIME_FLAVOR)[:12])\n' +
+            'launcher.payload_watcher = watcher\n' +
+            'launcher.health_interval = 60\n' +
+            'browser = FakeDevToolsConnection()\n' +
+            'browser.add_page("T1")\n' +
+            'use_fake_browser(launcher, browser)\n' +
+            'async def main():\n' +
+            '    task = asyncio.create_task(launcher._watch_targets())\n' +
+            '    await asyncio.sleep(0.1)\n' +
+            '    await settle(launcher)\n' +
+            '    first_hash = launcher.payload_hash\n' +
+            '    browser.commands.clear()\n' +
+            '    edit("slack-config.js", "window.SLACKPOLISH_CONFIG = {edited: true};\\n")\n' +
+            '    await asyncio.sleep(runtime.WATCH_INTERVAL_SECONDS + 0.3)\n' +
+            '    await settle(launcher)\n' +
+            '    sent = [{"method": c["method"], "sourceURL": c["params"].get("sourceURL"),\n' +
+            '             "edited": "edited: true" in c["params"].get("source", c["params"].get("expression", ""))}\n' +
+            '            for c in browser.commands]\n' +
+            '    result = {"first_hash": first_hash, "hash": launcher.payload_hash, "sent": sent,\n' +
+            '              "status_hash": launcher.status["payload_hash"]}\n' +
+            '    browser.drop()\n' +
+            '    try:\n' +
+            '        await task\n' +
+            '    except runtime.DevToolsProtocolError:\n' +
+            '        pass\n' +
+            '    return result\n' +
+            'print(json.dumps(asyncio.run(main())))'
+        );
+
+        assert(result.hash !== result.first_hash, 'The launcher should switch to the rebuilt payload');
+        assertEqual(result.status_hash, result.hash, 'The status should report the new build');
+        const methods = result.sent.map(command => command.method);
+        assert(methods.includes('Page.removeScriptToEvaluateOnNewDocument'), 'The old build should be unregistered');
+        const registered = result.sent.find(command => command.method === 'Page.addScriptToEvaluateOnNewDocument');
+        assert(registered && registered.edited, 'The new build should be registered for new documents');
+        const compiled = result.sent.find(command => command.method === 'Runtime.compileScript');
+        assertEqual(compiled && compiled.sourceURL, `slackpolish-runtime-${result.hash}.js`, 'The new build should run in the page');
+        assert(compiled.edited, 'The running page should get the edited script');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Runtime Watch Tests\n');
+
+        this.runTest('The watcher rebuilds changed scripts', () => this.testWatcherRebuildsChangedScripts());
+        this.runTest('A watching launcher hot-reloads targets', () => this.testWatchingLauncherHotReloads());
+
+        fs.rmSync(this.tempDir, { recursive: true, force: true });
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new RuntimeWatchTests();
+    tests.runAllTests();
+}
+
+module.exports = RuntimeWatchTests;
@@ -0,0 +1,196 @@
+#!/usr/bin/env node
+
+/**
+ * Installer Test: Slack Discovery
+ * Runs installers/slackpolish_discovery.py and the Linux installer's lookup
+ * against a temporary directory tree, with XDG_CACHE_HOME pointing at a
+ * temporary cache, and checks the location cache and the pruned scan.
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const INSTALLERS_DIR = path.join(__dirname, '../../installers');
+
+// The Linux installer with its well-known paths and search roots redirected to
+// sys.argv[1]; every lookup step is recorded in `steps`
+const SETUP =
+    'import importlib.util, json, os, sys\n' +
+    'import slackpolish_discovery as discovery\n' +
+    'spec = importlib.util.spec_from_file_location("installer", "install-slack-LINUX-X64.py")\n' +
+    'installer = importlib.util.module_from_spec(spec)\n' +
+    'spec.loader.exec_module(installer)\n' +
+    'root = sys.argv[1]\n' +
+    'steps = []\n' +
+    'def check_known_paths(paths, on_check=None):\n' +
+    '    steps.append("known-paths")\n' +
+    '    return None\n' +
+    'def search_roots(roots, **kwargs):\n' +
+    '    steps.append("scan")\n' +
+    '    return discovery.search_roots([root], **kwargs)\n' +
+    'installer.check_known_paths = check_known_paths\n' +
+    'installer.search_roots = search_roots\n' +
+    'def find(use_cache=True):\n' +
+    '    steps.clear()\n' +
+    '    found = installer.find_slack_installation_linux(use_cache=use_cache)\n' +
+    '    return {"found": found, "steps": list(steps)}\n';
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(`Assertion failed: ${message}`);
+    }
+}
+
+function assertEqual(actual, expected, message) {
+    if (actual !== expected) {
+        throw new Error(`Assertion failed: ${message}\nExpected: ${expected}\nActual: ${actual}`);
+    }
+}
+
+class SlackDiscoveryTests {
+    constructor() {
+        this.testCount = 0;
+        this.passedCount = 0;
+        this.failedCount = 0;
+        this.tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'slackpolish-discovery-'));
+    }
+
+    runTest(testName, testFunction) {
+        this.testCount++;
+        try {
+            console.log(`🧪 Running: ${testName}`);
+            testFunction();
+            this.passedCount++;
+            console.log(`✅ PASSED: ${testName}`);
+        } catch (error) {
+            this.failedCount++;
+            console.log(`❌ FAILED: ${testName}`);
+            console.log(`   Error: ${error.message}`);
+        }
+    }
+
+    // A fresh root and cache directory per test
+    makeTree(name, asarPaths) {
+        const root = path.join(this.tempDir, name, 'root');
+        const cacheHome = path.join(this.tempDir, name, 'cache');
+        for (const asarPath of asarPaths) {
+            fs.mkdirSync(path.join(root, path.dirname(asarPath)), { recursive: true });
+            fs.writeFileSync(path.join(root, asarPath), 'asar');
+        }
+        fs.mkdirSync(cacheHome, { recursive: true });
+        return { root, cacheHome };
+    }
+
+    runPython(tree, script) {
+        const result = spawnSync('python3', ['-c', SETUP + script, tree.root], {
+            cwd: INSTALLERS_DIR,
+            encoding: 'utf8',
+            env: { ...process.env, XDG_CACHE_HOME: tree.cacheHome }
+        });
+        if (result.status !== 0) {
+            throw new Error(`python3 failed: ${result.stderr || result.stdout}`);
+        }
+        const lines = result.stdout.trim().split('\n');
+        return JSON.parse(lines[lines.length - 1]);
+    }
+
+    testCacheHitSkipsScan() {
+        const tree = this.makeTree('hit', ['lib/slack/resources/app.asar']);
+        const expected = path.join(tree.root, 'lib', 'slack', 'resources');
+
+        const [first, second] = this.runPython(tree, 'print(json.dumps([find(), find()]))');
+
+        assertEqual(first.found, expected, 'The first lookup should scan and find Slack');
+        assertEqual(first.steps.join(), 'known-paths,scan', 'The first lookup should fall through to the scan');
+        assert(fs.existsSync(path.join(tree.cacheHome, 'slackpolish', 'slack-location.json')),
+            'The location should be cached under XDG_CACHE_HOME');
+        assertEqual(second.found, expected, 'The cached location should be returned');
+        assertEqual(second.steps.length, 0, 'A cache hit should not check known paths or scan');
+    }
+
+    testStaleEntryRescans() {
+        const tree = this.makeTree('stale', ['lib/slack/resources/app.asar']);
+        const asarPath = path.join(tree.root, 'lib', 'slack', 'resources', 'app.asar');
+
+        const result = this.runPython(tree,
+            'results = [find()]\n' +
+            'with open(os.path.join(results[0]["found"], "app.asar"), "a") as handle:\n' +
+            '    handle.write("slack update")\n' +
+            'results.append({"cached": discovery.load_cached_location()})\n' +
+            'results.append(find())\n' +
+            'results.append(find())\n' +
+            'results.append(find(use_cache=False))\n' +
+            'print(json.dumps(results))'
+        );
+        const [, stale, rescanned, cachedAgain, forced] = result;
+
+        assertEqual(stale.cached, null, 'A changed app.asar should invalidate the cached entry');
+        assertEqual(rescanned.steps.join(), 'known-paths,scan', 'A stale entry should trigger a rescan');
+        assertEqual(rescanned.found, path.dirname(asarPath), 'The rescan should find Slack again');
+        assertEqual(cachedAgain.steps.length, 0, 'The rescan should refresh the cache');
+        assertEqual(forced.steps.join(), 'known-paths,scan', '--rescan should skip a valid cache');
+    }
+
+    testPrunedDirectoriesAreNotWalked() {
+        const tree = this.makeTree('pruned', [
+            'node_modules/slack/resources/app.asar',
+            '.hidden/slack/resources/app.asar',
+            'share/cache/slack/resources/app.asar',
+            'a/b/c/d/e/f/slack/resources/app.asar',
+            'slack/a/b/c/d/e/f/resources/app.asar'
+        ]);
+        fs.mkdirSync(path.join(tree.root, 'share', 'other', 'deep', 'deeper'), { recursive: true });
+
+        const result = this.runPython(tree,
+            'walked = []\n' +
+            'scandir = os.scandir\n' +
+            'def recording_scandir(path):\n' +
+            '    walked.append(os.path.relpath(path, root))\n' +
+            '    return scandir(path)\n' +
+            'discovery.os.scandir = recording_scandir\n' +
+            'found = discovery.scan_root(root)\n' +
+            'print(json.dumps({"found": found, "walked": walked}))'
+        );
+
+        assertEqual(result.found, null, 'Installs in pruned or too deep directories should not be found');
+        assert(result.walked.includes(path.join('slack', 'a', 'b', 'c', 'd', 'e')), 'Directories at the depth limit should be listed');
+        for (const pruned of ['node_modules', '.hidden', 'cache']) {
+            assert(!result.walked.some(dir => dir.split(path.sep).includes(pruned)), `${pruned} should never be listed`);
+        }
+        assert(!result.walked.some(dir => dir.split(path.sep).length > 6), 'Nothing below the depth limit should be listed');
+        assert(!result.walked.includes(path.join('share', 'other', 'deep')),
+            'Deep directories without "slack" in the path should not be listed');
+    }
+
+    runAllTests() {
+        console.log('🚀 Starting Slack Discovery Tests\n');
+
+        this.runTest('A cache hit skips the scan', () => this.testCacheHitSkipsScan());
+        this.runTest('A stale entry triggers a rescan', () => this.testStaleEntryRescans());
+        this.runTest('Pruned directories are never walked', () => this.testPrunedDirectoriesAreNotWalked());
+
+        fs.rmSync(this.tempDir, { recursive: true, force: true });
+
+        console.log('\n📊 Test Results:');
+        console.log(`   Total: ${this.testCount}`);
+        console.log(`   ✅ Passed: ${this.passedCount}`);
+        console.log(`   ❌ Failed: ${this.failedCount}`);
+
+        if (this.failedCount === 0) {
+            console.log('\n🎉 All tests passed!');
+            process.exit(0);
+        } else {
+            console.log('\n💥 Some tests failed!');
+            process.exit(1);
+        }
+    }
+}
+
+if (require.main === module) {
+    const tests = new SlackDiscoveryTests();
+    tests.runAllTests();
+}
+
+module.exports = SlackDiscoveryTests;
@@ -0,0 +1,190 @@
+#!/usr/bin/env node
+
+/**
+ * SlackPolish Channel Message Cache Tests
+ * Runs SlackPolishChannelMessages from slack-text-improver.js against a fake
+ * conversations.history and checks that repeat fetches only ask for new messages.
+ */
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const TEST_NAME = 'Channel Message Cache';
+let testsPassed = 0;
+let testsTotal = 0;
+
+async function runTest(testName, testFunction) {
+    testsTotal++;
+    try {
+        console.log(`🧪 Testing: ${testName}`);
+        await testFunction();
+        testsPassed++;
+        console.log(`✅ PASSED: ${testName}`);
+    } catch (error) {
+        console.log(`❌ FAILED: ${testName}`);
+        console.log(`   Error: ${error.message}`);
+    }
+}
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(message || 'Assertion failed');
+    }
+}
+
+const scriptPath = path.join(__dirname, '../../slack-text-improver.js');
+const scriptContent = fs.readFileSync(scriptPath, 'utf8');
+
+// The cache helpers and the module initializer, evaluated without the rest of the IIFE
+const cacheSource = scriptContent.match(/    \/\/ Per-channel conversations\.history cache[\s\S]*?\n    function initializeGlobalChannelMessagesSystem\(\) \{[\s\S]*?\n    \}\n/);
+
+// A channel with one message per minute; conversations.history semantics, newest first
+function createFakeSlack(messageCount) {
+    const channel = [];
+    const calls = [];
+    const post = () => {
+        const ts = `${1700000000 + channel.length * 60}.000${String(channel.length).padStart(3, '0')}`;
+        channel.push({ ts, type: 'message', user: 'U1', text: `message ${channel.length}` });
+    };
+    for (let i = 0; i < messageCount; i++) post();
+
+    const api = {
+        call(method, params, callback) {
+            calls.push({ method, ...params });
+            const inclusive = params.inclusive !== false;
+            let matching = channel.filter(msg => {
+                const ts = parseFloat(msg.ts);
+                if (params.oldest && (inclusive ? ts < parseFloat(params.oldest) : ts <= parseFloat(params.oldest))) return false;
+                if (params.latest && (inclusive ? ts > parseFloat(params.latest) : ts >= parseFloat(params.latest))) return false;
+                return true;
+            }).reverse();
+            const limit = params.limit || 100;
+            const hasMore = matching.length > limit;
+            matching = matching.slice(0, limit);
+            setImmediate(() => callback({ ok: true, messages: matching, has_more: hasMore }));
+        }
+    };
+    return { channel, calls, post, api };
+}
+
+function loadModule(slack, config = {}) {
+    const window = {
+        location: { href: 'https://app.slack.com/client/T1/C123' },
+        TS: { api: slack.api },
+        SLACKPOLISH_CONFIG: config
+    };
+    const document = { querySelector: () => null, querySelectorAll: () => [] };
+    const context = vm.createContext({ window, document, console: { log() {}, error() {} }, setImmediate });
+    vm.runInContext(`${cacheSource[0]}\ninitializeGlobalChannelMessagesSystem();`, context);
+    return window.SlackPolishChannelMessages;
+}
+
+async function main() {
+    console.log(`🚀 Running ${TEST_NAME} Tests`);
+    console.log('=====================================\n');
+
+    await runTest('Cache module is present', () => {
+        assert(cacheSource, 'initializeGlobalChannelMessagesSystem not found');
+    });
+
+    await runTest('Repeat fetches only ask for newer messages', async () => {
+        const slack = createFakeSlack(30);
+        const messages = loadModule(slack);
+
+        const first = await messages.getRecentMessages(5);
+        assert(first.messages.map(msg => msg.text).join() === 'message 29,message 28,message 27,message 26,message 25',
+            'First fetch should return the newest messages, newest first');
+        assert(first.apiCallsMade === 1, `expected 1 call, got ${first.apiCallsMade}`);
+
+        slack.post();
+        slack.post();
+        slack.calls.length = 0;
+        const second = await messages.getRecentMessages(5);
+        assert(second.messages[0].text === 'message 31', 'New messages should be picked up');
+        assert(slack.calls.length === 1, `expected one refresh call, got ${slack.calls.length}`);
+        assert(slack.calls[0].oldest === first.messages[0].ts && slack.calls[0].inclusive === false,
+            'Refresh should start after the high-water mark');
+    });
+
+    await runTest('Older pages are fetched on demand and kept', async () => {
+        const slack = createFakeSlack(2500);
+        const messages = loadModule(slack);
+
+        await messages.getRecentMessages(5);
+        const all = await messages.getAllChannelMessages(false);
+        assert(all.messages.length === 2500, `expected every message, got ${all.messages.length}`);
+        assert(new Set(all.messages.map(msg => msg.ts)).size === 2500, 'Messages should not be duplicated');
+        assert(all.messages[0].text === 'message 2499' && all.messages[2499].text === 'message 0', 'Order should be newest first');
+
+        slack.calls.length = 0;
+        const again = await messages.getAllChannelMessages(false);
+        assert(again.messages.length === 2500, 'Cached history should be served again');
+        assert(slack.calls.length === 1, `a complete channel should cost one refresh call, got ${slack.calls.length}`);
+    });
+
+    await runTest('Date ranges are served from the cache', async () => {
+        const slack = createFakeSlack(100);
+        const messages = loadModule(slack);
+
+        await messages.getAllChannelMessages(false);
+        slack.calls.length = 0;
+        const range = await messages.getMessagesInRange(new Date((1700000000 + 10 * 60) * 1000), new Date((1700000000 + 19 * 60 + 1) * 1000));
+        assert(range.messages.length === 10, `expected 10 messages in range, got ${range.messages.length}`);
+        assert(range.messages[0].text === 'message 19' && range.messages[9].text === 'message 10', 'Range should hold messages 10 through 19');
+        assert(slack.calls.length === 1, `expected only the refresh call, got ${slack.calls.length}`);
+    });
+
+    await runTest('Count-limited requests with a past latest start at latest', async () => {
+        const slack = createFakeSlack(2000);
+        const messages = loadModule(slack);
+        const latest = slack.channel[100].ts;
+
+        const windowed = await messages.fetchChannelMessages({ count: 5, latest });
+        assert(windowed.messages.map(msg => msg.text).join() === 'message 100,message 99,message 98,message 97,message 96',
+            `expected the five messages up to latest, got ${windowed.messages.map(msg => msg.text)}`);
+        assert(slack.calls.length === 1 && slack.calls[0].latest === latest && slack.calls[0].inclusive !== false,
+            'The first page should be bounded by latest');
+
+        slack.calls.length = 0;
+        const earlier = await messages.fetchChannelMessages({ count: 5, latest: slack.channel[90].ts });
+        assert(earlier.messages[0].text === 'message 90', 'An earlier window should be served');
+        assert(slack.calls.every(call => call.latest), 'A request inside the window should not refresh from now');
+
+        slack.calls.length = 0;
+        const recent = await messages.getRecentMessages(5);
+        assert(recent.messages.map(msg => msg.text).join() === 'message 1999,message 1998,message 1997,message 1996,message 1995',
+            'The windowed seed should not be mistaken for the newest messages');
+        assert(slack.calls[0].oldest === latest, 'Newer messages should be fetched from the end of the window');
+        const all = await messages.getAllChannelMessages(false);
+        assert(all.messages.length === 2000 && new Set(all.messages.map(msg => msg.ts)).size === 2000,
+            `the cache should stay contiguous, got ${all.messages.length} messages`);
+    });
+
+    await runTest('Least recently used channels are evicted', async () => {
+        const slack = createFakeSlack(10);
+        const messages = loadModule(slack, { MESSAGE_CACHE: { maxChannels: 2 } });
+
+        for (const channelId of ['C1', 'C2', 'C1', 'C3']) {
+            messages.getCurrentChannelId = () => channelId;
+            await messages.getRecentMessages(5);
+        }
+        assert([...messages.messageCache.keys()].join() === 'C1,C3', `unexpected cache keys ${[...messages.messageCache.keys()]}`);
+    });
+
+    await runTest('Cache can be turned off', async () => {
+        const slack = createFakeSlack(10);
+        const messages = loadModule(slack, { MESSAGE_CACHE: { enabled: false } });
+
+        await messages.getRecentMessages(5);
+        slack.calls.length = 0;
+        await messages.getRecentMessages(5);
+        assert(slack.calls.length === 1 && !slack.calls[0].oldest, 'Every fetch should start from scratch');
+        assert(messages.messageCache.size === 0, 'Nothing should be cached');
+    });
+
+    console.log(`\n📊 ${TEST_NAME} Results: ${testsPassed}/${testsTotal} passed`);
+    process.exit(testsPassed === testsTotal ? 0 : 1);
+}
+
+main();
@@ -7,17 +7,18 @@
 
 const fs = require('fs');
 const path = require('path');
+const vm = require('vm');
 
 // Test configuration
 const TEST_NAME = 'Smart Context System';
 let testsPassed = 0;
 let testsTotal = 0;
 
-function runTest(testName, testFunction) {
+async function runTest(testName, testFunction) {
     testsTotal++;
     try {
         console.log(`🧪 Testing: ${testName}`);
-        testFunction();
+        await testFunction();
         testsPassed++;
         console.log(`✅ PASSED: ${testName}`);
     } catch (error) {
@@ -131,18 +132,142 @@ runTest('Thread Context Extraction', () => {
     assert(scriptContent.includes('isThreadReply'), 'Thread reply marking not found');
 });
 
-console.log('\n=====================================');
-console.log('📊 TEST SUMMARY');
-console.log('=====================================');
-console.log(`Total Tests: ${testsTotal}`);
-console.log(`✅ Passed: ${testsPassed}`);
-console.log(`❌ Failed: ${testsTotal - testsPassed}`);
-console.log(`📈 Success Rate: ${Math.round((testsPassed / testsTotal) * 100)}%`);
-
-if (testsPassed === testsTotal) {
-    console.log('\n🎉 All smart context tests passed!');
-    process.exit(0);
-} else {
-    console.log('\n💥 Some smart context tests failed.');
-    process.exit(1);
+// The whole script in a vm, with a fake DOM, clock and SlackPolishChannelMessages
+function loadRuntime(config = {}) {
+    const clock = { now: 1700000000000 };
+    const listeners = { document: [], window: [] };
+    const observers = [];
+    const fetches = [];
+    const channel = { id: 'C1' };
+    const track = (owner) => ({
+        addEventListener: (type, handler) => listeners[owner].push({ type, handler }),
+        removeEventListener: (type, handler) => {
+            listeners[owner] = listeners[owner].filter(entry => entry.type !== type || entry.handler !== handler);
+        }
+    });
+
+    const window = {
+        location: { href: 'https://app.slack.com/client/T1/C1', pathname: '/client/T1/C1' },
+        SLACKPOLISH_CONFIG: { SMART_CONTEXT: { enabled: true, privacyMode: false }, ...config },
+        SlackPolishChannelMessages: {
+            getCurrentChannelId: () => channel.id,
+            getRecentMessages: async (count) => {
+                fetches.push(channel.id);
+                return { channelId: channel.id, messages: [{ user: 'U1', text: `hello from ${channel.id}` }] };
+            }
+        },
+        ...track('window')
+    };
+    const document = {
+        readyState: 'complete',
+        body: null,
+        activeElement: null,
+        querySelector: (selector) => selector === 'title' ? { tagName: 'TITLE' } : null,
+        querySelectorAll: () => [],
+        getElementById: () => null,
+        ...track('document')
+    };
+    class FakeMutationObserver {
+        constructor(callback) {
+            this.callback = callback;
+            this.connected = false;
+            observers.push(this);
+        }
+        observe() { this.connected = true; }
+        disconnect() { this.connected = false; }
+    }
+    class FakeDate extends Date {
+        static now() { return clock.now; }
+    }
+
+    const source = scriptContent.replace(/    init\(\);\s*\}\)\(\);\s*$/, '    init();\n    window.__textImprover = textImprover;\n})();');
+    const context = vm.createContext({
+        window, document, localStorage: { getItem: () => null, setItem() {}, removeItem() {} },
+        MutationObserver: FakeMutationObserver, Date: FakeDate,
+        console: { log() {} }, setTimeout, clearTimeout
+    });
+    vm.runInContext(source, context);
+
+    // Switch channels the way Slack does: new path, then a retitled window
+    const switchChannel = (id) => {
+        channel.id = id;
+        window.location.pathname = `/client/T1/${id}`;
+        observers.forEach(observer => observer.connected && observer.callback([]));
+    };
+    const focusComposer = () => listeners.document
+        .filter(entry => entry.type === 'focusin')
+        .forEach(entry => entry.handler({ target: { isContentEditable: true } }));
+    return { window, listeners, observers, fetches, clock, switchChannel, focusComposer, textImprover: window.__textImprover };
+}
+
+async function main() {
+    // Test 13: Prefetched context is reused within the TTL
+    await runTest('Smart Context Prefetch TTL Hit', async () => {
+        const runtime = loadRuntime();
+        runtime.focusComposer();
+        assert(runtime.fetches.length === 1, `composer focus should start one fetch, saw ${runtime.fetches.length}`);
+
+        runtime.clock.now += 10000;
+        const context = await runtime.textImprover.getSmartContext();
+        assert(runtime.fetches.length === 1, 'The hotkey should reuse the prefetched context');
+        assert(context.length === 1 && context[0].text === 'hello from C1', 'Prefetched messages should be returned');
+    });
+
+    // Test 14: Expired context is fetched again
+    await runTest('Smart Context Prefetch Expiry', async () => {
+        const runtime = loadRuntime({ SMART_CONTEXT: { enabled: true, prefetchTtlSeconds: 5 } });
+        await runtime.textImprover.getSmartContext();
+        runtime.clock.now += 4000;
+        await runtime.textImprover.getSmartContext();
+        assert(runtime.fetches.length === 1, 'Context inside the configured TTL should be reused');
+
+        runtime.clock.now += 2000;
+        await runtime.textImprover.getSmartContext();
+        assert(runtime.fetches.length === 2, 'Context older than the TTL should be fetched again');
+    });
+
+    // Test 15: A channel switch prefetches the new channel instead of reusing the old one
+    await runTest('Smart Context Channel Switch', async () => {
+        const runtime = loadRuntime();
+        await runtime.textImprover.getSmartContext();
+        runtime.switchChannel('C2');
+        assert(runtime.fetches.join() === 'C1,C2', `the channel switch should prefetch C2, saw ${runtime.fetches.join()}`);
+
+        const context = await runtime.textImprover.getSmartContext();
+        assert(context[0].text === 'hello from C2', 'The new channel should not get the old channel\'s context');
+        assert(runtime.fetches.length === 2, 'The hotkey should reuse the channel-switch prefetch');
+    });
+
+    // Test 16: Teardown removes the composer listener and stops the channel observer
+    await runTest('Smart Context Prefetch Teardown', async () => {
+        const runtime = loadRuntime();
+        const focusListeners = () => runtime.listeners.document.filter(entry => entry.type === 'focusin').length;
+        assert(focusListeners() === 1 && runtime.observers.length === 1 && runtime.observers[0].connected,
+            'Setup should register one focusin listener and one title observer');
+
+        runtime.window.__SLACKPOLISH_RUNTIME_TEARDOWN__();
+        assert(focusListeners() === 0, 'The focusin listener should be removed');
+        assert(!runtime.observers[0].connected, 'The MutationObserver should be disconnected');
+        runtime.focusComposer();
+        runtime.switchChannel('C2');
+        assert(runtime.fetches.length === 0, 'Nothing should prefetch after teardown');
+    });
+
+    console.log('\n=====================================');
+    console.log('📊 TEST SUMMARY');
+    console.log('=====================================');
+    console.log(`Total Tests: ${testsTotal}`);
+    console.log(`✅ Passed: ${testsPassed}`);
+    console.log(`❌ Failed: ${testsTotal - testsPassed}`);
+    console.log(`📈 Success Rate: ${Math.round((testsPassed / testsTotal) * 100)}%`);
+
+    if (testsPassed === testsTotal) {
+        console.log('\n🎉 All smart context tests passed!');
+        process.exit(0);
+    } else {
+        console.log('\n💥 Some smart context tests failed.');
+        process.exit(1);
+    }
 }
+
+main();
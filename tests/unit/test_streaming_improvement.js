@@ -0,0 +1,119 @@
+#!/usr/bin/env node
+
+/**
+ * SlackPolish Streaming Improvement Tests
+ * Runs readOpenAIStream from slack-text-improver.js against chunked SSE bodies
+ * and checks the cancel / preview wiring around it.
+ */
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const TEST_NAME = 'Streaming Improvement';
+let testsPassed = 0;
+let testsTotal = 0;
+
+async function runTest(testName, testFunction) {
+    testsTotal++;
+    try {
+        console.log(`🧪 Testing: ${testName}`);
+        await testFunction();
+        testsPassed++;
+        console.log(`✅ PASSED: ${testName}`);
+    } catch (error) {
+        console.log(`❌ FAILED: ${testName}`);
+        console.log(`   Error: ${error.message}`);
+    }
+}
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(message || 'Assertion failed');
+    }
+}
+
+const scriptPath = path.join(__dirname, '../../slack-text-improver.js');
+const scriptContent = fs.readFileSync(scriptPath, 'utf8');
+
+// Pull the standalone stream reader out of the IIFE and evaluate it on its own
+const readerSource = scriptContent.match(/    async function readOpenAIStream\(response, onDelta\) \{[\s\S]*?\n    \}\n/);
+const context = vm.createContext({ TextDecoder, Uint8Array });
+if (readerSource) {
+    vm.runInContext(readerSource[0], context);
+}
+
+function sseResponse(events, chunkSize) {
+    const bytes = new TextEncoder().encode(events.map(event => `data: ${event}\n\n`).join(''));
+    let position = 0;
+    return {
+        body: {
+            getReader: () => ({
+                read: async () => {
+                    if (position >= bytes.length) return { done: true, value: undefined };
+                    const value = bytes.slice(position, position + chunkSize);
+                    position += chunkSize;
+                    return { done: false, value };
+                }
+            })
+        }
+    };
+}
+
+function delta(content) {
+    return JSON.stringify({ choices: [{ delta: { content } }] });
+}
+
+async function main() {
+    console.log(`🚀 Running ${TEST_NAME} Tests`);
+    console.log('=====================================\n');
+
+    await runTest('Stream reader is present', () => {
+        assert(readerSource, 'readOpenAIStream not found');
+        assert(typeof context.readOpenAIStream === 'function', 'readOpenAIStream did not evaluate');
+    });
+
+    await runTest('Chunks split mid-line and mid-character are reassembled', async () => {
+        const events = [delta('Héllo'), delta(' wörld'), delta(' 👋'), '[DONE]'];
+        for (const chunkSize of [1, 3, 7, 1024]) {
+            const seen = [];
+            const text = await context.readOpenAIStream(sseResponse(events, chunkSize), (soFar) => seen.push(soFar));
+            assert(text === 'Héllo wörld 👋', `chunk size ${chunkSize}: got ${JSON.stringify(text)}`);
+            assert(seen[0] === 'Héllo' && seen[seen.length - 1] === text, `chunk size ${chunkSize}: progress not reported`);
+        }
+    });
+
+    await runTest('Role-only and non-data lines are skipped', async () => {
+        const events = [JSON.stringify({ choices: [{ delta: { role: 'assistant' } }] }), delta('OK'), '[DONE]'];
+        const text = await context.readOpenAIStream(sseResponse(events, 5), null);
+        assert(text === 'OK', `got ${JSON.stringify(text)}`);
+    });
+
+    await runTest('Stream without [DONE] ends at EOF', async () => {
+        const text = await context.readOpenAIStream(sseResponse([delta('partial')], 4), null);
+        assert(text === 'partial', `got ${JSON.stringify(text)}`);
+    });
+
+    await runTest('Error events are raised', async () => {
+        let message = null;
+        try {
+            await context.readOpenAIStream(sseResponse([JSON.stringify({ error: { message: 'Rate limit' } })], 64), null);
+        } catch (error) {
+            message = error.message;
+        }
+        assert(message === 'Rate limit', `expected the stream error, got ${message}`);
+    });
+
+    await runTest('Requests stream and can be aborted', () => {
+        assert(scriptContent.includes('stream: !!options.onDelta'), 'Requests should set stream when onDelta is given');
+        assert(scriptContent.includes('signal: options.signal'), 'fetch should receive the abort signal');
+        assert(scriptContent.includes('listenForImprovementCancel(cancelController)'), 'Escape/typing should cancel');
+        assert(scriptContent.includes("error.name === 'AbortError'"), 'Cancellation should not be reported as an API error');
+        assert(scriptContent.includes('CONFIG.OPENAI_STREAM !== false'), 'Streaming should be configurable');
+    });
+
+    console.log(`\n📊 ${TEST_NAME} Results: ${testsPassed}/${testsTotal} passed`);
+    process.exit(testsPassed === testsTotal ? 0 : 1);
+}
+
+main();
@@ -0,0 +1,172 @@
+#!/usr/bin/env node
+
+/**
+ * SlackPolish Map-Reduce Summary Tests
+ * Runs the chunking and map-reduce pipeline from slack-channel-summary.js
+ * against a fake OpenAI endpoint.
+ */
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const TEST_NAME = 'Map-Reduce Summary';
+let testsPassed = 0;
+let testsTotal = 0;
+
+async function runTest(testName, testFunction) {
+    testsTotal++;
+    try {
+        console.log(`🧪 Testing: ${testName}`);
+        await testFunction();
+        testsPassed++;
+        console.log(`✅ PASSED: ${testName}`);
+    } catch (error) {
+        console.log(`❌ FAILED: ${testName}`);
+        console.log(`   Error: ${error.message}`);
+    }
+}
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(message || 'Assertion failed');
+    }
+}
+
+const scriptPath = path.join(__dirname, '../../slack-channel-summary.js');
+const scriptContent = fs.readFileSync(scriptPath, 'utf8');
+
+// Evaluate the module and hand its SlackChannelSummary object back to the test
+function loadSummary(fetch, config = {}) {
+    const source = scriptContent.replace(/\}\)\(\);\s*$/, 'window.__summary = SlackChannelSummary;\n})();');
+    const window = { SLACKPOLISH_CONFIG: config };
+    const context = vm.createContext({
+        window,
+        document: { readyState: 'loading', addEventListener() {}, getElementById: () => null },
+        localStorage: { getItem: (key) => key === 'slackpolish_openai_api_key' ? 'sk-test' : null },
+        console: { log() {}, error() {} },
+        fetch,
+        setTimeout
+    });
+    vm.runInContext(source, context);
+    return window.__summary;
+}
+
+// One message per hour, newest first, with a thread of replies on every fifth message
+function buildHistory(hours, textLength) {
+    const messages = [];
+    for (let h = hours - 1; h >= 0; h--) {
+        const ts = 1700000000 + h * 3600;
+        const parent = { ts: `${ts}.000100`, user: `U${h % 7}`, text: `topic ${h} ${'x'.repeat(textLength)}`, timestamp: new Date(ts * 1000).toISOString() };
+        messages.push(parent);
+        if (h % 5 === 0) {
+            for (let r = 1; r <= 3; r++) {
+                messages.push({ ts: `${ts + r}.000200`, user: 'U9', text: `reply ${r} to ${h}`, timestamp: new Date((ts + r) * 1000).toISOString(), isThreadReply: true, parentTs: parent.ts });
+            }
+        }
+    }
+    return messages;
+}
+
+function fakeOpenAI(latencyMs = 10) {
+    const stats = { requests: [], inFlight: 0, maxInFlight: 0 };
+    const fetch = async (url, options) => {
+        const body = JSON.parse(options.body);
+        const prompt = body.messages[0].content;
+        stats.requests.push({ prompt, maxTokens: body.max_tokens });
+        stats.inFlight++;
+        stats.maxInFlight = Math.max(stats.maxInFlight, stats.inFlight);
+        await new Promise(resolve => setTimeout(resolve, latencyMs));
+        stats.inFlight--;
+        const part = prompt.match(/are part (\d+) of/);
+        // Notes of ~400 tokens each, so a few dozen parts need merging before the final pass
+        const notes = 'n'.repeat(1600);
+        const content = part ? `notes for part ${part[1]} ${notes}` : (prompt.includes('Merge them') ? `merged ${notes}` : 'FINAL SUMMARY');
+        return { ok: true, json: async () => ({ choices: [{ message: { content } }] }) };
+    };
+    return { stats, fetch };
+}
+
+async function main() {
+    console.log(`🚀 Running ${TEST_NAME} Tests`);
+    console.log('=====================================\n');
+
+    await runTest('Chunks respect the token budget, threads and order', () => {
+        const summary = loadSummary(async () => {});
+        const messages = buildHistory(200, 200);
+        const budget = 2000;
+        const chunks = summary.splitMessagesIntoChunks(messages, budget);
+
+        assert(chunks.length > 1, 'History over budget should be split');
+        assert(chunks.every(chunk => chunk.tokens <= budget), 'No chunk should exceed the budget');
+        const flattened = [].concat(...chunks.map(chunk => chunk.messages));
+        assert(flattened.length === messages.length, 'Every message should land in exactly one chunk');
+        for (let i = 1; i < flattened.length; i++) {
+            assert(flattened[i].timestamp >= flattened[i - 1].timestamp, 'Chunks should run oldest first');
+        }
+        for (const chunk of chunks) {
+            const first = chunk.messages[0];
+            assert(!first.isThreadReply, 'A thread should not be split across chunks');
+        }
+    });
+
+    await runTest('Small histories stay in one request', () => {
+        const summary = loadSummary(async () => {});
+        const chunks = summary.splitMessagesIntoChunks(buildHistory(10, 20), 12000);
+        assert(chunks.length === 1, `expected one chunk, got ${chunks.length}`);
+    });
+
+    await runTest('Oversized threads are cut by lines', () => {
+        const summary = loadSummary(async () => {});
+        const parent = { ts: '1700000000.000100', user: 'U1', text: 'big thread', timestamp: new Date(1700000000000).toISOString() };
+        const replies = Array.from({ length: 50 }, (_, r) => ({
+            ts: `${1700000001 + r}.000200`, user: 'U2', text: 'y'.repeat(400),
+            timestamp: new Date((1700000001 + r) * 1000).toISOString(), isThreadReply: true, parentTs: parent.ts
+        }));
+        const chunks = summary.splitMessagesIntoChunks([parent, ...replies], 1000);
+        assert(chunks.length > 1 && chunks.every(chunk => chunk.tokens <= 1000), 'Thread should be cut to fit the budget');
+    });
+
+    await runTest('Parts are summarized concurrently and reduced hierarchically', async () => {
+        const openai = fakeOpenAI();
+        const summary = loadSummary(openai.fetch, { CHANNEL_SUMMARY: { CHUNK_TOKENS: 2000 } });
+        const messages = buildHistory(400, 300);
+        const chunks = summary.splitMessagesIntoChunks(messages, 2000);
+        const progress = [];
+        const setProgress = summary.setSummaryProgress;
+        summary.setSummaryProgress = function(text) {
+            progress.push(text);
+            setProgress.call(this, text);
+        };
+
+        const result = await summary.generateChunkedSummary(chunks, 'executive', { channelName: 'general', messages });
+
+        assert(result === 'FINAL SUMMARY', `unexpected result ${result}`);
+        const partRequests = openai.stats.requests.filter(r => /are part \d+ of/.test(r.prompt));
+        assert(partRequests.length === chunks.length, `expected ${chunks.length} part requests, got ${partRequests.length}`);
+        assert(openai.stats.maxInFlight === 3, `expected 3 requests in flight, saw ${openai.stats.maxInFlight}`);
+        assert(openai.stats.requests.some(r => r.prompt.includes('Merge them')), 'Expected an intermediate merge round');
+        const final = openai.stats.requests[openai.stats.requests.length - 1];
+        assert(final.prompt.includes('KEY HIGHLIGHTS') && final.maxTokens === 2000, 'Final pass should use the level format and token limit');
+        assert(progress.some(text => text.includes(`(${chunks.length}/${chunks.length} done)`)), 'Progress should count finished parts');
+        assert(progress[progress.length - 1].includes('Writing the final summary'), 'Progress should end with the final pass');
+    });
+
+    await runTest('Failures stop the pipeline and are reported', async () => {
+        let calls = 0;
+        const summary = loadSummary(async () => {
+            calls++;
+            return { ok: false, status: 500, statusText: 'Server Error' };
+        });
+        const messages = buildHistory(200, 200);
+        const chunks = summary.splitMessagesIntoChunks(messages, 2000);
+        const result = await summary.generateChunkedSummary(chunks, 'short', { channelName: 'general', messages });
+        assert(result.includes('Failed to generate AI summary: OpenAI API error: 500'), `unexpected result ${result}`);
+        assert(calls <= 3, `no new parts should start after a failure, saw ${calls} calls`);
+    });
+
+    console.log(`\n📊 ${TEST_NAME} Results: ${testsPassed}/${testsTotal} passed`);
+    process.exit(testsPassed === testsTotal ? 0 : 1);
+}
+
+main();
@@ -0,0 +1,157 @@
+#!/usr/bin/env node
+
+/**
+ * SlackPolish Thread Reply Fetching Tests
+ * Runs SlackPolishChannelMessages.includeThreadReplies from slack-text-improver.js
+ * against a fake conversations.replies with latency, pagination and rate limits.
+ */
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const TEST_NAME = 'Thread Reply Fetching';
+let testsPassed = 0;
+let testsTotal = 0;
+
+async function runTest(testName, testFunction) {
+    testsTotal++;
+    try {
+        console.log(`🧪 Testing: ${testName}`);
+        await testFunction();
+        testsPassed++;
+        console.log(`✅ PASSED: ${testName}`);
+    } catch (error) {
+        console.log(`❌ FAILED: ${testName}`);
+        console.log(`   Error: ${error.message}`);
+    }
+}
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(message || 'Assertion failed');
+    }
+}
+
+const scriptPath = path.join(__dirname, '../../slack-text-improver.js');
+const scriptContent = fs.readFileSync(scriptPath, 'utf8');
+
+const moduleSource = scriptContent.match(/    \/\/ Per-channel conversations\.history cache[\s\S]*?\n    function initializeGlobalChannelMessagesSystem\(\) \{[\s\S]*?\n    \}\n/);
+
+// Threads of `repliesPerThread` replies, answered after `latencyMs`, `pageSize` replies per page
+function createFakeSlack({ threads, repliesPerThread, latencyMs = 20, pageSize = 1000, rateLimitEvery = 0 }) {
+    const stats = { calls: 0, inFlight: 0, maxInFlight: 0, rateLimited: 0, logs: [] };
+    const parents = [];
+    for (let t = 0; t < threads; t++) {
+        parents.push({ ts: `${1700000000 + t * 100}.000001`, reply_count: repliesPerThread, text: `thread ${t}` });
+    }
+
+    const api = {
+        call(method, params, callback) {
+            stats.calls++;
+            stats.inFlight++;
+            stats.maxInFlight = Math.max(stats.maxInFlight, stats.inFlight);
+            setTimeout(() => {
+                stats.inFlight--;
+                if (rateLimitEvery && stats.calls % rateLimitEvery === 0) {
+                    stats.rateLimited++;
+                    callback({ ok: false, error: 'ratelimited', retry_after: 0.05 });
+                    return;
+                }
+                const parent = parents.find(p => p.ts === params.ts);
+                const start = params.cursor ? parseInt(params.cursor, 10) : 0;
+                const replies = [];
+                for (let r = start; r < Math.min(start + pageSize, repliesPerThread); r++) {
+                    replies.push({ ts: `${parseInt(parent.ts, 10) + r + 1}.000002`, text: `${parent.text} reply ${r}`, user: 'U2' });
+                }
+                const next = start + pageSize;
+                callback({
+                    ok: true,
+                    messages: [{ ts: parent.ts, text: parent.text }, ...replies],
+                    has_more: next < repliesPerThread,
+                    response_metadata: { next_cursor: next < repliesPerThread ? String(next) : '' }
+                });
+            }, latencyMs);
+        }
+    };
+    return { parents, stats, api };
+}
+
+function loadModule(slack, config = {}) {
+    const window = {
+        location: { href: 'https://app.slack.com/client/T1/C123' },
+        TS: { api: slack.api },
+        SLACKPOLISH_CONFIG: config,
+        SlackPolishDebug: { addLog: (source, message, data) => slack.stats.logs.push({ message, data }) }
+    };
+    const document = { querySelector: () => null, querySelectorAll: () => [] };
+    const context = vm.createContext({ window, document, console: { log() {}, error() {} }, setTimeout });
+    vm.runInContext(`${moduleSource[0]}\ninitializeGlobalChannelMessagesSystem();`, context);
+    return window.SlackPolishChannelMessages;
+}
+
+async function main() {
+    console.log(`🚀 Running ${TEST_NAME} Tests`);
+    console.log('=====================================\n');
+
+    await runTest('Replies are fetched concurrently and stay in order', async () => {
+        const slack = createFakeSlack({ threads: 12, repliesPerThread: 2 });
+        const messages = loadModule(slack, { CHANNEL_SUMMARY: { THREAD_CONCURRENCY: 4 } });
+        const plain = { ts: '1699999999.000001', reply_count: 0, text: 'no thread' };
+
+        const startedAt = Date.now();
+        const result = await messages.includeThreadReplies([plain, ...slack.parents], 'C123');
+        const elapsed = Date.now() - startedAt;
+
+        assert(slack.stats.maxInFlight === 4, `expected 4 calls in flight, saw ${slack.stats.maxInFlight}`);
+        assert(elapsed < 12 * 20, `12 threads at 20ms should finish well under ${12 * 20}ms, took ${elapsed}ms`);
+        assert(result.length === 1 + 12 * 3, `expected ${1 + 12 * 3} messages, got ${result.length}`);
+        assert(result[0].text === 'no thread', 'Messages without replies should be kept');
+        for (let t = 0; t < 12; t++) {
+            const at = 1 + t * 3;
+            assert(result[at].text === `thread ${t}`, `thread ${t} parent out of place`);
+            assert(result[at + 1].text === `thread ${t} reply 0` && result[at + 2].text === `thread ${t} reply 1`,
+                `thread ${t} replies should follow their parent`);
+            assert(result[at + 1].isThreadReply && result[at + 1].parentTs === slack.parents[t].ts, 'Replies should be marked');
+        }
+    });
+
+    await runTest('Long threads are paginated by cursor', async () => {
+        const slack = createFakeSlack({ threads: 2, repliesPerThread: 450, pageSize: 200, latencyMs: 1 });
+        const messages = loadModule(slack);
+
+        const result = await messages.includeThreadReplies(slack.parents, 'C123');
+        assert(result.length === 2 + 900, `expected every reply, got ${result.length - 2}`);
+        assert(slack.stats.calls === 6, `expected 3 pages per thread, got ${slack.stats.calls} calls`);
+        assert(!result.some((msg, i) => i > 0 && msg.isThreadReply && msg.ts === msg.parentTs), 'Parents should not repeat');
+    });
+
+    await runTest('Rate-limited calls back off and are retried', async () => {
+        const slack = createFakeSlack({ threads: 10, repliesPerThread: 1, latencyMs: 5, rateLimitEvery: 4 });
+        const messages = loadModule(slack, { CHANNEL_SUMMARY: { THREAD_CONCURRENCY: 4 } });
+
+        const result = await messages.includeThreadReplies(slack.parents, 'C123');
+        assert(slack.stats.rateLimited > 0, 'The fake API should have rate-limited some calls');
+        assert(result.length === 20, `every thread should still be fetched, got ${result.length - 10} replies`);
+        const backoff = slack.stats.logs.find(log => log.message === 'Slack API rate limited, backing off');
+        assert(backoff && backoff.data.delayMs === 50, 'Retry-After should set the backoff');
+        assert(backoff.data.concurrency < 4, 'Concurrency should drop after a rate limit');
+    });
+
+    await runTest('Per-call timing is reported', async () => {
+        const slack = createFakeSlack({ threads: 3, repliesPerThread: 1, latencyMs: 5 });
+        const messages = loadModule(slack);
+
+        await messages.includeThreadReplies(slack.parents, 'C123');
+        const timings = slack.stats.logs.filter(log => log.message === 'Slack API call timing');
+        assert(timings.length === 3, `expected a timing per call, got ${timings.length}`);
+        assert(timings.every(log => log.data.method === 'conversations.replies' && log.data.durationMs >= 0), 'Timing fields');
+        const summary = slack.stats.logs.find(log => log.message === 'Thread replies included');
+        assert(summary && summary.data.threads === 3 && summary.data.replies === 3, 'Summary log should count threads and replies');
+    });
+
+    console.log(`\n📊 ${TEST_NAME} Results: ${testsPassed}/${testsTotal} passed`);
+    process.exit(testsPassed === testsTotal ? 0 : 1);
+}
+
+main();